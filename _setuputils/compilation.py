@@ -119,8 +119,15 @@ def getSetupOptions(path):
     return options
 
 def getExtensionArgsFromSetupOptions(options):
-    args = {}
+    args = {"extra_compile_args" : [], "extra_link_args" : []}
     if "c++11" in options:
         if onLinux or onMacOS:
-            args["extra_compile_args"] = ["-std=c++11"]
+            args["extra_compile_args"].append("-std=c++11")
+    if "openmp" in options:
+        # the default compiler on macOS does not support OpenMP, prange is sequential there
+        if onLinux:
+            args["extra_compile_args"].append("-fopenmp")
+            args["extra_link_args"].append("-fopenmp")
+        elif onWindows:
+            args["extra_compile_args"].append("/openmp")
     return args
@@ -0,0 +1,137 @@
+import os
+import re
+import hashlib
+from . generic import *
+
+'''
+The registration manifest contains the modules of the addon and the classes
+that have to be registered in the order in which they can be registered.
+Having it avoids searching the package and inspecting all classes at startup.
+The classes are found by scanning the source files, so that the build does
+not need Blender. The stamp allows the addon to detect that python files
+changed after the manifest has been generated.
+'''
+
+registerBaseTypes = {
+    "Panel", "Operator", "PropertyGroup",
+    "AddonPreferences", "Header", "Menu",
+    "Node", "NodeSocket", "NodeTree",
+    "UIList", "RenderEngine"
+}
+
+classPattern = re.compile(r"^class\s+(\w+)\s*\(([^)]*)\)\s*:", flags = re.MULTILINE)
+propertyTypePattern = re.compile(r"(?:Pointer|Collection)Property\(\s*type\s*=\s*(\w+)")
+parentIDPattern = re.compile(r"^\s+bl_parent_id\s*=\s*[\"'](\w+)[\"']", flags = re.MULTILINE)
+idNamePattern = re.compile(r"^\s+bl_idname\s*=\s*[\"'](\w+)[\"']", flags = re.MULTILINE)
+classEndPattern = re.compile(r"^[^\s#]", flags = re.MULTILINE)
+
+def execute_RegistrationManifest(addonDirectory):
+    printHeader("Generate Registration Manifest")
+
+    modules = getModuleNames(addonDirectory)
+    classes = list(iterRegisterClasses(addonDirectory, modules))
+    manifest = {
+        "modules" : modules,
+        "classes" : [[cls.module, cls.name] for cls in sortClasses(classes)],
+        "stamp" : getManifestStamp(addonDirectory, modules)
+    }
+
+    path = os.path.join(addonDirectory, "registration_manifest.json")
+    writeJsonFile(path, manifest)
+    print("{} modules, {} classes".format(len(modules), len(classes)))
+
+def getModuleNames(addonDirectory):
+    # same modules that pkgutil finds in the installed addon
+    return sorted(iterModuleNames(addonDirectory, ""))
+
+def iterModuleNames(directory, root):
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if os.path.isdir(path):
+            if fileExists(os.path.join(path, "__init__.py")):
+                yield from iterModuleNames(path, root + name + ".")
+        else:
+            moduleName, extension = os.path.splitext(name)
+            if extension not in (".py", ".pyx"): continue
+            # the setup info files are not part of the installed addon
+            if moduleName in ("__init__", "__setup_info"): continue
+            yield root + moduleName
+
+def getManifestStamp(addonDirectory, modules):
+    # has to be the same as get_manifest_stamp in auto_load.py
+    stamp = hashlib.sha1()
+    for moduleName in modules:
+        path = os.path.join(addonDirectory, *moduleName.split(".")) + ".py"
+        if not fileExists(path): continue
+        stamp.update("{}:{}\n".format(moduleName, os.path.getsize(path)).encode())
+    return stamp.hexdigest()
+
+def getModulePath(addonDirectory, moduleName):
+    basePath = os.path.join(addonDirectory, *moduleName.split("."))
+    if fileExists(basePath + ".py"):
+        return basePath + ".py"
+    return basePath + ".pyx"
+
+class RegisterClass:
+    def __init__(self, module, name, body):
+        self.module = module
+        self.name = name
+        self.idName = findFirst(idNamePattern, body)
+        self.parentID = findFirst(parentIDPattern, body)
+        self.typeNames = set(propertyTypePattern.findall(body))
+        self.dependencies = set()
+
+def iterRegisterClasses(addonDirectory, modules):
+    for moduleName in modules:
+        text = readTextFile(getModulePath(addonDirectory, moduleName))
+        for match in classPattern.finditer(text):
+            if hasRegisterBaseType(match.group(2)):
+                yield RegisterClass(moduleName, match.group(1), getClassBody(text, match.end()))
+
+def getClassBody(text, start):
+    # the body ends at the first line that is not indented
+    match = classEndPattern.search(text, start)
+    return text[start:match.start() if match else len(text)]
+
+def hasRegisterBaseType(bases):
+    for base in bases.split(","):
+        base = base.strip()
+        if base.startswith("bpy.types.") and base[len("bpy.types."):] in registerBaseTypes:
+            return True
+    return False
+
+def sortClasses(classes):
+    classesByName = {}
+    for cls in classes:
+        classesByName.setdefault(cls.name, []).append(cls)
+    classesByIDName = {cls.idName : cls for cls in classes if cls.idName is not None}
+
+    for cls in classes:
+        for typeName in cls.typeNames:
+            candidates = classesByName.get(typeName, [])
+            sameModule = [c for c in candidates if c.module == cls.module]
+            if len(sameModule) == 1: cls.dependencies.add(sameModule[0])
+            elif len(candidates) == 1: cls.dependencies.add(candidates[0])
+        if cls.parentID in classesByIDName:
+            cls.dependencies.add(classesByIDName[cls.parentID])
+
+    sortedClasses = []
+    sortedSet = set()
+    unsorted = sorted(classes, key = lambda cls: (cls.module, cls.name))
+    while len(unsorted) > 0:
+        remaining = []
+        for cls in unsorted:
+            if cls.dependencies <= sortedSet:
+                sortedClasses.append(cls)
+                sortedSet.add(cls)
+            else:
+                remaining.append(cls)
+        if len(remaining) == len(unsorted):
+            raise Exception("cyclic class dependencies: {}".format(
+                ", ".join(cls.name for cls in remaining)))
+        unsorted = remaining
+    return sortedClasses
+
+def findFirst(pattern, text):
+    match = pattern.search(text)
+    return None if match is None else match.group(1)
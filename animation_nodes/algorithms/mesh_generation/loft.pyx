@@ -1,5 +1,6 @@
+from libc.string cimport memcpy
 from ... math cimport Vector3, mixVec3Arrays
-from ... data_structures cimport Vector3DList, Spline, BezierSpline
+from ... data_structures cimport Vector3DList, Spline, BezierSpline, SplineList
 from ... utils.lists cimport findListSegment_LowLevel, findListSegment
 
 from . import grid
@@ -12,6 +13,7 @@ cdef class LinearLoft:
         public bint cyclic
         public str distributionType
         public int uniformResolution
+        Vector3DList splineLines
 
     def validate(self):
         if self.start > self.end:
@@ -46,6 +48,8 @@ cdef class LinearLoft:
             Vector3DList vertices, tmp1, tmp2
             long totalLineAmount, i, lineIndex
 
+        self.calcSplineLines()
+
         controlLines = endIndices[0] - startIndices[0] + 2
         subdivisionLines = (controlLines - 1) * subdivisions
         totalLineAmount = controlLines + subdivisionLines
@@ -55,8 +59,8 @@ cdef class LinearLoft:
         if startIndices[0] == endIndices[0]: # <- only one segment in the result
             tmp1 = Vector3DList(length = samples);
             tmp2 = Vector3DList(length = samples);
-            self.writeSplineLine(self.splines[startIndices[0]], tmp1.data)
-            self.writeSplineLine(self.splines[startIndices[1]], tmp2.data)
+            self.writeSplineLine(startIndices[0], tmp1.data)
+            self.writeSplineLine(startIndices[1], tmp2.data)
 
             self.writeMixedLine(target = vertices.data,
                     sourceA = tmp1.data,
@@ -73,23 +77,22 @@ cdef class LinearLoft:
             # TODO: speedup when startT or endT is 0 or 1
             tmp1 = Vector3DList(length = samples)
             tmp2 = Vector3DList(length = samples)
-            self.writeSplineLine(self.splines[startIndices[0]], tmp1.data)
-            self.writeSplineLine(self.splines[startIndices[1]], tmp2.data)
+            self.writeSplineLine(startIndices[0], tmp1.data)
+            self.writeSplineLine(startIndices[1], tmp2.data)
             self.writeMixedLine(target = vertices.data,
                     sourceA = tmp1.data,
                     sourceB = tmp2.data,
                     factor = startT)
-            self.writeSplineLine(self.splines[endIndices[0]], tmp1.data)
-            self.writeSplineLine(self.splines[endIndices[1]], tmp2.data)
+            self.writeSplineLine(endIndices[0], tmp1.data)
+            self.writeSplineLine(endIndices[1], tmp2.data)
             self.writeMixedLine(target = vertices.data + (totalLineAmount - 1) * samples,
                     sourceA = tmp1.data,
                     sourceB = tmp2.data,
                     factor = endT)
 
             for i in range(endIndices[0] - startIndices[0]):
-                spline = self.splines[i + startIndices[1]]
                 lineIndex = (i + 1) * (subdivisions + 1)
-                self.writeSplineLine(spline, vertices.data + lineIndex * samples)
+                self.writeSplineLine(i + startIndices[1], vertices.data + lineIndex * samples)
                 self.writeSubdivisionLines(
                         target = vertices.data + (lineIndex - subdivisions) * samples,
                         sourceA = vertices.data + (lineIndex - subdivisions - 1) * samples,
@@ -106,13 +109,18 @@ cdef class LinearLoft:
 
         return vertices
 
-    cdef writeSplineLine(self, Spline spline, Vector3* target):
+    cdef calcSplineLines(self):
+        # evaluate all splines in one pass instead of one after another
+        cdef SplineList splineList = SplineList.fromSplines(self.splines)
         if self.distributionType == "UNIFORM":
-            self.ensureUniformConverter(self.uniformResolution)
-
-        spline.calcDistributedPoints_LowLevel(self.splineSamples, target,
+            splineList.ensureUniformConverter(self.uniformResolution)
+        self.splineLines = splineList.getDistributedPoints(self.splineSamples,
             0, 1, self.distributionType)
 
+    cdef writeSplineLine(self, long splineIndex, Vector3* target):
+        memcpy(target, self.splineLines.data + splineIndex * self.splineSamples,
+            self.splineSamples * sizeof(Vector3))
+
     cdef writeMixedLine(self, Vector3* target, Vector3* sourceA, Vector3* sourceB, float factor):
         mixVec3Arrays(target, sourceA, sourceB, self.splineSamples, factor)
 
@@ -155,6 +163,7 @@ cdef class SmoothLoft:
         public bint cyclic
         public str splineDistributionType, surfaceDistributionType
         public int uniformResolution
+        Vector3DList splineLines
 
     def validate(self):
         if self.start > self.end:
@@ -187,10 +196,12 @@ cdef class SmoothLoft:
             rightHandles = Vector3DList(length = splineAmount),
             cyclic = self.cyclic)
 
-        cdef Spline spline
+        # the i-th surface spline goes through the i-th sample of every spline
+        cdef SplineList splineList = SplineList.fromSplines(self.splines)
         if self.splineDistributionType == "UNIFORM":
-            for spline in self.splines:
-                spline.ensureUniformConverter(self.uniformResolution)
+            splineList.ensureUniformConverter(self.uniformResolution)
+        self.splineLines = splineList.getDistributedPoints(self.splineSamples,
+            0, 1, self.splineDistributionType)
 
         for i in range(self.splineSamples):
             self.createSurfaceSpline(i, surfaceSplinePoints.data)
@@ -199,21 +210,10 @@ cdef class SmoothLoft:
 
         return vertices
 
-    cdef createSurfaceSpline(self, float index, Vector3* _surfaceSplinePoints):
-        cdef:
-            int k
-            Spline spline
-            float t
-            float tCyclic = index / <float>self.splineSamples
-            float tNormal = index / <float>(self.splineSamples - 1)
-            bint useUniform = self.splineDistributionType == "UNIFORM"
-
+    cdef createSurfaceSpline(self, Py_ssize_t index, Vector3* _surfaceSplinePoints):
+        cdef Py_ssize_t k
         for k in range(len(self.splines)):
-            spline = self.splines[k]
-            t = tCyclic if spline.cyclic else tNormal
-            if useUniform:
-                t = spline.toUniformParameter_LowLevel(t)
-            spline.evaluatePoint_LowLevel(t, _surfaceSplinePoints + k)
+            _surfaceSplinePoints[k] = self.splineLines.data[k * self.splineSamples + index]
 
     cdef sampleSurfaceSpline(self, BezierSpline spline, Vector3* output):
         if self.surfaceDistributionType == "UNIFORM":
@@ -1,6 +1,9 @@
 import os
 import bpy
 import sys
+import json
+import hashlib
+import time
 import typing
 import inspect
 import pkgutil
@@ -16,22 +19,56 @@ __all__ = (
 modules = None
 ordered_classes = None
 
+manifest_path = Path(__file__).parent / "registration_manifest.json"
+
+# duration of the startup steps in seconds
+startup_timings = {}
+module_import_timings = []
+used_manifest = False
+
 def init():
     global modules
     global ordered_classes
-
-    modules = get_all_submodules(Path(__file__).parent)
-    ordered_classes = get_ordered_classes_to_register(modules)
+    global used_manifest
+
+    start = time.perf_counter()
+    directory = Path(__file__).parent
+    manifest = load_manifest()
+
+    modules = None
+    if manifest is not None:
+        modules = try_import_modules(manifest["modules"], directory.name)
+    if modules is None:
+        manifest = None
+        modules = get_all_submodules(directory)
+    after_import = time.perf_counter()
+
+    ordered_classes = None
+    if manifest is not None:
+        ordered_classes = get_classes_from_manifest(manifest, modules)
+    used_manifest = ordered_classes is not None
+    if ordered_classes is None:
+        ordered_classes = get_ordered_classes_to_register(modules)
+    end = time.perf_counter()
+
+    startup_timings["Import Modules"] = after_import - start
+    startup_timings["Find Classes"] = end - after_import
 
 def register():
+    start = time.perf_counter()
     for cls in ordered_classes:
         bpy.utils.register_class(cls)
+    after_classes = time.perf_counter()
 
     for module in modules:
         if module.__name__ == __name__:
             continue
         if hasattr(module, "register"):
             module.register()
+    end = time.perf_counter()
+
+    startup_timings["Register Classes"] = after_classes - start
+    startup_timings["Register Modules"] = end - after_classes
 
 def unregister():
     for cls in reversed(ordered_classes):
@@ -48,11 +85,21 @@ def unregister():
 #################################################
 
 def get_all_submodules(directory):
-    return list(iter_submodules(directory, directory.name))
-
-def iter_submodules(path, package_name):
-    for name in sorted(iter_submodule_names(path)):
-        yield importlib.import_module("." + name, package_name)
+    return import_modules(sorted(iter_submodule_names(directory)), directory.name)
+
+def import_modules(names, package_name):
+    module_import_timings.clear()
+    modules = []
+    for name in names:
+        # modules that have been imported before are measured with their importer
+        start = time.perf_counter()
+        modules.append(importlib.import_module("." + name, package_name))
+        module_import_timings.append((name, time.perf_counter() - start))
+    return modules
+
+def try_import_modules(names, package_name):
+    try: return import_modules(names, package_name)
+    except ImportError: return None
 
 def iter_submodule_names(path, root=""):
     for _, module_name, is_package in pkgutil.iter_modules([str(path)]):
@@ -64,6 +111,50 @@ def iter_submodule_names(path, root=""):
             yield root + module_name
 
 
+# Registration manifest
+#################################################
+
+def load_manifest():
+    # the manifest is generated by setup.py and does not exist in the sources
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # python files can be changed without running setup.py again
+    if manifest.get("stamp") != get_manifest_stamp(manifest["modules"], manifest_path.parent):
+        return None
+    return manifest
+
+def get_manifest_stamp(module_names, directory):
+    # has to be the same as in _setuputils/registration_manifest.py,
+    # only the sizes are used because copying can change modification times
+    stamp = hashlib.sha1()
+    for name in module_names:
+        path = directory.joinpath(*name.split(".")).with_suffix(".py")
+        try: size = os.stat(path).st_size
+        except OSError: continue
+        stamp.update("{}:{}\n".format(name, size).encode())
+    return stamp.hexdigest()
+
+def get_classes_from_manifest(manifest, modules):
+    base_types = get_register_base_types()
+    modules_by_name = {module.__name__ : module for module in modules}
+    package_name = Path(__file__).parent.name
+
+    classes = []
+    for module_name, class_name in manifest["classes"]:
+        module = modules_by_name.get(package_name + "." + module_name)
+        cls = getattr(module, class_name, None)
+        if not inspect.isclass(cls) or not any(base in base_types for base in cls.__bases__):
+            # the manifest is outdated
+            return None
+        if not getattr(cls, "is_registered", False):
+            classes.append(cls)
+    return classes
+
+
 # Find classes to register
 #################################################
 
@@ -51,6 +51,11 @@ class VectorizeCodeEffect(CodeEffect):
             yield code
             return
 
+        kernelName = self.getKernelName(node, required)
+        if kernelName is not None:
+            yield self.getKernelCallLine(node, kernelName, required)
+            return
+
         iteratorName = "vectorizeIterator"
         yield from self.iterOutputListCreationLines(node)
         yield from self.iterIteratorCreationLines(iteratorName)
@@ -59,6 +64,28 @@ class VectorizeCodeEffect(CodeEffect):
         yield from self.iterAppendToOutputListLines(node)
         yield "    pass"
 
+    def getKernelName(self, node, required):
+        # Nodes can process all elements at once in a kernel method
+        # that gets the (list or single) inputs and returns the output lists.
+        if not hasattr(node, "getVectorizedKernelName"):
+            return None
+        if not all(self.allowInputListExtension):
+            return None
+        return node.getVectorizedKernelName(required)
+
+    def getKernelCallLine(self, node, kernelName, required):
+        # by default kernels only return the required outputs
+        returnsAllOutputs = getattr(node, "vectorizedKernelReturnsAllOutputs", False)
+        inputVariables = node.getInputSocketVariables()
+        outputVariables = node.getOutputSocketVariables()
+        parameterString = ", ".join(inputVariables[socket.identifier] for socket in node.inputs)
+        outputString = ", ".join(outputVariables[socket.identifier] for socket in node.outputs
+                                 if returnsAllOutputs or socket.identifier in required)
+        executionString = "self.{}({})".format(kernelName, parameterString)
+
+        if outputString == "": return executionString
+        else: return "{} = {}".format(outputString, executionString)
+
     def iterOutputListCreationLines(self, node):
         for name, index in zip(self.listOutputNames, self.outputIndices):
             socket = node.outputs[index]
@@ -154,3 +181,28 @@ class ReturnDefaultsOnExceptionCodeEffect(CodeEffect):
                 else:
                     yield f"    {outputVariables[s.identifier]} = self.outputs[{i}].getDefaultValue()"
         yield "    pass"
+
+
+class CacheOutputsCodeEffect(CodeEffect):
+    def __init__(self, propertyExpressions):
+        self.propertyExpressions = propertyExpressions
+
+    def apply(self, node, code, required):
+        inputVariables = node.getInputSocketVariables()
+        outputVariables = node.getOutputSocketVariables()
+        inputs = [inputVariables[s.identifier] for s in node.inputs if s.dataType != "Node Control"]
+        outputs = [outputVariables[s.identifier] for s in node.outputs if s.identifier in required]
+        outputsString = "".join(name + ", " for name in outputs)
+
+        yield "_cache_key = AN.execution.output_cache.createKey(self.identifier, ({}), ({}), {})".format(
+            "".join(name + ", " for name in inputs),
+            "".join(expression + ", " for expression in self.propertyExpressions),
+            repr(tuple(sorted(required))))
+        yield "_cached_outputs = AN.execution.output_cache.getCachedOutputs(_cache_key)"
+        yield "if _cached_outputs is None:"
+        yield from self.iterIndented(code)
+        yield "    AN.execution.output_cache.storeOutputs(_cache_key, ({}))".format(outputsString)
+        yield "else:"
+        if len(outputs) > 0:
+            yield "    {} = _cached_outputs".format(outputsString)
+        yield "    pass"
@@ -50,9 +50,13 @@ class AnimationNodeTree(bpy.types.NodeTree):
         description = "The global scene used by this node tree (never none)")
 
     editNodeLabels: BoolProperty(name = "Edit Node Labels", default = False)
+    diskCacheDirectory: StringProperty(name = "Disk Cache Directory", default = "//an_cache",
+        subtype = "DIR_PATH", description = "Directory in which the disk caches of nodes in this tree are stored")
+    diskCacheProcessAmount: IntProperty(name = "Processes", default = 0, min = 0,
+        description = "Amount of background processes used to bake the disk cache in parallel (0 = one per core)")
 
     def update(self):
-        treeChanged()
+        treeChanged(self)
 
     def canAutoExecute(self, events):
         a = self.autoExecution
@@ -16,7 +16,8 @@ from ... sockets.info import toIdName as toSocketIdName
 from ... utils.attributes import setattrRecursive, getattrRecursive
 from ... operators.dynamic_operators import getInvokeFunctionOperator
 from ... utils.nodes import getAnimationNodeTrees, iterAnimationNodes, idToSocket
-from .. effects import PrependCodeEffect, ReturnDefaultsOnExceptionCodeEffect
+from ... execution.incremental import getPropertyTokenExpressions
+from .. effects import PrependCodeEffect, ReturnDefaultsOnExceptionCodeEffect, CacheOutputsCodeEffect
 
 from ... utils.blender_ui import (
     getNodeCornerLocation_BottomLeft,
@@ -42,10 +43,19 @@ class AnimationNode:
     def useNetworkColorChanged(self, context):
         colorAllNodes()
 
+    def cacheOutputsChanged(self, context):
+        from ... events import executionCodeChanged
+        executionCodeChanged()
+
     # unique string for each node; don't change it at all
     identifier: StringProperty(name = "Identifier", default = "")
     inInvalidNetwork: BoolProperty(name = "In Invalid Network", default = False)
     useNetworkColor: BoolProperty(name = "Use Network Color", default = True, update = useNetworkColorChanged)
+    cacheOutputs: BoolProperty(name = "Cache Outputs", default = False, update = cacheOutputsChanged,
+        description = "Reuse the outputs of previous executions with the same inputs (only for pure nodes)")
+
+    useDiskCache: BoolProperty(name = "Use Disk Cache", default = False, update = cacheOutputsChanged,
+        description = "Load the outputs of this node from baked files on disk when possible")
 
     # used for the listboxes in the sidebar
     activeInputIndex: IntProperty()
@@ -55,7 +65,11 @@ class AnimationNode:
     onlySearchTags = False
 
     # can contain: 'NO_EXECUTION', 'NOT_IN_SUBPROGRAM',
-    #              'NO_AUTO_EXECUTION'
+    #              'NO_AUTO_EXECUTION', 'PURE', 'COPY_ON_WRITE'
+    # pure nodes only depend on their inputs and properties
+    # and don't have side effects
+    # copy on write nodes can get modified inputs that share memory with
+    # other values, they only change them through methods that copy shared data
     options = set()
 
     # can be "NONE", "ALWAYS" or "HIDDEN_ONLY"
@@ -504,6 +518,10 @@ class AnimationNode:
     def nodeTree(self):
         return self.id_data
 
+    @property
+    def cachesOutputs(self):
+        return self.cacheOutputs and "PURE" in self.options
+
     @property
     def inputsByIdentifier(self):
         return {socket.identifier : socket for socket in self.inputs}
@@ -593,6 +611,9 @@ class AnimationNode:
         if errorType == "EXCEPTION":
             yield ReturnDefaultsOnExceptionCodeEffect("self.ControlledExecutionException")
 
+        if self.cachesOutputs:
+            yield CacheOutputsCodeEffect(getPropertyTokenExpressions(self, "self"))
+
 
 
 # Non-Persistent data (will be removed when Blender is closed)
@@ -369,6 +369,10 @@ class AnimationNodeSocket:
     def isCopyable(self):
         return hasattr(self, "getCopyExpression")
 
+    @classmethod
+    def isLazyCopyable(self):
+        return hasattr(self, "getLazyCopyExpression")
+
     @classmethod
     def hasProperty(cls):
         return hasattr(cls, "drawProperty")
@@ -45,6 +45,10 @@ class CListSocket(ListSocket):
     def getCopyExpression(cls):
         return "value.copy()"
 
+    @classmethod
+    def getLazyCopyExpression(cls):
+        return "value.copyOnWrite()"
+
     @classmethod
     def getFromValuesCode(cls):
         return cls.listClass.__name__ + ".fromValues(value)"
@@ -0,0 +1,145 @@
+import sys
+import numpy
+import timeit
+from mathutils import Matrix
+from collections import OrderedDict
+
+from . data_structures import (
+    Vector3DList, PolySpline, SplineList, VirtualDoubleList
+)
+from . data_structures.falloffs.evaluation import FalloffEvaluator
+from . data_structures.meshes.mesh_data import calculatePolygonNormals
+from . algorithms.mesh_generation.grid import getGridMesh_Size
+from . algorithms.mesh.points_scatter import scatterPointsOnPolygons
+from . algorithms.mesh.triangulate_mesh import triangulatePolygonsUsingFanSpanMethod
+from . nodes.falloff.point_distance_falloff import PointDistanceFalloff
+
+'''
+Every benchmark gets the amount of elements it should work on and returns a
+function that runs the measured operation once. That way preparing the input
+data is not part of the measurement.
+'''
+
+defaultSizes = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+benchmarks = OrderedDict()
+
+def benchmark(name):
+    def benchmarkDecorator(function):
+        benchmarks[name] = function
+        return function
+    return benchmarkDecorator
+
+def runBenchmarks(sizes = defaultSizes, filter = "", repetitions = 5):
+    results = OrderedDict()
+    for name, setup in benchmarks.items():
+        if filter not in name:
+            continue
+
+        results[name] = OrderedDict()
+        for size in sizes:
+            duration = measure(setup(size), repetitions)
+            results[name][str(size)] = duration
+            print("{:40}{:>10}  {:.6f} s".format(name, size, duration))
+    return results
+
+def measure(function, repetitions):
+    # the smallest duration is least affected by other processes
+    timer = timeit.Timer(function)
+    loops, _ = timer.autorange()
+    return min(timer.repeat(repetitions, loops)) / loops
+
+def getEnvironmentInfo():
+    import bpy
+    from . import bl_info
+    return OrderedDict([
+        ("addon", ".".join(map(str, bl_info["version"]))),
+        ("blender", bpy.app.version_string),
+        ("python", sys.version.split()[0]),
+        ("platform", sys.platform)
+    ])
+
+
+# Inputs
+##########################################
+
+def randomVectors(amount, seed = 0):
+    random = numpy.random.RandomState(seed)
+    return Vector3DList.fromNumpyArray(random.rand(amount * 3).astype(numpy.float32))
+
+def gridMesh(polygonAmount):
+    divisions = max(int(polygonAmount ** 0.5), 1) + 1
+    return getGridMesh_Size(10, 10, divisions, divisions)
+
+
+# Lists
+##########################################
+
+@benchmark("Vector3DList.copy")
+def copyVectors(amount):
+    vectors = randomVectors(amount)
+    return lambda: vectors.copy()
+
+@benchmark("Vector3DList.transform")
+def transformVectors(amount):
+    vectors = randomVectors(amount)
+    matrix = Matrix.Rotation(0.5, 4, "Z")
+    return lambda: vectors.transform(matrix)
+
+@benchmark("Vector3DList.getSumOfElements")
+def sumVectors(amount):
+    vectors = randomVectors(amount)
+    return lambda: vectors.getSumOfElements()
+
+@benchmark("PolygonIndicesList.copy")
+def copyPolygons(amount):
+    polygons = gridMesh(amount).polygons
+    return lambda: polygons.copy()
+
+@benchmark("PolygonIndicesList.reversed")
+def reversePolygons(amount):
+    polygons = gridMesh(amount).polygons
+    return lambda: polygons.reversed()
+
+
+# Falloffs
+##########################################
+
+@benchmark("Falloff.evaluateList")
+def evaluateFalloff(amount):
+    vectors = randomVectors(amount)
+    falloff = PointDistanceFalloff((0.5, 0.5, 0.5), 0.2, 0.3)
+    evaluator = FalloffEvaluator.create(falloff, "LOCATION", False)
+    # the evaluator only stores a borrowed pointer to the falloff
+    return lambda: (falloff, evaluator.evaluateList(vectors))[1]
+
+
+# Meshes
+##########################################
+
+@benchmark("scatterPointsOnPolygons")
+def scatterPoints(amount):
+    mesh = gridMesh(10000)
+    polygons = triangulatePolygonsUsingFanSpanMethod(mesh.polygons)
+    normals = calculatePolygonNormals(mesh.vertices, polygons)
+    weights = VirtualDoubleList.create(1, 1)
+    return lambda: scatterPointsOnPolygons(mesh.vertices, polygons, normals, weights, 0, amount)
+
+
+# Splines
+##########################################
+
+@benchmark("PolySpline.getDistributedPoints")
+def sampleSpline(amount):
+    spline = PolySpline(randomVectors(1000))
+    return lambda: spline.getDistributedPoints(amount)
+
+@benchmark("PolySpline.getDistributedPoints.uniform")
+def sampleSplineUniform(amount):
+    spline = PolySpline(randomVectors(1000))
+    spline.ensureUniformConverter(10000)
+    return lambda: spline.getDistributedPoints(amount, 0, 1, "UNIFORM")
+
+@benchmark("SplineList.getDistributedPoints")
+def sampleSplineList(amount):
+    splines = SplineList.fromSplines([PolySpline(randomVectors(100, seed)) for seed in range(100)])
+    return lambda: splines.getDistributedPoints(max(amount // 100, 2))
@@ -4,6 +4,7 @@ def importDataStructures():
 
     from . lists.clist import CList
     from . meshes.mesh_data import Mesh
+    from . kd_trees.kd_tree import KDTree
     from . gpencils.gp_layer_data import GPLayer
     from . gpencils.gp_frame_data import GPFrame
     from . gpencils.gp_stroke_data import GPStroke
@@ -24,6 +25,7 @@ def importDataStructures():
     from . splines.base_spline import Spline
     from . splines.poly_spline import PolySpline
     from . splines.bezier_spline import BezierSpline
+    from . splines.spline_list import SplineList
     from . default_lists.c_default_list import CDefaultList
     from . interpolation import Interpolation
     from . falloffs.falloff_base import Falloff, BaseFalloff, CompoundFalloff
@@ -1,3 +1,7 @@
+# setup: options = openmp
+
+import os
+from cython.parallel cimport prange
 from cpython.mem cimport PyMem_Malloc, PyMem_Free
 from cpython.ref cimport PyObject, Py_INCREF, Py_DECREF
 
@@ -303,6 +307,27 @@ cdef float evaluateClamping(void *settings, void *value, Py_ssize_t index):
 # List Evaluation
 #########################################################
 
+# Threads
+#########################################################
+
+# starting threads is only worth it for longer lists
+cdef Py_ssize_t minElementsPerThread = 10000
+cdef int threadAmount = os.cpu_count() or 1
+
+def setThreadAmount(int amount):
+    '''Zero uses one thread per core.'''
+    global threadAmount
+    if amount <= 0:
+        amount = os.cpu_count() or 1
+    threadAmount = amount
+
+def getThreadAmount():
+    return threadAmount
+
+cdef int getUsedThreadAmount(Py_ssize_t amount):
+    return max(1, min(threadAmount, amount // minElementsPerThread))
+
+
 cdef createListEvaluatorFunction(Falloff falloff, str sourceType, bint clamped,
                                  ListEvaluatorFunction *outFunction, void **outSettings):
 
@@ -351,7 +376,24 @@ cdef evaluateList_UnknownType(Falloff falloff, dict preparedLists, Py_ssize_t st
 cdef evaluateList_BaseFalloff(BaseFalloff falloff, dict preparedLists, Py_ssize_t startIndex,
                               Py_ssize_t amount, float *target):
     cdef void *data = intToPointer(preparedLists[falloff.dataType])
-    falloff.evaluateList(data, startIndex, amount, target)
+    cdef int threads = getUsedThreadAmount(amount)
+    if falloff.evaluatesWithoutGIL and threads > 1:
+        evaluateList_BaseFalloff_Parallel(falloff, data, startIndex, amount, target, threads)
+    else:
+        falloff.evaluateList(data, startIndex, amount, target)
+
+cdef evaluateList_BaseFalloff_Parallel(BaseFalloff falloff, void *data, Py_ssize_t startIndex,
+                                       Py_ssize_t amount, float *target, int threads):
+    cdef Py_ssize_t elementSize = getSizeOfFalloffDataType(falloff.dataType)
+    cdef Py_ssize_t chunkSize = (amount + threads - 1) // threads
+    cdef Py_ssize_t chunk, start, length
+
+    for chunk in prange(threads, nogil = True, num_threads = threads, schedule = "static"):
+        start = chunk * chunkSize
+        length = min(chunkSize, amount - start)
+        if length > 0:
+            falloff.evaluateList_NoGIL(<char*>data + start * elementSize,
+                                       startIndex + start, length, target + start)
 
 cdef evaluateList_CompoundFalloff(CompoundFalloff falloff, dict preparedLists,
                                   Py_ssize_t startIndex, Py_ssize_t amount, float *target):
@@ -370,10 +412,26 @@ cdef evaluateList_CompoundFalloff(CompoundFalloff falloff, dict preparedLists,
     cdef Py_ssize_t i
     for i in range(len(dependencies)):
         depsResults[i] = (<FloatList>subResults[i]).data
-    falloff.evaluateList(depsResults, amount, target)
+
+    cdef int threads = getUsedThreadAmount(amount)
+    if falloff.evaluatesWithoutGIL and threads > 1:
+        evaluateList_CompoundFalloff_Parallel(falloff, depsResults, amount, target, threads)
+    else:
+        falloff.evaluateList(depsResults, amount, target)
 
     PyMem_Free(depsResults)
 
+cdef evaluateList_CompoundFalloff_Parallel(CompoundFalloff falloff, float **depsResults,
+                                           Py_ssize_t amount, float *target, int threads):
+    cdef Py_ssize_t chunkSize = (amount + threads - 1) // threads
+    cdef Py_ssize_t chunk, start, end
+
+    for chunk in prange(threads, nogil = True, num_threads = threads, schedule = "static"):
+        start = chunk * chunkSize
+        end = min(start + chunkSize, amount)
+        if start < end:
+            falloff.evaluateList_NoGIL(depsResults, start, end, target)
+
 cdef evaluateList_UnkownType_Multiple(list falloffs, dict preparedLists,
                                       Py_ssize_t startIndex, Py_ssize_t amount):
     cdef list results = []
@@ -8,12 +8,18 @@ cdef class Falloff:
 
 cdef class BaseFalloff(Falloff):
     cdef str dataType
+    cdef bint evaluatesWithoutGIL
     cdef float evaluate(self, void *object, Py_ssize_t index)
     cdef void evaluateList(self, void *objects, Py_ssize_t startIndex,
                            Py_ssize_t amount, float *target)
+    cdef void evaluateList_NoGIL(self, void *objects, Py_ssize_t startIndex,
+                                 Py_ssize_t amount, float *target) nogil
 
 cdef class CompoundFalloff(Falloff):
+    cdef bint evaluatesWithoutGIL
     cdef list getDependencies(self)
     cdef list getClampingRequirements(self)
     cdef float evaluate(self, float *dependencyResults)
     cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target)
+    cdef void evaluateList_NoGIL(self, float **dependencyResults, Py_ssize_t start,
+                                 Py_ssize_t end, float *target) nogil
@@ -24,6 +24,13 @@ cdef class BaseFalloff(Falloff):
         for i in range(amount):
             target[i] = self.evaluate(<char*>objects + i * elementSize, i + startIndex)
 
+    cdef void evaluateList_NoGIL(self, void *objects, Py_ssize_t startIndex,
+                                 Py_ssize_t amount, float *target) nogil:
+        # Falloffs that set evaluatesWithoutGIL have to override this method.
+        # Different parts of the list can be evaluated in multiple threads at the same time.
+        with gil:
+            self.evaluateList(objects, startIndex, amount, target)
+
     def __repr__(self):
         return "{}".format(type(self).__name__)
 
@@ -39,16 +46,24 @@ cdef class CompoundFalloff(Falloff):
         raise NotImplementedError()
 
     cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
-        cdef Py_ssize_t i, j
-        cdef Py_ssize_t depsAmount = len(self.getDependencies())
-        cdef float *buffer = <float*>malloc(sizeof(float) * depsAmount)
+        self.evaluateList_NoGIL(dependencyResults, 0, amount, target)
 
-        for i in range(amount):
-            for j in range(depsAmount):
-                buffer[j] = dependencyResults[j][i]
-            target[i] = self.evaluate(buffer)
-
-        free(buffer)
+    cdef void evaluateList_NoGIL(self, float **dependencyResults, Py_ssize_t start,
+                                 Py_ssize_t end, float *target) nogil:
+        # Falloffs that set evaluatesWithoutGIL have to override this method.
+        # Different ranges of the results can be evaluated in multiple threads at the same time.
+        cdef Py_ssize_t i, j
+        cdef Py_ssize_t depsAmount
+        cdef float *buffer
+
+        with gil:
+            depsAmount = len(self.getDependencies())
+            buffer = <float*>malloc(sizeof(float) * depsAmount)
+            for i in range(start, end):
+                for j in range(depsAmount):
+                    buffer[j] = dependencyResults[j][i]
+                target[i] = self.evaluate(buffer)
+            free(buffer)
 
 
     def __repr__(self):
@@ -0,0 +1,22 @@
+from ... math cimport Vector3
+from .. lists.base_lists cimport Vector3DList, LongList, DoubleList, CharList
+
+cdef struct SearchResult:
+    float distanceSquared
+    long index
+
+cdef struct ResultBuffer:
+    SearchResult *results
+    Py_ssize_t length
+    Py_ssize_t capacity
+
+cdef class KDTree:
+    cdef readonly Vector3DList points
+    cdef LongList order
+    cdef CharList axes
+
+    cdef list toResultTuples(self, LongList indices, DoubleList distances)
+
+    cdef Py_ssize_t findNearestN_LowLevel(self, Vector3 *vector, Py_ssize_t amount,
+                                          SearchResult *results)
+    cdef findInRadius_LowLevel(self, Vector3 *vector, float radius, ResultBuffer *buffer)
@@ -0,0 +1,458 @@
+cimport cython
+from libc.math cimport sqrt
+from libc.stdlib cimport qsort
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+from ... math cimport Vector3, toVector3, toPyVector3, distanceSquaredVec3
+from .. lists.base_lists cimport Vector3DList, LongList, DoubleList, CharList, EdgeIndicesList
+
+cdef class KDTree:
+    '''
+    Balanced kd-tree that is built once from a list of points.
+
+    The tree is stored implicitly in the order of the point indices: the
+    element in the middle of a range splits the range along the axis that
+    is stored at the same position. The elements before it are not larger
+    and the elements after it are not smaller on this axis.
+
+    find, find_n and find_range work like in mathutils.kdtree.KDTree.
+    '''
+
+    def __cinit__(self, Vector3DList points = None):
+        if points is None:
+            points = Vector3DList()
+
+        self.points = points.copy()
+        self.order = LongList(length = points.length)
+        self.axes = CharList(length = points.length)
+
+        cdef Py_ssize_t i
+        for i in range(self.order.length):
+            self.order.data[i] = i
+        buildTree(self.points.data, self.order.data, self.axes.data, 0, self.order.length)
+
+    def __len__(self):
+        return self.points.length
+
+    def __repr__(self):
+        return "<KDTree with {} points>".format(self.points.length)
+
+
+    # Compatibility with mathutils.kdtree.KDTree
+    ###############################################
+
+    def find(self, co):
+        cdef Vector3 vector = toVector3(co)
+        cdef SearchResult result
+        if self.findNearestN_LowLevel(&vector, 1, &result) == 0:
+            return None, None, None
+        return toPyVector3(self.points.data + result.index), result.index, sqrt(result.distanceSquared)
+
+    def find_n(self, co, Py_ssize_t n):
+        indices, distances = self.findNearestN(Vector3DList.fromValues([co]), n)
+        return self.toResultTuples(indices, distances)
+
+    def find_range(self, co, float radius):
+        indices, distances, _ = self.findInRadius(Vector3DList.fromValues([co]), radius)
+        return self.toResultTuples(indices, distances)
+
+    cdef list toResultTuples(self, LongList indices, DoubleList distances):
+        cdef Py_ssize_t i
+        return [(toPyVector3(self.points.data + indices.data[i]), indices.data[i], distances.data[i])
+                for i in range(indices.length)]
+
+
+    # Batch Queries
+    ###############################################
+
+    def findNearestN(self, Vector3DList vectors, Py_ssize_t amount):
+        '''
+        Find the closest points of every vector.
+        Every vector gets min(amount, len(self)) results that are sorted by distance.
+        The results of all vectors are stored one after the other.
+        '''
+        amount = max(0, min(amount, self.points.length))
+
+        cdef Py_ssize_t i, j
+        cdef LongList indices = LongList(length = vectors.length * amount)
+        cdef DoubleList distances = DoubleList(length = vectors.length * amount)
+        cdef SearchResult *results = <SearchResult*>PyMem_Malloc(sizeof(SearchResult) * max(amount, 1))
+
+        for i in range(vectors.length):
+            self.findNearestN_LowLevel(vectors.data + i, amount, results)
+            for j in range(amount):
+                indices.data[i * amount + j] = results[j].index
+                distances.data[i * amount + j] = sqrt(results[j].distanceSquared)
+
+        PyMem_Free(results)
+        return indices, distances
+
+    def findInRadius(self, Vector3DList vectors, float radius):
+        '''
+        Find all points that are not further away from a vector than the radius.
+        The results of a vector are sorted by distance and the results of all
+        vectors are stored one after the other. The amounts list contains how
+        many points have been found for every vector.
+        '''
+        cdef ResultBuffer buffer = createResultBuffer()
+        cdef LongList amounts = LongList(length = vectors.length)
+        cdef Py_ssize_t i, start
+
+        try:
+            for i in range(vectors.length):
+                start = buffer.length
+                self.findInRadius_LowLevel(vectors.data + i, radius, &buffer)
+                sortResults(buffer.results + start, buffer.length - start)
+                amounts.data[i] = buffer.length - start
+            indices, distances = resultBufferToLists(&buffer)
+        finally:
+            PyMem_Free(buffer.results)
+        return indices, distances, amounts
+
+    def findNeighbourEdges(self, Py_ssize_t amount):
+        '''
+        Connect every point with the given amount of closest other points.
+        Every edge is only contained once.
+        '''
+        amount = max(0, amount)
+
+        cdef Py_ssize_t pointAmount = self.points.length
+        cdef Py_ssize_t searchAmount = min(amount + 1, pointAmount)
+        cdef SearchResult *results = <SearchResult*>PyMem_Malloc(
+            sizeof(SearchResult) * max(pointAmount * searchAmount, 1))
+
+        cdef Py_ssize_t i, j
+        for i in range(pointAmount):
+            self.findNearestN_LowLevel(self.points.data + i, searchAmount, results + i * searchAmount)
+
+        # the first point of an edge is the point for which it has been found first
+        cdef Py_ssize_t edgeAmount = 0
+        for i in range(pointAmount):
+            for j in range(searchAmount):
+                if isNewNeighbourEdge(results, searchAmount, i, j):
+                    edgeAmount += 1
+
+        cdef EdgeIndicesList edges = EdgeIndicesList(length = edgeAmount)
+        cdef long neighbour
+        edgeAmount = 0
+        for i in range(pointAmount):
+            for j in range(searchAmount):
+                if isNewNeighbourEdge(results, searchAmount, i, j):
+                    neighbour = results[i * searchAmount + j].index
+                    edges.data[edgeAmount].v1 = min(i, neighbour)
+                    edges.data[edgeAmount].v2 = max(i, neighbour)
+                    edgeAmount += 1
+
+        PyMem_Free(results)
+        return edges
+
+    def findPairsInRadius(self, float radius):
+        '''
+        Connect all points that are not further away from each other than the radius.
+        The edges of a point are sorted by distance.
+        '''
+        cdef ResultBuffer buffer = createResultBuffer()
+        cdef LongList amounts = LongList(length = self.points.length)
+        cdef EdgeIndicesList edges
+        cdef Py_ssize_t i, j, start, end, edgeIndex
+
+        try:
+            for i in range(self.points.length):
+                start = buffer.length
+                self.findInRadius_LowLevel(self.points.data + i, radius, &buffer)
+
+                # keep every pair only for the point with the smaller index
+                end = buffer.length
+                buffer.length = start
+                for j in range(start, end):
+                    if buffer.results[j].index > i:
+                        buffer.results[buffer.length] = buffer.results[j]
+                        buffer.length += 1
+
+                sortResults(buffer.results + start, buffer.length - start)
+                amounts.data[i] = buffer.length - start
+
+            edges = EdgeIndicesList(length = buffer.length)
+            edgeIndex = 0
+            for i in range(self.points.length):
+                for j in range(amounts.data[i]):
+                    edges.data[edgeIndex].v1 = i
+                    edges.data[edgeIndex].v2 = buffer.results[edgeIndex].index
+                    edgeIndex += 1
+        finally:
+            PyMem_Free(buffer.results)
+        return edges
+
+    def getPoints(self, LongList indices):
+        cdef Vector3DList result = Vector3DList(length = indices.length)
+        cdef Py_ssize_t i
+        for i in range(indices.length):
+            if not (0 <= indices.data[i] < self.points.length):
+                raise IndexError("point index out of range")
+            result.data[i] = self.points.data[indices.data[i]]
+        return result
+
+
+    # Low Level
+    ###############################################
+
+    cdef Py_ssize_t findNearestN_LowLevel(self, Vector3 *vector, Py_ssize_t amount,
+                                          SearchResult *results):
+        '''The results array has to have space for the given amount of results.'''
+        if amount <= 0 or self.points.length == 0:
+            return 0
+
+        cdef NearestSearch search
+        search.points = self.points.data
+        search.order = self.order.data
+        search.axes = self.axes.data
+        search.vector = vector
+        search.results = results
+        search.amount = amount
+        search.found = 0
+        searchNearest(&search, 0, self.order.length)
+        return search.found
+
+    cdef findInRadius_LowLevel(self, Vector3 *vector, float radius, ResultBuffer *buffer):
+        '''Appends the unsorted results to the buffer.'''
+        if radius < 0:
+            return
+
+        cdef RadiusSearch search
+        search.points = self.points.data
+        search.order = self.order.data
+        search.axes = self.axes.data
+        search.vector = vector
+        search.radius = radius
+        search.radiusSquared = radius * radius
+        search.buffer = buffer
+        searchInRadius(&search, 0, self.order.length)
+
+
+# Build
+###############################################
+
+cdef inline float getCoordinate(Vector3 *v, char axis) nogil:
+    return (<float*>v)[axis]
+
+@cython.cdivision(True)
+cdef void buildTree(Vector3 *points, long *order, char *axes,
+                    Py_ssize_t start, Py_ssize_t end) nogil:
+    if end <= start:
+        return
+
+    cdef char axis = getLargestExtentAxis(points, order, start, end)
+    cdef Py_ssize_t middle = (start + end) // 2
+    selectByAxis(points, order, start, end, middle, axis)
+    axes[middle] = axis
+
+    buildTree(points, order, axes, start, middle)
+    buildTree(points, order, axes, middle + 1, end)
+
+cdef char getLargestExtentAxis(Vector3 *points, long *order,
+                               Py_ssize_t start, Py_ssize_t end) nogil:
+    cdef Vector3 low = points[order[start]]
+    cdef Vector3 high = low
+    cdef Vector3 *point
+    cdef Py_ssize_t i
+
+    for i in range(start + 1, end):
+        point = points + order[i]
+        if point.x < low.x: low.x = point.x
+        elif point.x > high.x: high.x = point.x
+        if point.y < low.y: low.y = point.y
+        elif point.y > high.y: high.y = point.y
+        if point.z < low.z: low.z = point.z
+        elif point.z > high.z: high.z = point.z
+
+    cdef float extentX = high.x - low.x
+    cdef float extentY = high.y - low.y
+    cdef float extentZ = high.z - low.z
+
+    if extentX >= extentY and extentX >= extentZ: return 0
+    if extentY >= extentZ: return 1
+    return 2
+
+@cython.cdivision(True)
+cdef void selectByAxis(Vector3 *points, long *order, Py_ssize_t start, Py_ssize_t end,
+                       Py_ssize_t k, char axis) nogil:
+    # quickselect with three-way partitioning, so that equal coordinates are handled in linear time
+    cdef Py_ssize_t left = start
+    cdef Py_ssize_t right = end - 1
+    cdef Py_ssize_t lower, upper, i
+    cdef float pivot, coordinate
+
+    while right > left:
+        pivot = getCoordinate(points + order[(left + right) // 2], axis)
+        lower = left
+        upper = right
+        i = left
+        while i <= upper:
+            coordinate = getCoordinate(points + order[i], axis)
+            if coordinate < pivot:
+                swapIndices(order, lower, i)
+                lower += 1
+                i += 1
+            elif coordinate > pivot:
+                swapIndices(order, i, upper)
+                upper -= 1
+            else:
+                i += 1
+
+        if k < lower: right = lower - 1
+        elif k > upper: left = upper + 1
+        else: return
+
+cdef inline void swapIndices(long *order, Py_ssize_t a, Py_ssize_t b) nogil:
+    cdef long tmp = order[a]
+    order[a] = order[b]
+    order[b] = tmp
+
+
+# Nearest Search
+###############################################
+
+cdef struct NearestSearch:
+    Vector3 *points
+    long *order
+    char *axes
+    Vector3 *vector
+    SearchResult *results
+    Py_ssize_t amount
+    Py_ssize_t found
+
+@cython.cdivision(True)
+cdef void searchNearest(NearestSearch *search, Py_ssize_t start, Py_ssize_t end) nogil:
+    if end <= start:
+        return
+
+    cdef Py_ssize_t middle = (start + end) // 2
+    cdef long index = search.order[middle]
+    cdef Vector3 *point = search.points + index
+    insertNearestCandidate(search, index, distanceSquaredVec3(search.vector, point))
+
+    cdef char axis = search.axes[middle]
+    cdef float difference = getCoordinate(search.vector, axis) - getCoordinate(point, axis)
+
+    if difference < 0:
+        searchNearest(search, start, middle)
+        if canContainCloserPoints(search, difference * difference):
+            searchNearest(search, middle + 1, end)
+    else:
+        searchNearest(search, middle + 1, end)
+        if canContainCloserPoints(search, difference * difference):
+            searchNearest(search, start, middle)
+
+cdef inline bint canContainCloserPoints(NearestSearch *search, float distanceSquared) nogil:
+    if search.found < search.amount:
+        return True
+    return distanceSquared < search.results[search.found - 1].distanceSquared
+
+cdef void insertNearestCandidate(NearestSearch *search, long index, float distanceSquared) nogil:
+    cdef Py_ssize_t i
+    if search.found == search.amount:
+        # replace the furthest result
+        if distanceSquared >= search.results[search.found - 1].distanceSquared:
+            return
+        i = search.found - 1
+    else:
+        i = search.found
+        search.found += 1
+
+    while i > 0 and search.results[i - 1].distanceSquared > distanceSquared:
+        search.results[i] = search.results[i - 1]
+        i -= 1
+    search.results[i].distanceSquared = distanceSquared
+    search.results[i].index = index
+
+cdef inline bint isNewNeighbourEdge(SearchResult *results, Py_ssize_t searchAmount,
+                                    Py_ssize_t i, Py_ssize_t j):
+    cdef long neighbour = results[i * searchAmount + j].index
+    cdef Py_ssize_t k
+    if neighbour == i:
+        return False
+    if neighbour > i:
+        return True
+    # the edge already exists when this point is a neighbour of the other point
+    for k in range(searchAmount):
+        if results[neighbour * searchAmount + k].index == i:
+            return False
+    return True
+
+
+# Radius Search
+###############################################
+
+cdef struct RadiusSearch:
+    Vector3 *points
+    long *order
+    char *axes
+    Vector3 *vector
+    float radius
+    float radiusSquared
+    ResultBuffer *buffer
+
+@cython.cdivision(True)
+cdef int searchInRadius(RadiusSearch *search, Py_ssize_t start, Py_ssize_t end) except -1:
+    if end <= start:
+        return 0
+
+    cdef Py_ssize_t middle = (start + end) // 2
+    cdef long index = search.order[middle]
+    cdef Vector3 *point = search.points + index
+    cdef float distanceSquared = distanceSquaredVec3(search.vector, point)
+    if distanceSquared <= search.radiusSquared:
+        appendResult(search.buffer, index, distanceSquared)
+
+    cdef char axis = search.axes[middle]
+    cdef float difference = getCoordinate(search.vector, axis) - getCoordinate(point, axis)
+    if difference <= search.radius:
+        searchInRadius(search, start, middle)
+    if difference >= -search.radius:
+        searchInRadius(search, middle + 1, end)
+    return 0
+
+
+# Result Buffer
+###############################################
+
+cdef ResultBuffer createResultBuffer():
+    cdef ResultBuffer buffer
+    buffer.results = NULL
+    buffer.length = 0
+    buffer.capacity = 0
+    return buffer
+
+cdef int appendResult(ResultBuffer *buffer, long index, float distanceSquared) except -1:
+    cdef Py_ssize_t newCapacity
+    cdef SearchResult *newResults
+    if buffer.length == buffer.capacity:
+        newCapacity = buffer.capacity * 2 + 16
+        newResults = <SearchResult*>PyMem_Realloc(buffer.results, sizeof(SearchResult) * newCapacity)
+        if newResults == NULL:
+            raise MemoryError()
+        buffer.results = newResults
+        buffer.capacity = newCapacity
+
+    buffer.results[buffer.length].index = index
+    buffer.results[buffer.length].distanceSquared = distanceSquared
+    buffer.length += 1
+    return 0
+
+cdef resultBufferToLists(ResultBuffer *buffer):
+    cdef LongList indices = LongList(length = buffer.length)
+    cdef DoubleList distances = DoubleList(length = buffer.length)
+    cdef Py_ssize_t i
+    for i in range(buffer.length):
+        indices.data[i] = buffer.results[i].index
+        distances.data[i] = sqrt(buffer.results[i].distanceSquared)
+    return indices, distances
+
+cdef void sortResults(SearchResult *results, Py_ssize_t amount):
+    qsort(results, amount, sizeof(SearchResult), compareSearchResults)
+
+cdef int compareSearchResults(const void *a, const void *b) nogil:
+    cdef SearchResult *resultA = <SearchResult*>a
+    cdef SearchResult *resultB = <SearchResult*>b
+    if resultA.distanceSquared < resultB.distanceSquared: return -1
+    if resultA.distanceSquared > resultB.distanceSquared: return 1
+    return (resultA.index > resultB.index) - (resultA.index < resultB.index)
@@ -0,0 +1,57 @@
+from unittest import TestCase
+from random import Random
+from . kd_tree import KDTree
+from .. lists.base_lists import Vector3DList
+
+def createRandomPoints(amount, seed):
+    random = Random(seed)
+    return Vector3DList.fromValues([(random.random(), random.random(), random.random())
+                                    for _ in range(amount)])
+
+def distanceSquared(a, b):
+    return sum((a[i] - b[i]) ** 2 for i in range(3))
+
+class TestFindNearestN(TestCase):
+    def testCompareWithBruteForce(self):
+        points = createRandomPoints(200, 0)
+        vectors = createRandomPoints(20, 1)
+        indices, distances = KDTree(points).findNearestN(vectors, 5)
+        self.assertEqual(len(indices), 100)
+        for i, vector in enumerate(vectors):
+            expected = sorted(range(len(points)), key = lambda j: distanceSquared(vector, points[j]))[:5]
+            self.assertEqual(list(indices[i * 5:(i + 1) * 5]), expected)
+
+    def testMoreThanAvailable(self):
+        indices, distances = KDTree(createRandomPoints(3, 0)).findNearestN(createRandomPoints(2, 1), 10)
+        self.assertEqual(len(indices), 6)
+
+    def testEmptyTree(self):
+        tree = KDTree()
+        self.assertEqual(tree.find((0, 0, 0)), (None, None, None))
+        self.assertEqual(len(tree.findNearestN(createRandomPoints(4, 0), 3)[0]), 0)
+
+class TestFindInRadius(TestCase):
+    def testCompareWithBruteForce(self):
+        points = createRandomPoints(200, 2)
+        vectors = createRandomPoints(20, 3)
+        indices, distances, amounts = KDTree(points).findInRadius(vectors, 0.3)
+        start = 0
+        for vector, amount in zip(vectors, amounts):
+            expected = {j for j, point in enumerate(points) if distanceSquared(vector, point) <= 0.09}
+            self.assertEqual(set(indices[start:start + amount]), expected)
+            start += amount
+        self.assertEqual(start, len(indices))
+
+class TestEdges(TestCase):
+    def testPairsInRadius(self):
+        points = createRandomPoints(100, 4)
+        edges = KDTree(points).findPairsInRadius(0.2)
+        expected = {(i, j) for i in range(len(points)) for j in range(i + 1, len(points))
+                    if distanceSquared(points[i], points[j]) <= 0.04}
+        self.assertEqual(len(edges), len(expected))
+        self.assertEqual(set(edges), expected)
+
+    def testNeighbourEdgesAreUnique(self):
+        edges = KDTree(createRandomPoints(100, 5)).findNeighbourEdges(3)
+        self.assertEqual(len(set(edges)), len(edges))
+        self.assertTrue(all(a < b for a, b in edges))
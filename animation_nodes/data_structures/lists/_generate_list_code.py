@@ -48,6 +48,7 @@ def generate_pyx(target, utils):
             LISTNAME = info["LISTNAME"],
             TYPE = info["TYPE"],
             MEMVIEW = info["MEMVIEW"],
+            ELEMENT_SHAPE = info["ELEMENT_SHAPE"],
             TRY_CONVERSION_CODE = indent(info["TRY_CONVERSION_CODE"], " "*8),
             TO_PYOBJECT_CODE = indent(info["TO_PYOBJECT_CODE"], " "*8)
         )
@@ -99,6 +100,7 @@ def iterNumericListInfo(utils):
             LISTNAME = listName,
             TYPE = dataType,
             MEMVIEW = dataType,
+            ELEMENT_SHAPE = "()",
             EQUALS = r"\1 == \2",
             TRY_CONVERSION_CODE = "target[0] = value",
             TO_PYOBJECT_CODE = "return value[0]",
@@ -120,6 +122,7 @@ def iterSpecialListInfo(utils):
             LISTNAME = name,
             TYPE = info["Type"],
             MEMVIEW = info["Buffer Type"],
+            ELEMENT_SHAPE = repr(tuple(info["Element Shape"])),
             EQUALS = info["Equals"],
             TRY_CONVERSION_CODE = info["Try Conversion"],
             TO_PYOBJECT_CODE = "return " + info["To PyObject"],
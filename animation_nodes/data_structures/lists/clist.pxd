@@ -1,3 +1,8 @@
+cdef class SharedData:
+    cdef void* data
+    cdef Py_ssize_t users
+    cdef object buffer
+
 cdef class CList:
     cdef void *getPointer(self)
     cdef int getElementSize(self)
@@ -1,6 +1,23 @@
 cimport cython
 from libc.string cimport memcpy
+from cpython cimport PyMem_Free
 from ... data_structures cimport LongList
+from ... algorithms.hashing.murmurhash3 cimport murmur3_32
+
+cdef class SharedData:
+    '''
+    Owns memory that is used by multiple lists at the same time.
+    The memory is freed when the last of these lists is deallocated,
+    unless it belongs to a buffer that is kept alive instead.
+    '''
+    def __cinit__(self):
+        self.data = NULL
+        self.users = 0
+        self.buffer = None
+
+    def __dealloc__(self):
+        if self.buffer is None:
+            PyMem_Free(self.data)
 
 @cython.freelist(10)
 cdef class CList:
@@ -16,6 +33,12 @@ cdef class CList:
     cdef Py_ssize_t getCapacity(self):
         raise NotImplementedError()
 
+    def getMemoryUsage(self):
+        return self.getCapacity() * self.getElementSize()
+
+    def getContentHash(self):
+        return murmur3_32(<char*>self.getPointer(), self.getLength() * self.getElementSize(), 0)
+
     def repeated(self, *, Py_ssize_t length = -1, Py_ssize_t amount = -1, default = None):
         if length < 0 and amount < 0:
             raise ValueError("'length' or 'amount' has to be non-negative")
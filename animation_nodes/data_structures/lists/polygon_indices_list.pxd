@@ -11,6 +11,8 @@ cdef class PolygonIndicesList:
     cpdef append(self, value)
     cpdef extend(self, values)
     cpdef copy(self)
+    cpdef copyOnWrite(self)
+    cpdef makeUnique(self)
     cpdef index(self, value)
     cpdef count(self, value)
     cpdef remove(self, value)
@@ -94,6 +94,30 @@ cdef class PolygonIndicesList:
         for i in range(otherList.getLength()):
             self.polyStarts.data[oldLength + i] += oldIndicesLength
 
+    @classmethod
+    def fromLists(cls, UIntegerList indices, UIntegerList polyStarts, UIntegerList polyLengths):
+        '''The lists are used directly and are not copied.'''
+        if polyStarts.length != polyLengths.length:
+            raise ValueError("polyStarts and polyLengths must have the same length")
+        cdef PolygonIndicesList newList = PolygonIndicesList()
+        newList.indices = indices
+        newList.polyStarts = polyStarts
+        newList.polyLengths = polyLengths
+        return newList
+
+    @classmethod
+    def fromNumpyArrays(cls, indices, polyStarts, polyLengths, bint copy = True):
+        '''With copy = False the memory of the arrays is used when possible.'''
+        return cls.fromLists(UIntegerList.fromNumpyArray(indices, copy = copy),
+                             UIntegerList.fromNumpyArray(polyStarts, copy = copy),
+                             UIntegerList.fromNumpyArray(polyLengths, copy = copy))
+
+    def asNumpyArrays(self):
+        '''Returns (indices, polyStarts, polyLengths) arrays that share the memory with the list.'''
+        return (self.indices.asNumpyArray(),
+                self.polyStarts.asNumpyArray(),
+                self.polyLengths.asNumpyArray())
+
     cpdef copy(self):
         cdef PolygonIndicesList newList = PolygonIndicesList()
         newList.indices.overwrite(self.indices)
@@ -101,6 +125,16 @@ cdef class PolygonIndicesList:
         newList.polyLengths.overwrite(self.polyLengths)
         return newList
 
+    cpdef copyOnWrite(self):
+        return PolygonIndicesList.fromLists(self.indices.copyOnWrite(),
+                                            self.polyStarts.copyOnWrite(),
+                                            self.polyLengths.copyOnWrite())
+
+    cpdef makeUnique(self):
+        self.indices.makeUnique()
+        self.polyStarts.makeUnique()
+        self.polyLengths.makeUnique()
+
     cpdef index(self, value):
         cdef:
             UIntegerList _value = UIntegerList.fromValues(value)
@@ -153,6 +187,7 @@ cdef class PolygonIndicesList:
     cdef setElementAtIndex(self, long index, value):
         # value has to be valid at this point
         index = self.tryCorrectIndex(index)
+        self.makeUnique()
         if len(value) == self.polyLengths.data[index]:
             self.setElementAtIndex_SameLength(index, value)
         else:
@@ -187,6 +222,7 @@ cdef class PolygonIndicesList:
 
     cdef removeElementAtIndex(self, long index):
         index = self.tryCorrectIndex(index)
+        self.makeUnique()
         cdef:
             int polyStart = self.polyStarts.data[index]
             int polyLength = self.polyLengths.data[index]
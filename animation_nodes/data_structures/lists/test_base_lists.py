@@ -1,6 +1,6 @@
 from mathutils import Vector
 from unittest import TestCase
-from . base_lists import IntegerList, FloatList
+from . base_lists import IntegerList, FloatList, DoubleList, Vector3DList
 
 class TestInsertion(TestCase):
     def setUp(self):
@@ -96,6 +96,103 @@ class TestCopy(TestCase):
         self.assertEqual(len(a), 1)
         self.assertEqual(len(b), 0)
 
+class TestCopyOnWrite(TestCase):
+    def setUp(self):
+        self.list = IntegerList.fromValues((0, 1, 2, 3))
+
+    def testSharedUntilChanged(self):
+        b = self.list.copyOnWrite()
+        self.assertTrue(b.isShared())
+        self.assertEqual(b, [0, 1, 2, 3])
+
+    def testChangeCopy(self):
+        b = self.list.copyOnWrite()
+        b[0] = 10
+        b.append(4)
+        self.assertEqual(self.list, [0, 1, 2, 3])
+        self.assertEqual(b, [10, 1, 2, 3, 4])
+
+    def testChangeOriginal(self):
+        b = self.list.copyOnWrite()
+        self.list.append(4)
+        del self.list[0]
+        self.assertEqual(self.list, [1, 2, 3, 4])
+        self.assertEqual(b, [0, 1, 2, 3])
+
+    def testClearCopy(self):
+        b = self.list.copyOnWrite()
+        b.clear()
+        b.append(5)
+        self.assertEqual(self.list, [0, 1, 2, 3])
+        self.assertEqual(b, [5])
+
+    def testLastUserTakesMemory(self):
+        b = self.list.copyOnWrite()
+        del self.list
+        b.makeUnique()
+        self.assertFalse(b.isShared())
+        self.assertEqual(b, [0, 1, 2, 3])
+
+class TestNumpyArray(TestCase):
+    def testSharedMemory(self):
+        myList = FloatList.fromValues([0, 1, 2])
+        array = myList.asNumpyArray()
+        array[1] = 5
+        self.assertEqual(myList, [0, 5, 2])
+
+    def testShaped(self):
+        vectors = Vector3DList.fromValues([(0, 1, 2), (3, 4, 5)])
+        array = vectors.asNumpyArray(shaped = True)
+        self.assertEqual(array.shape, (2, 3))
+        self.assertEqual(array[1, 2], 5)
+
+    def testFromArrayWithoutCopy(self):
+        import numpy
+        array = numpy.array([[0, 1, 2], [3, 4, 5]], dtype = "float32")
+        vectors = Vector3DList.fromNumpyArray(array, copy = False)
+        array[0, 0] = 9
+        self.assertEqual(vectors[0], Vector((9, 1, 2)))
+        self.assertEqual(len(vectors), 2)
+
+    def testFromArrayWithCopy(self):
+        import numpy
+        array = numpy.array([0, 1, 2], dtype = "float32")
+        myList = FloatList.fromNumpyArray(array)
+        array[0] = 9
+        self.assertEqual(myList, [0, 1, 2])
+
+    def testFromStridedArray(self):
+        import numpy
+        array = numpy.array([0, 1, 2, 3, 4], dtype = "float32")
+        myList = FloatList.fromNumpyArray(array[::2], copy = False)
+        array[0] = 9
+        self.assertEqual(myList, [0, 2, 4])
+
+    def testRoundTripSharesMemory(self):
+        import numpy
+        array = numpy.array([0, 1, 2], dtype = "float64")
+        myList = DoubleList.fromNumpyArray(array, copy = False)
+        self.assertTrue(numpy.shares_memory(myList.asNumpyArray(), array))
+        myList[0] = 9
+        self.assertEqual(array[0], 9)
+
+    def testCopyOnWriteOfArrayList(self):
+        import numpy
+        array = numpy.array([0, 1, 2], dtype = "float64")
+        myList = DoubleList.fromNumpyArray(array, copy = False)
+        copy = myList.copyOnWrite()
+        copy[0] = 9
+        self.assertEqual(array[0], 0)
+        self.assertEqual(copy, [9, 1, 2])
+        self.assertTrue(numpy.shares_memory(myList.asNumpyArray(), array))
+
+    def testFromReadOnlyArray(self):
+        import numpy
+        array = numpy.array([0, 1, 2], dtype = "float32")
+        array.flags.writeable = False
+        self.assertEqual(FloatList.fromNumpyArray(array), [0, 1, 2])
+        self.assertEqual(FloatList.fromNumpyArray(array, copy = False), [0, 1, 2])
+
 class TestAppend(TestCase):
     def testEmptyList(self):
         a = IntegerList()
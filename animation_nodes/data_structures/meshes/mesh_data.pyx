@@ -80,6 +80,17 @@ cdef class Mesh:
     def topologyChanged(self):
         self.derivedMeshDataCache.pop("Linked Vertices", None)
 
+    def getTopologyHash(self):
+        '''
+        Changes when the vertex amount, edges, polygons or material indices change.
+        Meshes with the same hash differ only in vertex positions and loop attributes.
+        '''
+        return (self.vertices.length,
+                self.edges.length, self.edges.getContentHash(),
+                self.polygons.indices.length, self.polygons.indices.getContentHash(),
+                self.polygons.polyLengths.getContentHash(),
+                self.materialIndices.getContentHash())
+
     def getPolygonOrientationMatrices(self, normalized = True):
         normals = self.getPolygonNormals(normalized)
         tangents = self.getPolygonTangents(normalized)
@@ -179,6 +190,29 @@ cdef class Mesh:
         mesh.copyMeshProperties(self)
         return mesh
 
+    def copyOnWrite(self):
+        '''
+        Create a mesh that shares the memory of all lists with this mesh.
+        Lists are only copied when they are changed.
+        '''
+        mesh = Mesh(self.vertices.copyOnWrite(), self.edges.copyOnWrite(),
+                    self.polygons.copyOnWrite(), self.materialIndices.copyOnWrite(),
+                    skipValidation = True)
+        for ((meshProperty, _), (sourceMeshProperty, _)) in zip(
+                mesh.getMeshProperties(), self.getMeshProperties()):
+            for name, value in sourceMeshProperty.items():
+                meshProperty[name] = value.copyOnWrite()
+        return mesh
+
+    def makeUnique(self):
+        self.vertices.makeUnique()
+        self.edges.makeUnique()
+        self.polygons.makeUnique()
+        self.materialIndices.makeUnique()
+        for meshProperty, _ in self.getMeshProperties():
+            for value in meshProperty.values():
+                value.makeUnique()
+
     def copyMeshProperties(self, Mesh source):
         for ((meshProperty, _), (sourceMeshProperty, _)) in zip(
                 self.getMeshProperties(), source.getMeshProperties()):
@@ -0,0 +1,30 @@
+from unittest import TestCase
+from . mesh_data import Mesh
+from .. lists.polygon_indices_list import PolygonIndicesList
+from .. lists.base_lists import Vector3DList, EdgeIndicesList, LongList
+
+def createQuad():
+    vertices = Vector3DList.fromValues([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+    edges = EdgeIndicesList.fromValues([(0, 1), (1, 2), (2, 3), (3, 0)])
+    polygons = PolygonIndicesList.fromValues([(0, 1, 2, 3)])
+    return Mesh(vertices, edges, polygons, LongList.fromValues([0]))
+
+class TestTopologyHash(TestCase):
+    def testMovedVertices(self):
+        a = createQuad()
+        b = createQuad()
+        b.vertices.move((0, 0, 5))
+        self.assertEqual(a.getTopologyHash(), b.getTopologyHash())
+
+    def testChangedPolygon(self):
+        a = createQuad()
+        b = createQuad()
+        b.polygons.indices[0] = 2
+        b.polygons.indices[2] = 0
+        self.assertNotEqual(a.getTopologyHash(), b.getTopologyHash())
+
+    def testChangedMaterialIndex(self):
+        a = createQuad()
+        b = createQuad()
+        b.materialIndices[0] = 1
+        self.assertNotEqual(a.getTopologyHash(), b.getTopologyHash())
@@ -0,0 +1,13 @@
+from .. interpolation cimport Interpolation
+from .. lists.base_lists cimport DoubleList, LongList
+
+cdef class MIDINoteIndex:
+    cdef readonly LongList starts
+    cdef readonly DoubleList timeOns
+    cdef readonly DoubleList timeOffs
+    cdef readonly DoubleList maxTimeOffs
+
+    cdef double evaluateKey(self, long key, double time,
+                            double attackTime, Interpolation attackInterpolation,
+                            double releaseTime, Interpolation releaseInterpolation)
+    cdef Py_ssize_t findFirstNoteAfter(self, double time, Py_ssize_t start, Py_ssize_t end)
@@ -0,0 +1,116 @@
+from .. interpolation cimport Interpolation
+from .. lists.base_lists cimport DoubleList, LongList
+
+cdef long channelAmount = 16
+cdef long noteNumberAmount = 128
+
+cdef class MIDINoteIndex:
+    '''
+    Notes of a track sorted by channel, note number and start time.
+
+    The notes of a channel and note number are stored in one range of the
+    arrays. maxTimeOffs[i] is the largest end time of the notes in the range
+    up to and including i. When it is smaller than the evaluated time, none
+    of the notes before i can be active, so the search can stop there.
+    '''
+
+    def __cinit__(self, notes):
+        cdef Py_ssize_t i, start, end
+        cdef long key
+
+        validNotes = [note for note in notes
+            if 0 <= note.channel < channelAmount and 0 <= note.noteNumber < noteNumberAmount]
+        validNotes.sort(key = lambda note: (note.channel, note.noteNumber, note.timeOn))
+
+        self.starts = LongList(length = channelAmount * noteNumberAmount + 1)
+        self.timeOns = DoubleList(length = len(validNotes))
+        self.timeOffs = DoubleList(length = len(validNotes))
+        self.maxTimeOffs = DoubleList(length = len(validNotes))
+
+        self.starts.fill(0)
+        for i, note in enumerate(validNotes):
+            self.timeOns.data[i] = note.timeOn
+            self.timeOffs.data[i] = note.timeOff
+            self.starts.data[note.channel * noteNumberAmount + note.noteNumber + 1] += 1
+
+        for key in range(channelAmount * noteNumberAmount):
+            self.starts.data[key + 1] += self.starts.data[key]
+
+        for key in range(channelAmount * noteNumberAmount):
+            start, end = self.starts.data[key], self.starts.data[key + 1]
+            for i in range(start, end):
+                if i == start: self.maxTimeOffs.data[i] = self.timeOffs.data[i]
+                else: self.maxTimeOffs.data[i] = max(self.maxTimeOffs.data[i - 1], self.timeOffs.data[i])
+
+    def __len__(self):
+        return self.timeOns.length
+
+    def evaluate(self, double time, long channel, long noteNumber,
+                 double attackTime, Interpolation attackInterpolation not None,
+                 double releaseTime, Interpolation releaseInterpolation not None):
+        if not (0 <= channel < channelAmount and 0 <= noteNumber < noteNumberAmount):
+            return 0.0
+        return self.evaluateKey(channel * noteNumberAmount + noteNumber, time,
+            attackTime, attackInterpolation, releaseTime, releaseInterpolation)
+
+    def evaluateAll(self, double time, long channel,
+                    double attackTime, Interpolation attackInterpolation not None,
+                    double releaseTime, Interpolation releaseInterpolation not None):
+        cdef DoubleList values = DoubleList(length = noteNumberAmount)
+        cdef long i
+        if not (0 <= channel < channelAmount):
+            values.fill(0)
+            return values
+
+        for i in range(noteNumberAmount):
+            values.data[i] = self.evaluateKey(channel * noteNumberAmount + i, time,
+                attackTime, attackInterpolation, releaseTime, releaseInterpolation)
+        return values
+
+    cdef double evaluateKey(self, long key, double time,
+                            double attackTime, Interpolation attackInterpolation,
+                            double releaseTime, Interpolation releaseInterpolation):
+        cdef Py_ssize_t start = self.starts.data[key]
+        cdef Py_ssize_t end = self.findFirstNoteAfter(time, start, self.starts.data[key + 1])
+        cdef bint foundNote = False
+        cdef double result = 0
+        cdef double value
+        cdef Py_ssize_t i
+
+        for i in range(end - 1, start - 1, -1):
+            if self.maxTimeOffs.data[i] + releaseTime < time:
+                break
+            if self.timeOffs.data[i] + releaseTime >= time:
+                value = evaluateNote(self.timeOns.data[i], self.timeOffs.data[i], time,
+                    attackTime, attackInterpolation, releaseTime, releaseInterpolation)
+                result = value if not foundNote else max(result, value)
+                foundNote = True
+        return result
+
+    cdef Py_ssize_t findFirstNoteAfter(self, double time, Py_ssize_t start, Py_ssize_t end):
+        # binary search for the first note that starts after the time
+        cdef Py_ssize_t center
+        while start < end:
+            center = (start + end) // 2
+            if self.timeOns.data[center] <= time: start = center + 1
+            else: end = center
+        return start
+
+cdef double evaluateNote(double timeOn, double timeOff, double time,
+                         double attackTime, Interpolation attackInterpolation,
+                         double releaseTime, Interpolation releaseInterpolation):
+    # same as MIDINote.evaluate
+    cdef double peakTime = timeOn + attackTime
+    cdef double endTime = timeOff + releaseTime
+    if timeOff >= time >= peakTime:
+        return 1
+    elif peakTime > time >= timeOn:
+        if attackTime == 0: return 1
+        return attackInterpolation.evaluate(clamp((time - timeOn) / attackTime))
+    elif endTime >= time > timeOff:
+        if releaseTime == 0: return 1
+        return releaseInterpolation.evaluate(clamp(1 - (time - timeOff) / releaseTime))
+    return 0
+
+cdef inline double clamp(double x):
+    return min(max(x, 0), 1)
@@ -1,6 +1,7 @@
 from typing import List
 from . midi_note import MIDINote
 from dataclasses import dataclass, field
+from . midi_note_index import MIDINoteIndex
 
 @dataclass
 class MIDITrack:
@@ -8,24 +9,42 @@ class MIDITrack:
     index: int = 0
     notes: List[MIDINote] = field(default_factory = list)
 
+    # The index is built when the track is evaluated the first time. It is
+    # built again when the notes list is replaced or its length changed.
+    # Call clearNoteIndex after changing notes in place.
+    _noteIndex: MIDINoteIndex = field(default = None, init = False, repr = False, compare = False)
+    _indexedNotes: List[MIDINote] = field(default = None, init = False, repr = False, compare = False)
+    _indexedNoteAmount: int = field(default = 0, init = False, repr = False, compare = False)
+
     def evaluate(self, time, channel, noteNumber, attackTime, attackInterpolation, releaseTime, releaseInterpolation):
-        noteFilter = lambda note: note.channel == channel and note.noteNumber == noteNumber
-        timeFilter = lambda note: note.timeOff + releaseTime >= time >= note.timeOn
-        filteredNotes = filter(lambda note: noteFilter(note) and timeFilter(note), self.notes)
-        arguments = (time, attackTime, attackInterpolation, releaseTime, releaseInterpolation)
-        return max((note.evaluate(*arguments) for note in filteredNotes), default = 0)
+        return self.getNoteIndex().evaluate(time, channel, noteNumber,
+            attackTime, attackInterpolation, releaseTime, releaseInterpolation)
 
     def evaluateAll(self, time, channel, attackTime, attackInterpolation, releaseTime, releaseInterpolation):
-        channelFilter = lambda note: note.channel == channel
-        timeFilter = lambda note: note.timeOff + releaseTime >= time >= note.timeOn
-        filteredNotes = list(filter(lambda note: channelFilter(note) and timeFilter(note), self.notes))
-        arguments = (time, attackTime, attackInterpolation, releaseTime, releaseInterpolation)
-        noteValues = []
-        for i in range(128):
-            filteredByNumberNotes = filter(lambda note: note.noteNumber == i, filteredNotes)
-            value = max((note.evaluate(*arguments) for note in filteredByNumberNotes), default = 0)
-            noteValues.append(value)
-        return noteValues
+        return self.getNoteIndex().evaluateAll(time, channel,
+            attackTime, attackInterpolation, releaseTime, releaseInterpolation)
+
+    def getNoteIndex(self):
+        if not self.hasValidNoteIndex():
+            self._noteIndex = MIDINoteIndex(self.notes)
+            self._indexedNotes = self.notes
+            self._indexedNoteAmount = len(self.notes)
+        return self._noteIndex
+
+    def hasValidNoteIndex(self):
+        return (self._noteIndex is not None
+            and self._indexedNotes is self.notes
+            and self._indexedNoteAmount == len(self.notes))
+
+    def clearNoteIndex(self):
+        self._noteIndex = None
+        self._indexedNotes = None
 
     def copy(self):
-        return MIDITrack(self.name, self.index, [n.copy() for n in self.notes])
+        track = MIDITrack(self.name, self.index, [n.copy() for n in self.notes])
+        if self.hasValidNoteIndex():
+            # the index is never changed, so the copy can use the same one
+            track._noteIndex = self._noteIndex
+            track._indexedNotes = track.notes
+            track._indexedNoteAmount = len(track.notes)
+        return track
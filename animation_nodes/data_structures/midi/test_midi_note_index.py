@@ -0,0 +1,50 @@
+from unittest import TestCase
+from random import Random
+from . midi_note import MIDINote
+from . midi_track import MIDITrack
+from ... algorithms.interpolations import Linear, PowerOut
+
+def createRandomNotes(amount, seed):
+    random = Random(seed)
+    notes = []
+    for _ in range(amount):
+        timeOn = random.uniform(0, 10)
+        timeOff = timeOn + random.uniform(0, 2)
+        notes.append(MIDINote(random.randint(0, 2), random.randint(60, 64), timeOn, timeOff, 1))
+    return notes
+
+def evaluateNotes(notes, time, channel, noteNumber, *arguments):
+    values = [note.evaluate(time, *arguments) for note in notes
+              if note.channel == channel and note.noteNumber == noteNumber
+              and note.timeOff + arguments[2] >= time >= note.timeOn]
+    return max(values, default = 0)
+
+class TestEvaluate(TestCase):
+    def testEmpty(self):
+        track = MIDITrack()
+        self.assertEqual(track.evaluate(1, 0, 60, 0.1, Linear(), 0.1, Linear()), 0)
+        self.assertEqual(list(track.evaluateAll(1, 0, 0.1, Linear(), 0.1, Linear())), [0] * 128)
+
+    def testInvalidChannel(self):
+        track = MIDITrack(notes = [MIDINote(0, 60, 0, 1, 1)])
+        self.assertEqual(track.evaluate(0.5, 20, 60, 0, Linear(), 0, Linear()), 0)
+        self.assertEqual(list(track.evaluateAll(0.5, -1, 0, Linear(), 0, Linear())), [0] * 128)
+
+    def testSameAsNotes(self):
+        notes = createRandomNotes(300, seed = 1)
+        track = MIDITrack(notes = notes)
+        arguments = (0.3, Linear(), 0.5, PowerOut(2))
+        for i in range(200):
+            time = i * 0.06
+            for channel in range(3):
+                values = track.evaluateAll(time, channel, *arguments)
+                for noteNumber in range(59, 66):
+                    expected = evaluateNotes(notes, time, channel, noteNumber, *arguments)
+                    self.assertAlmostEqual(values[noteNumber], expected)
+                    self.assertAlmostEqual(track.evaluate(time, channel, noteNumber, *arguments), expected)
+
+    def testIndexUpdate(self):
+        track = MIDITrack(notes = [MIDINote(0, 60, 0, 1, 1)])
+        self.assertEqual(track.evaluate(2.5, 0, 60, 0, Linear(), 0, Linear()), 0)
+        track.notes.append(MIDINote(0, 60, 2, 3, 1))
+        self.assertEqual(track.evaluate(2.5, 0, 60, 0, Linear(), 0, Linear()), 1)
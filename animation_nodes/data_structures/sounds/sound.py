@@ -9,7 +9,9 @@ class Sound:
 
     def getSamplesInRange(self, start, end):
         if end <= start: raise ValueError("Invaild range!")
-        start, end = int(start * sampleRate), int(end * sampleRate)
+        return self.getSamplesInSampleRange(int(start * sampleRate), int(end * sampleRate))
+
+    def getSamplesInSampleRange(self, start, end):
         samples = numpy.zeros(end - start + 1)
 
         for sequence in self.soundSequences:
@@ -19,27 +21,54 @@ class Sound:
             
             sequenceStartOffset = int(sequence.startOffset * sampleRate)
             i, j = max(start, sequenceStart), min(end, sequenceEnd)
-            chunk = sequence.data.samples[i - sequenceStart + sequenceStartOffset:
-                                          j - sequenceStart + sequenceStartOffset] * sequence.volume
+            chunk = sequence.data.getSamples(i - sequenceStart + sequenceStartOffset,
+                                             j - sequenceStart + sequenceStartOffset) * sequence.volume
             samples[i - start:i - start + len(chunk)] += chunk
         return samples
 
     def computeSpectrum(self, start, end, beta = 6):
         samples = self.getSamplesInRange(start, end)
-        chunk = numpy.zeros(2**ceil(log(len(samples), 2)))
+        chunk = numpy.zeros(getFFTSize(len(samples)))
         chunk[:len(samples)] = samples * getCachedKaiser(len(samples), beta)
         return numpy.abs(numpy.fft.rfft(chunk)) / len(samples) * 2
 
     def computeTimeSmoothedSpectrum(self, start, end, attack, release, smoothingSamples = 5, beta = 6):
-        FFT = None
         duration = end - start
-        for i in range(smoothingSamples, -1, -1):
-            newFFT = self.computeSpectrum(start - i * duration, end - i * duration, beta = beta)
-            if FFT is None: FFT = newFFT
-            else:
-                factor = numpy.array((attack, release))[(newFFT < FFT).astype(int)]
-                FFT = FFT * factor + newFFT * (1 - factor)
-        return FFT
+        spectra = [self.computeSpectrum(start - i * duration, end - i * duration, beta = beta)
+                   for i in range(smoothingSamples, -1, -1)]
+        return smoothSpectra(spectra, attack, release)
+
+    def computeTimeSmoothedSpectrumAtFrame(self, frame, fps, duration, attack, release,
+                                           smoothingSamples = 5, beta = 6):
+        '''
+        Like computeTimeSmoothedSpectrum(frame / fps, frame / fps + duration, ...),
+        but the spectra of integer frames are looked up in a spectrogram.
+        The start sample of a window can differ by one from the computed one,
+        because it is derived from the integer frame and not from a rounded time.
+        '''
+        if not float(frame).is_integer():
+            return self.computeTimeSmoothedSpectrum(frame / fps, frame / fps + duration,
+                attack, release, smoothingSamples, beta)
+
+        from . spectrogram import getCachedSpectrogram
+        spectrogram = getCachedSpectrogram(self, fps, duration, beta)
+        return smoothSpectra(spectrogram.getSpectra(int(frame), smoothingSamples), attack, release)
+
+    def getCacheKey(self):
+        return tuple((id(sequence.data), sequence.start, sequence.startOffset,
+                      sequence.end, sequence.volume) for sequence in self.soundSequences)
+
+def smoothSpectra(spectra, attack, release):
+    FFT = None
+    for newFFT in spectra:
+        if FFT is None: FFT = newFFT
+        else:
+            factor = numpy.array((attack, release))[(newFFT < FFT).astype(int)]
+            FFT = FFT * factor + newFFT * (1 - factor)
+    return FFT
+
+def getFFTSize(length):
+    return 2**ceil(log(length, 2))
 
 @lru_cache(maxsize = 16)
 def getCachedKaiser(length, beta):
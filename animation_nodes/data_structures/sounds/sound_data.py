@@ -1,4 +1,201 @@
+import os
+import numpy
+import hashlib
+import tempfile
+import weakref
+import itertools
+from collections import OrderedDict
+
 class SoundData:
+    '''
+    Samples of a sound that are completely stored in memory.
+    '''
     def __init__(self, samples, sampleRate):
         self.samples = samples
         self.sampleRate = sampleRate
+
+    @property
+    def length(self):
+        return len(self.samples)
+
+    def getSamples(self, start, end):
+        return self.samples[start:end]
+
+class StreamedSoundData:
+    '''
+    Samples of a sound that are decoded in chunks when they are accessed.
+    The decoded chunks are stored in a cache with a limited size. Optionally
+    the whole sound is decoded once into a file that is memory mapped.
+
+    The aud sound has to be mono and have the given sample rate already.
+    Aud sounds are evaluated lazily, so limiting them only decodes the
+    requested part.
+    '''
+    def __init__(self, sound, sampleRate, sourcePath = None):
+        self.sound = sound
+        self.sampleRate = sampleRate
+        self.key = next(keyCounter)
+        self.sourcePath = sourcePath
+        self.decodedFile = None
+        self.decodedFileFailed = False
+        streamedSoundDatas.add(self)
+
+        self.length = sound.length
+        if self.length < 0:
+            # the length of some streams is only known after decoding
+            self.length = len(sound.data())
+
+    @property
+    def samples(self):
+        return self.getSamples(0, self.length)
+
+    def getSamples(self, start, end):
+        start = max(start, 0)
+        end = min(end, self.length)
+        if end <= start:
+            return numpy.zeros(0, dtype = numpy.float32)
+
+        decodedFile = self.getDecodedFile()
+        if decodedFile is not None:
+            return decodedFile[start:end]
+
+        firstChunk = start // chunkSize
+        lastChunk = (end - 1) // chunkSize
+        if firstChunk == lastChunk:
+            offset = firstChunk * chunkSize
+            return self.getChunk(firstChunk)[start - offset:end - offset]
+
+        chunks = [self.getChunk(i) for i in range(firstChunk, lastChunk + 1)]
+        offset = firstChunk * chunkSize
+        return numpy.concatenate(chunks)[start - offset:end - offset]
+
+    def getChunk(self, index):
+        key = (self.key, index)
+        chunk = chunkCache.get(key)
+        if chunk is None:
+            chunk = self.decodeChunk(index)
+            chunkCache.store(key, chunk)
+        return chunk
+
+    def decodeChunk(self, index):
+        start = index * chunkSize
+        amount = min(chunkSize, self.length - start)
+        # a resampler starts without history at the beginning of a limited sound,
+        # so a few samples before the chunk are decoded as well and dropped again
+        padding = min(start, chunkPadding)
+        samples = self.sound.limit((start - padding) / self.sampleRate,
+                                   (start + amount) / self.sampleRate).data().ravel()[padding:]
+
+        # limit works with seconds, so the amount can differ by a sample
+        chunk = numpy.zeros(amount, dtype = numpy.float32)
+        chunk[:min(amount, len(samples))] = samples[:amount]
+        return chunk
+
+    def getDecodedFile(self):
+        if self.decodedFile is not None:
+            return self.decodedFile
+        if not useDecodedFiles or self.sourcePath is None or self.decodedFileFailed:
+            return None
+        # memory maps cannot be empty
+        if self.length == 0:
+            return None
+
+        path = getDecodedFilePath(self.sourcePath, self.sampleRate)
+        if path is None:
+            return None
+
+        try:
+            if not os.path.exists(path):
+                self.writeDecodedFile(path)
+            if os.path.getsize(path) != self.length * 4:
+                raise OSError("decoded file has the wrong size: " + path)
+            self.decodedFile = numpy.memmap(path, dtype = numpy.float32, mode = "r")
+        except OSError:
+            # the chunks are decoded in memory instead
+            self.decodedFileFailed = True
+        return self.decodedFile
+
+    def writeDecodedFile(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        # other processes can decode the same sound at the same time
+        temporaryPath = "{}.{}.{}.tmp".format(path, os.getpid(), os.urandom(4).hex())
+        try:
+            with open(temporaryPath, "wb") as f:
+                for index in range((self.length + chunkSize - 1) // chunkSize):
+                    f.write(self.decodeChunk(index).tobytes())
+            os.replace(temporaryPath, path)
+        finally:
+            if os.path.exists(temporaryPath):
+                os.remove(temporaryPath)
+
+    def releaseDecodedFile(self):
+        self.decodedFile = None
+
+def releaseDecodedFiles():
+    for soundData in list(streamedSoundDatas):
+        soundData.releaseDecodedFile()
+
+def getDecodedFilePath(sourcePath, sampleRate):
+    try: stat = os.stat(sourcePath)
+    except OSError: return None
+    identifier = "{}|{}|{}|{}".format(sourcePath, stat.st_mtime, stat.st_size, sampleRate)
+    name = hashlib.sha1(identifier.encode()).hexdigest() + ".f32"
+    return os.path.join(getDecodedFileDirectory(), name)
+
+def getDecodedFileDirectory():
+    return os.path.join(tempfile.gettempdir(), "animation_nodes_sounds")
+
+def removeDecodedFiles():
+    directory = getDecodedFileDirectory()
+    if not os.path.isdir(directory):
+        return
+    for name in os.listdir(directory):
+        try: os.remove(os.path.join(directory, name))
+        except OSError: pass
+
+
+# Chunk Cache
+##########################################
+
+chunkSize = 2 ** 18
+chunkPadding = 2 ** 10
+keyCounter = itertools.count()
+streamedSoundDatas = weakref.WeakSet()
+
+class SampleChunkCache:
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.size = 0
+        self.budget = 256 * 1024 ** 2
+
+    def get(self, key):
+        chunk = self.entries.get(key)
+        if chunk is not None:
+            self.entries.move_to_end(key)
+        return chunk
+
+    def store(self, key, chunk):
+        if key in self.entries:
+            self.size -= self.entries.pop(key).nbytes
+        self.entries[key] = chunk
+        self.size += chunk.nbytes
+        self.removeOldEntries()
+
+    def removeOldEntries(self):
+        # the newest chunk is kept, even when it is larger than the budget
+        while self.size > self.budget and len(self.entries) > 1:
+            _, chunk = self.entries.popitem(last = False)
+            self.size -= chunk.nbytes
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+chunkCache = SampleChunkCache()
+useDecodedFiles = False
+
+def setSoundCacheSettings(cacheSize, decodedFiles):
+    global useDecodedFiles
+    chunkCache.budget = cacheSize * 1024 ** 2
+    chunkCache.removeOldEntries()
+    useDecodedFiles = decodedFiles
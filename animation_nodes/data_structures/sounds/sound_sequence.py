@@ -2,8 +2,9 @@ import os
 import bpy
 import aud
 from functools import lru_cache
-from . sound_data import SoundData
 from ... utils.scene import getFPS
+from ... utils.operators import makeOperator
+from . sound_data import StreamedSoundData, chunkCache, releaseDecodedFiles, removeDecodedFiles
 from ... utils.depsgraph import getEvaluatedID
 
 # We define a constant sampleRate to avoid expensive resampling during execution.
@@ -33,19 +34,34 @@ class SoundSequence:
         return cls(soundData, sequence.frame_final_start / fps, sequence.frame_offset_start / fps,
             sequence.frame_final_end / fps, sequence.volume, fps)
 
+# The sound data only decodes the samples that are accessed, so caching it is cheap.
 @lru_cache(maxsize=16)
 def getCachedSoundDataFromPath(path):
-    return getSoundData(aud.Sound.file(path))
+    return getSoundData(aud.Sound.file(path), sourcePath = path)
 
 @lru_cache(maxsize=16)
 def getCachedSoundDataFromSound(sound):
     return getSoundData(getEvaluatedID(sound).factory)
 
-def getSoundData(sound):
+def getSoundData(sound, sourcePath = None):
     if sound.specs[0] == sampleRate:
-        return SoundData(sound.rechannel(1).data().ravel(), sampleRate)
+        return StreamedSoundData(sound.rechannel(1), sampleRate, sourcePath)
     else:
-        return SoundData(sound.rechannel(1).resample(sampleRate, True).data().ravel(), sampleRate)
+        return StreamedSoundData(sound.rechannel(1).resample(sampleRate, True), sampleRate, sourcePath)
+
+@makeOperator("an.clear_sound_cache", "Clear Sound Cache",
+              description = "Remove the decoded sound samples from memory and disk")
+def clearSoundCache():
+    # spectrograms reference sound data and are keyed by its id
+    from . spectrogram import clearSpectrogramCache
+    clearSpectrogramCache()
+    getCachedSoundDataFromPath.cache_clear()
+    getCachedSoundDataFromSound.cache_clear()
+    chunkCache.clear()
+    # sound data can still be referenced elsewhere, but open memory maps
+    # have to be released before the files can be removed
+    releaseDecodedFiles()
+    removeDecodedFiles()
 
 def findSceneWithSequence(sequence):
     for scene in bpy.data.scenes:
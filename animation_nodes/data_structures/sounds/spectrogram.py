@@ -0,0 +1,124 @@
+import numpy
+from collections import OrderedDict
+from . sound_sequence import sampleRate
+from . sound import getFFTSize, getCachedKaiser
+
+# Spectrograms are stored by sound, fps, window duration and kaiser beta.
+# Computing the spectra takes a moment, but afterwards the spectrum of a
+# window is only a lookup. The computed spectra of all spectrograms together
+# never use more than maxSpectrogramCacheSize bytes. The least recently used
+# spectrogram is removed first.
+maxSpectrogramCacheSize = 256 * 1024 ** 2
+spectrogramCache = OrderedDict()
+
+# amount of frames whose windows are computed together when one of them is needed
+blockSize = 64
+
+def getCachedSpectrogram(sound, fps, duration, beta):
+    key = (sound.getCacheKey(), fps, duration, beta)
+    if key in spectrogramCache:
+        spectrogramCache.move_to_end(key)
+        return spectrogramCache[key]
+
+    spectrogram = Spectrogram(sound, fps, duration, beta)
+    spectrogramCache[key] = spectrogram
+    return spectrogram
+
+def clearSpectrogramCache():
+    spectrogramCache.clear()
+
+def getSpectrogramCacheSize():
+    return sum(spectrogram.size for spectrogram in spectrogramCache.values())
+
+def freeSpectrogramCache(usedSpectrogram):
+    # the spectrogram that is used right now is reduced last
+    cacheSize = getSpectrogramCacheSize()
+    for key, spectrogram in list(spectrogramCache.items()):
+        if cacheSize <= maxSpectrogramCacheSize:
+            return
+        if spectrogram is not usedSpectrogram:
+            cacheSize -= spectrogram.size
+            del spectrogramCache[key]
+
+    while cacheSize > maxSpectrogramCacheSize and len(usedSpectrogram.spectra) > 0:
+        cacheSize -= usedSpectrogram.removeOldestSpectrum()
+
+class Spectrogram:
+    '''
+    Contains the spectra of the windows that are smoothed for a frame.
+    The window (frame, step) starts step window durations before the frame.
+    When the duration is a whole number of frames, the key of a window is
+    reduced to (frame - step * framesPerWindow, 0), so that frames share
+    their windows. Spectra are always looked up by these integer keys.
+    '''
+    def __init__(self, sound, fps, duration, beta):
+        self.sound = sound
+        self.fps = fps
+        self.duration = duration
+        self.beta = beta
+        self.framesPerWindow = getWholeFrameAmount(duration * fps)
+        self.spectra = OrderedDict()
+        self.size = 0
+
+    def getSpectra(self, frame, steps):
+        '''
+        The spectra of the windows of an integer frame, the earliest window first.
+        '''
+        keys = [self.getKey(frame, step) for step in range(steps, -1, -1)]
+        missingKeys = [key for key in keys if key not in self.spectra]
+        if len(missingKeys) > 0:
+            self.computeSpectra(frame, steps)
+
+        spectra = []
+        for key in keys:
+            self.spectra.move_to_end(key)
+            spectra.append(self.spectra[key])
+        freeSpectrogramCache(self)
+        return spectra
+
+    def getKey(self, frame, step):
+        if self.framesPerWindow is None:
+            return (frame, step)
+        return (frame - step * self.framesPerWindow, 0)
+
+    def getWindowSampleRange(self, key):
+        frame, step = key
+        start = frame / self.fps - step * self.duration
+        return int(start * sampleRate), int((start + self.duration) * sampleRate)
+
+    def computeSpectra(self, frame, steps):
+        # the windows of the following frames are computed in the same batch
+        keys = {self.getKey(blockFrame, step)
+                for blockFrame in range(frame, frame + blockSize)
+                for step in range(steps + 1)}
+        keys = sorted(key for key in keys if key not in self.spectra)
+
+        ranges = numpy.array([self.getWindowSampleRange(key) for key in keys], dtype = numpy.int64)
+        startSamples, endSamples = ranges[:, 0], ranges[:, 1]
+        firstSample = int(startSamples.min())
+        samples = self.sound.getSamplesInSampleRange(firstSample, int(endSamples.max()))
+        lengths = endSamples - startSamples + 1
+
+        for length in numpy.unique(lengths):
+            length = int(length)
+            rows = numpy.flatnonzero(lengths == length)
+            indices = (startSamples[rows] - firstSample)[:, None] + numpy.arange(length)
+            windowSamples = samples[indices]
+            # Sound.getSamplesInRange never fills the last sample of the range
+            windowSamples[:, -1] = 0
+            windowSamples *= getCachedKaiser(length, self.beta)
+            batchSpectra = numpy.abs(numpy.fft.rfft(windowSamples, n = getFFTSize(length), axis = 1)) / length * 2
+            for row, spectrum in zip(rows, batchSpectra):
+                self.spectra[keys[row]] = spectrum
+                self.size += spectrum.nbytes
+
+    def removeOldestSpectrum(self):
+        _, spectrum = self.spectra.popitem(last = False)
+        self.size -= spectrum.nbytes
+        return spectrum.nbytes
+
+def getWholeFrameAmount(frames):
+    amount = round(frames)
+    if amount >= 1 and abs(frames - amount) < 1e-6:
+        return amount
+    return None
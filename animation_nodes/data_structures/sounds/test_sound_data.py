@@ -0,0 +1,32 @@
+import aud
+import numpy
+from unittest import TestCase
+from . import sound_data
+from . sound_data import StreamedSoundData, chunkCache
+
+class TestStreamedSoundData(TestCase):
+    def setUp(self):
+        self.oldChunkSize = sound_data.chunkSize
+        sound_data.chunkSize = 2 ** 12
+        chunkCache.clear()
+
+    def tearDown(self):
+        sound_data.chunkSize = self.oldChunkSize
+        chunkCache.clear()
+
+    def testResampledChunksAreContinuous(self):
+        sound = aud.Sound.sine(440, 48000).limit(0, 0.5).resample(44100, True)
+        data = StreamedSoundData(sound, 44100)
+        expected = sound.data().ravel()
+        self.assertEqual(data.length, len(expected))
+
+        # compare more than one chunk with the sound decoded at once
+        samples = data.getSamples(0, sound_data.chunkSize * 4)
+        numpy.testing.assert_allclose(samples, expected[:len(samples)], atol = 1e-4)
+
+    def testRangeAcrossChunkBorder(self):
+        sound = aud.Sound.sine(440, 44100).limit(0, 0.5)
+        data = StreamedSoundData(sound, 44100)
+        start = sound_data.chunkSize - 10
+        samples = data.getSamples(start, start + 20)
+        numpy.testing.assert_allclose(samples, sound.data().ravel()[start:start + 20], atol = 1e-4)
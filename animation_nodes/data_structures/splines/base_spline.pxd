@@ -85,3 +85,7 @@ cdef class Spline:
     #############################################
 
     cdef Spline getTrimmedCopy_LowLevel(self, float start, float end)
+
+
+cdef void calculateNormalsForTangents_LowLevel(Vector3 *tangents, Vector3 *normals,
+                                               Py_ssize_t amount, bint cyclic)
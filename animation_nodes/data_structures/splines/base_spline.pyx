@@ -537,23 +537,23 @@ cdef evaluateFunction_Array(Spline spline, EvaluateFunction evaluate,
 ######################################################
 
 def calculateNormalsForTangents(Vector3DList tangents not None, bint cyclic = False):
-    if tangents.length == 0:
-        return Vector3DList()
-
     cdef Vector3DList normals = Vector3DList(length = tangents.length)
-    cdef Vector3 *_normals = normals.data
-    cdef Vector3 *_tangents = tangents.data
+    calculateNormalsForTangents_LowLevel(tangents.data, normals.data, tangents.length, cyclic)
+    return normals
 
-    setInitialNormal(_tangents + 0, _normals + 0)
+cdef void calculateNormalsForTangents_LowLevel(Vector3 *tangents, Vector3 *normals,
+                                               Py_ssize_t amount, bint cyclic):
+    if amount == 0:
+        return
+
+    setInitialNormal(tangents + 0, normals + 0)
 
     cdef Py_ssize_t i
-    for i in range(1, tangents.length):
-        calcNextNormal(_normals + i, _normals + i - 1, _tangents + i - 1, _tangents + i)
+    for i in range(1, amount):
+        calcNextNormal(normals + i, normals + i - 1, tangents + i - 1, tangents + i)
 
     if cyclic:
-        makeNormalsCyclic(tangents, normals)
-
-    return normals
+        makeNormalsCyclic(tangents, normals, amount)
 
 cdef void setInitialNormal(Vector3 *tangent, Vector3 *target):
     cdef Vector3 upVector = Vector3(0, 0, 1)
@@ -576,33 +576,34 @@ cdef void calcNextNormal(Vector3 *target, Vector3 *lastNormal, Vector3 *lastTang
     rotateAroundAxisVec3(&newNormal, lastNormal, &axis, angle)
     projectOnCenterPlaneVec3(target, &newNormal, currentTangent)
 
-cdef makeNormalsCyclic(Vector3DList tangents, Vector3DList normals):
-    cdef Vector3 *firstNormal = normals.data + 0
+cdef void makeNormalsCyclic(Vector3 *tangents, Vector3 *normals, Py_ssize_t amount):
+    cdef Vector3 *firstNormal = normals + 0
     cdef Vector3 lastNormal
-    calcNextNormal(&lastNormal, normals.data + normals.length - 1, tangents.data + tangents.length - 1, tangents.data + 0)
+    calcNextNormal(&lastNormal, normals + amount - 1, tangents + amount - 1, tangents + 0)
 
     cdef float angle = angleVec3(firstNormal, &lastNormal)
 
     cdef Vector3 cross
     crossVec3(&cross, firstNormal, &lastNormal)
-    if dotVec3(&cross, tangents.data + 0) <= 0:
+    if dotVec3(&cross, tangents + 0) <= 0:
         angle = -angle
 
-    applyRotationGradient(tangents, normals, -angle)
+    applyRotationGradient(tangents, normals, amount, -angle)
 
-cdef applyRotationGradient(Vector3DList tangents, Vector3DList normals, float fullAngle):
+cdef void applyRotationGradient(Vector3 *tangents, Vector3 *normals,
+                                Py_ssize_t amount, float fullAngle):
     cdef Py_ssize_t i
     cdef Vector3 normal
     cdef float angle
     cdef float remainingRotation = fullAngle
     cdef float doneRotation = 0
 
-    for i in range(1, normals.length):
-        if angleVec3(tangents.data + i, tangents.data + i - 1) < 0.001:
-            rotateAroundAxisVec3(normals.data + i, &normal, tangents.data + i, doneRotation)
+    for i in range(1, amount):
+        if angleVec3(tangents + i, tangents + i - 1) < 0.001:
+            rotateAroundAxisVec3(normals + i, &normal, tangents + i, doneRotation)
         else:
-            angle = remainingRotation / (normals.length - i)
-            normal = normals.data[i]
-            rotateAroundAxisVec3(normals.data + i, &normal, tangents.data + i, angle + doneRotation)
+            angle = remainingRotation / (amount - i)
+            normal = normals[i]
+            rotateAroundAxisVec3(normals + i, &normal, tangents + i, angle + doneRotation)
             remainingRotation -= angle
             doneRotation += angle
@@ -10,3 +10,8 @@ cdef class BezierSpline(Spline):
         public FloatList radii
         public FloatList tilts
         Vector3DList normalsCache
+
+cdef void evaluateBezierSegment_Point(Vector3 *result, float t, Vector3 **w)
+cdef void evaluateBezierSegment_Tangent(Vector3 *result, float t, Vector3 **w)
+cdef void evaluateBezierSegment_Normal(Vector3 *result, float t, Vector3 **w)
+cdef float evaluateBezierSegment_Curvature(float t, Vector3 **w)
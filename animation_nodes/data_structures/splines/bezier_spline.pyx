@@ -469,7 +469,7 @@ cdef inline void getSegmentIndex(BezierSpline spline, float parameter, Py_ssize_
 cdef inline int getSegmentAmount(BezierSpline spline):
     return spline.points.length - 1 + spline.cyclic
 
-cdef inline void evaluateBezierSegment_Point(Vector3 *result, float t, Vector3 **w):
+cdef void evaluateBezierSegment_Point(Vector3 *result, float t, Vector3 **w):
     cdef:
         float t2 = t * t
         float t3 = t2 * t
@@ -482,7 +482,7 @@ cdef inline void evaluateBezierSegment_Point(Vector3 *result, float t, Vector3 *
     result.y = w[0].y*mt3 + w[1].y*coeff1 + w[2].y*coeff2 + w[3].y*t3
     result.z = w[0].z*mt3 + w[1].z*coeff1 + w[2].z*coeff2 + w[3].z*t3
 
-cdef inline void evaluateBezierSegment_Tangent(Vector3 *result, float t, Vector3 **w):
+cdef void evaluateBezierSegment_Tangent(Vector3 *result, float t, Vector3 **w):
     cdef:
         float t2 = t * t
         float coeff0 = -3 +  6 * t - 3 * t2
@@ -493,13 +493,13 @@ cdef inline void evaluateBezierSegment_Tangent(Vector3 *result, float t, Vector3
     result.y = w[0].y*coeff0 + w[1].y*coeff1 + w[2].y*coeff2 + w[3].y*coeff3
     result.z = w[0].z*coeff0 + w[1].z*coeff1 + w[2].z*coeff2 + w[3].z*coeff3
 
-cdef inline void evaluateBezierSegment_Normal(Vector3 *result, float t, Vector3 **w):
+cdef void evaluateBezierSegment_Normal(Vector3 *result, float t, Vector3 **w):
     result.x = 6 * (1 - t) * (w[2].x - 2 * w[1].x + w[0].x) + 6 * t * (w[3].x - 2 * w[2].x + w[1].x)
     result.y = 6 * (1 - t) * (w[2].y - 2 * w[1].y + w[0].y) + 6 * t * (w[3].y - 2 * w[2].y + w[1].y)
     result.z = 6 * (1 - t) * (w[2].z - 2 * w[1].z + w[0].z) + 6 * t * (w[3].z - 2 * w[2].z + w[1].z)
 
 @cython.cdivision(True)
-cdef inline float evaluateBezierSegment_Curvature(float t, Vector3 **w):
+cdef float evaluateBezierSegment_Curvature(float t, Vector3 **w):
     cdef Vector3 tangent
     evaluateBezierSegment_Tangent(&tangent, t, w)
     cdef Vector3 normal
@@ -8,3 +8,6 @@ cdef class PolySpline(Spline):
         public FloatList radii
         public FloatList tilts
         Vector3DList normalsCache
+
+cdef void calcUniformParameters_LowLevel(Vector3 *points, Py_ssize_t pointAmount, bint cyclic,
+                                         Py_ssize_t amount, float *parameters)
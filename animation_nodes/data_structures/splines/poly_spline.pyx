@@ -213,54 +213,58 @@ cdef class PolySpline(Spline):
         findListSegment_LowLevel(self.points.length, self.cyclic, parameter, indices, &t)
         return self.radii.data[indices[0]] * (1 - t) + self.radii.data[indices[1]] * t
 
-    @cython.cdivision(True)
     def getUniformParameters(self, Py_ssize_t amount):
-        cdef:
-            Py_ssize_t i
-            Vector3* _points = self.points.data
-            Py_ssize_t pointAmount = self.points.length
-
-        if amount <= 1 or pointAmount <= 1:
-            return FloatList.fromValue(0, length = amount)
-
-        cdef FloatList distances = FloatList(length = pointAmount - 1 + int(self.cyclic))
-        for i in range(pointAmount - 1):
-            distances.data[i] = distanceVec3(_points + i, _points + i + 1)
-        if self.cyclic:
-            distances.data[pointAmount - 1] = distanceVec3(_points + pointAmount - 1, _points)
-
-        cdef float totalLength = distances.getSumOfElements()
-        if totalLength < 0.001: # <- necessary to remove the risk of running
-                                #    into endless loops or division by 0
-            return FloatList.fromValue(0, length = amount)
-
-        cdef:
-            # Safe Division: amount > 1
-            float stepSize = totalLength / (amount - 1)
-            float factor = 1 / <float>distances.length
-            float missingDistance = stepSize
-            float residualDistance
-            Py_ssize_t currentIndex = 1
-            FloatList parameters = FloatList(length = max(0, amount))
-
-        for i in range(distances.length):
-            residualDistance = distances.data[i]
-            while residualDistance > missingDistance and currentIndex < amount:
-                residualDistance -= missingDistance
-                # Safe Division: distances.data[i] > 0
-                parameters.data[currentIndex] = (i + 1 - residualDistance / distances.data[i]) * factor
-                missingDistance = stepSize
-                currentIndex += 1
-            missingDistance -= residualDistance
-
-        parameters.data[0] = 0
-        # It can happen that more than one element is 1 due to float inaccuracy
-        for i in range(currentIndex, amount):
-            parameters.data[i] = 1
-
+        cdef FloatList parameters = FloatList(length = max(0, amount))
+        calcUniformParameters_LowLevel(self.points.data, self.points.length, self.cyclic,
+                                       parameters.length, parameters.data)
         return parameters
 
 
+@cython.cdivision(True)
+cdef void calcUniformParameters_LowLevel(Vector3 *points, Py_ssize_t pointAmount, bint cyclic,
+                                         Py_ssize_t amount, float *parameters):
+    cdef Py_ssize_t i
+    cdef Py_ssize_t segmentAmount = pointAmount - 1 + cyclic
+
+    if amount <= 1 or pointAmount <= 1:
+        for i in range(amount):
+            parameters[i] = 0
+        return
+
+    cdef float totalLength = 0
+    for i in range(segmentAmount):
+        totalLength += distanceVec3(points + i, points + (i + 1) % pointAmount)
+
+    if totalLength < 0.001: # <- necessary to remove the risk of running
+                            #    into endless loops or division by 0
+        for i in range(amount):
+            parameters[i] = 0
+        return
+
+    cdef:
+        # Safe Division: amount > 1
+        float stepSize = totalLength / (amount - 1)
+        float factor = 1 / <float>segmentAmount
+        float missingDistance = stepSize
+        float residualDistance, distance
+        Py_ssize_t currentIndex = 1
+
+    for i in range(segmentAmount):
+        distance = distanceVec3(points + i, points + (i + 1) % pointAmount)
+        residualDistance = distance
+        while residualDistance > missingDistance and currentIndex < amount:
+            residualDistance -= missingDistance
+            # Safe Division: distance > 0
+            parameters[currentIndex] = (i + 1 - residualDistance / distance) * factor
+            missingDistance = stepSize
+            currentIndex += 1
+        missingDistance -= residualDistance
+
+    parameters[0] = 0
+    # It can happen that more than one element is 1 due to float inaccuracy
+    for i in range(currentIndex, amount):
+        parameters[i] = 1
+
 cdef inline int getSegmentAmount(PolySpline spline):
     return spline.points.length - 1 + spline.cyclic
 
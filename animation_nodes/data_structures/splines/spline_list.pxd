@@ -0,0 +1,43 @@
+from ... math cimport Vector3, Matrix4
+from .. lists.base_lists cimport FloatList, LongList, BooleanList, Vector3DList
+
+cdef struct SplineView:
+    bint cyclic
+    bint isBezier
+    Py_ssize_t pointAmount
+    Vector3 *points
+    Vector3 *leftHandles
+    Vector3 *rightHandles
+    float *radii
+    float *tilts
+    Vector3 *normals
+    Py_ssize_t uniformAmount
+    float *uniformParameters
+
+cdef class SplineList:
+    cdef:
+        readonly Vector3DList points
+        readonly Vector3DList leftHandles
+        readonly Vector3DList rightHandles
+        readonly FloatList radii
+        readonly FloatList tilts
+        readonly LongList pointStarts
+        readonly BooleanList cyclics
+        readonly BooleanList bezierFlags
+        readonly LongList materialIndices
+
+        LongList normalStarts
+        Vector3DList normalsCache
+        LongList uniformStarts
+        FloatList uniformParameters
+        Py_ssize_t uniformResolution
+
+    cpdef void markChanged(self)
+    cpdef bint isEvaluable(self)
+    cdef bint isSplineEvaluable(self, Py_ssize_t index)
+    cdef void getSplineView(self, Py_ssize_t index, SplineView *view)
+
+    cdef checkUniformConverter(self)
+    cpdef ensureUniformConverter(self, Py_ssize_t minResolution)
+    cdef checkNormals(self)
+    cpdef ensureNormals(self)
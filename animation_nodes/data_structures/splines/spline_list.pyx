@@ -0,0 +1,609 @@
+cimport cython
+from libc.string cimport memcpy, memset
+from ... utils.lists cimport findListSegment_LowLevel
+from ... math cimport (
+    mixVec3, subVec3, crossVec3, normalizeVec3_InPlace,
+    rotateAroundAxisVec3, projectOnCenterPlaneVec3,
+    scaleMatrix3x3Part, matrixFromNormalizedAxisData
+)
+from .. lists.base_lists cimport Matrix4x4List
+from . base_spline cimport Spline, calculateNormalsForTangents_LowLevel
+from . poly_spline cimport PolySpline, calcUniformParameters_LowLevel
+from . bezier_spline cimport (
+    BezierSpline,
+    evaluateBezierSegment_Point,
+    evaluateBezierSegment_Tangent,
+    evaluateBezierSegment_Curvature
+)
+
+# same as in bezier_spline.pyx
+cdef Py_ssize_t bezierNormalsResolution = 5
+
+ctypedef void (*EvaluateVector)(SplineView*, float, Vector3*)
+ctypedef void (*EvaluateMatrix)(SplineView*, float, Matrix4*)
+ctypedef float (*EvaluateFloat)(SplineView*, float)
+
+ctypedef fused EvaluateFunction:
+    EvaluateVector
+    EvaluateFloat
+    EvaluateMatrix
+
+cdef class SplineList:
+    '''
+    Stores many poly and bezier splines in a few packed lists so that all
+    of them can be evaluated in one pass. The points of the i-th spline are
+    stored from pointStarts[i] to pointStarts[i + 1]. The handles of poly
+    splines are equal to their points.
+
+    The evaluation functions return the samples of all splines one after
+    another. Splines that are not evaluable get zeros.
+    '''
+
+    def __cinit__(self):
+        self.points = Vector3DList()
+        self.leftHandles = Vector3DList()
+        self.rightHandles = Vector3DList()
+        self.radii = FloatList()
+        self.tilts = FloatList()
+        self.pointStarts = LongList.fromValue(0, length = 1)
+        self.cyclics = BooleanList()
+        self.bezierFlags = BooleanList()
+        self.materialIndices = LongList()
+        self.markChanged()
+
+    @classmethod
+    def fromSplines(cls, splines):
+        cdef Py_ssize_t splineAmount = len(splines)
+        cdef LongList pointStarts = LongList(length = splineAmount + 1)
+        cdef Py_ssize_t i
+
+        pointStarts.data[0] = 0
+        for i, spline in enumerate(splines):
+            if not isinstance(spline, (PolySpline, BezierSpline)):
+                raise TypeError("expected a list of poly or bezier splines")
+            pointStarts.data[i + 1] = pointStarts.data[i] + len(spline.points)
+
+        cdef SplineList splineList = SplineList()
+        cdef Py_ssize_t totalPointAmount = pointStarts.data[splineAmount]
+        splineList.points = Vector3DList(length = totalPointAmount)
+        splineList.leftHandles = Vector3DList(length = totalPointAmount)
+        splineList.rightHandles = Vector3DList(length = totalPointAmount)
+        splineList.radii = FloatList(length = totalPointAmount)
+        splineList.tilts = FloatList(length = totalPointAmount)
+        splineList.pointStarts = pointStarts
+        splineList.cyclics = BooleanList(length = splineAmount)
+        splineList.bezierFlags = BooleanList(length = splineAmount)
+        splineList.materialIndices = LongList(length = splineAmount)
+
+        cdef Py_ssize_t start, amount
+        cdef PolySpline polySpline
+        cdef BezierSpline bezierSpline
+        for i, spline in enumerate(splines):
+            start = pointStarts.data[i]
+            amount = pointStarts.data[i + 1] - start
+            splineList.cyclics.data[i] = spline.cyclic
+            splineList.materialIndices.data[i] = spline.materialIndex
+
+            if isinstance(spline, PolySpline):
+                polySpline = spline
+                splineList.bezierFlags.data[i] = False
+                copyVectors(splineList.points, start, polySpline.points, amount)
+                copyVectors(splineList.leftHandles, start, polySpline.points, amount)
+                copyVectors(splineList.rightHandles, start, polySpline.points, amount)
+                copyFloats(splineList.radii, start, polySpline.radii, amount)
+                copyFloats(splineList.tilts, start, polySpline.tilts, amount)
+            else:
+                bezierSpline = spline
+                splineList.bezierFlags.data[i] = True
+                copyVectors(splineList.points, start, bezierSpline.points, amount)
+                copyVectors(splineList.leftHandles, start, bezierSpline.leftHandles, amount)
+                copyVectors(splineList.rightHandles, start, bezierSpline.rightHandles, amount)
+                copyFloats(splineList.radii, start, bezierSpline.radii, amount)
+                copyFloats(splineList.tilts, start, bezierSpline.tilts, amount)
+
+        return splineList
+
+    def getSplines(self):
+        cdef Py_ssize_t i, start, end
+        splines = []
+        for i in range(len(self)):
+            start = self.pointStarts.data[i]
+            end = self.pointStarts.data[i + 1]
+            if self.bezierFlags.data[i]:
+                spline = BezierSpline(self.points[start:end],
+                                      self.leftHandles[start:end],
+                                      self.rightHandles[start:end],
+                                      self.radii[start:end],
+                                      self.tilts[start:end],
+                                      self.cyclics.data[i],
+                                      self.materialIndices.data[i])
+            else:
+                spline = PolySpline(self.points[start:end],
+                                    self.radii[start:end],
+                                    self.tilts[start:end],
+                                    self.cyclics.data[i],
+                                    self.materialIndices.data[i])
+            splines.append(spline)
+        return splines
+
+    def __len__(self):
+        return self.cyclics.length
+
+    def __repr__(self):
+        return "<SplineList with {} splines and {} points>".format(len(self), self.points.length)
+
+    cpdef void markChanged(self):
+        self.normalStarts = None
+        self.normalsCache = None
+        self.uniformStarts = None
+        self.uniformParameters = None
+        self.uniformResolution = -1
+
+
+    # Evaluability
+    #############################################
+
+    cpdef bint isEvaluable(self):
+        cdef Py_ssize_t i
+        for i in range(len(self)):
+            if not self.isSplineEvaluable(i):
+                return False
+        return True
+
+    cdef bint isSplineEvaluable(self, Py_ssize_t index):
+        return self.pointStarts.data[index + 1] - self.pointStarts.data[index] >= 2
+
+    cdef void getSplineView(self, Py_ssize_t index, SplineView *view):
+        cdef Py_ssize_t start = self.pointStarts.data[index]
+        view.cyclic = self.cyclics.data[index]
+        view.isBezier = self.bezierFlags.data[index]
+        view.pointAmount = self.pointStarts.data[index + 1] - start
+        view.points = self.points.data + start
+        view.leftHandles = self.leftHandles.data + start
+        view.rightHandles = self.rightHandles.data + start
+        view.radii = self.radii.data + start
+        view.tilts = self.tilts.data + start
+
+        if self.normalsCache is None:
+            view.normals = NULL
+        else:
+            view.normals = self.normalsCache.data + self.normalStarts.data[index]
+
+        if self.uniformParameters is None:
+            view.uniformAmount = 0
+            view.uniformParameters = NULL
+        else:
+            start = self.uniformStarts.data[index]
+            view.uniformAmount = self.uniformStarts.data[index + 1] - start
+            view.uniformParameters = self.uniformParameters.data + start
+
+
+    # Uniform Conversion
+    #############################################
+
+    cdef checkUniformConverter(self):
+        if self.uniformParameters is None:
+            raise Exception("cannot evaluate uniform parameters, call splineList.ensureUniformConverter(resolution) first")
+
+    cpdef ensureUniformConverter(self, Py_ssize_t minResolution):
+        minResolution = max(0, minResolution)
+        if self.uniformParameters is not None and self.uniformResolution >= minResolution:
+            return
+
+        cdef Py_ssize_t i, pointAmount, amount
+        cdef Py_ssize_t splineAmount = len(self)
+        cdef Py_ssize_t maxBezierResolution = 0
+        cdef LongList uniformStarts = LongList(length = splineAmount + 1)
+
+        uniformStarts.data[0] = 0
+        for i in range(splineAmount):
+            pointAmount = self.pointStarts.data[i + 1] - self.pointStarts.data[i]
+            amount = pointAmount + max(pointAmount - 1, 0) * minResolution
+            uniformStarts.data[i + 1] = uniformStarts.data[i] + amount
+            if self.bezierFlags.data[i]:
+                maxBezierResolution = max(maxBezierResolution, amount)
+
+        cdef FloatList uniformParameters = FloatList(length = uniformStarts.data[splineAmount])
+        cdef Vector3DList samples = Vector3DList(length = maxBezierResolution)
+        cdef float *target
+        cdef SplineView view
+
+        for i in range(splineAmount):
+            self.getSplineView(i, &view)
+            amount = uniformStarts.data[i + 1] - uniformStarts.data[i]
+            target = uniformParameters.data + uniformStarts.data[i]
+            if view.isBezier:
+                # same as converting the spline to a poly spline with the resolution first
+                if self.isSplineEvaluable(i):
+                    evaluateDistributed_Single(&view, amount, evaluatePoint, 0, 1, False, samples.data, 0)
+                    calcUniformParameters_LowLevel(samples.data, amount, False, amount, target)
+                else:
+                    memset(target, 0, amount * sizeof(float))
+            else:
+                calcUniformParameters_LowLevel(view.points, view.pointAmount, view.cyclic, amount, target)
+
+        self.uniformStarts = uniformStarts
+        self.uniformParameters = uniformParameters
+        self.uniformResolution = minResolution
+
+    def toUniformParameters(self, FloatList parameters):
+        self.checkUniformConverter()
+        if not parameters.allValuesInRange(0, 1):
+            raise Exception("parameters have to be between 0 and 1")
+
+        cdef FloatList result = FloatList(length = len(self) * parameters.length)
+        cdef Py_ssize_t i, j
+        cdef SplineView view
+        cdef float *target
+
+        for i in range(len(self)):
+            target = result.data + i * parameters.length
+            if not self.isSplineEvaluable(i):
+                memset(target, 0, parameters.length * sizeof(float))
+                continue
+            self.getSplineView(i, &view)
+            for j in range(parameters.length):
+                target[j] = toUniformParameter(&view, parameters.data[j])
+        return result
+
+
+    # Normals
+    #############################################
+
+    cdef checkNormals(self):
+        if self.normalsCache is None:
+            raise Exception("normals are not available yet, please call splineList.ensureNormals() first")
+
+    cpdef ensureNormals(self):
+        if self.normalsCache is not None:
+            return
+
+        cdef Py_ssize_t i, j, k, segmentAmount, amount
+        cdef Py_ssize_t splineAmount = len(self)
+        cdef LongList normalStarts = LongList(length = splineAmount + 1)
+
+        normalStarts.data[0] = 0
+        for i in range(splineAmount):
+            amount = 0
+            if self.isSplineEvaluable(i):
+                amount = self.pointStarts.data[i + 1] - self.pointStarts.data[i] - 1 + self.cyclics.data[i]
+                if self.bezierFlags.data[i]:
+                    amount *= bezierNormalsResolution
+            normalStarts.data[i + 1] = normalStarts.data[i] + amount
+
+        cdef Vector3DList tangents = Vector3DList(length = normalStarts.data[splineAmount])
+        cdef Vector3DList normals = Vector3DList(length = normalStarts.data[splineAmount])
+        cdef Vector3 *_tangents
+        cdef Vector3 *w[4]
+        cdef long indices[2]
+        cdef SplineView view
+
+        for i in range(splineAmount):
+            if not self.isSplineEvaluable(i):
+                continue
+            self.getSplineView(i, &view)
+            _tangents = tangents.data + normalStarts.data[i]
+            segmentAmount = view.pointAmount - 1 + view.cyclic
+
+            # same tangents as in PolySpline.ensureNormals and BezierSpline.ensureNormals
+            for j in range(segmentAmount):
+                indices[0] = j
+                indices[1] = (j + 1) % view.pointAmount
+                if view.isBezier:
+                    getBezierSegment(&view, indices, w)
+                    for k in range(bezierNormalsResolution):
+                        evaluateBezierSegment_Tangent(_tangents + j * bezierNormalsResolution + k,
+                            k / <float>(bezierNormalsResolution - 1), w)
+                else:
+                    subVec3(_tangents + j, view.points + indices[1], view.points + indices[0])
+
+            calculateNormalsForTangents_LowLevel(_tangents, normals.data + normalStarts.data[i],
+                normalStarts.data[i + 1] - normalStarts.data[i], view.cyclic)
+
+        self.normalStarts = normalStarts
+        self.normalsCache = normals
+
+
+    # Get Multiple Samples
+    #############################################
+
+    def getDistributedPoints(self, Py_ssize_t amount,
+                             float start = 0, float end = 1,
+                             str distributionType = "RESOLUTION"):
+        cdef Vector3DList result = Vector3DList(length = len(self) * max(amount, 0))
+        evaluateDistributed(self, amount, evaluatePoint, start, end, distributionType, result.data)
+        return result
+
+    def getDistributedTangents(self, Py_ssize_t amount,
+                               float start = 0, float end = 1,
+                               str distributionType = "RESOLUTION"):
+        cdef Vector3DList result = Vector3DList(length = len(self) * max(amount, 0))
+        evaluateDistributed(self, amount, evaluateTangent, start, end, distributionType, result.data)
+        return result
+
+    def getDistributedNormals(self, Py_ssize_t amount,
+                              float start = 0, float end = 1,
+                              str distributionType = "RESOLUTION"):
+        self.checkNormals()
+        cdef Vector3DList result = Vector3DList(length = len(self) * max(amount, 0))
+        evaluateDistributed(self, amount, evaluateNormal, start, end, distributionType, result.data)
+        return result
+
+    def getDistributedCurvatures(self, Py_ssize_t amount,
+                                 float start = 0, float end = 1,
+                                 str distributionType = "RESOLUTION"):
+        cdef FloatList result = FloatList(length = len(self) * max(amount, 0))
+        evaluateDistributed(self, amount, evaluateCurvature, start, end, distributionType, result.data)
+        return result
+
+    def getDistributedRadii(self, Py_ssize_t amount,
+                            float start = 0, float end = 1,
+                            str distributionType = "RESOLUTION"):
+        cdef FloatList result = FloatList(length = len(self) * max(amount, 0))
+        evaluateDistributed(self, amount, evaluateRadius, start, end, distributionType, result.data)
+        return result
+
+    def getDistributedTilts(self, Py_ssize_t amount,
+                            float start = 0, float end = 1,
+                            str distributionType = "RESOLUTION"):
+        cdef FloatList result = FloatList(length = len(self) * max(amount, 0))
+        evaluateDistributed(self, amount, evaluateTilt, start, end, distributionType, result.data)
+        return result
+
+    def getDistributedMatrices(self, Py_ssize_t amount,
+                               float start = 0, float end = 1,
+                               str distributionType = "RESOLUTION"):
+        self.checkNormals()
+        cdef Matrix4x4List result = Matrix4x4List(length = len(self) * max(amount, 0))
+        evaluateDistributed(self, amount, evaluateMatrix, start, end, distributionType, result.data)
+        return result
+
+
+    # Sample with the same Parameters
+    #############################################
+
+    def samplePoints(self, FloatList parameters, str parameterType = "RESOLUTION"):
+        cdef Vector3DList result = Vector3DList(length = len(self) * parameters.length)
+        evaluateSampled(self, parameters, evaluatePoint, parameterType, result.data)
+        return result
+
+    def sampleTangents(self, FloatList parameters, str parameterType = "RESOLUTION"):
+        cdef Vector3DList result = Vector3DList(length = len(self) * parameters.length)
+        evaluateSampled(self, parameters, evaluateTangent, parameterType, result.data)
+        return result
+
+    def sampleNormals(self, FloatList parameters, str parameterType = "RESOLUTION"):
+        self.checkNormals()
+        cdef Vector3DList result = Vector3DList(length = len(self) * parameters.length)
+        evaluateSampled(self, parameters, evaluateNormal, parameterType, result.data)
+        return result
+
+    def sampleCurvatures(self, FloatList parameters, str parameterType = "RESOLUTION"):
+        cdef FloatList result = FloatList(length = len(self) * parameters.length)
+        evaluateSampled(self, parameters, evaluateCurvature, parameterType, result.data)
+        return result
+
+    def sampleRadii(self, FloatList parameters, str parameterType = "RESOLUTION"):
+        cdef FloatList result = FloatList(length = len(self) * parameters.length)
+        evaluateSampled(self, parameters, evaluateRadius, parameterType, result.data)
+        return result
+
+    def sampleTilts(self, FloatList parameters, str parameterType = "RESOLUTION"):
+        cdef FloatList result = FloatList(length = len(self) * parameters.length)
+        evaluateSampled(self, parameters, evaluateTilt, parameterType, result.data)
+        return result
+
+    def sampleMatrices(self, FloatList parameters, str parameterType = "RESOLUTION"):
+        self.checkNormals()
+        cdef Matrix4x4List result = Matrix4x4List(length = len(self) * parameters.length)
+        evaluateSampled(self, parameters, evaluateMatrix, parameterType, result.data)
+        return result
+
+
+cdef copyVectors(Vector3DList target, Py_ssize_t start, Vector3DList source, Py_ssize_t amount):
+    memcpy(target.data + start, source.data, amount * sizeof(Vector3))
+
+cdef copyFloats(FloatList target, Py_ssize_t start, FloatList source, Py_ssize_t amount):
+    memcpy(target.data + start, source.data, amount * sizeof(float))
+
+
+# Evaluate all Splines
+######################################################
+
+cdef evaluateDistributed(SplineList splines, Py_ssize_t amount, EvaluateFunction evaluate,
+                         float start, float end, str distributionType, void *target):
+    if amount < 0:
+        raise ValueError("amount has to be >= 0")
+    if not (0 <= start <= 1 and 0 <= end <= 1):
+        raise ValueError("start and end values have to be between 0 and 1")
+    if distributionType not in ("RESOLUTION", "UNIFORM"):
+        raise ValueError("expected 'RESOLUTION' or 'UNIFORM' as distribution type")
+    if distributionType == "UNIFORM":
+        splines.checkUniformConverter()
+
+    cdef bint convertToUniform = distributionType == "UNIFORM"
+    cdef SplineView view
+    cdef Py_ssize_t i
+    for i in range(len(splines)):
+        if splines.isSplineEvaluable(i):
+            splines.getSplineView(i, &view)
+            evaluateDistributed_Single(&view, amount, evaluate, start, end,
+                convertToUniform, target, i * amount)
+        else:
+            writeZeros(evaluate, target, i * amount, amount)
+
+cdef evaluateSampled(SplineList splines, FloatList parameters, EvaluateFunction evaluate,
+                     str parameterType, void *target):
+    if not parameters.allValuesInRange(0, 1):
+        raise Exception("parameters have to be between 0 and 1")
+    if parameterType not in ("RESOLUTION", "UNIFORM"):
+        raise Exception("Unknown parameterType; expected 'RESOLUTION' or 'UNIFORM' but got {}".format(repr(parameterType)))
+    if parameterType == "UNIFORM":
+        splines.checkUniformConverter()
+
+    cdef bint convertToUniform = parameterType == "UNIFORM"
+    cdef Py_ssize_t i, j, offset
+    cdef SplineView view
+    cdef float t
+    for i in range(len(splines)):
+        offset = i * parameters.length
+        if not splines.isSplineEvaluable(i):
+            writeZeros(evaluate, target, offset, parameters.length)
+            continue
+
+        splines.getSplineView(i, &view)
+        for j in range(parameters.length):
+            t = parameters.data[j]
+            if convertToUniform:
+                t = toUniformParameter(&view, t)
+            if EvaluateFunction is EvaluateVector:
+                evaluate(&view, t, <Vector3*>target + offset + j)
+            elif EvaluateFunction is EvaluateFloat:
+                (<float*>target)[offset + j] = evaluate(&view, t)
+            elif EvaluateFunction is EvaluateMatrix:
+                evaluate(&view, t, <Matrix4*>target + offset + j)
+
+@cython.cdivision(True)
+cdef void evaluateDistributed_Single(SplineView *spline, Py_ssize_t amount, EvaluateFunction evaluate,
+                                     float start, float end, bint convertToUniform,
+                                     void *target, Py_ssize_t offset):
+    # same distribution as evaluateDistributed in base_spline.pyx
+    if amount == 0:
+        return
+    if amount == 1:
+        if EvaluateFunction is EvaluateVector:
+            evaluate(spline, (start + end) / 2, <Vector3*>target + offset)
+        elif EvaluateFunction is EvaluateFloat:
+            (<float*>target)[offset] = evaluate(spline, (start + end) / 2)
+        elif EvaluateFunction is EvaluateMatrix:
+            evaluate(spline, (start + end) / 2, <Matrix4*>target + offset)
+        return
+
+    cdef float step
+    if spline.cyclic and start == 0 and end == 1:
+        step = (end - start) / amount
+    else:
+        step = (end - start) / (amount - 1)
+
+    cdef Py_ssize_t i
+    cdef float t
+    for i in range(amount):
+        t = start + i * step
+        if t > 1: t = 1
+        elif t < 0: t = 0
+        if convertToUniform:
+            t = toUniformParameter(spline, t)
+        if EvaluateFunction is EvaluateVector:
+            evaluate(spline, t, <Vector3*>target + offset + i)
+        elif EvaluateFunction is EvaluateFloat:
+            (<float*>target)[offset + i] = evaluate(spline, t)
+        elif EvaluateFunction is EvaluateMatrix:
+            evaluate(spline, t, <Matrix4*>target + offset + i)
+
+cdef void writeZeros(EvaluateFunction evaluate, void *target, Py_ssize_t offset, Py_ssize_t amount):
+    if EvaluateFunction is EvaluateVector:
+        memset(<Vector3*>target + offset, 0, amount * sizeof(Vector3))
+    elif EvaluateFunction is EvaluateFloat:
+        memset(<float*>target + offset, 0, amount * sizeof(float))
+    elif EvaluateFunction is EvaluateMatrix:
+        memset(<Matrix4*>target + offset, 0, amount * sizeof(Matrix4))
+
+
+# Evaluate single Spline
+######################################################
+
+cdef float toUniformParameter(SplineView *spline, float t):
+    cdef float factor
+    cdef long indices[2]
+    findListSegment_LowLevel(spline.uniformAmount, False, t, indices, &factor)
+    return spline.uniformParameters[indices[0]] * (1 - factor) + \
+           spline.uniformParameters[indices[1]] * factor
+
+cdef inline void getBezierSegment(SplineView *spline, long *indices, Vector3 **w):
+    w[0] = spline.points + indices[0]
+    w[1] = spline.rightHandles + indices[0]
+    w[2] = spline.leftHandles + indices[1]
+    w[3] = spline.points + indices[1]
+
+cdef void evaluatePoint(SplineView *spline, float parameter, Vector3 *result):
+    cdef long indices[2]
+    cdef float t
+    cdef Vector3 *w[4]
+    findListSegment_LowLevel(spline.pointAmount, spline.cyclic, parameter, indices, &t)
+    if spline.isBezier:
+        getBezierSegment(spline, indices, w)
+        evaluateBezierSegment_Point(result, t, w)
+    else:
+        mixVec3(result, spline.points + indices[0], spline.points + indices[1], t)
+
+cdef void evaluateTangent(SplineView *spline, float parameter, Vector3 *result):
+    cdef long indices[2]
+    cdef float t
+    cdef Vector3 *w[4]
+    findListSegment_LowLevel(spline.pointAmount, spline.cyclic, parameter, indices, &t)
+    if spline.isBezier:
+        getBezierSegment(spline, indices, w)
+        evaluateBezierSegment_Tangent(result, t, w)
+    else:
+        subVec3(result, spline.points + indices[1], spline.points + indices[0])
+
+cdef float evaluateCurvature(SplineView *spline, float parameter):
+    cdef long indices[2]
+    cdef float t
+    cdef Vector3 *w[4]
+    if not spline.isBezier:
+        return 0
+    findListSegment_LowLevel(spline.pointAmount, spline.cyclic, parameter, indices, &t)
+    getBezierSegment(spline, indices, w)
+    return evaluateBezierSegment_Curvature(t, w)
+
+cdef float evaluateRadius(SplineView *spline, float parameter):
+    cdef long indices[2]
+    cdef float t
+    findListSegment_LowLevel(spline.pointAmount, spline.cyclic, parameter, indices, &t)
+    return spline.radii[indices[0]] * (1 - t) + spline.radii[indices[1]] * t
+
+cdef float evaluateTilt(SplineView *spline, float parameter):
+    cdef long indices[2]
+    cdef float t
+    findListSegment_LowLevel(spline.pointAmount, spline.cyclic, parameter, indices, &t)
+    return spline.tilts[indices[0]] * (1 - t) + spline.tilts[indices[1]] * t
+
+cdef void evaluateNormal_Approximated(SplineView *spline, float parameter, Vector3 *result):
+    cdef long indices[2]
+    cdef long normalIndices[2]
+    cdef float t, f
+    cdef Py_ssize_t offset
+    findListSegment_LowLevel(spline.pointAmount, spline.cyclic, parameter, indices, &t)
+    if spline.isBezier:
+        findListSegment_LowLevel(bezierNormalsResolution, False, t, normalIndices, &f)
+        offset = indices[0] * bezierNormalsResolution
+        mixVec3(result,
+            spline.normals + offset + normalIndices[0],
+            spline.normals + offset + normalIndices[1],
+            f)
+    else:
+        result[0] = spline.normals[indices[0]]
+
+cdef void evaluateNormal(SplineView *spline, float t, Vector3 *result):
+    # same as Spline.evaluateNormal_LowLevel
+    cdef Vector3 approx
+    cdef Vector3 tangent
+    evaluateNormal_Approximated(spline, t, &approx)
+    evaluateTangent(spline, t, &tangent)
+    cdef float tilt = evaluateTilt(spline, t)
+    cdef Vector3 rotated
+    rotateAroundAxisVec3(&rotated, &approx, &tangent, tilt)
+    projectOnCenterPlaneVec3(result, &rotated, &tangent)
+
+cdef void evaluateMatrix(SplineView *spline, float t, Matrix4 *result):
+    # same as Spline.evaluateMatrix_LowLevel
+    cdef Vector3 point, tangent, normal, bitangent
+    evaluatePoint(spline, t, &point)
+    evaluateTangent(spline, t, &tangent)
+    evaluateNormal(spline, t, &normal)
+    normalizeVec3_InPlace(&tangent)
+    normalizeVec3_InPlace(&normal)
+    crossVec3(&bitangent, &tangent, &normal)
+    matrixFromNormalizedAxisData(result, &point, &tangent, &normal, &bitangent)
+    scaleMatrix3x3Part(result, evaluateRadius(spline, t))
@@ -0,0 +1,91 @@
+from unittest import TestCase
+from . poly_spline import PolySpline
+from . spline_list import SplineList
+from . bezier_spline import BezierSpline
+from .. lists.base_lists import Vector3DList, FloatList
+
+def createSplines():
+    poly = PolySpline(Vector3DList.fromValues([(0, 0, 0), (1, 0, 0), (1, 2, 0)]))
+    cyclicPoly = PolySpline(Vector3DList.fromValues([(0, 0, 0), (0, 1, 0), (0, 1, 3), (2, 0, 1)]), cyclic = True)
+    bezier = BezierSpline(Vector3DList.fromValues([(0, 0, 0), (3, 1, 0)]),
+                          Vector3DList.fromValues([(-1, 0, 0), (2, 0, 0)]),
+                          Vector3DList.fromValues([(1, 1, 0), (4, 1, 1)]))
+    return [poly, cyclicPoly, bezier]
+
+class TestFromSplines(TestCase):
+    def testEmpty(self):
+        splineList = SplineList.fromSplines([])
+        self.assertEqual(len(splineList), 0)
+        self.assertEqual(len(splineList.getDistributedPoints(5)), 0)
+
+    def testPacking(self):
+        splineList = SplineList.fromSplines(createSplines())
+        self.assertEqual(len(splineList), 3)
+        self.assertEqual(len(splineList.points), 9)
+        self.assertEqual(list(splineList.pointStarts), [0, 3, 7, 9])
+        self.assertEqual(list(splineList.cyclics), [False, True, False])
+        self.assertEqual(list(splineList.bezierFlags), [False, False, True])
+
+    def testGetSplines(self):
+        splines = createSplines()
+        for original, unpacked in zip(splines, SplineList.fromSplines(splines).getSplines()):
+            self.assertEqual(original.type, unpacked.type)
+            self.assertEqual(original.cyclic, unpacked.cyclic)
+            self.assertEqual(list(original.points), list(unpacked.points))
+
+    def testWrongType(self):
+        with self.assertRaises(TypeError):
+            SplineList.fromSplines([1, 2])
+
+class TestEvaluation(TestCase):
+    def setUp(self):
+        self.splines = createSplines()
+        self.splineList = SplineList.fromSplines(self.splines)
+
+    def assertSameVectors(self, a, b):
+        self.assertEqual(len(a), len(b))
+        for v1, v2 in zip(a, b):
+            for c1, c2 in zip(v1, v2):
+                self.assertAlmostEqual(c1, c2, places = 4)
+
+    def testDistributedPoints(self):
+        result = self.splineList.getDistributedPoints(7, 0.1, 0.9)
+        expected = Vector3DList()
+        for spline in self.splines:
+            expected.extend(spline.getDistributedPoints(7, 0.1, 0.9))
+        self.assertSameVectors(result, expected)
+
+    def testUniformDistribution(self):
+        self.splineList.ensureUniformConverter(10)
+        result = self.splineList.getDistributedPoints(6, 0, 1, "UNIFORM")
+        expected = Vector3DList()
+        for spline in self.splines:
+            spline.ensureUniformConverter(10)
+            expected.extend(spline.getDistributedPoints(6, 0, 1, "UNIFORM"))
+        self.assertSameVectors(result, expected)
+
+    def testUniformRequiresConverter(self):
+        with self.assertRaises(Exception):
+            self.splineList.getDistributedPoints(5, 0, 1, "UNIFORM")
+
+    def testNormals(self):
+        self.splineList.ensureNormals()
+        result = self.splineList.getDistributedNormals(5)
+        expected = Vector3DList()
+        for spline in self.splines:
+            spline.ensureNormals()
+            expected.extend(spline.getDistributedNormals(5))
+        self.assertSameVectors(result, expected)
+
+    def testSamplePoints(self):
+        parameters = FloatList.fromValues([0, 0.25, 1])
+        result = self.splineList.samplePoints(parameters)
+        expected = Vector3DList()
+        for spline in self.splines:
+            expected.extend(spline.samplePoints(parameters))
+        self.assertSameVectors(result, expected)
+
+    def testNotEvaluableSpline(self):
+        splineList = SplineList.fromSplines([PolySpline(Vector3DList.fromValues([(1, 2, 3)]))])
+        self.assertFalse(splineList.isEvaluable())
+        self.assertEqual(list(splineList.getDistributedRadii(3)), [0, 0, 0])
@@ -1,6 +1,7 @@
 import bpy
 import itertools
 from . import problems
+from . import tree_info
 from . update import updateEverything
 from . utils.recursion import noRecursion
 from . utils.nodes import iterNodesInAnimationNodeTrees, getAnimationNodeTrees
@@ -13,7 +14,12 @@ def update(events):
         print("Skip event: cannot write to ID classes")
         return
 
-    if didNameChange() or events.intersection({"File", "Addon", "Tree"}):
+    nameChanged = didNameChange()
+    if nameChanged:
+        # the names are part of the node ids, so all trees have to be analysed again
+        tree_info.treeChanged()
+
+    if nameChanged or events.intersection({"File", "Addon", "Tree"}):
         updateEverything()
 
     if problems.canAutoExecute():
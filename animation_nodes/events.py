@@ -34,6 +34,8 @@ evaluatedDepsgraph = None
 @eventHandler("FRAME_CHANGE_POST")
 def frameChanged(scene, depsgraph):
     global evaluatedDepsgraph
+    from . execution.disk_cache import isBaking
+    if isBaking(): return
     evaluatedDepsgraph = depsgraph
     event_handler.update(event.getActives().union({"Frame"}))
     evaluatedDepsgraph = None
@@ -57,16 +59,41 @@ def addonChanged():
     event.addonChanged = True
     treeChanged()
 
-def executionCodeChanged(self = None, context = None):
+@eventHandler("ADDON_LOAD_POST")
+def threadAmountChanged(self = None, context = None):
+    from . preferences import getExecutionCodeSettings
+    from . data_structures.falloffs.evaluation import setThreadAmount
+    setThreadAmount(getExecutionCodeSettings().threadAmount)
+
+@eventHandler("ADDON_LOAD_POST")
+def soundCacheSettingsChanged(self = None, context = None):
+    from . preferences import getExecutionCodeSettings
+    from . data_structures.sounds.sound_data import setSoundCacheSettings
+    settings = getExecutionCodeSettings()
+    setSoundCacheSettings(settings.soundCacheSize, settings.useDecodedSoundFiles)
+
+@eventHandler("UNDO_POST")
+def undoOrRedo():
+    # the trees are restored without update notifications
     treeChanged()
+
+def executionCodeChanged(self = None, context = None):
+    treeChanged(self)
     propertyChanged()
 
 def networkChanged(self = None, context = None):
-    treeChanged()
+    treeChanged(self)
 
 def treeChanged(self = None, context = None):
     event.treeChanged = True
-    tree_info.treeChanged()
+    tree_info.treeChanged(getChangedTreeName(self))
+
+def getChangedTreeName(owner):
+    # changes of nodes and sockets only affect the tree they are in
+    if isinstance(owner, (bpy.types.NodeTree, bpy.types.Node, bpy.types.NodeSocket)):
+        if isinstance(owner.id_data, bpy.types.NodeTree):
+            return owner.id_data.name
+    return None
 
 
 @eventHandler("RENDER_INIT")
@@ -6,8 +6,9 @@ from .. sockets.info import getAllowedInputDataTypes
 from .. sockets.implicit_conversion import getConversionCode
 from .. problems import NodeFailesToCreateExecutionCode
 from .. preferences import addonName, getExecutionCodeType
-from .. tree_info import (iterLinkedSocketsWithInfo, isSocketLinked,
-                          iterLinkedInputSocketsWithOriginDataType)
+from . incremental import nodeSupportsIncrementalExecution, getPropertyTokenExpressions
+from .. tree_info import (iterLinkedSocketsWithInfo, isSocketLinked, getOriginNodes,
+                          getTargetNodes, iterLinkedInputSocketsWithOriginDataType)
 
 
 
@@ -32,6 +33,7 @@ def getInitialVariables(nodes):
 def iterSetupCodeLines(nodes, variables):
     yield from iter_Imports(nodes)
     yield get_LoadMeasurementsDict()
+    yield get_LoadProfiler()
     yield from iter_GetNodeReferences(nodes)
     yield from iter_GetSocketValues(nodes, variables)
 
@@ -59,6 +61,9 @@ def getModulesNeededByNodes(nodes):
 def get_LoadMeasurementsDict():
     return "_node_execution_times = animation_nodes.execution.measurements.getMeasurementsDict()"
 
+def get_LoadProfiler():
+    return "_profiler = animation_nodes.execution.profiler.getProfiler()"
+
 def iter_GetNodeReferences(nodes):
     yield "nodes = bpy.data.node_groups[{}].nodes".format(repr(nodes[0].nodeTree.name))
     for node in nodes:
@@ -100,7 +105,7 @@ def iterUnlinkedSockets(nodes):
 
 def getFunction_IterNodeExecutionLines():
     mode = getExecutionCodeType()
-    if mode == "DEFAULT":
+    if mode in ("DEFAULT", "INCREMENTAL"):
         return iterNodeExecutionLines_Basic
     elif mode == "MONITOR":
         return iterNodeExecutionLines_Monitored
@@ -108,6 +113,8 @@ def getFunction_IterNodeExecutionLines():
         return iterNodeExecutionLines_MeasureTimes
     elif mode == "BAKE":
         return iterNodeExecutionLines_Bake
+    elif mode == "PROFILE":
+        return iterNodeExecutionLines_Profile
 
 def iterNodeExecutionLines_Basic(node, variables):
     yield from iterNodeCommentLines(node)
@@ -153,6 +160,134 @@ def iterNodeExecutionLines_Bake(node, variables):
     except:
         handleExecutionCodeCreationException(node)
 
+def iterNodeExecutionLines_Profile(node, variables):
+    yield from iterNodeCommentLines(node)
+    try:
+        conversionLines = list(iterInputConversionLines(node, variables))
+        copyLines = list(iterInputCopyLines(node, variables))
+        resolveInnerLinks(node, variables)
+        bodyLines = list(iterRealNodeExecutionLines(node, variables))
+    except:
+        handleExecutionCodeCreationException(node)
+
+    lines = list(chain(
+        iterProfiledLines(conversionLines, "Conversion", "conversion", node),
+        iterProfiledLines(copyLines, "Copy Inputs", "copy", node),
+        iterProfiledLines(bodyLines, "Body", "body", node)))
+    yield from iterLinesInProfilerFrame(getProfilerBeginLine(node.name, "node", node), lines)
+
+def iterProfiledLines(lines, name, category, node):
+    if len(lines) == 0:
+        return
+    yield from iterLinesInProfilerFrame(getProfilerBeginLine(name, category, node), lines)
+
+def iterLinesInProfilerFrame(beginLine, lines):
+    # the frame is also closed when the lines raise an exception
+    yield beginLine
+    yield "try:"
+    for line in lines:
+        yield "    " + line
+    yield "    pass"
+    yield "finally:"
+    yield "    _profiler.end()"
+
+def getProfilerBeginLine(name, category, node):
+    return "_profiler.begin({}, {}, {})".format(repr(name), repr(category), repr(node.nodeTree.name))
+
+def iterNodeExecutionLines_Incremental(node, variables, nodeByID):
+    stateName = getNodeStateVariable(node)
+    if not nodeSupportsIncrementalExecution(node):
+        yield from iterNodeExecutionLines_Basic(node, variables)
+        outputNames = getLinkedOutputVariables(node, variables)
+        yield "{}.updateOutputs(({}))".format(stateName, toTupleContent(outputNames))
+        return
+
+    token = getIncrementalTokenExpression(node, variables, nodeByID)
+    try:
+        bodyLines = list(chain(setupNodeForExecution(node, variables),
+                               iterRealNodeExecutionLines(node, variables)))
+    except:
+        handleExecutionCodeCreationException(node)
+    outputNames = getLinkedOutputVariables(node, variables)
+
+    yield from iterNodeCommentLines(node)
+    yield "if {}.needsExecution(({})):".format(stateName, token)
+    for line in bodyLines:
+        yield "    " + line
+    yield "    {}.storeOutputs(({}))".format(stateName, toTupleContent(outputNames))
+    yield "else:"
+    if len(outputNames) > 0:
+        yield "    {} = {}.outputs".format(toTupleContent(outputNames), stateName)
+    yield "    pass"
+
+def iterNodeExecutionLines_DiskCache(node, variables, iterNodeExecutionLines):
+    lines = list(iterNodeExecutionLines(node, variables))
+    outputNames = getLinkedOutputVariables(node, variables)
+    identifiers = getDiskCacheLinkedIdentifiers(node)
+
+    yield "_disk_cache_outputs = AN.execution.disk_cache.loadOutputs({}, {})".format(node.identifier, repr(identifiers))
+    yield "if _disk_cache_outputs is None:"
+    for line in lines:
+        yield "    " + line
+    yield "    AN.execution.disk_cache.writeOutputsIfBaking({}, {}, ({}))".format(
+        node.identifier, repr(identifiers), toTupleContent(outputNames))
+    yield "else:"
+    if len(outputNames) > 0:
+        yield "    {} = _disk_cache_outputs".format(toTupleContent(outputNames))
+    yield "    pass"
+
+def usesDiskCache(node):
+    # the disk cache module imports the sockets, so it is imported on first use
+    from . disk_cache import usesDiskCache
+    return usesDiskCache(node)
+
+def getDiskCacheLinkedIdentifiers(node):
+    return tuple(socket.identifier for socket in node.linkedOutputs)
+
+def getDiskCacheDependencies(nodes, nodeByID):
+    '''
+    Finds the pure nodes that are only used by nodes with a disk cache.
+    These don't have to be executed when all of those nodes are baked.
+    '''
+    dependencies = {}
+    for node in reversed(nodes):
+        if usesDiskCache(node):
+            dependencies[node] = {node}
+        elif "PURE" in node.options:
+            targets = getTargetNodes(node, nodeByID)
+            if len(targets) > 0 and all(target in dependencies for target in targets):
+                dependencies[node] = set().union(*(dependencies[target] for target in targets))
+    return {node : cachedNodes for node, cachedNodes in dependencies.items() if not usesDiskCache(node)}
+
+def getConstantTokenExpression(nodes, variables):
+    parts = []
+    for node in nodes:
+        for socket in node.unlinkedInputs:
+            if socket.dataType != "Node Control":
+                parts.append(variables[socket])
+        parts.extend(getPropertyTokenExpressions(node, node.identifier))
+    return toTupleContent(parts)
+
+def getIncrementalTokenExpression(node, variables, nodeByID):
+    parts = []
+    for originNode in getOriginNodes(node, nodeByID):
+        parts.append(getNodeStateVariable(originNode) + ".version")
+    for socket in node.unlinkedInputs:
+        if socket.dataType != "Node Control":
+            parts.append(variables[socket])
+    parts.extend(getPropertyTokenExpressions(node, node.identifier))
+    return toTupleContent(parts)
+
+def getNodeStateVariable(node):
+    return node.identifier + "_state"
+
+def getLinkedOutputVariables(node, variables):
+    return [variables[socket] for socket in node.linkedOutputs]
+
+def toTupleContent(names):
+    if len(names) == 0: return ""
+    return ", ".join(names) + ","
+
 def iterNodeCommentLines(node):
     yield ""
     yield "# Node: {} - {}".format(repr(node.nodeTree.name), repr(node.name))
@@ -220,6 +355,46 @@ def handleExecutionCodeCreationException(node):
 
 
 
+# Static Optimizations
+##########################################
+
+def removeUnusedNodes(nodes, nodeByID):
+    '''
+    Pure nodes whose outputs are not used by another executed node
+    don't have an effect and are not executed at all.
+    '''
+    unusedNodes = set()
+    for node in reversed(nodes):
+        if "PURE" not in node.options or usesDiskCache(node):
+            continue
+        if all(target in unusedNodes for target in getTargetNodes(node, nodeByID)):
+            unusedNodes.add(node)
+    return [node for node in nodes if node not in unusedNodes]
+
+def getConstantNodes(nodes, nodeByID):
+    '''
+    Constant nodes are pure nodes that only depend on
+    unlinked inputs, properties and other constant nodes.
+    '''
+    constantNodes = set()
+    for node in nodes:
+        if usesDiskCache(node) or not nodeSupportsIncrementalExecution(node):
+            continue
+        if all(origin in constantNodes for origin in getOriginNodes(node, nodeByID)):
+            constantNodes.add(node)
+    return constantNodes
+
+def iterConstantBoundaryTargets(constantNodes, executedNodes, nodeByID):
+    '''Yields (socket, target) for links from constant to other executed nodes.'''
+    for node in constantNodes:
+        for socket in node.linkedOutputs:
+            for target in iterLinkedSocketsWithInfo(socket, node, nodeByID):
+                targetNode = target.node
+                if targetNode in executedNodes and targetNode not in constantNodes:
+                    yield socket, target
+
+
+
 # Modify Socket Variables
 ##########################################
 
@@ -228,29 +403,62 @@ def resolveInnerLinks(node, variables):
     for inputName, outputName in node.iterInnerLinks():
         variables[outputs[outputName]] = variables[inputs[inputName]]
 
-def linkOutputSocketsToTargets(node, variables, nodeByID):
+def linkOutputSocketsToTargets(node, variables, nodeByID, copyAlways = False):
+    # cached outputs must never be changed by the nodes that use them
+    copyAlways = copyAlways or node.cachesOutputs
+    lines = []
     for socket in node.linkedOutputs:
-        yield from linkSocketToTargets(socket, node, variables, nodeByID)
+        lines.extend(linkSocketToTargets(socket, node, variables, nodeByID, copyAlways))
+
+    if getExecutionCodeType() == "PROFILE":
+        yield from iterProfiledLines(lines, "Copy Outputs: " + node.name, "copy", node)
+    else:
+        yield from lines
+
+def linkSocketToTargets(socket, node, variables, nodeByID, copyAlways = False):
+    # only the sockets of executed nodes have variables, see removeUnusedNodes
+    targets = tuple(target for target in iterLinkedSocketsWithInfo(socket, node, nodeByID)
+                    if target in variables)
+    needACopy = getTargetsThatNeedACopy(socket, targets, copyAlways)
+    lazyCopies = getTargetsThatCanShareData(socket, targets, needACopy)
+    socket.execution.neededCopies = len(needACopy) - len(lazyCopies)
 
-def linkSocketToTargets(socket, node, variables, nodeByID):
-    targets = tuple(iterLinkedSocketsWithInfo(socket, node, nodeByID))
-    needACopy = getTargetsThatNeedACopy(socket, targets)
-    socket.execution.neededCopies = len(needACopy)
+    if "COPY_ON_WRITE" in node.options and socket.isLazyCopyable():
+        # the output might still share memory with the input of the node
+        if any(target.dataIsModified and not allowsCopyOnWrite(target) for target in targets):
+            yield "{}.makeUnique()".format(variables[socket])
 
     for target in targets:
-        if target in needACopy:
+        if target in lazyCopies:
+            yield getLazyCopyLine(socket, variables[target], variables)
+        elif target in needACopy:
             yield getCopyLine(socket, variables[target], variables)
         else:
             variables[target] = variables[socket]
 
-def getTargetsThatNeedACopy(socket, targets):
+def getTargetsThatNeedACopy(socket, targets, copyAlways = False):
     if not socket.isCopyable(): return []
     modifiedTargets = [target for target in targets if target.dataIsModified]
-    if socket.loop.copyAlways: return modifiedTargets
+    if socket.loop.copyAlways or copyAlways: return modifiedTargets
     if len(targets) == 1: return []
     if len(targets) > len(modifiedTargets): return modifiedTargets
     else: return modifiedTargets[1:]
 
+def getTargetsThatCanShareData(socket, targets, needACopy):
+    if not socket.isLazyCopyable(): return []
+    # all nodes that get the data have to copy it before changing it
+    modifiedTargets = [target for target in targets if target.dataIsModified]
+    if all(allowsCopyOnWrite(target) for target in modifiedTargets):
+        return needACopy
+    return []
+
+def allowsCopyOnWrite(target):
+    return "COPY_ON_WRITE" in target.node.options
+
+def getLazyCopyLine(fromSocket, targetName, variables):
+    expression = fromSocket.getLazyCopyExpression().replace("value", variables[fromSocket])
+    return "{} = {}".format(targetName, expression)
+
 def getCopyLine(fromSocket, targetName, variables):
     return "{} = {}".format(targetName, getCopyExpression(fromSocket, variables))
 
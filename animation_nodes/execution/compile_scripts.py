@@ -1,5 +1,12 @@
+import os
 import sys
+import bpy
+import marshal
+import hashlib
+from importlib.util import MAGIC_NUMBER
 from .. problems import InvalidSyntax
+from .. utils.operators import makeOperator
+from .. preferences import getExecutionCodeSettings
 
 cache = {}
 
@@ -11,7 +18,7 @@ def compileScript(script, name = "<string>"):
     try:
         scriptHash = hash(script)
         if scriptHash not in cache:
-            compiledCode = compile(script, name, "exec")
+            compiledCode = compileWithPersistentCache(script, name)
             cache[scriptHash] = compiledCode
 
         return cache[scriptHash]
@@ -29,3 +36,80 @@ def compileScript(script, name = "<string>"):
         print("\n"*5)
 
         InvalidSyntax().report()
+
+
+# Persistent Cache
+##########################################
+
+# Compiled code objects are marshalled to files that are named by a hash of
+# the script, so that unchanged scripts don't have to be compiled again in
+# later Blender sessions. The python magic number is part of the hash,
+# because marshalled code can only be loaded by the same python version.
+
+fileExtension = ".ancode"
+maxCachedFileAmount = 2000
+_cacheDirectoryPruned = False
+
+def compileWithPersistentCache(script, name):
+    if not getExecutionCodeSettings().usePersistentScriptCache:
+        return compile(script, name, "exec")
+
+    path = getCodeFilePath(script, name)
+    compiledCode = readCodeFile(path)
+    if compiledCode is None:
+        compiledCode = compile(script, name, "exec")
+        writeCodeFile(path, compiledCode)
+    return compiledCode
+
+def getCodeFilePath(script, name):
+    key = hashlib.sha1(MAGIC_NUMBER + name.encode() + b"\0" + script.encode()).hexdigest()
+    return os.path.join(getCacheDirectory(), key + fileExtension)
+
+def getCacheDirectory():
+    return bpy.utils.user_resource("CONFIG", path = os.path.join("animation_nodes", "compiled_scripts"))
+
+def readCodeFile(path):
+    try:
+        with open(path, "rb") as f:
+            compiledCode = marshal.load(f)
+        # the modification time is used to remove the least recently used files
+        os.utime(path)
+        return compiledCode
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+def writeCodeFile(path, compiledCode):
+    global _cacheDirectoryPruned
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        # write to a temporary file first, so that other processes never read half written files
+        temporaryPath = "{}.{}.tmp".format(path, os.getpid())
+        with open(temporaryPath, "wb") as f:
+            marshal.dump(compiledCode, f)
+        os.replace(temporaryPath, path)
+    except OSError:
+        return
+
+    if not _cacheDirectoryPruned:
+        pruneCacheDirectory(os.path.dirname(path))
+        _cacheDirectoryPruned = True
+
+def pruneCacheDirectory(directory):
+    paths = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(fileExtension)]
+    if len(paths) <= maxCachedFileAmount:
+        return
+    paths.sort(key = os.path.getmtime)
+    for path in paths[:len(paths) - maxCachedFileAmount]:
+        try: os.remove(path)
+        except OSError: pass
+
+@makeOperator("an.clear_compiled_script_cache", "Clear Compiled Script Cache",
+              description = "Remove the compiled execution scripts that are stored on disk")
+def clearCompiledScriptCache():
+    directory = getCacheDirectory()
+    if not os.path.isdir(directory):
+        return
+    for name in os.listdir(directory):
+        if name.endswith(fileExtension):
+            try: os.remove(os.path.join(directory, name))
+            except OSError: pass
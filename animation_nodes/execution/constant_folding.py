@@ -0,0 +1,19 @@
+from . incremental import valuesAreEqual
+
+# Constant nodes are executed in the setup script. Their results are reused
+# in later setups as long as the inputs and properties of these nodes
+# (the token) don't change.
+
+constantValuesByKey = {}
+
+def getConstantValues(key, token):
+    entry = constantValuesByKey.get(key)
+    if entry is None or not valuesAreEqual(entry[0], token):
+        return None
+    return entry[1]
+
+def storeConstantValues(key, token, values):
+    constantValuesByKey[key] = (token, values)
+
+def resetConstantValues():
+    constantValuesByKey.clear()
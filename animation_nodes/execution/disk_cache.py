@@ -0,0 +1,339 @@
+import os
+import bpy
+import mmap
+import json
+import shutil
+import struct
+import subprocess
+from bpy.props import *
+from .. utils.blender_ui import redrawAll
+from .. sockets.info import getSocketClass
+from .. base_types.sockets.list_sockets import CListSocket
+from .. data_structures.lists import base_lists
+from .. data_structures import CList, PolygonIndicesList, Mesh
+
+# Every baked frame of a node is stored in a separate file:
+#     magic (8 bytes), header size (uint32), json header, aligned raw buffers
+#
+# The header describes how the outputs are reconstructed from the buffers.
+# When a frame is loaded, the file is memory-mapped and the lists use the
+# mapped memory directly. The mapping is private, so changing the lists
+# never changes the file.
+
+fileMagic = b"ANCACHE1"
+fileExtension = ".ancache"
+bufferAlignment = 64
+
+_isBaking = False
+
+def isBaking():
+    return _isBaking
+
+def getNodeCacheDirectory(node):
+    directory = bpy.path.abspath(node.nodeTree.diskCacheDirectory)
+    return os.path.join(directory, node.identifier.lstrip("_"))
+
+def getFramePath(node, frame):
+    return os.path.join(getNodeCacheDirectory(node), "{:.3f}{}".format(frame, fileExtension))
+
+def getCurrentFrame(node):
+    return node.nodeTree.scene.frame_current_final
+
+def isFrameBaked(node, identifiers):
+    '''
+    True when loadOutputs can load these outputs of the current frame.
+    '''
+    if _isBaking: return False
+    path = getFramePath(node, getCurrentFrame(node))
+    if not os.path.exists(path): return False
+    outputs = readFrameHeader(path)["outputs"]
+    return all(identifier in outputs for identifier in identifiers)
+
+def getBakedFramesAmount(node):
+    directory = getNodeCacheDirectory(node)
+    if not os.path.isdir(directory): return 0
+    return sum(1 for name in os.listdir(directory) if name.endswith(fileExtension))
+
+# describeValue can write these types and all lists that are CLists
+diskCacheDataTypes = {"Integer", "Float", "Boolean", "Text", "Text List",
+                      "Mesh", "Mesh List", "Polygon Indices List"}
+
+def nodeSupportsDiskCache(node):
+    return all(canWriteDataType(socket.dataType) for socket in node.outputs)
+
+def canWriteDataType(dataType):
+    if dataType in diskCacheDataTypes:
+        return True
+    return issubclass(getSocketClass(dataType), CListSocket)
+
+def usesDiskCache(node):
+    return node.useDiskCache and nodeSupportsDiskCache(node)
+
+
+# Execution
+##########################################
+
+def loadOutputs(node, identifiers):
+    if not isFrameBaked(node, identifiers): return None
+    outputs = readFrameFile(getFramePath(node, getCurrentFrame(node)))
+    return tuple(outputs[identifier] for identifier in identifiers)
+
+def writeOutputsIfBaking(node, identifiers, values):
+    if not _isBaking: return
+    path = getFramePath(node, getCurrentFrame(node))
+    os.makedirs(os.path.dirname(path), exist_ok = True)
+    writeFrameFile(path, dict(zip(identifiers, values)))
+
+
+# File Format
+##########################################
+
+def writeFrameFile(path, outputs):
+    buffers = []
+    description = {identifier : describeValue(value, buffers) for identifier, value in outputs.items()}
+
+    # offsets are relative to the aligned end of the header
+    offsets = []
+    offset = 0
+    for data in buffers:
+        offsets.append(offset)
+        offset = getAlignedSize(offset + len(data))
+
+    headerBytes = json.dumps({"outputs" : description, "offsets" : offsets}).encode()
+    dataStart = getDataStart(len(headerBytes))
+
+    with open(path, "wb") as f:
+        f.write(fileMagic)
+        f.write(struct.pack("<I", len(headerBytes)))
+        f.write(headerBytes)
+        for data, offset in zip(buffers, offsets):
+            f.write(b"\0" * (dataStart + offset - f.tell()))
+            f.write(data)
+
+def readFrameFile(path):
+    with open(path, "rb") as f:
+        header, headerSize = readHeader(f, path)
+        mappedFile = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_COPY)
+
+    view = memoryview(mappedFile)
+    dataStart = getDataStart(headerSize)
+    offsets = [dataStart + offset for offset in header["offsets"]]
+    return {identifier : createValue(description, view, offsets)
+            for identifier, description in header["outputs"].items()}
+
+def readFrameHeader(path):
+    with open(path, "rb") as f:
+        return readHeader(f, path)[0]
+
+def readHeader(f, path):
+    if f.read(len(fileMagic)) != fileMagic:
+        raise Exception("invalid disk cache file: " + path)
+    headerSize = struct.unpack("<I", f.read(4))[0]
+    return json.loads(f.read(headerSize).decode()), headerSize
+
+def getDataStart(headerSize):
+    return getAlignedSize(len(fileMagic) + 4 + headerSize)
+
+def getAlignedSize(size):
+    return (size + bufferAlignment - 1) // bufferAlignment * bufferAlignment
+
+def describeValue(value, buffers):
+    if isinstance(value, CList):
+        buffers.append(value.asBytes())
+        return {"type" : "CList", "class" : type(value).__name__,
+                "buffer" : len(buffers) - 1, "size" : len(buffers[-1])}
+    elif isinstance(value, PolygonIndicesList):
+        return {"type" : "PolygonIndicesList",
+                "indices" : describeValue(value.indices, buffers),
+                "polyStarts" : describeValue(value.polyStarts, buffers),
+                "polyLengths" : describeValue(value.polyLengths, buffers)}
+    elif isinstance(value, Mesh):
+        return {"type" : "Mesh",
+                "vertices" : describeValue(value.vertices, buffers),
+                "edges" : describeValue(value.edges, buffers),
+                "polygons" : describeValue(value.polygons, buffers),
+                "materialIndices" : describeValue(value.materialIndices, buffers),
+                "uvMaps" : [(name, describeValue(uvs, buffers)) for name, uvs in value.getUVMaps()],
+                "vertexColorLayers" : [(name, describeValue(colors, buffers))
+                                       for name, colors in value.getVertexColorLayers()]}
+    elif isinstance(value, list):
+        return {"type" : "List", "elements" : [describeValue(element, buffers) for element in value]}
+    elif isinstance(value, (int, float, bool, str)) or value is None:
+        return {"type" : "Simple", "value" : value}
+    raise TypeError("cannot write '{}' to the disk cache".format(type(value).__name__))
+
+def createValue(description, view, offsets):
+    dataType = description["type"]
+    if dataType == "CList":
+        listType = getattr(base_lists, description["class"])
+        start = offsets[description["buffer"]]
+        return listType.fromBuffer(view[start:start + description["size"]])
+    elif dataType == "PolygonIndicesList":
+        return PolygonIndicesList.fromLists(
+            createValue(description["indices"], view, offsets),
+            createValue(description["polyStarts"], view, offsets),
+            createValue(description["polyLengths"], view, offsets))
+    elif dataType == "Mesh":
+        mesh = Mesh(createValue(description["vertices"], view, offsets),
+                    createValue(description["edges"], view, offsets),
+                    createValue(description["polygons"], view, offsets),
+                    createValue(description["materialIndices"], view, offsets),
+                    skipValidation = True)
+        for name, uvDescription in description["uvMaps"]:
+            mesh.insertUVMap(name, createValue(uvDescription, view, offsets))
+        for name, colorDescription in description["vertexColorLayers"]:
+            mesh.insertVertexColorLayer(name, createValue(colorDescription, view, offsets))
+        return mesh
+    elif dataType == "List":
+        return [createValue(element, view, offsets) for element in description["elements"]]
+    elif dataType == "Simple":
+        return description["value"]
+    raise Exception("unknown data type in disk cache: " + dataType)
+
+
+# Operators
+##########################################
+
+class BakeToDiskCache(bpy.types.Operator):
+    bl_idname = "an.bake_to_disk_cache"
+    bl_label = "Bake to Disk Cache"
+    bl_description = "Execute the tree for every frame in the scene range and write the outputs of nodes that use the disk cache"
+
+    treeName: StringProperty()
+    useCustomRange: BoolProperty(default = False)
+    frameStart: IntProperty()
+    frameEnd: IntProperty()
+
+    def execute(self, context):
+        global _isBaking
+        from .. problems import canExecute
+        from . units import setupExecutionUnits, finishExecutionUnits
+
+        nodeTree = bpy.data.node_groups.get(self.treeName)
+        if nodeTree is None or not canExecute():
+            return {"CANCELLED"}
+
+        scene = nodeTree.scene
+        oldFrame = scene.frame_current
+        if self.useCustomRange:
+            frames = range(self.frameStart, self.frameEnd + 1)
+        else:
+            frames = range(scene.frame_start, scene.frame_end + 1)
+        windowManager = context.window_manager
+        windowManager.progress_begin(0, len(frames))
+
+        _isBaking = True
+        try:
+            for i, frame in enumerate(frames):
+                # the frame change handler does not execute trees while baking
+                scene.frame_set(frame)
+                setupExecutionUnits()
+                nodeTree._execute()
+                finishExecutionUnits()
+                windowManager.progress_update(i)
+        finally:
+            _isBaking = False
+            windowManager.progress_end()
+            scene.frame_set(oldFrame)
+
+        redrawAll()
+        return {"FINISHED"}
+
+class BakeToDiskCacheParallel(bpy.types.Operator):
+    bl_idname = "an.bake_to_disk_cache_parallel"
+    bl_label = "Bake to Disk Cache (Parallel)"
+    bl_description = ("Split the frame range across background Blender processes that "
+                      "bake the disk cache at the same time (uses the saved file)")
+
+    treeName: StringProperty()
+
+    def invoke(self, context, event):
+        nodeTree = bpy.data.node_groups.get(self.treeName)
+        if nodeTree is None:
+            return {"CANCELLED"}
+        if bpy.data.filepath == "":
+            self.report({"ERROR"}, "The file has to be saved, because the processes load it from disk")
+            return {"CANCELLED"}
+        if bpy.data.is_dirty:
+            self.report({"WARNING"}, "Unsaved changes are not used by the background processes")
+
+        scene = nodeTree.scene
+        processAmount = nodeTree.diskCacheProcessAmount or os.cpu_count() or 1
+        frameRanges = splitFrameRange(scene.frame_start, scene.frame_end, processAmount)
+        self.processes = [startBakeProcess(self.treeName, start, end) for start, end in frameRanges]
+        self.finishedAmount = 0
+        self.failedAmount = 0
+
+        windowManager = context.window_manager
+        windowManager.progress_begin(0, len(self.processes))
+        windowManager.modal_handler_add(self)
+        self.timer = windowManager.event_timer_add(0.2, window = context.window)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type == "ESC":
+            for process in self.processes:
+                process.terminate()
+                process.wait()
+            self.report({"WARNING"}, "Baking cancelled")
+            return self.finish(context, {"CANCELLED"})
+
+        if event.type == "TIMER":
+            for process in self.getFinishedProcesses():
+                self.processes.remove(process)
+                self.finishedAmount += 1
+                if process.returncode != 0:
+                    self.failedAmount += 1
+            context.window_manager.progress_update(self.finishedAmount)
+
+            if len(self.processes) == 0:
+                if self.failedAmount > 0:
+                    self.report({"ERROR"}, "{} processes failed".format(self.failedAmount))
+                    return self.finish(context, {"CANCELLED"})
+                return self.finish(context, {"FINISHED"})
+
+        return {"PASS_THROUGH"}
+
+    def getFinishedProcesses(self):
+        return [process for process in self.processes if process.poll() is not None]
+
+    def finish(self, context, result):
+        windowManager = context.window_manager
+        windowManager.event_timer_remove(self.timer)
+        windowManager.progress_end()
+        redrawAll()
+        return result
+
+def splitFrameRange(start, end, amount):
+    frameAmount = end - start + 1
+    amount = max(1, min(amount, frameAmount))
+    ranges = []
+    for i in range(amount):
+        rangeStart = start + frameAmount * i // amount
+        rangeEnd = start + frameAmount * (i + 1) // amount - 1
+        ranges.append((rangeStart, rangeEnd))
+    return ranges
+
+def startBakeProcess(treeName, frameStart, frameEnd):
+    script = ("import bpy\n"
+              "bpy.ops.an.bake_to_disk_cache(treeName = {}, useCustomRange = True, "
+              "frameStart = {}, frameEnd = {})").format(repr(treeName), frameStart, frameEnd)
+    command = [bpy.app.binary_path, "--background", bpy.data.filepath,
+               "--python-exit-code", "1", "--python-expr", script]
+    return subprocess.Popen(command, stdout = subprocess.DEVNULL)
+
+class ClearDiskCache(bpy.types.Operator):
+    bl_idname = "an.clear_disk_cache"
+    bl_label = "Clear Disk Cache"
+    bl_description = "Remove all baked frames of this node"
+
+    nodeIdentifier: StringProperty()
+
+    def execute(self, context):
+        from .. tree_info import getNodeByIdentifier
+        node = getNodeByIdentifier(self.nodeIdentifier)
+        directory = getNodeCacheDirectory(node)
+        if os.path.isdir(directory):
+            shutil.rmtree(directory)
+        redrawAll()
+        return {"FINISHED"}
@@ -0,0 +1,109 @@
+import bpy
+from mathutils import Vector, Matrix, Euler, Quaternion, Color
+from collections import defaultdict
+
+class IncrementalNodeState:
+    '''
+    Stores what is needed to decide whether a node has to be executed again.
+    The version is incremented whenever the outputs of the node change.
+    Nodes that depend on this node use the version as part of their token.
+    '''
+    __slots__ = ("version", "token", "pendingToken", "outputs")
+
+    def __init__(self):
+        self.version = 0
+        self.token = None
+        self.pendingToken = None
+        self.outputs = ()
+
+    def needsExecution(self, token):
+        if self.token is not None and valuesAreEqual(token, self.token):
+            return False
+        self.pendingToken = token
+        return True
+
+    def storeOutputs(self, outputs):
+        # the token is only stored when the execution was successfull
+        self.token = self.pendingToken
+        self.pendingToken = None
+        self.updateOutputs(outputs)
+
+    def updateOutputs(self, outputs):
+        if not valuesAreEqual(outputs, self.outputs):
+            self.version += 1
+        self.outputs = outputs
+
+statesByNodeIdentifier = defaultdict(IncrementalNodeState)
+
+def getNodeState(identifier):
+    return statesByNodeIdentifier[identifier]
+
+def resetNodeStates():
+    statesByNodeIdentifier.clear()
+
+
+# Value Comparison
+##########################################
+
+# values of these types can't be changed in place
+immutableTypes = (int, float, bool, str, type(None), bpy.types.ID)
+comparableTypes = None
+
+def getComparableTypes():
+    # importing data_structures when this module is loaded creates a circular import
+    global comparableTypes
+    if comparableTypes is None:
+        from .. data_structures import CList
+        comparableTypes = immutableTypes + (Vector, Matrix, Euler, Quaternion, Color, CList)
+    return comparableTypes
+
+def valuesAreEqual(a, b):
+    '''
+    Returns False when it is not known whether the values are equal.
+    A mutable value is never equal to itself, because it might have been changed.
+    '''
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, tuple):
+        return len(a) == len(b) and all(map(valuesAreEqual, a, b))
+    if isinstance(a, list):
+        return a is not b and len(a) == len(b) and all(map(valuesAreEqual, a, b))
+    if isinstance(a, getComparableTypes()):
+        if a is b:
+            return isinstance(a, immutableTypes)
+        try: return bool(a == b)
+        except: return False
+    return False
+
+
+# Node Properties
+##########################################
+
+ignoredPropertyNames = {"identifier", "inInvalidNetwork", "useNetworkColor",
+                        "activeInputIndex", "activeOutputIndex", "cacheOutputs",
+                        "useDiskCache"}
+simplePropertyTypes = {"BOOLEAN", "INT", "FLOAT", "STRING", "ENUM"}
+
+def nodeSupportsIncrementalExecution(node):
+    if "PURE" not in node.options:
+        return False
+    return all(prop.type in simplePropertyTypes for prop in iterNodeProperties(node))
+
+def getPropertyTokenExpressions(node, nodeName):
+    expressions = []
+    for prop in iterNodeProperties(node):
+        expression = "{}.{}".format(nodeName, prop.identifier)
+        if getattr(prop, "is_array", False):
+            expression = "tuple({})".format(expression)
+        elif prop.type == "ENUM" and prop.is_enum_flag:
+            expression = "tuple(sorted({}))".format(expression)
+        expressions.append(expression)
+    return expressions
+
+def iterNodeProperties(node):
+    baseNames = bpy.types.Node.bl_rna.properties.keys()
+    for prop in node.bl_rna.properties:
+        name = prop.identifier
+        if name in baseNames or name in ignoredPropertyNames:
+            continue
+        yield prop
@@ -2,6 +2,7 @@ from .. sockets.info import toIdName
 from .. tree_info import getNodesByType
 from . compile_scripts import compileScript
 from .. problems import ExecutionUnitNotSetup
+from .. preferences import getExecutionCodeType
 from . code_generator import (getInitialVariables,
                               iterSetupCodeLines,
                               getCopyExpression,
@@ -10,6 +11,7 @@ from . code_generator import (getInitialVariables,
                               getLoadSocketValueLine,
                               iterInputConversionLines,
                               linkOutputSocketsToTargets,
+                              iterLinesInProfilerFrame,
                               getFunction_IterNodeExecutionLines)
 
 class LoopExecutionUnit:
@@ -159,10 +161,18 @@ class LoopExecutionUnit:
 
         iterNodeExecutionLines = getFunction_IterNodeExecutionLines()
         ignoreNodes = {"an_LoopInputNode", "an_LoopGeneratorOutputNode", "an_ReassignLoopParameterNode", "an_LoopBreakNode"}
+
+        lines = []
         for node in nodes:
             if node.bl_idname in ignoreNodes: continue
-            yield from iterNodeExecutionLines(node, variables)
-            yield from linkOutputSocketsToTargets(node, variables, nodeByID)
+            lines.extend(iterNodeExecutionLines(node, variables))
+            lines.extend(linkOutputSocketsToTargets(node, variables, nodeByID))
+
+        if getExecutionCodeType() == "PROFILE":
+            yield from iterLinesInProfilerFrame(
+                "_profiler.begin('Iteration', 'loop', {})".format(repr(self.network.treeName)), lines)
+        else:
+            yield from lines
 
         yield from self.iter_LoopBreak(inputNode, variables, nodeByID)
         yield from self.iter_AddToGenerators(inputNode, variables, nodeByID)
@@ -1,10 +1,26 @@
 import sys, traceback
+from itertools import chain
+from functools import partial
 from .. import problems
 from . compile_scripts import compileScript
+from .. preferences import getExecutionCodeType
 from .. problems import ExecutionUnitNotSetup, ExceptionDuringExecution
-from . code_generator import (getInitialVariables,
+from . code_generator import (toTupleContent,
+                              getConstantNodes,
+                              removeUnusedNodes,
+                              getInitialVariables,
                               iterSetupCodeLines,
+                              usesDiskCache,
+                              getNodeStateVariable,
+                              getDiskCacheLinkedIdentifiers,
+                              getDiskCacheDependencies,
                               linkOutputSocketsToTargets,
+                              iterNodeExecutionLines_Basic,
+                              iterNodeExecutionLines_DiskCache,
+                              getConstantTokenExpression,
+                              iterLinesInProfilerFrame,
+                              iterConstantBoundaryTargets,
+                              iterNodeExecutionLines_Incremental,
                               getFunction_IterNodeExecutionLines)
 
 class MainExecutionUnit:
@@ -53,16 +69,130 @@ class MainExecutionUnit:
         try: nodes = self.network.getSortedAnimationNodes(nodeByID)
         except: return
 
+        nodes = removeUnusedNodes(nodes, nodeByID)
+        if len(nodes) == 0: return
+
         variables = getInitialVariables(nodes)
-        self.setupScript = "\n".join(iterSetupCodeLines(nodes, variables))
-        self.executeScript = "\n".join(self.iterExecutionScriptLines(nodes, variables, nodeByID))
+        codeType = getExecutionCodeType()
+        if codeType == "INCREMENTAL":
+            self.setupScript = "\n".join(self.iterIncrementalSetupScriptLines(nodes, variables))
+            self.executeScript = "\n".join(self.iterIncrementalExecutionScriptLines(nodes, variables, nodeByID))
+        elif codeType == "PROFILE":
+            self.setupScript = "\n".join(iterSetupCodeLines(nodes, variables))
+            self.executeScript = "\n".join(self.iterProfiledExecutionScriptLines(nodes, variables, nodeByID))
+        elif codeType == "DEFAULT":
+            self.generateScriptsWithConstantFolding(nodes, variables, nodeByID)
+        else:
+            self.setupScript = "\n".join(iterSetupCodeLines(nodes, variables))
+            self.executeScript = "\n".join(self.iterExecutionScriptLines(nodes, variables, nodeByID))
+
+    def generateScriptsWithConstantFolding(self, nodes, variables, nodeByID):
+        constantNodes = getConstantNodes(nodes, nodeByID)
+        sortedConstantNodes = [node for node in nodes if node in constantNodes]
+        otherNodes = [node for node in nodes if node not in constantNodes]
+
+        # the constant nodes have to be handled first, because they change the variables
+        setupLines = list(iterSetupCodeLines(nodes, variables))
+        setupLines.append("_constant_exception = None")
+        setupLines.extend(self.iterConstantSetupScriptLines(sortedConstantNodes, nodes, variables, nodeByID))
+        executionLines = ["if _constant_exception is not None: raise _constant_exception"]
+        executionLines.extend(self.iterConstantCopyLines(sortedConstantNodes, nodes, variables, nodeByID))
+        executionLines.extend(self.iterExecutionScriptLines(otherNodes, variables, nodeByID))
+
+        self.setupScript = "\n".join(setupLines)
+        self.executeScript = "\n".join(executionLines)
+
+    def iterConstantSetupScriptLines(self, constantNodes, nodes, variables, nodeByID):
+        if len(constantNodes) == 0:
+            return
+
+        token = getConstantTokenExpression(constantNodes, variables)
+        lines = []
+        for node in constantNodes:
+            lines.append("_constant_node = {}".format(repr(node.identifier)))
+            lines.extend(iterNodeExecutionLines_Basic(node, variables))
+            lines.extend(linkOutputSocketsToTargets(node, variables, nodeByID))
+
+        names = []
+        for socket, target in iterConstantBoundaryTargets(constantNodes, set(nodes), nodeByID):
+            if variables[target] not in names:
+                names.append(variables[target])
+
+        key = repr(constantNodes[0].identifier)
+        yield ""
+        yield "# Constant Nodes"
+        yield "_constant_token = ({})".format(token)
+        yield "_constant_values = AN.execution.constant_folding.getConstantValues({}, _constant_token)".format(key)
+        yield "if _constant_values is None:"
+        yield "    try:"
+        for line in lines:
+            yield "        " + line
+        yield "        _constant_values = ({})".format(toTupleContent(names))
+        yield "        AN.execution.constant_folding.storeConstantValues({}, _constant_token, _constant_values)".format(key)
+        # the execution script raises the exception, so that it is handled like other exceptions
+        yield "    except Exception as e:"
+        yield "        animation_nodes.problems.NodeRaisesExceptionDuringExecution(_constant_node).report()"
+        yield "        _constant_exception = e"
+        yield "        _constant_values = ({})".format(toTupleContent(["None"] * len(names)))
+        if len(names) > 0:
+            yield "{} = _constant_values".format(toTupleContent(names))
+
+    def iterConstantCopyLines(self, constantNodes, nodes, variables, nodeByID):
+        # constant values are reused, so nodes must never change them
+        targets = iterConstantBoundaryTargets(constantNodes, set(nodes), nodeByID)
+        for i, (socket, target) in enumerate(targets):
+            if target.dataIsModified and socket.isCopyable():
+                newName = "{}_frame{}".format(variables[target], i)
+                yield "{} = {}".format(newName, socket.getCopyExpression().replace("value", variables[target]))
+                variables[target] = newName
 
     def iterExecutionScriptLines(self, nodes, variables, nodeByID):
         iterNodeExecutionLines = getFunction_IterNodeExecutionLines()
+        diskCacheDependencies = getDiskCacheDependencies(nodes, nodeByID)
+
+        for node in nodes:
+            yield from self.iterNodeScriptLines(node, variables, nodeByID,
+                iterNodeExecutionLines, diskCacheDependencies)
+
+    def iterProfiledExecutionScriptLines(self, nodes, variables, nodeByID):
+        yield from iterLinesInProfilerFrame(
+            "_profiler.beginExecution({})".format(repr(self.network.treeName)),
+            self.iterExecutionScriptLines(nodes, variables, nodeByID))
+
+    def iterIncrementalSetupScriptLines(self, nodes, variables):
+        yield from iterSetupCodeLines(nodes, variables)
+        for node in nodes:
+            yield "{} = animation_nodes.execution.incremental.getNodeState({})".format(
+                getNodeStateVariable(node), repr(node.identifier))
+
+    def iterIncrementalExecutionScriptLines(self, nodes, variables, nodeByID):
+        iterNodeExecutionLines = partial(iterNodeExecutionLines_Incremental, nodeByID = nodeByID)
+        diskCacheDependencies = getDiskCacheDependencies(nodes, nodeByID)
 
         for node in nodes:
-            yield from iterNodeExecutionLines(node, variables)
-            yield from linkOutputSocketsToTargets(node, variables, nodeByID)
+            yield from self.iterNodeScriptLines(node, variables, nodeByID,
+                iterNodeExecutionLines, diskCacheDependencies, copyAlways = True)
+
+    def iterNodeScriptLines(self, node, variables, nodeByID, iterNodeExecutionLines,
+                            diskCacheDependencies, copyAlways = False):
+        if usesDiskCache(node):
+            lines = iterNodeExecutionLines_DiskCache(node, variables, iterNodeExecutionLines)
+        else:
+            lines = iterNodeExecutionLines(node, variables)
+        lines = chain(lines, linkOutputSocketsToTargets(node, variables, nodeByID, copyAlways))
+
+        if node in diskCacheDependencies:
+            # the node only has to run when one of the cached nodes it feeds is not baked
+            # uses the same check as loadOutputs, so the cached nodes never run without their inputs
+            conditions = " and ".join("AN.execution.disk_cache.isFrameBaked({}, {})".format(
+                cachedNode.identifier, repr(getDiskCacheLinkedIdentifiers(cachedNode)))
+                for cachedNode in diskCacheDependencies[node])
+            yield "if not ({}):".format(conditions)
+            for line in lines:
+                yield "    " + line
+            yield "    pass"
+        else:
+            yield from lines
 
     def compileScripts(self):
         self.setupCodeObject = compileScript(self.setupScript, name = "setup: {}".format(repr(self.network.treeName)))
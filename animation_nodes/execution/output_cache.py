@@ -0,0 +1,129 @@
+import sys
+import bpy
+from collections import OrderedDict
+from mathutils import Vector, Matrix, Euler, Quaternion
+from .. utils.operators import makeOperator
+from .. preferences import getExecutionCodeSettings
+from .. data_structures import CList, PolygonIndicesList, Mesh, PolySpline, BezierSpline
+
+class OutputCache:
+    '''
+    Least recently used cache for node outputs.
+    The total size of the stored outputs never exceeds the budget.
+    '''
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.clear()
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        if key is None:
+            return None
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def store(self, key, outputs, budget):
+        if key is None:
+            return
+        # keys contain copies of the list inputs
+        size = getValueSize(outputs) + getKeySize(key)
+        if size > budget:
+            return
+        if key in self.entries:
+            self.size -= self.entries.pop(key)[1]
+        while self.size + size > budget:
+            _, (_, evictedSize) = self.entries.popitem(last = False)
+            self.size -= evictedSize
+            self.evictions += 1
+        self.entries[key] = (outputs, size)
+        self.size += size
+
+outputCache = OutputCache()
+
+def getCachedOutputs(key):
+    return outputCache.get(key)
+
+def storeOutputs(key, outputs):
+    budget = getExecutionCodeSettings().outputCacheSize * 1024 ** 2
+    outputCache.store(key, outputs, budget)
+
+def createKey(identifier, inputs, properties, required):
+    try: return (identifier, getValueKey(inputs), properties, required)
+    except UnhashableValue: return None
+
+@makeOperator("an.clear_output_cache", "Clear Output Cache", redraw = True)
+def clearOutputCache():
+    outputCache.clear()
+
+
+# Value Keys
+##########################################
+
+class UnhashableValue(Exception):
+    pass
+
+simpleTypes = (int, float, bool, str, type(None))
+
+def getValueKey(value):
+    if isinstance(value, simpleTypes):
+        return value
+    if isinstance(value, (tuple, list)):
+        return tuple(getValueKey(element) for element in value)
+    if isinstance(value, (Vector, Euler, Quaternion)):
+        return (type(value).__name__, tuple(value))
+    if isinstance(value, Matrix):
+        return ("Matrix", tuple(tuple(row) for row in value))
+    if isinstance(value, CList):
+        # the full content, so that different lists can never share a key
+        return (type(value).__name__, value.asBytes())
+    if isinstance(value, PolygonIndicesList):
+        return ("PolygonIndicesList", getValueKey(value.indices), getValueKey(value.polyLengths))
+    if isinstance(value, Mesh):
+        return ("Mesh", getValueKey(value.vertices), getValueKey(value.edges),
+                getValueKey(value.polygons), getValueKey(value.materialIndices),
+                getValueKey(value.getUVMaps()),
+                getValueKey(value.getVertexColorLayers()))
+    if isinstance(value, PolySpline):
+        return ("PolySpline", value.cyclic, value.materialIndex, getValueKey(value.points),
+                getValueKey(value.radii), getValueKey(value.tilts))
+    if isinstance(value, BezierSpline):
+        return ("BezierSpline", value.cyclic, value.materialIndex, getValueKey(value.points),
+                getValueKey(value.leftHandles), getValueKey(value.rightHandles),
+                getValueKey(value.radii), getValueKey(value.tilts))
+    if isinstance(value, bpy.types.ID):
+        return ("ID", value.as_pointer())
+    raise UnhashableValue()
+
+def getKeySize(key):
+    if isinstance(key, tuple):
+        return sum(getKeySize(element) for element in key)
+    if isinstance(key, bytes):
+        return len(key)
+    return 0
+
+
+# Value Sizes
+##########################################
+
+def getValueSize(value):
+    if isinstance(value, (tuple, list)):
+        return sum(getValueSize(element) for element in value)
+    if isinstance(value, CList):
+        return value.getMemoryUsage()
+    if isinstance(value, PolygonIndicesList):
+        return getValueSize((value.indices, value.polyStarts, value.polyLengths))
+    if isinstance(value, Mesh):
+        return getValueSize((value.vertices, value.edges, value.polygons, value.materialIndices,
+                             value.getUVMaps(), value.getVertexColorLayers()))
+    return sys.getsizeof(value)
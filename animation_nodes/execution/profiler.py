@@ -0,0 +1,129 @@
+import bpy
+import json
+from bpy.props import *
+from time import perf_counter as getCurrentTime
+from .. utils.operators import makeOperator
+
+class Profiler:
+    '''
+    Records when frames are opened and closed during the execution.
+    Frames are nested: a tree contains nodes, a node contains the
+    conversion, copy and body buckets and the body of a node that
+    invokes a subprogram contains the nodes of the subprogram.
+    '''
+    maxEventAmount = 2_000_000
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        # (isOpen, frame, time) with frame = (name, category, treeName)
+        self.events = []
+        self.openFrames = []
+        self.droppedEvents = 0
+
+    def beginExecution(self, treeName):
+        # frames stay open when an exception was raised in the previous execution
+        self.closeOpenFrames()
+        self.begin(treeName, "tree", treeName)
+
+    def begin(self, name, category, treeName):
+        if len(self.events) >= self.maxEventAmount:
+            self.droppedEvents += 1
+            self.openFrames.append(None)
+            return
+        frame = (name, category, treeName)
+        self.openFrames.append(frame)
+        self.events.append((True, frame, getCurrentTime()))
+
+    def end(self):
+        frame = self.openFrames.pop()
+        if frame is not None:
+            self.events.append((False, frame, getCurrentTime()))
+
+    def closeOpenFrames(self):
+        while len(self.openFrames) > 0:
+            self.end()
+
+    @property
+    def isEmpty(self):
+        return len(self.events) == 0
+
+profiler = Profiler()
+
+def getProfiler():
+    return profiler
+
+
+# Export
+##########################################
+
+def toChromeTrace(profiler):
+    events = []
+    for isOpen, (name, category, treeName), time in profiler.events:
+        events.append({
+            "name" : name,
+            "cat" : category,
+            "ph" : "B" if isOpen else "E",
+            "ts" : time * 1_000_000,
+            "pid" : 0,
+            "tid" : 0,
+            "args" : {"tree" : treeName}})
+    return {"traceEvents" : events, "displayTimeUnit" : "ms"}
+
+def toSpeedscope(profiler):
+    frames = []
+    frameIndices = {}
+    events = []
+    for isOpen, frame, time in profiler.events:
+        if frame not in frameIndices:
+            name, category, treeName = frame
+            frameIndices[frame] = len(frames)
+            frames.append({"name" : name, "file" : "{} ({})".format(treeName, category)})
+        events.append({"type" : "O" if isOpen else "C", "frame" : frameIndices[frame], "at" : time})
+
+    return {
+        "$schema" : "https://www.speedscope.app/file-format-schema.json",
+        "exporter" : "Animation Nodes",
+        "name" : "Animation Nodes Execution",
+        "shared" : {"frames" : frames},
+        "profiles" : [{
+            "type" : "evented",
+            "name" : "Animation Nodes Execution",
+            "unit" : "seconds",
+            "startValue" : events[0]["at"] if len(events) > 0 else 0,
+            "endValue" : events[-1]["at"] if len(events) > 0 else 0,
+            "events" : events}]}
+
+exportFormatItems = [
+    ("CHROME", "Chrome Trace", "Can be opened in chrome://tracing and Perfetto", "NONE", 0),
+    ("SPEEDSCOPE", "Speedscope", "Can be opened in speedscope.app", "NONE", 1)]
+
+class ExportProfile(bpy.types.Operator):
+    bl_idname = "an.export_profile"
+    bl_label = "Export Profile"
+    bl_description = "Write the recorded profile to a json file"
+
+    filepath: StringProperty(subtype = "FILE_PATH")
+    exportFormat: EnumProperty(name = "Format", items = exportFormatItems, default = "CHROME")
+
+    def invoke(self, context, event):
+        if self.filepath == "":
+            self.filepath = "animation_nodes_profile.json"
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        profiler.closeOpenFrames()
+        if self.exportFormat == "CHROME":
+            data = toChromeTrace(profiler)
+        else:
+            data = toSpeedscope(profiler)
+
+        with open(bpy.path.abspath(self.filepath), "w") as f:
+            json.dump(data, f)
+        return {"FINISHED"}
+
+@makeOperator("an.reset_profile", "Reset Profile", redraw = True)
+def resetProfile():
+    profiler.reset()
@@ -0,0 +1,105 @@
+import bpy
+import hashlib
+from .. tree_info import getLinkedSocketsIDs, getNetworkByIdentifier
+from .. preferences import getExecutionCodeSettings
+
+class UnhashableStructure(Exception):
+    pass
+
+def getNetworkStructureHashes(networks, nodeByID):
+    '''
+    The hash of a network changes when something changes that can change the
+    generated code: nodes, their properties, sockets, links, invoked subprograms
+    and the execution code settings. The hash is None when it can't be computed.
+    '''
+    hashes = {}
+    for network in networks:
+        hashes[network] = getNetworkStructureHash(network, nodeByID, hashes, set())
+    return hashes
+
+def getNetworkStructureHash(network, nodeByID, hashes, visitedIdentifiers):
+    if network in hashes:
+        return hashes[network]
+    try:
+        parts = getNetworkStructure(network, nodeByID, hashes, visitedIdentifiers)
+        structureHash = hashlib.sha1(repr(parts).encode()).hexdigest()
+    except UnhashableStructure:
+        structureHash = None
+    hashes[network] = structureHash
+    return structureHash
+
+def getNetworkStructure(network, nodeByID, hashes, visitedIdentifiers):
+    nodes = sorted(network.getAnimationNodes(nodeByID), key = lambda node: node.identifier)
+    return (network.type, network.identifier, network.name, sorted(network.nodeIDs),
+            getPropertyValues(getExecutionCodeSettings()),
+            getInvokedSubprogramHashes(network, nodeByID, hashes, visitedIdentifiers),
+            [getNodeStructure(node) for node in nodes])
+
+def getInvokedSubprogramHashes(network, nodeByID, hashes, visitedIdentifiers):
+    if network.identifier is not None:
+        if network.identifier in visitedIdentifiers:
+            raise UnhashableStructure()
+        visitedIdentifiers = visitedIdentifiers | {network.identifier}
+
+    subprogramHashes = []
+    for identifier in sorted(network.getInvokedSubprogramIdentifiers(nodeByID)):
+        subprogram = getNetworkByIdentifier(identifier)
+        if subprogram is None:
+            subprogramHashes.append((identifier, None))
+            continue
+        subprogramHash = getNetworkStructureHash(subprogram, nodeByID, hashes, visitedIdentifiers)
+        if subprogramHash is None:
+            raise UnhashableStructure()
+        subprogramHashes.append((identifier, subprogramHash))
+    return subprogramHashes
+
+def getNodeStructure(node):
+    return (node.bl_idname, node.identifier, node.name, sorted(node.options),
+            getPropertyValues(node, nodeBaseNames),
+            [getSocketStructure(socket) for socket in node.inputs],
+            [getSocketStructure(socket) for socket in node.outputs])
+
+def getSocketStructure(socket):
+    return (socket.bl_idname, socket.identifier, socket.name, socket.hide,
+            getPropertyValues(socket, socketBaseNames),
+            sorted(getLinkedSocketsIDs(socket)))
+
+
+# Property Values
+##########################################
+
+nodeBaseNames = set(bpy.types.Node.bl_rna.properties.keys())
+nodeBaseNames.update(("inInvalidNetwork", "useNetworkColor"))
+socketBaseNames = set(bpy.types.NodeSocket.bl_rna.properties.keys())
+# contains the amount of copies that is written by the code generator
+socketBaseNames.add("execution")
+
+def getPropertyValues(owner, ignoredNames = set()):
+    values = []
+    for prop in owner.bl_rna.properties:
+        name = prop.identifier
+        if name in ignoredNames or name == "rna_type":
+            continue
+        values.append((name, getPropertyValue(prop, getattr(owner, name))))
+    return values
+
+def getPropertyValue(prop, value):
+    if prop.type == "POINTER":
+        if value is None:
+            return None
+        if isinstance(value, bpy.types.ID):
+            return (type(value).__name__, value.name)
+        if isinstance(value, bpy.types.PropertyGroup):
+            return getPropertyValues(value)
+        raise UnhashableStructure()
+    if prop.type == "COLLECTION":
+        return [getPropertyValues(item) for item in value]
+    if getattr(prop, "is_array", False):
+        return toNestedTuple(value)
+    if prop.type == "ENUM" and prop.is_enum_flag:
+        return sorted(value)
+    return value
+
+def toNestedTuple(value):
+    try: return tuple(toNestedTuple(element) for element in value)
+    except TypeError: return value
@@ -0,0 +1,46 @@
+from unittest import TestCase
+from . output_cache import OutputCache, getValueKey, getValueSize
+from .. data_structures import (
+    Mesh, Vector3DList, Vector2DList, EdgeIndicesList, PolygonIndicesList, LongList, DoubleList
+)
+
+def createQuad():
+    vertices = Vector3DList.fromValues([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+    edges = EdgeIndicesList.fromValues([(0, 1), (1, 2), (2, 3), (3, 0)])
+    polygons = PolygonIndicesList.fromValues([(0, 1, 2, 3)])
+    return Mesh(vertices, edges, polygons, LongList.fromValues([0]))
+
+class TestValueKey(TestCase):
+    def testEqualLists(self):
+        a = DoubleList.fromValues([1, 2, 3])
+        b = DoubleList.fromValues([1, 2, 3])
+        self.assertEqual(getValueKey(a), getValueKey(b))
+
+    def testDifferentLists(self):
+        a = DoubleList.fromValues([1, 2, 3])
+        b = DoubleList.fromValues([1, 2, 4])
+        self.assertNotEqual(getValueKey(a), getValueKey(b))
+
+    def testMesh(self):
+        a = createQuad()
+        b = createQuad()
+        self.assertEqual(getValueKey(a), getValueKey(b))
+
+        b.insertUVMap("UV", Vector2DList.fromValues([(0, 0), (1, 0), (1, 1), (0, 1)]))
+        self.assertNotEqual(getValueKey(a), getValueKey(b))
+
+class TestValueSize(TestCase):
+    def testMesh(self):
+        mesh = createQuad()
+        size = getValueSize(mesh)
+        mesh.insertUVMap("UV", Vector2DList.fromValues([(0, 0), (1, 0), (1, 1), (0, 1)]))
+        self.assertGreater(getValueSize(mesh), size)
+
+class TestOutputCache(TestCase):
+    def testEviction(self):
+        cache = OutputCache()
+        cache.store(("a", ), DoubleList(length = 100), budget = 1000)
+        cache.store(("b", ), DoubleList(length = 100), budget = 1000)
+        self.assertIsNone(cache.get(("a", )))
+        self.assertIsNotNone(cache.get(("b", )))
+        self.assertEqual(cache.evictions, 1)
@@ -2,12 +2,15 @@ import traceback
 from .. import problems
 from collections import defaultdict
 from . cache import clearExecutionCache
+from . incremental import resetNodeStates
+from . constant_folding import resetConstantValues
 from . measurements import resetMeasurements
 from . main_execution_unit import MainExecutionUnit
 from . loop_execution_unit import LoopExecutionUnit
 from . group_execution_unit import GroupExecutionUnit
 from . script_execution_unit import ScriptExecutionUnit
-from .. tree_info import getNetworksByType, getSubprogramNetworks
+from . structure_hash import getNetworkStructureHashes
+from .. tree_info import getNetworks, getNetworksByType, getSubprogramNetworks
 from .. utils.nodes import getAnimationNodeTrees, iterAnimationNodes
 from .. problems import ExceptionDuringCodeCreation, CouldNotSetupExecutionUnits
 
@@ -15,10 +18,14 @@ _mainUnitsByNodeTree = defaultdict(list)
 _subprogramUnitsByIdentifier = {}
 
 def createExecutionUnits(nodeByID):
+    previousUnits = getExecutionUnits()
     reset()
     try:
-        createMainUnits(nodeByID)
-        createSubprogramUnits(nodeByID)
+        structureHashes = getNetworkStructureHashes(getNetworks(), nodeByID)
+        unitsByHash = {unit.structureHash : unit for unit in previousUnits
+                       if getattr(unit, "structureHash", None) is not None}
+        createMainUnits(nodeByID, structureHashes, unitsByHash)
+        createSubprogramUnits(nodeByID, structureHashes, unitsByHash)
     except:
         print("\n"*5)
         traceback.print_exc()
@@ -26,6 +33,8 @@ def createExecutionUnits(nodeByID):
 
 def reset():
     resetMeasurements()
+    resetNodeStates()
+    resetConstantValues()
     _mainUnitsByNodeTree.clear()
     _subprogramUnitsByIdentifier.clear()
 
@@ -33,21 +42,53 @@ def reset():
         for socket in node.outputs:
             socket.execution.neededCopies = 0
 
-def createMainUnits(nodeByID):
+def createMainUnits(nodeByID, structureHashes, unitsByHash):
     for network in getNetworksByType("Main"):
-        unit = MainExecutionUnit(network, nodeByID)
+        unit = getOrCreateUnit(MainExecutionUnit, network, nodeByID, structureHashes, unitsByHash)
         _mainUnitsByNodeTree[network.treeName].append(unit)
 
-def createSubprogramUnits(nodeByID):
+def createSubprogramUnits(nodeByID, structureHashes, unitsByHash):
     for network in getSubprogramNetworks():
         if network.type == "Group":
-            unit = GroupExecutionUnit(network, nodeByID)
+            unitType = GroupExecutionUnit
         if network.type == "Loop":
-            unit = LoopExecutionUnit(network, nodeByID)
+            unitType = LoopExecutionUnit
         if network.type == "Script":
-            unit = ScriptExecutionUnit(network, nodeByID)
+            unitType = ScriptExecutionUnit
+        unit = getOrCreateUnit(unitType, network, nodeByID, structureHashes, unitsByHash)
         _subprogramUnitsByIdentifier[network.identifier] = unit
 
+def getOrCreateUnit(unitType, network, nodeByID, structureHashes, unitsByHash):
+    '''
+    Units of networks that did not change since the last update are reused,
+    so that only the code of changed networks is generated again.
+    '''
+    structureHash = structureHashes.get(network)
+    unit = unitsByHash.pop(structureHash, None)
+    if type(unit) is unitType:
+        unit.network = network
+        restoreNeededCopies(unit.neededCopies, nodeByID)
+        return unit
+
+    problemAmount = len(problems.currentProblems)
+    unit = unitType(network, nodeByID)
+    # units that reported problems are created again, so that the problems are reported again
+    unit.structureHash = structureHash if len(problems.currentProblems) == problemAmount else None
+    unit.neededCopies = getNeededCopies(network, nodeByID)
+    return unit
+
+def getNeededCopies(network, nodeByID):
+    neededCopies = {}
+    for node in network.getAnimationNodes(nodeByID):
+        for socket in node.outputs:
+            if socket.execution.neededCopies > 0:
+                neededCopies[socket.toID()] = socket.execution.neededCopies
+    return neededCopies
+
+def restoreNeededCopies(neededCopies, nodeByID):
+    for (nodeID, isOutput, identifier), amount in neededCopies.items():
+        nodeByID[nodeID].outputsByIdentifier[identifier].execution.neededCopies = amount
+
 
 def setupExecutionUnits():
     try:
@@ -14,3 +14,7 @@ Data_Type, Subproperty_Name and Property_Name must not be empty nor contain '*'.
 from . data_types import keyDataTypeItems
 from . data_types import dataTypeByIdentifier as IDKeyTypes
 from . existing_keys import getAllIDKeys, updateIdKeysList, IDKey, findsIDKeys
+from . packed_storage import (
+    packableDataTypes, hasPackedIDKey, getPackedIDKey,
+    setPackedValues, packIDKey, unpackIDKey
+)
@@ -1,5 +1,6 @@
 import bpy
 from . existing_keys import getAllIDKeys, IDKey, getUnremovableIDKeys
+from . packed_storage import packableDataTypes, getPackingCollection, getPackedObjectValue
 from .. utils.layout import splitAlignment
 from .. utils.operators import makeOperator
 
@@ -37,6 +38,14 @@ class IDKeyPanel(bpy.types.Panel):
             props.propertyName = idKey.name
             row.label(text = idKey.name)
 
+            if idKey.type in packableDataTypes:
+                props = row.operator("an.pack_id_key", text = "", icon = "PACKAGE", emboss = False)
+                props.dataType = idKey.type
+                props.propertyName = idKey.name
+                props = row.operator("an.unpack_id_key", text = "", icon = "UGLYPACKAGE", emboss = False)
+                props.dataType = idKey.type
+                props.propertyName = idKey.name
+
             if idKey not in unremovableIDKeys:
                 props = row.operator("an.remove_id_key", text = "", icon = "X", emboss = False)
                 props.dataType = idKey.type
@@ -51,9 +60,24 @@ class IDKeyPanel(bpy.types.Panel):
         box = layout.box()
         exists = object.id_keys.exists(*idKey)
         self.drawIDKeyHeader(box, object, idKey, exists)
-        if exists: object.id_keys.drawProperty(box, *idKey)
+        # objects cannot be renamed while drawing
+        collection = getPackingCollection(object, *idKey, renameObjects = False)
+        if collection is not None: self.drawPackedValue(box, object, idKey, collection)
+        elif exists: object.id_keys.drawProperty(box, *idKey)
         object.id_keys.drawExtras(box, *idKey)
 
+    def drawPackedValue(self, layout, object, idKey, collection):
+        # the ID properties of the object are not used for packed values,
+        # so editing them here would have no effect
+        col = layout.column(align = True)
+        col.label(text = "Packed in {}".format(repr(collection.name)), icon = "PACKAGE")
+        value = getPackedObjectValue(object, *idKey, renameObjects = False)
+        if idKey.type == "Transforms":
+            for label, vector in zip(["Location", "Rotation", "Scale"], value):
+                col.label(text = "{}: {}".format(label, ", ".join("{:.3f}".format(x) for x in vector)))
+        else:
+            col.label(text = str(round(value, 4)))
+
     def drawIDKeyHeader(self, layout, object, idKey, exists):
         left, right = splitAlignment(layout)
         left.label(text = idKey.name)
@@ -1,6 +1,9 @@
 import bpy
 from bpy.props import *
 from . data_types import dataTypeByIdentifier
+from . packed_storage import (
+    getPackedObjectValue, getPackingCollection, updatePackedObject, removePackedObject
+)
 
 def checkIDKeyName(name):
     if "*" in name:
@@ -11,14 +14,22 @@ def checkIDKeyName(name):
 class IDKeyProperties(bpy.types.PropertyGroup):
     bl_idname = "an_IDKeyProperties"
 
+    # the packed value of an object is used instead of its ID properties
+
     def _getIDKeyData(self, dataType, propertyName):
+        value = getPackedObjectValue(self.id_data, dataType, propertyName)
+        if value is not None:
+            return value
         return dataTypeByIdentifier[dataType].get(self.id_data, propertyName)
 
     def _setIDKeyData(self, dataType, propertyName, data):
-        return dataTypeByIdentifier[dataType].set(self.id_data, propertyName, data)
+        dataTypeByIdentifier[dataType].set(self.id_data, propertyName, data)
+        updatePackedObject(self.id_data, dataType, propertyName)
 
     def _doesIDKeyExist(self, dataType, propertyName):
-        return dataTypeByIdentifier[dataType].exists(self.id_data, propertyName)
+        if dataTypeByIdentifier[dataType].exists(self.id_data, propertyName):
+            return True
+        return getPackingCollection(self.id_data, dataType, propertyName, renameObjects = False) is not None
 
     def _drawProperty(self, layout, dataType, propertyName):
         dataTypeByIdentifier[dataType].drawProperty(layout, self.id_data, propertyName)
@@ -29,9 +40,11 @@ class IDKeyProperties(bpy.types.PropertyGroup):
     def _createIDKey(self, dataType, propertyName):
         checkIDKeyName(propertyName)
         dataTypeByIdentifier[dataType].create(self.id_data, propertyName)
+        updatePackedObject(self.id_data, dataType, propertyName)
 
     def _removeIDKey(self, dataType, propertyName):
         dataTypeByIdentifier[dataType].remove(self.id_data, propertyName)
+        removePackedObject(self.id_data, dataType, propertyName)
 
     get = _getIDKeyData
     set = _setIDKeyData
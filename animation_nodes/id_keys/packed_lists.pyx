@@ -0,0 +1,153 @@
+from .. math cimport Vector3, Euler3
+from .. data_structures cimport (
+    Vector3DList, EulerList, FloatList, DoubleList, LongList, BooleanList
+)
+
+'''
+Packed ID Keys store their values in lists whose order is the order of the
+packed object names. Reading and writing the values of many objects then
+only has to find the index of every object once.
+'''
+
+# Indices
+###########################################
+
+def getObjectIndices(objects, dict indexByName):
+    '''
+    The index is -1 for objects that are not packed.
+    '''
+    cdef LongList indices = LongList(length = len(objects))
+    cdef Py_ssize_t i
+    for i, object in enumerate(objects):
+        if object is None: indices.data[i] = -1
+        else: indices.data[i] = indexByName.get(object.name, -1)
+    return indices
+
+def getUnpackedPositions(objects, LongList indices):
+    '''
+    Positions of the objects that are not None and not packed.
+    '''
+    cdef LongList positions = LongList()
+    cdef Py_ssize_t i
+    for i in range(indices.length):
+        if indices.data[i] < 0 and objects[i] is not None:
+            positions.append(i)
+    return positions
+
+def indicesExist(LongList indices):
+    cdef BooleanList exists = BooleanList(length = indices.length)
+    cdef Py_ssize_t i
+    for i in range(indices.length):
+        exists.data[i] = indices.data[i] >= 0
+    return exists
+
+
+# Read
+###########################################
+
+def gatherVectors(Vector3DList source, LongList indices, default):
+    cdef Vector3DList result = Vector3DList(length = indices.length)
+    cdef Vector3 _default
+    cdef Py_ssize_t i
+    _default.x, _default.y, _default.z = default
+    for i in range(indices.length):
+        if indices.data[i] >= 0: result.data[i] = source.data[indices.data[i]]
+        else: result.data[i] = _default
+    return result
+
+def gatherEulers(EulerList source, LongList indices):
+    cdef EulerList result = EulerList(length = indices.length)
+    cdef Euler3 _default = Euler3(0, 0, 0, 0)
+    cdef Py_ssize_t i
+    for i in range(indices.length):
+        if indices.data[i] >= 0: result.data[i] = source.data[indices.data[i]]
+        else: result.data[i] = _default
+    return result
+
+def gatherDoubles(DoubleList source, LongList indices, double default):
+    cdef DoubleList result = DoubleList(length = indices.length)
+    cdef Py_ssize_t i
+    for i in range(indices.length):
+        if indices.data[i] >= 0: result.data[i] = source.data[indices.data[i]]
+        else: result.data[i] = default
+    return result
+
+def gatherLongs(LongList source, LongList indices, long default):
+    cdef LongList result = LongList(length = indices.length)
+    cdef Py_ssize_t i
+    for i in range(indices.length):
+        if indices.data[i] >= 0: result.data[i] = source.data[indices.data[i]]
+        else: result.data[i] = default
+    return result
+
+
+# Write
+###########################################
+
+# values at negative indices are skipped
+
+def scatterVectors(Vector3DList target, LongList indices, Vector3DList values):
+    checkLengths(indices, values)
+    cdef Py_ssize_t i
+    for i in range(indices.length):
+        if indices.data[i] >= 0: target.data[indices.data[i]] = values.data[i]
+
+def scatterEulers(EulerList target, LongList indices, EulerList values):
+    checkLengths(indices, values)
+    cdef Py_ssize_t i
+    for i in range(indices.length):
+        if indices.data[i] >= 0: target.data[indices.data[i]] = values.data[i]
+
+def scatterDoubles(DoubleList target, LongList indices, DoubleList values):
+    checkLengths(indices, values)
+    cdef Py_ssize_t i
+    for i in range(indices.length):
+        if indices.data[i] >= 0: target.data[indices.data[i]] = values.data[i]
+
+def scatterLongs(LongList target, LongList indices, LongList values):
+    checkLengths(indices, values)
+    cdef Py_ssize_t i
+    for i in range(indices.length):
+        if indices.data[i] >= 0: target.data[indices.data[i]] = values.data[i]
+
+def scatterBooleans(BooleanList target, LongList indices, BooleanList values):
+    checkLengths(indices, values)
+    cdef Py_ssize_t i
+    for i in range(indices.length):
+        if indices.data[i] >= 0: target.data[indices.data[i]] = values.data[i]
+
+cdef checkLengths(LongList indices, values):
+    if indices.length != len(values):
+        raise ValueError("expected {} values, got {}".format(indices.length, len(values)))
+
+
+# Euler Conversion
+###########################################
+
+def eulersFromArrays(FloatList values, LongList orders):
+    '''
+    ID properties cannot store eulers, so they are stored as
+    three angles and the rotation order index per euler.
+    '''
+    cdef EulerList eulers = EulerList(length = orders.length)
+    cdef Py_ssize_t i
+    if values.length != orders.length * 3:
+        raise ValueError("expected three angles per rotation order")
+
+    for i in range(orders.length):
+        eulers.data[i].x = values.data[i * 3 + 0]
+        eulers.data[i].y = values.data[i * 3 + 1]
+        eulers.data[i].z = values.data[i * 3 + 2]
+        eulers.data[i].order = <char>orders.data[i]
+    return eulers
+
+def eulersToArrays(EulerList eulers):
+    cdef FloatList values = FloatList(length = eulers.length * 3)
+    cdef LongList orders = LongList(length = eulers.length)
+    cdef Py_ssize_t i
+    for i in range(eulers.length):
+        values.data[i * 3 + 0] = eulers.data[i].x
+        values.data[i * 3 + 1] = eulers.data[i].y
+        values.data[i * 3 + 2] = eulers.data[i].z
+        orders.data[i] = eulers.data[i].order
+    return values, orders
@@ -0,0 +1,511 @@
+import bpy
+import numpy
+from mathutils import Euler
+from .. utils.handlers import eventHandler
+from .. utils.operators import makeOperator
+from . data_types import dataTypeByIdentifier
+from . existing_keys import removesIDKey
+from .. data_structures import Vector3DList, EulerList, FloatList, DoubleList, LongList
+from . packed_lists import (
+    getObjectIndices, getUnpackedPositions, indicesExist,
+    gatherVectors, gatherEulers, gatherDoubles, gatherLongs,
+    scatterVectors, scatterEulers, scatterDoubles, scatterLongs, scatterBooleans,
+    eulersFromArrays, eulersToArrays
+)
+
+'''
+A packed ID Key stores the values of an ID Key for many objects in one
+ID property group on a collection:
+    AN*Packed*Data_Type*Property_Name
+
+The group contains the names of the packed objects, an array per value
+and a revision that is increased on every write. Reading the values of
+many objects does not have to access the ID properties of every object.
+
+The arrays are converted to lists once per revision. The converted lists
+are cached for the rest of the session.
+
+The values of objects that are not packed are read from the ID properties
+of the objects. The packed value of an object is its value, so
+object.id_keys.set, get and remove use the packed ID Keys that contain the
+object. setPackedValues does not change the ID properties of the objects.
+
+Packed objects store the name they have been packed with. When a packed
+object is not found by its name, it has been renamed and the packed ID Keys
+are renamed as well, unless an object with the old name still exists.
+'''
+
+packableDataTypes = {"Transforms", "Float", "Integer"}
+packedNameKey = "AN*Packed*Name"
+cachedPackedIDKeys = {}
+
+# (data type, name) -> names of the collections that contain the packed ID Key
+packedCollectionNames = {}
+knownCollectionAmount = 0
+
+def getPackedKey(dataType, name):
+    return "AN*Packed*%s*%s" % (dataType, name)
+
+def hasPackedIDKey(collection, dataType, name):
+    return collection is not None and getPackedKey(dataType, name) in collection
+
+def getPackedIDKey(collection, dataType, name):
+    '''
+    Returns None when the collection does not contain this ID Key.
+    '''
+    if not hasPackedIDKey(collection, dataType, name):
+        return None
+
+    group = collection[getPackedKey(dataType, name)]
+    cacheKey = (collection.as_pointer(), dataType, name)
+    packed = cachedPackedIDKeys.get(cacheKey)
+    if packed is None or packed.revision != group["revision"]:
+        packed = packedIDKeyTypes[dataType].fromGroup(group, name)
+        cachedPackedIDKeys[cacheKey] = packed
+    return packed
+
+def setPackedValues(collection, dataType, name, objects, *values):
+    '''
+    Objects that are not packed yet are added to the ID Key.
+    None objects are skipped.
+    '''
+    if dataType not in packableDataTypes:
+        raise Exception("ID Keys of type {} cannot be packed".format(repr(dataType)))
+
+    packed = getPackedIDKey(collection, dataType, name)
+    if packed is None:
+        packed = packedIDKeyTypes[dataType](name, [], 0)
+
+    indices = packed.addObjects(objects)
+    packed.setValues(indices, *values)
+    packed.revision += 1
+
+    key = getPackedKey(dataType, name)
+    if key not in collection:
+        collection[key] = {}
+        packedCollectionNames.pop((dataType, name), None)
+    packed.writeGroup(collection[key])
+    cachedPackedIDKeys[(collection.as_pointer(), dataType, name)] = packed
+
+def removePackedIDKey(collection, dataType, name):
+    key = getPackedKey(dataType, name)
+    if key in collection:
+        del collection[key]
+    cachedPackedIDKeys.pop((collection.as_pointer(), dataType, name), None)
+    packedCollectionNames.pop((dataType, name), None)
+
+def getPackedCollections(dataType, name):
+    '''
+    Collections that contain a packed ID Key with this type and name.
+    '''
+    global knownCollectionAmount
+    key = getPackedKey(dataType, name)
+    names = packedCollectionNames.get((dataType, name))
+    if names is not None and knownCollectionAmount == len(bpy.data.collections):
+        collections = [bpy.data.collections.get(collectionName) for collectionName in names]
+        # collections can be renamed or lose the ID Key, e.g. in the ui
+        if all(collection is not None and key in collection for collection in collections):
+            return collections
+
+    if knownCollectionAmount != len(bpy.data.collections):
+        packedCollectionNames.clear()
+        knownCollectionAmount = len(bpy.data.collections)
+
+    collections = [collection for collection in bpy.data.collections if key in collection]
+    packedCollectionNames[(dataType, name)] = [collection.name for collection in collections]
+    return collections
+
+@eventHandler("FILE_LOAD_POST")
+@eventHandler("UNDO_POST")
+def clearPackedIDKeyCache():
+    cachedPackedIDKeys.clear()
+    packedCollectionNames.clear()
+
+
+# Pack and Unpack
+###########################################
+
+def packIDKey(collection, dataType, name):
+    '''
+    Copy the ID Key of all objects in the collection that have it.
+    '''
+    if dataType not in packableDataTypes:
+        raise Exception("ID Keys of type {} cannot be packed".format(repr(dataType)))
+
+    typeClass = dataTypeByIdentifier[dataType]
+    objects = [object for object in collection.all_objects if typeClass.exists(object, name)]
+    setPackedValues(collection, dataType, name, objects, *getObjectValues(dataType, objects, name))
+
+def getObjectValues(dataType, objects, name):
+    # read from the ID properties of the objects
+    typeClass = dataTypeByIdentifier[dataType]
+    if dataType == "Transforms":
+        return (typeClass.getLocations(objects, name),
+                typeClass.getRotations(objects, name),
+                typeClass.getScales(objects, name))
+    else:
+        return (typeClass.getList(objects, name), )
+
+def unpackIDKey(collection, dataType, name):
+    '''
+    Write the packed values back to the ID properties of the objects.
+    '''
+    packed = getPackedIDKey(collection, dataType, name)
+    if packed is None:
+        return
+
+    typeClass = dataTypeByIdentifier[dataType]
+    objects = [object for object in collection.all_objects if object.name in packed.indexByName]
+    for object, value in zip(objects, packed.iterValues(objects)):
+        typeClass.set(object, name, value)
+
+@makeOperator("an.pack_id_key", "Pack ID Key", arguments = ["String", "String"],
+              description = "Store this ID Key of all objects in the active collection in the collection")
+def packIDKeyInActiveCollection(dataType, propertyName):
+    packIDKey(bpy.context.collection, dataType, propertyName)
+
+@makeOperator("an.unpack_id_key", "Unpack ID Key", arguments = ["String", "String"],
+              description = "Write the ID Key stored in the active collection back to its objects")
+def unpackIDKeyInActiveCollection(dataType, propertyName):
+    unpackIDKey(bpy.context.collection, dataType, propertyName)
+
+@removesIDKey
+def removePackedIDKeys(idKey):
+    for collection in bpy.data.collections:
+        removePackedIDKey(collection, idKey.type, idKey.name)
+
+
+# Single Objects
+###########################################
+
+def iterPackedEntries(object, dataType, name, renameObjects = True):
+    '''
+    Yields (collection, packed ID Key, index) for all packed ID Keys
+    with this type and name that contain the object.
+    '''
+    if dataType not in packableDataTypes or not isinstance(object, bpy.types.Object):
+        return
+
+    for collection in getPackedCollections(dataType, name):
+        packed = getPackedIDKey(collection, dataType, name)
+        if renameObjects: index = packed.getIndex(object)
+        else: index = packed.indexByName.get(object.name, -1)
+        if index >= 0:
+            yield collection, packed, index
+
+def getPackingCollection(object, dataType, name, renameObjects = True):
+    for collection, _, _ in iterPackedEntries(object, dataType, name, renameObjects):
+        return collection
+    return None
+
+def getPackedObjectValue(object, dataType, name, renameObjects = True):
+    '''
+    Returns None when the object is not packed.
+    '''
+    for _, packed, index in iterPackedEntries(object, dataType, name, renameObjects):
+        return packed.getValue(index)
+    return None
+
+def updatePackedObject(object, dataType, name):
+    '''
+    Copy the ID Key of the object to all packed ID Keys that contain it.
+    '''
+    entries = list(iterPackedEntries(object, dataType, name))
+    if len(entries) == 0:
+        return
+
+    values = getObjectValues(dataType, [object], name)
+    for collection, packed, index in entries:
+        packed.setValues(LongList.fromValues([index]), *values)
+        packed.revision += 1
+        # only the changed elements are written, so that setting many objects stays fast
+        group = collection[getPackedKey(dataType, name)]
+        packed.writeValue(group, index)
+        group["revision"] = packed.revision
+
+def removePackedObject(object, dataType, name):
+    for collection, packed, index in list(iterPackedEntries(object, dataType, name)):
+        packed.removeObject(index)
+        packed.revision += 1
+        packed.writeGroup(collection[getPackedKey(dataType, name)])
+
+def renamePackedObjects(objects):
+    '''
+    Returns the (old name, new name) pairs of the objects that have
+    been renamed since they were packed.
+    '''
+    renamed = []
+    for object in objects:
+        oldName = object.get(packedNameKey)
+        if oldName is None or oldName == object.name:
+            continue
+        # the object is a copy of a packed object
+        if oldName in bpy.data.objects:
+            continue
+        renamed.append((oldName, object.name))
+        object[packedNameKey] = object.name
+
+    if len(renamed) == 0:
+        return renamed
+
+    for collection in bpy.data.collections:
+        for key in collection.keys():
+            parts = key.split("*")
+            if len(parts) != 4 or key != getPackedKey(parts[2], parts[3]):
+                continue
+            if parts[2] not in packedIDKeyTypes:
+                continue
+            packed = getPackedIDKey(collection, parts[2], parts[3])
+            if packed.renameObjects(renamed):
+                packed.revision += 1
+                group = collection[key]
+                group["objects"] = packed.objectNames
+                group["revision"] = packed.revision
+    return renamed
+
+
+# Packed ID Key Types
+###########################################
+
+class PackedIDKey:
+    dataType = None
+
+    def __init__(self, name, objectNames, revision):
+        self.name = name
+        self.objectNames = list(objectNames)
+        self.indexByName = {name : i for i, name in enumerate(self.objectNames)}
+        self.revision = revision
+
+    @classmethod
+    def fromGroup(cls, group, name):
+        raise NotImplementedError()
+
+    def getIndices(self, objects):
+        indices = getObjectIndices(objects, self.indexByName)
+        positions = getUnpackedPositions(objects, indices)
+        if len(positions) > 0:
+            renamed = renamePackedObjects([objects[i] for i in positions])
+            if self.renameObjects(renamed):
+                indices = getObjectIndices(objects, self.indexByName)
+        return indices
+
+    def getIndex(self, object):
+        return self.getIndices([object])[0]
+
+    def renameObjects(self, renamed):
+        changed = False
+        for oldName, newName in renamed:
+            index = self.indexByName.get(oldName)
+            if index is None or newName in self.indexByName:
+                continue
+            self.objectNames[index] = newName
+            del self.indexByName[oldName]
+            self.indexByName[newName] = index
+            changed = True
+        return changed
+
+    def readUnpacked(self, result, objects, indices, method, scatter):
+        positions = getUnpackedPositions(objects, indices)
+        if len(positions) > 0:
+            typeClass = dataTypeByIdentifier[self.dataType]
+            values = getattr(typeClass, method)([objects[i] for i in positions], self.name)
+            scatter(result, positions, values)
+        return result
+
+    def existsList(self, objects):
+        indices = self.getIndices(objects)
+        return self.readUnpacked(indicesExist(indices), objects, indices,
+                                 "existsList", scatterBooleans)
+
+    def addObjects(self, objects):
+        oldAmount = len(self.objectNames)
+        for object in objects:
+            if object is not None and object.name not in self.indexByName:
+                self.indexByName[object.name] = len(self.objectNames)
+                self.objectNames.append(object.name)
+                if object.get(packedNameKey) != object.name:
+                    object[packedNameKey] = object.name
+        self.appendDefaults(len(self.objectNames) - oldAmount)
+        return self.getIndices(objects)
+
+    def removeObject(self, index):
+        remaining = LongList.fromValues(i for i in range(len(self.objectNames)) if i != index)
+        del self.objectNames[index]
+        self.indexByName = {name : i for i, name in enumerate(self.objectNames)}
+        self.keepValues(remaining)
+
+    def writeGroup(self, group):
+        group["objects"] = self.objectNames
+        self.writeValues(group)
+        group["revision"] = self.revision
+
+    def appendDefaults(self, amount):
+        raise NotImplementedError()
+
+    def keepValues(self, indices):
+        raise NotImplementedError()
+
+    def setValues(self, indices, *values):
+        raise NotImplementedError()
+
+    def writeValues(self, group):
+        raise NotImplementedError()
+
+    def writeValue(self, group, index):
+        raise NotImplementedError()
+
+    def getValue(self, index):
+        raise NotImplementedError()
+
+    def iterValues(self, objects):
+        raise NotImplementedError()
+
+class PackedTransforms(PackedIDKey):
+    dataType = "Transforms"
+
+    def __init__(self, name, objectNames, revision, locations = None, rotations = None, scales = None):
+        super().__init__(name, objectNames, revision)
+        self.locations = Vector3DList() if locations is None else locations
+        self.rotations = EulerList() if rotations is None else rotations
+        self.scales = Vector3DList() if scales is None else scales
+
+    @classmethod
+    def fromGroup(cls, group, name):
+        rotations = eulersFromArrays(FloatList.fromNumpyArray(readFloatArray(group, "rotation")),
+                                     LongList.fromValues(group["rotationOrder"]))
+        return cls(name, group["objects"], group["revision"],
+                   Vector3DList.fromNumpyArray(readFloatArray(group, "location")),
+                   rotations,
+                   Vector3DList.fromNumpyArray(readFloatArray(group, "scale")))
+
+    def getLocations(self, objects):
+        indices = self.getIndices(objects)
+        return self.readUnpacked(gatherVectors(self.locations, indices, (0.0, 0.0, 0.0)),
+                                 objects, indices, "getLocations", scatterVectors)
+
+    def getRotations(self, objects):
+        indices = self.getIndices(objects)
+        return self.readUnpacked(gatherEulers(self.rotations, indices),
+                                 objects, indices, "getRotations", scatterEulers)
+
+    def getScales(self, objects):
+        indices = self.getIndices(objects)
+        return self.readUnpacked(gatherVectors(self.scales, indices, (1.0, 1.0, 1.0)),
+                                 objects, indices, "getScales", scatterVectors)
+
+    def appendDefaults(self, amount):
+        self.locations.extend(Vector3DList.fromValue((0.0, 0.0, 0.0), amount))
+        self.rotations.extend(EulerList.fromValue(Euler((0.0, 0.0, 0.0)), amount))
+        self.scales.extend(Vector3DList.fromValue((1.0, 1.0, 1.0), amount))
+
+    def keepValues(self, indices):
+        self.locations = gatherVectors(self.locations, indices, (0.0, 0.0, 0.0))
+        self.rotations = gatherEulers(self.rotations, indices)
+        self.scales = gatherVectors(self.scales, indices, (1.0, 1.0, 1.0))
+
+    def setValues(self, indices, locations, rotations, scales):
+        scatterVectors(self.locations, indices, locations)
+        scatterEulers(self.rotations, indices, rotations)
+        scatterVectors(self.scales, indices, scales)
+
+    def writeValues(self, group):
+        rotations, orders = eulersToArrays(self.rotations)
+        group["location"] = self.locations.asNumpyArray()
+        group["rotation"] = rotations.asNumpyArray()
+        group["rotationOrder"] = orders.asNumpyArray().astype(numpy.int32)
+        group["scale"] = self.scales.asNumpyArray()
+
+    def writeValue(self, group, index):
+        rotations, orders = eulersToArrays(EulerList.fromValues([self.rotations[index]]))
+        location, scale = self.locations[index], self.scales[index]
+        for i in range(3):
+            group["location"][index * 3 + i] = location[i]
+            group["rotation"][index * 3 + i] = rotations[i]
+            group["scale"][index * 3 + i] = scale[i]
+        group["rotationOrder"][index] = orders[0]
+
+    def getValue(self, index):
+        return self.locations[index], self.rotations[index], self.scales[index]
+
+    def iterValues(self, objects):
+        return zip(self.getLocations(objects), self.getRotations(objects), self.getScales(objects))
+
+class PackedNumbers(PackedIDKey):
+    listType = None
+    default = None
+
+    def __init__(self, name, objectNames, revision, values = None):
+        super().__init__(name, objectNames, revision)
+        self.values = self.listType() if values is None else values
+
+    def getList(self, objects):
+        raise NotImplementedError()
+
+    def appendDefaults(self, amount):
+        self.values.extend(self.listType.fromValue(self.default, amount))
+
+    def writeValue(self, group, index):
+        group["values"][index] = self.values[index]
+
+    def getValue(self, index):
+        return self.values[index]
+
+    def iterValues(self, objects):
+        return iter(self.getList(objects))
+
+class PackedFloats(PackedNumbers):
+    dataType = "Float"
+    listType = DoubleList
+    default = 0.0
+
+    @classmethod
+    def fromGroup(cls, group, name):
+        values = numpy.asarray(group["values"], dtype = numpy.float64)
+        return cls(name, group["objects"], group["revision"], DoubleList.fromNumpyArray(values))
+
+    def getList(self, objects):
+        indices = self.getIndices(objects)
+        return self.readUnpacked(gatherDoubles(self.values, indices, self.default),
+                                 objects, indices, "getList", scatterDoubles)
+
+    def keepValues(self, indices):
+        self.values = gatherDoubles(self.values, indices, self.default)
+
+    def setValues(self, indices, values):
+        scatterDoubles(self.values, indices, values)
+
+    def writeValues(self, group):
+        group["values"] = self.values.asNumpyArray()
+
+class PackedIntegers(PackedNumbers):
+    dataType = "Integer"
+    listType = LongList
+    default = 0
+
+    @classmethod
+    def fromGroup(cls, group, name):
+        return cls(name, group["objects"], group["revision"], LongList.fromValues(group["values"]))
+
+    def getList(self, objects):
+        indices = self.getIndices(objects)
+        return self.readUnpacked(gatherLongs(self.values, indices, self.default),
+                                 objects, indices, "getList", scatterLongs)
+
+    def keepValues(self, indices):
+        self.values = gatherLongs(self.values, indices, self.default)
+
+    def setValues(self, indices, values):
+        scatterLongs(self.values, indices, values)
+
+    def writeValues(self, group):
+        group["values"] = self.values.asNumpyArray().astype(numpy.int32)
+
+packedIDKeyTypes = {
+    "Transforms" : PackedTransforms,
+    "Float" : PackedFloats,
+    "Integer" : PackedIntegers
+}
+
+def readFloatArray(group, key):
+    # the arrays can be double precision when they were changed in the ui
+    return numpy.asarray(group[key], dtype = numpy.float32)
@@ -0,0 +1,84 @@
+from unittest import TestCase
+from mathutils import Euler
+from . packed_lists import (
+    getObjectIndices, getUnpackedPositions, indicesExist,
+    gatherVectors, gatherEulers, gatherDoubles, gatherLongs,
+    scatterVectors, scatterDoubles, scatterLongs,
+    eulersFromArrays, eulersToArrays
+)
+from .. data_structures import Vector3DList, EulerList, FloatList, DoubleList, LongList
+
+class NamedObject:
+    def __init__(self, name):
+        self.name = name
+
+def createObjects(*names):
+    return [None if name is None else NamedObject(name) for name in names]
+
+class TestIndices(TestCase):
+    def testObjectIndices(self):
+        objects = createObjects("b", None, "x", "a")
+        indices = getObjectIndices(objects, {"a" : 0, "b" : 1})
+        self.assertEqual(indices, LongList.fromValues([1, -1, -1, 0]))
+
+    def testUnpackedPositions(self):
+        objects = createObjects("b", None, "x", "a")
+        indices = LongList.fromValues([1, -1, -1, 0])
+        self.assertEqual(getUnpackedPositions(objects, indices), LongList.fromValues([2]))
+
+    def testIndicesExist(self):
+        exists = indicesExist(LongList.fromValues([2, -1, 0]))
+        self.assertEqual(list(exists), [True, False, True])
+
+class TestGather(TestCase):
+    def testVectors(self):
+        source = Vector3DList.fromValues([(1, 2, 3), (4, 5, 6)])
+        result = gatherVectors(source, LongList.fromValues([1, -1, 0]), (7, 8, 9))
+        self.assertEqual(result, Vector3DList.fromValues([(4, 5, 6), (7, 8, 9), (1, 2, 3)]))
+
+    def testEulers(self):
+        source = EulerList.fromValues([Euler((1, 2, 3), "ZYX")])
+        result = gatherEulers(source, LongList.fromValues([-1, 0]))
+        self.assertEqual(tuple(result[0]), (0, 0, 0))
+        self.assertEqual(tuple(result[1]), (1, 2, 3))
+        self.assertEqual(result[1].order, "ZYX")
+
+    def testDoubles(self):
+        source = DoubleList.fromValues([1.5, 2.5])
+        result = gatherDoubles(source, LongList.fromValues([1, -1]), -1)
+        self.assertEqual(result, DoubleList.fromValues([2.5, -1]))
+
+    def testLongs(self):
+        source = LongList.fromValues([3, 4])
+        result = gatherLongs(source, LongList.fromValues([-1, 0, 1]), 9)
+        self.assertEqual(result, LongList.fromValues([9, 3, 4]))
+
+class TestScatter(TestCase):
+    def testNegativeIndicesAreSkipped(self):
+        target = DoubleList.fromValues([0, 0, 0])
+        scatterDoubles(target, LongList.fromValues([2, -1, 0]), DoubleList.fromValues([1, 2, 3]))
+        self.assertEqual(target, DoubleList.fromValues([3, 0, 1]))
+
+    def testVectors(self):
+        target = Vector3DList.fromValues([(0, 0, 0), (0, 0, 0)])
+        scatterVectors(target, LongList.fromValues([1, -1]), Vector3DList.fromValues([(1, 2, 3), (4, 5, 6)]))
+        self.assertEqual(target, Vector3DList.fromValues([(0, 0, 0), (1, 2, 3)]))
+
+    def testWrongLength(self):
+        target = LongList.fromValues([0, 0])
+        with self.assertRaises(ValueError):
+            scatterLongs(target, LongList.fromValues([0, 1]), LongList.fromValues([1]))
+
+class TestEulerConversion(TestCase):
+    def testRoundTrip(self):
+        eulers = EulerList.fromValues([Euler((1, 2, 3), "XYZ"), Euler((4, 5, 6), "YZX")])
+        values, orders = eulersToArrays(eulers)
+        self.assertEqual(values, FloatList.fromValues([1, 2, 3, 4, 5, 6]))
+
+        result = eulersFromArrays(values, orders)
+        self.assertEqual([tuple(euler) for euler in result], [(1, 2, 3), (4, 5, 6)])
+        self.assertEqual([euler.order for euler in result], ["XYZ", "YZX"])
+
+    def testWrongLength(self):
+        with self.assertRaises(ValueError):
+            eulersFromArrays(FloatList.fromValues([1, 2]), LongList.fromValues([0]))
@@ -1,6 +1,6 @@
 from ... math cimport Vector3
 
-cdef extern from "FastNoiseSIMD.h":
+cdef extern from "FastNoiseSIMD.h" nogil:
     cdef cppclass FastNoiseSIMD:
 
         @staticmethod
@@ -38,8 +38,8 @@ cdef extern from "FastNoiseSIMD.h":
         int sampleSizeY;
         int sampleSizeZ;
 
-        void SetSize(int size)
-        void Free()
+        void SetSize(int size) nogil
+        void Free() nogil
 
 
     enum NoiseType "FastNoiseSIMD::NoiseType":
@@ -91,3 +91,6 @@ cdef class PyNoise:
 
     cdef calculateList_LowLevel(self, Vector3 *vectors, Py_ssize_t amount, float *target)
     cdef calculateSingle_LowLevel(self, Vector3 *vector)
+
+cdef void calcNoise_NoGIL(FastNoiseSIMD *fn, Vector3 *offset, float amplitude,
+                          float *results, Vector3 *vectors, Py_ssize_t amount) nogil
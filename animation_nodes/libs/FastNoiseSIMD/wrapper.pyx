@@ -146,6 +146,10 @@ cdef class PyNoise:
 
 
 cdef void calcNoise(PyNoise noise, float *results, Vector3 *vectors, Py_ssize_t amount):
+    calcNoise_NoGIL(noise.fn, &noise.offset, noise.amplitude, results, vectors, amount)
+
+cdef void calcNoise_NoGIL(FastNoiseSIMD *fn, Vector3 *offset, float amplitude,
+                          float *results, Vector3 *vectors, Py_ssize_t amount) nogil:
     cdef FastNoiseVectorSet vectorSet
     vectorSet.SetSize(amount)
     vectorSet.sampleScale = 0
@@ -156,11 +160,9 @@ cdef void calcNoise(PyNoise noise, float *results, Vector3 *vectors, Py_ssize_t
         vectorSet.ySet[i] = vectors[i].y
         vectorSet.zSet[i] = vectors[i].z
 
-    cdef Vector3 offset = noise.offset
-    noise.fn.FillNoiseSet(results, &vectorSet, offset.x, offset.y, offset.z)
+    fn.FillNoiseSet(results, &vectorSet, offset.x, offset.y, offset.z)
 
     vectorSet.Free()
 
-    cdef float amplitude = noise.amplitude
     for i in range(amount):
         results[i] *= amplitude
@@ -23,7 +23,7 @@ cdef void subVec3(Vector3* target, Vector3* a, Vector3* b)
 cdef void multVec3(Vector3* target, Vector3* a, Vector3* b)
 cdef void divideVec3(Vector3* target, Vector3* a, Vector3* b)
 
-cdef float dotVec3(Vector3* a, Vector3* b)
+cdef float dotVec3(Vector3* a, Vector3* b) nogil
 cdef float angleVec3(Vector3 *a, Vector3 *b)
 cdef void crossVec3(Vector3* result, Vector3* a, Vector3* b)
 cdef float scalarTripleProduct(Vector3 *a, Vector3 *b, Vector3 *c)
@@ -38,8 +38,8 @@ cdef void normalizeVec3(Vector3* target, Vector3* v)
 cdef void normalizeLengthVec3_Inplace(Vector3* v, float length)
 cdef void normalizeLengthVec3(Vector3* target, Vector3* v, float length)
 
-cdef float distanceVec3(Vector3* a, Vector3* b)
-cdef float distanceSquaredVec3(Vector3* a, Vector3* b)
+cdef float distanceVec3(Vector3* a, Vector3* b) nogil
+cdef float distanceSquaredVec3(Vector3* a, Vector3* b) nogil
 
 cdef void absoluteVec3(Vector3* target, Vector3* source)
 cdef void snapVec3(Vector3* target, Vector3* v, Vector3* step)
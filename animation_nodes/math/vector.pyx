@@ -105,17 +105,17 @@ cdef void normalizeLengthVec3_Inplace(Vector3* v, float length):
     else:
         v.x = v.y = v.z = 0
 
-cdef float distanceVec3(Vector3* a, Vector3* b):
+cdef float distanceVec3(Vector3* a, Vector3* b) nogil:
     return sqrt(distanceSquaredVec3(a, b))
 
-cdef float distanceSquaredVec3(Vector3* a, Vector3* b):
+cdef float distanceSquaredVec3(Vector3* a, Vector3* b) nogil:
     cdef:
         float diff1 = (a.x - b.x)
         float diff2 = (a.y - b.y)
         float diff3 = (a.z - b.z)
     return diff1 * diff1 + diff2 * diff2 + diff3 * diff3
 
-cdef float dotVec3(Vector3* a, Vector3* b):
+cdef float dotVec3(Vector3* a, Vector3* b) nogil:
     return a.x * b.x + a.y * b.y + a.z * b.z
 
 @cython.cdivision(True)
@@ -6,6 +6,7 @@ from ... data_structures import VirtualDoubleList, DoubleList
 class DelayTimeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_DelayTimeNode"
     bl_label = "Delay Time"
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
 
     useListA: VectorizedSocket.newProperty()
@@ -10,6 +10,7 @@ repetitionTypeItems = [
 class RepeatTimeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RepeatTimeNode"
     bl_label = "Repeat Time"
+    options = {"PURE"}
 
     repetitionType: EnumProperty(name = "Repetition Type", default = "LOOP",
         items = repetitionTypeItems, update = executionCodeChanged)
@@ -14,6 +14,7 @@ compareLabels = {t[0] : t[1] for t in compareTypeItems}
 class BooleanListLogicNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_BooleanListLogicNode"
     bl_label = "Boolean List Logic"
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
 
     compareType: EnumProperty(name = "Compare Type", default = "ALL_TRUE",
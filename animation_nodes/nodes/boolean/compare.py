@@ -18,6 +18,7 @@ numericLabelTypes = ["Integer", "Float"]
 class CompareNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CompareNode"
     bl_label = "Compare"
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
 
     assignedType: DataTypeSelectorSocket.newProperty(default = "Integer")
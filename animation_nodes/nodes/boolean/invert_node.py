@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class InvertBooleanNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_InvertBooleanNode"
     bl_label = "Invert Boolean"
+    options = {"PURE"}
 
     useList: VectorizedSocket.newProperty()
 
@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, DataTypeSelectorSocket
 class SwitchNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SwitchNode"
     bl_label = "Switch"
+    options = {"PURE"}
 
     assignedType: DataTypeSelectorSocket.newProperty(default = "Float")
 
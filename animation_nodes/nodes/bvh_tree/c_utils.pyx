@@ -0,0 +1,121 @@
+from ... utils.bvh import direction1, direction2, direction3
+from ... math cimport Vector3, setVector3, normalizeVec3
+from ... data_structures cimport (
+    Vector3DList, DoubleList, LongList, BooleanList, VirtualVector3DList)
+
+# The queries are still answered by mathutils.bvhtree.BVHTree, but all
+# elements are processed in one call without creating Vector objects for
+# the inputs and without appending to the output lists one by one.
+
+def rayCastList(bvhTree, Py_ssize_t amount,
+                VirtualVector3DList starts, VirtualVector3DList directions,
+                float minDistance, float maxDistance, bint startInInfinity):
+    cdef HitLists hits = HitLists(amount)
+    cdef Vector3 direction, origin
+    cdef Vector3 *start
+    cdef Py_ssize_t i
+    rayCast = bvhTree.ray_cast
+
+    for i in range(amount):
+        start = starts.get(i)
+        normalizeVec3(&direction, directions.get(i))
+
+        if startInInfinity:
+            origin.x = start.x - direction.x * 100000
+            origin.y = start.y - direction.y * 100000
+            origin.z = start.z - direction.z * 100000
+            result = rayCast((origin.x, origin.y, origin.z),
+                             (direction.x, direction.y, direction.z))
+            hits.set(i, result, 0, True)
+        else:
+            origin.x = start.x + direction.x * minDistance
+            origin.y = start.y + direction.y * minDistance
+            origin.z = start.z + direction.z * minDistance
+            result = rayCast((origin.x, origin.y, origin.z),
+                             (direction.x, direction.y, direction.z),
+                             maxDistance - minDistance)
+            hits.set(i, result, minDistance, False)
+
+    return hits.asTuple()
+
+def findNearestList(bvhTree, Vector3DList vectors, float maxDistance):
+    cdef HitLists hits = HitLists(vectors.length)
+    cdef Vector3 *vector
+    cdef Py_ssize_t i
+    findNearest = bvhTree.find_nearest
+
+    for i in range(vectors.length):
+        vector = vectors.data + i
+        hits.set(i, findNearest((vector.x, vector.y, vector.z), maxDistance), 0, False)
+
+    return hits.asTuple()
+
+def areInsideVolume(bvhTree, Vector3DList vectors):
+    cdef BooleanList result = BooleanList(length = vectors.length)
+    cdef Vector3 *vector
+    cdef Py_ssize_t i
+    rayCast = bvhTree.ray_cast
+
+    for i in range(vectors.length):
+        vector = vectors.data + i
+        result.data[i] = isInsideVolume(rayCast, (vector.x, vector.y, vector.z))
+
+    return result
+
+cdef bint isInsideVolume(rayCast, tuple vector):
+    # same as utils.bvh.isInsideVolume
+    cdef int hits1 = countHits(rayCast, vector, direction1)
+    if hits1 == 0: return False
+    if hits1 == 1: return True
+
+    cdef int hits2 = countHits(rayCast, vector, direction2)
+    if hits1 % 2 == hits2 % 2:
+        return hits1 % 2 == 1
+
+    cdef int hits3 = countHits(rayCast, vector, direction3)
+    return hits3 % 2 == 1
+
+cdef int countHits(rayCast, tuple start, direction):
+    cdef int hits = 0
+    offset = direction * 0.0001
+    location = rayCast(start, direction)[0]
+
+    while location is not None:
+        hits += 1
+        location = rayCast(location + offset, direction)[0]
+
+    return hits
+
+
+cdef class HitLists:
+    cdef Vector3DList locations
+    cdef Vector3DList normals
+    cdef DoubleList distances
+    cdef LongList polygonIndices
+    cdef BooleanList hits
+
+    def __cinit__(self, Py_ssize_t amount):
+        self.locations = Vector3DList(length = amount)
+        self.normals = Vector3DList(length = amount)
+        self.distances = DoubleList(length = amount)
+        self.polygonIndices = LongList(length = amount)
+        self.hits = BooleanList(length = amount)
+
+    cdef set(self, Py_ssize_t index, tuple result, float distanceOffset, bint ignoreDistance):
+        location, normal, polygonIndex, distance = result
+        if location is None:
+            self.locations.data[index].x = self.locations.data[index].y = self.locations.data[index].z = 0
+            self.normals.data[index].x = self.normals.data[index].y = self.normals.data[index].z = 0
+            self.distances.data[index] = 0
+            self.polygonIndices.data[index] = -1
+            self.hits.data[index] = False
+        else:
+            setVector3(self.locations.data + index, location)
+            setVector3(self.normals.data + index, normal)
+            self.distances.data[index] = 0 if ignoreDistance else distance + distanceOffset
+            self.polygonIndices.data[index] = polygonIndex
+            self.hits.data[index] = True
+
+    cdef tuple asTuple(self):
+        # same order as the outputs of the nodes
+        return self.locations, self.normals, self.distances, self.polygonIndices, self.hits
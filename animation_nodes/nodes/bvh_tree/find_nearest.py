@@ -1,11 +1,13 @@
 import bpy
 from ... base_types import AnimationNode, VectorizedSocket
+from . c_utils import findNearestList
 
 class FindNearestSurfacePointNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FindNearestSurfacePointNode"
     bl_label = "Find Nearest Surface Point"
     bl_width_default = 160
     codeEffects = [VectorizedSocket.CodeEffect]
+    vectorizedKernelReturnsAllOutputs = True
 
     useVectorList: VectorizedSocket.newProperty()
 
@@ -43,3 +45,9 @@ class FindNearestSurfacePointNode(bpy.types.Node, AnimationNode):
         yield "    distance = 0"
         yield "    hit = False"
         yield "else: hit = True"
+
+    def getVectorizedKernelName(self, required):
+        return "findNearestList"
+
+    def findNearestList(self, bvhTree, vectors, maxDistance):
+        return findNearestList(bvhTree, vectors, maxDistance)
@@ -1,5 +1,6 @@
 import bpy
 from ... base_types import AnimationNode, VectorizedSocket
+from . c_utils import areInsideVolume
 
 class IsInsideVolumeBVHTreeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_IsInsideVolumeBVHTreeNode"
@@ -20,3 +21,9 @@ class IsInsideVolumeBVHTreeNode(bpy.types.Node, AnimationNode):
 
     def getExecutionCode(self, required):
         return "isInside = AN.utils.bvh.isInsideVolume(bvhTree, vector)"
+
+    def getVectorizedKernelName(self, required):
+        return "areInsideVolume"
+
+    def areInsideVolume(self, bvhTree, vectors):
+        return areInsideVolume(bvhTree, vectors)
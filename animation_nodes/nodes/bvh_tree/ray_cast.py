@@ -2,12 +2,15 @@ import bpy
 from bpy.props import *
 from ... events import executionCodeChanged
 from ... base_types import AnimationNode, VectorizedSocket
+from ... data_structures import VirtualVector3DList
+from . c_utils import rayCastList
 
 class RayCastBVHTreeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RayCastBVHTreeNode"
     bl_label = "Ray Cast BVHTree"
     bl_width_default = 160
     codeEffects = [VectorizedSocket.CodeEffect]
+    vectorizedKernelReturnsAllOutputs = True
 
     useStartList: VectorizedSocket.newProperty()
     useDirectionList: VectorizedSocket.newProperty()
@@ -54,6 +57,16 @@ class RayCastBVHTreeNode(bpy.types.Node, AnimationNode):
         else:
             yield from self.iterStartAtLocationCode()
 
+    def getVectorizedKernelName(self, required):
+        return "rayCastList"
+
+    def rayCastList(self, bvhTree, start, direction, minDistance, maxDistance):
+        starts = VirtualVector3DList.create(start, (0, 0, 0))
+        directions = VirtualVector3DList.create(direction, (0, 0, -1))
+        amount = VirtualVector3DList.getMaxRealLength(starts, directions)
+        return rayCastList(bvhTree, amount, starts, directions,
+                           minDistance, maxDistance, self.startInInfinity)
+
     def iterStartAtLocationCode(self):
         yield "location, normal, polygonIndex, distance = bvhTree.ray_cast(start + _direction * minDistance, _direction, maxDistance - minDistance)"
         yield "if location is None:"
@@ -7,6 +7,7 @@ from ... base_types import AnimationNode
 class ChooseColorNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ChooseColorNode"
     bl_label = "Choose Color"
+    options = {"PURE"}
 
     colorProperty: FloatVectorProperty(
         default = [0.5, 0.5, 0.5], subtype = "COLOR",
@@ -24,6 +24,7 @@ sourceTypeItems = [
 class CombineColorNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CombineColorNode"
     bl_label = "Combine Color"
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
 
     useListR: VectorizedSocket.newProperty()
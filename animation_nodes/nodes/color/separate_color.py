@@ -16,6 +16,7 @@ targetTypeItems = [
 class SeparateColorNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SeparateColorNode"
     bl_label = "Separate Color"
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
 
     useList: VectorizedSocket.newProperty()
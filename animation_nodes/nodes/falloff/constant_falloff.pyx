@@ -5,6 +5,7 @@ from ... data_structures cimport BaseFalloff
 class ConstantFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ConstantFalloffNode"
     bl_label = "Constant Falloff"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Float", "Strength", "strength")
@@ -21,6 +22,7 @@ cdef class ConstantFalloff(BaseFalloff):
         self.value = value
         self.clamped = 0 <= value <= 1
         self.dataType = "NONE"
+        self.evaluatesWithoutGIL = True
 
     cdef float evaluate(self, void *object, Py_ssize_t index):
         return self.value
@@ -30,3 +32,9 @@ cdef class ConstantFalloff(BaseFalloff):
         cdef Py_ssize_t i
         for i in range(amount):
             target[i] = self.value
+
+    cdef void evaluateList_NoGIL(self, void *values, Py_ssize_t startIndex,
+                                 Py_ssize_t amount, float *target) nogil:
+        cdef Py_ssize_t i
+        for i in range(amount):
+            target[i] = self.value
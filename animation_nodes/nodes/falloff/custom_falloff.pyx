@@ -5,6 +5,7 @@ from ... data_structures cimport BaseFalloff, FloatList
 class CustomFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CustomFalloffNode"
     bl_label = "Custom Falloff"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Float List", "Strengths", "strengths")
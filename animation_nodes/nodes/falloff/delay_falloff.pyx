@@ -6,6 +6,7 @@ from . interpolate_falloff import InterpolateFalloff
 class DelayFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_DelayFalloffNode"
     bl_label = "Delay Falloff"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Float", "Time", "time")
@@ -1,4 +1,6 @@
 import bpy
+cimport cython
+from libc.math cimport fabs
 from bpy.props import *
 from ... data_structures cimport BaseFalloff
 from ... base_types import AnimationNode
@@ -9,6 +11,7 @@ from ... math cimport signedDistancePointToPlane_Normalized as signedDistance
 class DirectionalFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_DirectionalFalloffNode"
     bl_label = "Directional Falloff"
+    options = {"PURE"}
 
     __annotations__ = {}
     __annotations__["falloffLeft"] = BoolProperty(name = "Falloff Left", default = False)
@@ -50,18 +53,40 @@ cdef class DirectionalFalloff(BaseFalloff):
         self.size = size
         self.clamped = True
         self.dataType = "LOCATION"
+        self.evaluatesWithoutGIL = True
 
 cdef class UniDirectionalFalloff(DirectionalFalloff):
     cdef float evaluate(self, void *value, Py_ssize_t index):
-        cdef float distance = signedDistance(&self.position, &self.direction, <Vector3*>value)
-        cdef float result = 1 - distance / self.size
-        if result < 0: return 0
-        if result > 1: return 1
-        return result
+        return calcUniDirectional(self, <Vector3*>value)
+
+    cdef void evaluateList_NoGIL(self, void *values, Py_ssize_t startIndex,
+                                 Py_ssize_t amount, float *target) nogil:
+        cdef Py_ssize_t i
+        for i in range(amount):
+            target[i] = calcUniDirectional(self, <Vector3*>values + i)
 
 cdef class BiDirectionalFalloff(DirectionalFalloff):
     cdef float evaluate(self, void *value, Py_ssize_t index):
-        cdef float distance = abs(signedDistance(&self.position, &self.direction, <Vector3*>value))
-        cdef float result = 1 - distance / self.size
-        if result < 0: return 0
-        return result
+        return calcBiDirectional(self, <Vector3*>value)
+
+    cdef void evaluateList_NoGIL(self, void *values, Py_ssize_t startIndex,
+                                 Py_ssize_t amount, float *target) nogil:
+        cdef Py_ssize_t i
+        for i in range(amount):
+            target[i] = calcBiDirectional(self, <Vector3*>values + i)
+
+
+@cython.cdivision(True)
+cdef inline float calcUniDirectional(DirectionalFalloff self, Vector3 *v) nogil:
+    cdef float distance = signedDistance(&self.position, &self.direction, v)
+    cdef float result = 1 - distance / self.size
+    if result < 0: return 0
+    if result > 1: return 1
+    return result
+
+@cython.cdivision(True)
+cdef inline float calcBiDirectional(DirectionalFalloff self, Vector3 *v) nogil:
+    cdef float distance = fabs(signedDistance(&self.position, &self.direction, v))
+    cdef float result = 1 - distance / self.size
+    if result < 0: return 0
+    return result
@@ -13,6 +13,7 @@ falloffTypeItems = [
 class EvaluateFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_EvaluateFalloffNode"
     bl_label = "Evaluate Falloff"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     __annotations__ = {}
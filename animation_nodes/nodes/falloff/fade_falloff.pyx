@@ -15,6 +15,7 @@ class FadeFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FadeFalloffNode"
     bl_label = "Fade Falloff"
     bl_width_default = 160
+    options = {"PURE"}
 
     __annotations__ = {}
     __annotations__["mode"] = EnumProperty(name = "Mode", default = "START_AMOUNT",
@@ -15,6 +15,7 @@ class IndexMaskFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_IndexMaskFalloffNode"
     bl_label = "Index Mask Falloff"
     bl_width_default = 160
+    options = {"PURE"}
 
     __annotations__ = {}
     __annotations__["maskType"] = EnumProperty(name = "Mask Type",
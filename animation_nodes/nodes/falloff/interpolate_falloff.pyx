@@ -5,6 +5,7 @@ from ... data_structures cimport CompoundFalloff, Falloff, Interpolation
 class InterpolateFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_InterpolateFalloffNode"
     bl_label = "Interpolate Falloff"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Falloff", "Falloff", "inFalloff")
@@ -5,6 +5,7 @@ from ... base_types import AnimationNode
 class InvertFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_InvertFalloffNode"
     bl_label = "Invert Falloff"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Falloff", "Falloff", "inFalloff")
@@ -10,6 +10,7 @@ from . constant_falloff import ConstantFalloff
 class MeshFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MeshFalloffNode"
     bl_label = "Mesh Falloff"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("BVHTree", "BVHTree", "bvhTree", defaultDrawType = "PROPERTY_ONLY")
@@ -19,6 +19,7 @@ onlyTwoTypes = ["SUBTRACT", "OVERLAY"]
 class MixFalloffsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MixFalloffsNode"
     bl_label = "Mix Falloffs"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     __annotations__ = {}
@@ -86,6 +87,7 @@ cdef class MixTwoFalloffsBase(CompoundFalloff):
     def __cinit__(self, Falloff a, Falloff b):
         self.a = a
         self.b = b
+        self.evaluatesWithoutGIL = True
 
     cdef list getDependencies(self):
         return [self.a, self.b]
@@ -94,55 +96,60 @@ cdef class AddTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         return dependencyResults[0] + dependencyResults[1]
 
-    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+    cdef void evaluateList_NoGIL(self, float **dependencyResults, Py_ssize_t start,
+                                 Py_ssize_t end, float *target) nogil:
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
+        for i in range(start, end):
             target[i] = a[i] + b[i]
 
 cdef class MultiplyTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         return dependencyResults[0] * dependencyResults[1]
 
-    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+    cdef void evaluateList_NoGIL(self, float **dependencyResults, Py_ssize_t start,
+                                 Py_ssize_t end, float *target) nogil:
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
+        for i in range(start, end):
             target[i] = a[i] * b[i]
 
 cdef class MinTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         return min(dependencyResults[0], dependencyResults[1])
 
-    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+    cdef void evaluateList_NoGIL(self, float **dependencyResults, Py_ssize_t start,
+                                 Py_ssize_t end, float *target) nogil:
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
+        for i in range(start, end):
             target[i] = min(a[i], b[i])
 
 cdef class MaxTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         return max(dependencyResults[0], dependencyResults[1])
 
-    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+    cdef void evaluateList_NoGIL(self, float **dependencyResults, Py_ssize_t start,
+                                 Py_ssize_t end, float *target) nogil:
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
+        for i in range(start, end):
             target[i] = max(a[i], b[i])
 
 cdef class SubtractTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         return dependencyResults[0] - dependencyResults[1]
 
-    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+    cdef void evaluateList_NoGIL(self, float **dependencyResults, Py_ssize_t start,
+                                 Py_ssize_t end, float *target) nogil:
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
+        for i in range(start, end):
             target[i] = a[i] - b[i]
 
 # Overlay is defined as follows:
@@ -168,11 +175,12 @@ cdef class OverlayTwoFalloffs(MixTwoFalloffsBase):
         else:
             return a + b * (1 - a)
 
-    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+    cdef void evaluateList_NoGIL(self, float **dependencyResults, Py_ssize_t start,
+                                 Py_ssize_t end, float *target) nogil:
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
+        for i in range(start, end):
             if a[i] < 0.5:
                 target[i] = a[i] * (1 + b[i])
             else:
@@ -188,6 +196,7 @@ cdef class MixFalloffsBase(CompoundFalloff):
         self.amount = len(falloffs)
         if self.amount == 0:
             raise Exception("at least one falloff required")
+        self.evaluatesWithoutGIL = True
 
     cdef list getDependencies(self):
         return self.falloffs
@@ -200,6 +209,16 @@ cdef class AddFalloffs(MixFalloffsBase):
             sum += dependencyResults[i]
         return sum
 
+    cdef void evaluateList_NoGIL(self, float **dependencyResults, Py_ssize_t start,
+                                 Py_ssize_t end, float *target) nogil:
+        cdef Py_ssize_t i, j
+        cdef float sum
+        for i in range(start, end):
+            sum = 0
+            for j in range(self.amount):
+                sum += dependencyResults[j][i]
+            target[i] = sum
+
 cdef class MultiplyFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -208,6 +227,16 @@ cdef class MultiplyFalloffs(MixFalloffsBase):
             product *= dependencyResults[i]
         return product
 
+    cdef void evaluateList_NoGIL(self, float **dependencyResults, Py_ssize_t start,
+                                 Py_ssize_t end, float *target) nogil:
+        cdef Py_ssize_t i, j
+        cdef float product
+        for i in range(start, end):
+            product = 1
+            for j in range(self.amount):
+                product *= dependencyResults[j][i]
+            target[i] = product
+
 cdef class MinFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -217,6 +246,17 @@ cdef class MinFalloffs(MixFalloffsBase):
                 minValue = dependencyResults[i]
         return minValue
 
+    cdef void evaluateList_NoGIL(self, float **dependencyResults, Py_ssize_t start,
+                                 Py_ssize_t end, float *target) nogil:
+        cdef Py_ssize_t i, j
+        cdef float minValue
+        for i in range(start, end):
+            minValue = dependencyResults[0][i]
+            for j in range(1, self.amount):
+                if dependencyResults[j][i] < minValue:
+                    minValue = dependencyResults[j][i]
+            target[i] = minValue
+
 cdef class MaxFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -225,3 +265,14 @@ cdef class MaxFalloffs(MixFalloffsBase):
             if dependencyResults[i] > maxValue:
                 maxValue = dependencyResults[i]
         return maxValue
+
+    cdef void evaluateList_NoGIL(self, float **dependencyResults, Py_ssize_t start,
+                                 Py_ssize_t end, float *target) nogil:
+        cdef Py_ssize_t i, j
+        cdef float maxValue
+        for i in range(start, end):
+            maxValue = dependencyResults[0][i]
+            for j in range(1, self.amount):
+                if dependencyResults[j][i] > maxValue:
+                    maxValue = dependencyResults[j][i]
+            target[i] = maxValue
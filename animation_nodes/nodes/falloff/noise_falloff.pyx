@@ -8,10 +8,12 @@ from ... libs.FastNoiseSIMD import Noise3DNodeBase
 from ... math cimport Vector3
 from ... data_structures cimport BaseFalloff
 from ... libs.FastNoiseSIMD cimport PyNoise
+from ... libs.FastNoiseSIMD.wrapper cimport FastNoiseSIMD, calcNoise_NoGIL
 
 class NoiseFalloffNode(bpy.types.Node, AnimationNode, Noise3DNodeBase):
     bl_idname = "an_NoiseFalloffNode"
     bl_label = "Noise Falloff"
+    options = {"PURE"}
 
     def create(self):
         self.createNoiseInputs()
@@ -29,10 +31,20 @@ class NoiseFalloffNode(bpy.types.Node, AnimationNode, Noise3DNodeBase):
 
 cdef class NoiseFalloff(BaseFalloff):
     cdef PyNoise noise
+    cdef FastNoiseSIMD *fn
+    cdef Vector3 offset
+    cdef float amplitude
+
     def __cinit__(self, PyNoise noise):
         self.noise = noise
+        self.fn = noise.fn
+        self.offset = noise.offset
+        self.amplitude = noise.amplitude
         self.clamped = False
         self.dataType = "LOCATION"
+        # FillNoiseSet only reads the settings of the noise object and the static tables
+        # that are initialized in its constructor, every thread uses its own vector set
+        self.evaluatesWithoutGIL = True
 
     cdef float evaluate(self, void *value, Py_ssize_t index):
         return self.noise.calculateSingle_LowLevel(<Vector3*>value)
@@ -40,3 +52,7 @@ cdef class NoiseFalloff(BaseFalloff):
     cdef void evaluateList(self, void *values, Py_ssize_t startIndex,
                             Py_ssize_t amount, float *target):
         self.noise.calculateList_LowLevel(<Vector3*>values, amount, target)
+
+    cdef void evaluateList_NoGIL(self, void *values, Py_ssize_t startIndex,
+                                 Py_ssize_t amount, float *target) nogil:
+        calcNoise_NoGIL(self.fn, &self.offset, self.amplitude, target, <Vector3*>values, amount)
@@ -6,6 +6,7 @@ from ... math cimport Vector3, setVector3, distanceVec3
 class PointDistanceFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_PointDistanceFalloffNode"
     bl_label = "Point Distance Falloff"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Vector", "Origin", "origin")
@@ -37,6 +38,7 @@ cdef class PointDistanceFalloff(BaseFalloff):
 
         self.dataType = "LOCATION"
         self.clamped = True
+        self.evaluatesWithoutGIL = True
 
     cdef float evaluate(self, void *value, Py_ssize_t index):
         return calcDistance(self, <Vector3*>value)
@@ -47,8 +49,14 @@ cdef class PointDistanceFalloff(BaseFalloff):
         for i in range(amount):
             target[i] = calcDistance(self, <Vector3*>values + i)
 
+    cdef void evaluateList_NoGIL(self, void *values, Py_ssize_t startIndex,
+                                 Py_ssize_t amount, float *target) nogil:
+        cdef Py_ssize_t i
+        for i in range(amount):
+            target[i] = calcDistance(self, <Vector3*>values + i)
+
 
-cdef inline float calcDistance(PointDistanceFalloff self, Vector3 *v):
+cdef inline float calcDistance(PointDistanceFalloff self, Vector3 *v) nogil:
     cdef float distance = distanceVec3(&self.origin, v)
     if distance <= self.minDistance: return 1
     if distance <= self.maxDistance: return 1 - (distance - self.minDistance) * self.factor
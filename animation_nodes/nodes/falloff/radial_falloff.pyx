@@ -12,6 +12,7 @@ from ... math cimport (
 class RadialFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RadialFalloffNode"
     bl_label = "Radial Falloff"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Vector", "Origin", "origin")
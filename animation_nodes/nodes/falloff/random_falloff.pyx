@@ -6,6 +6,7 @@ from ... algorithms.random cimport randomDouble_Range
 class RandomFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RandomFalloffNode"
     bl_label = "Random Falloff"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Integer", "Seed", "seed")
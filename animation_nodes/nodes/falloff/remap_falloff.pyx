@@ -8,6 +8,7 @@ from ... data_structures cimport Falloff, CompoundFalloff, Interpolation
 class RemapFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RemapFalloffNode"
     bl_label = "Remap Falloff"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Falloff", "Falloff", "inFalloff")
@@ -41,6 +42,7 @@ cdef class RemapFalloff(CompoundFalloff):
         self.inLength = inMax - inMin
         self.outLength = outMax - outMin
         self.clamped = falloff.clamped and 0 <= min(outMin, outMax) <= max(outMin, outMax) <= 1
+        self.evaluatesWithoutGIL = True
 
     cdef list getDependencies(self):
         return [self.falloff]
@@ -49,6 +51,14 @@ cdef class RemapFalloff(CompoundFalloff):
     cdef float evaluate(self, float *dependencyResults):
         return self.outMin + ((dependencyResults[0] - self.inMin) / self.inLength) * self.outLength
 
+    @cython.cdivision(True)
+    cdef void evaluateList_NoGIL(self, float **dependencyResults, Py_ssize_t start,
+                                 Py_ssize_t end, float *target) nogil:
+        cdef float *values = dependencyResults[0]
+        cdef Py_ssize_t i
+        for i in range(start, end):
+            target[i] = self.outMin + ((values[i] - self.inMin) / self.inLength) * self.outLength
+
 cdef class RemapInterpolatedFalloff(CompoundFalloff):
     cdef:
         Falloff falloff
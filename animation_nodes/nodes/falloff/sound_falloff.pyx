@@ -51,6 +51,9 @@ class SoundFalloffNode(bpy.types.Node, AnimationNode):
     __annotations__["kaiserBeta"] = FloatProperty(name = "Kaiser Beta", default = 6, min = 0,
         description = ("Beta parameter of the Kaiser window function."
         " High value corresponds to higher main-lobe leaking and lower side-lobe leaking"))
+    __annotations__["useSpectrogramCache"] = BoolProperty(name = "Cache Spectrogram", default = True,
+        description = ("Compute the spectrum of every frame once and look it up afterwards."
+        " Uses more memory, but is much faster when the frame changes"))
 
     def create(self):
         self.newInput("Sound", "Sound", "sound")
@@ -95,6 +98,7 @@ class SoundFalloffNode(bpy.types.Node, AnimationNode):
         col.prop(self, "reductionFunction", text = "")
         col.prop(self, "smoothingSamples")
         col.prop(self, "kaiserBeta")
+        col.prop(self, "useSpectrogramCache")
 
     def getExecutionFunctionName(self):
         if self.type == "AVERAGE": return "execute_Average_IndexOffset"
@@ -110,7 +114,7 @@ class SoundFalloffNode(bpy.types.Node, AnimationNode):
 
         return Average_Index_SoundFalloff(sound, frame, scale, attack, release, amplitude,
             low, high, getFPS(scene), self.smoothingSamples, self.kaiserBeta,
-            reductionFunctions[self.reductionFunction])
+            reductionFunctions[self.reductionFunction], self.useSpectrogramCache)
 
     def execute_Spectrum_IndexFrequency(self, sound, frame, attack, release, amplitude,
         low, high, count, interpolation, length, offset, scene):
@@ -131,12 +135,17 @@ class SoundFalloffNode(bpy.types.Node, AnimationNode):
         if not isValidRange(low, high): self.raiseErrorMessage("Invalid interval!")
         if count < 1: self.raiseErrorMessage("Invalid count!")
 
-        spectrum = sound.computeTimeSmoothedSpectrum(frame / getFPS(scene),
-            (frame + 1) / getFPS(scene), attack, release, self.smoothingSamples, self.kaiserBeta)
+        fps = getFPS(scene)
+        if self.useSpectrogramCache:
+            spectrum = sound.computeTimeSmoothedSpectrumAtFrame(frame, fps, 1 / fps,
+                attack, release, self.smoothingSamples, self.kaiserBeta)
+        else:
+            spectrum = sound.computeTimeSmoothedSpectrum(frame / fps,
+                (frame + 1) / fps, attack, release, self.smoothingSamples, self.kaiserBeta)
         maxFrequency = len(spectrum) - 1
 
         pins = interpolation.evaluateList(DoubleList.fromNumpyArray(numpy.linspace(
-            low, high, num = count - self.fadeLowToZero - self.fadeHighToZero + 1)))
+            low, high, num = count - self.fadeLowToZero - self.fadeHighToZero + 1), copy = False))
 
         bins = FloatList(count)
         reductionFunction = reductionFunctions[self.reductionFunction]
@@ -152,12 +161,14 @@ class SoundFalloffNode(bpy.types.Node, AnimationNode):
 cdef class Average_Index_SoundFalloff(BaseFalloff):
     cdef:
         int fps, smoothingSamples
+        bint useSpectrogramCache
         object sound, reductionFunction
         float frame, scale, attack, release, amplitude, low, high, kaiserBeta
 
     def __cinit__(self, object sound, float frame, float scale,
         float attack, float release, float amplitude, float low, float high,
-        int fps, int smoothingSamples, float kaiserBeta, object reductionFunction):
+        int fps, int smoothingSamples, float kaiserBeta, object reductionFunction,
+        bint useSpectrogramCache):
         self.sound = sound
         self.frame = frame
         self.scale = scale
@@ -170,14 +181,20 @@ cdef class Average_Index_SoundFalloff(BaseFalloff):
         self.smoothingSamples = smoothingSamples
         self.kaiserBeta = kaiserBeta
         self.reductionFunction = reductionFunction
+        self.useSpectrogramCache = useSpectrogramCache
         self.dataType = "NONE"
         self.clamped = False
 
     cdef float evaluate(self, void *object, Py_ssize_t index):
-        spectrum = self.sound.computeTimeSmoothedSpectrum(
-            (self.frame - index * self.scale) / self.fps,
-            (self.frame + 1 - index * self.scale) / self.fps,
-            self.attack, self.release, self.smoothingSamples, self.kaiserBeta)
+        if self.useSpectrogramCache:
+            spectrum = self.sound.computeTimeSmoothedSpectrumAtFrame(
+                self.frame - index * self.scale, self.fps, 1.0 / self.fps,
+                self.attack, self.release, self.smoothingSamples, self.kaiserBeta)
+        else:
+            spectrum = self.sound.computeTimeSmoothedSpectrum(
+                (self.frame - index * self.scale) / self.fps,
+                (self.frame + 1 - index * self.scale) / self.fps,
+                self.attack, self.release, self.smoothingSamples, self.kaiserBeta)
         cdef int maxFrequency = len(spectrum) - 1
 
         return self.reductionFunction(
@@ -23,6 +23,7 @@ class SplineFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SplineFalloffNode"
     bl_label = "Spline Falloff"
     bl_width_default = 160
+    options = {"PURE"}
 
     __annotations__ = {}
 
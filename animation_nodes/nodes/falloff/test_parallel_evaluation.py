@@ -0,0 +1,37 @@
+from unittest import TestCase
+from . remap_falloff import RemapFalloff
+from . mix_falloffs import MixFalloffs
+from . constant_falloff import ConstantFalloff
+from . point_distance_falloff import PointDistanceFalloff
+from . directional_falloff import BiDirectionalFalloff
+from ... data_structures import Vector3DList
+from ... data_structures.falloffs.evaluation import setThreadAmount, getThreadAmount
+
+def createVectors(amount):
+    return Vector3DList.fromValues([(i * 0.001, (i % 100) * 0.01, 0) for i in range(amount)])
+
+def createFalloffs():
+    a = PointDistanceFalloff((5, 0, 0), 2, 3)
+    b = BiDirectionalFalloff((0, 0, 0), (1, 0, 0), 10)
+    yield RemapFalloff(a, 0, 1, 1, 0)
+    for method in ("ADD", "MULTIPLY", "MAX", "MIN", "SUBTRACT", "OVERLAY"):
+        yield MixFalloffs([a, b], method)
+    for method in ("ADD", "MULTIPLY", "MAX", "MIN"):
+        yield MixFalloffs([a, b, ConstantFalloff(0.5)], method)
+
+class TestParallelEvaluation(TestCase):
+    def setUp(self):
+        self.oldThreadAmount = getThreadAmount()
+
+    def tearDown(self):
+        setThreadAmount(self.oldThreadAmount)
+
+    def testSameResultsAsSerial(self):
+        # long enough to use multiple threads
+        vectors = createVectors(100000)
+        for falloff in createFalloffs():
+            setThreadAmount(1)
+            serial = falloff.getEvaluator("LOCATION").evaluateList(vectors)
+            setThreadAmount(4)
+            parallel = falloff.getEvaluator("LOCATION").evaluateList(vectors)
+            self.assertEqual(serial, parallel, repr(falloff))
@@ -7,6 +7,7 @@ from ... algorithms.perlin_noise cimport perlinNoise1D
 class WiggleFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_WiggleFalloffNode"
     bl_label = "Wiggle Falloff"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Integer", "Seed", "seed")
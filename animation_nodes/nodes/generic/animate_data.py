@@ -8,6 +8,7 @@ class AnimateDataNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_AnimateDataNode"
     bl_label = "Animate Data"
     bl_width_default = 160
+    options = {"PURE"}
     dynamicLabelType = "ALWAYS"
 
     onlySearchTags = True
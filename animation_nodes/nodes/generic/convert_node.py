@@ -6,6 +6,7 @@ class ConvertNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ConvertNode"
     bl_label = "Convert"
     bl_width = 100
+    options = {"PURE"}
 
     dataType: DataTypeSelectorSocket.newProperty(default = "Generic")
     lastCorrectionType: IntProperty()
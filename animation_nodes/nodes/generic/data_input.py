@@ -6,6 +6,7 @@ from ... sockets.info import getSocketClasses
 class DataInputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_DataInputNode"
     bl_label = "Data Input"
+    options = {"PURE"}
     dynamicLabelType = "ALWAYS"
     onlySearchTags = True
 
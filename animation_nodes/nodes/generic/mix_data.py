@@ -32,6 +32,7 @@ nodeTypes = {
 class MixDataNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MixDataNode"
     bl_label = "Mix"
+    options = {"PURE"}
     dynamicLabelType = "ALWAYS"
 
     onlySearchTags = True
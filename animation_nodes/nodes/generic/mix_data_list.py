@@ -16,6 +16,7 @@ nodeTypes = {
 class MixDataListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MixDataListNode"
     bl_label = "Mix Data List"
+    options = {"PURE"}
     dynamicLabelType = "ALWAYS"
 
     onlySearchTags = True
@@ -8,6 +8,7 @@ class BMeshLimitedDissolveNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_BMeshLimitedDissolveNode"
     bl_label = "Limited Dissolve BMesh"
     bl_width_default = 160
+    options = {"PURE"}
 
     def create(self):
         self.newInput("BMesh", "BMesh", "bm", dataIsModified = True)
@@ -19,6 +19,7 @@ class BMeshTriangulateNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_BMeshTriangulateNode"
     bl_label = "Triangulate BMesh"
     bl_width_default = 160
+    options = {"PURE"}
 
     quad: EnumProperty(name = "Quad Method", default = "BEAUTY",
           description = "Select a quad triangulation method",
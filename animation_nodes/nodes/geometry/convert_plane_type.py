@@ -10,6 +10,7 @@ class ConvertPlaneTypeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ConvertPlaneTypeNode"
     bl_label = "Convert Plane Type"
     bl_width_default = 180
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
 
     searchTags = [(name, {"conversionType" : repr(type)}) for type, name, _,_,_ in conversionTypeItems]
@@ -8,6 +8,7 @@ class IntersectLineLineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_IntersectLineLineNode"
     bl_label = "Intersect Line Line"
     bl_width_default = 160
+    options = {"PURE"}
     searchTags = ["Nearest Points on 2 Lines"]
 
     useFirstLineStartList: VectorizedSocket.newProperty()
@@ -8,6 +8,7 @@ class IntersectLinePlaneNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_IntersectLinePlaneNode"
     bl_label = "Intersect Line Plane"
     bl_width_default = 160
+    options = {"PURE"}
 
     useLineStartList: VectorizedSocket.newProperty()
     useLineEndList: VectorizedSocket.newProperty()
@@ -8,6 +8,7 @@ class IntersectLineSphereNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_IntersectLineSphereNode"
     bl_label = "Intersect Line Sphere"
     bl_width_default = 200
+    options = {"PURE"}
 
     useLineStartList: VectorizedSocket.newProperty()
     useLineEndList: VectorizedSocket.newProperty()
@@ -8,6 +8,7 @@ class IntersectPlanePlaneNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_IntersectPlanePlaneNode"
     bl_label = "Intersect Plane Plane"
     bl_width_default = 160
+    options = {"PURE"}
 
     useFirstPlanePointList: VectorizedSocket.newProperty()
     useFirstPlaneNormalList: VectorizedSocket.newProperty()
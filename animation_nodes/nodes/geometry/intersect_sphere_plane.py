@@ -8,6 +8,7 @@ class IntersectSpherePlaneNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_IntersectSpherePlaneNode"
     bl_label = "Intersect Sphere Plane"
     bl_width_default = 160
+    options = {"PURE"}
 
     useSphereCenterList: VectorizedSocket.newProperty()
     useSphereRadiusList: VectorizedSocket.newProperty()
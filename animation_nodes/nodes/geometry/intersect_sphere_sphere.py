@@ -8,6 +8,7 @@ class IntersectSphereSphereNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_IntersectSphereSphereNode"
     bl_label = "Intersect Sphere Sphere"
     bl_width_default = 160
+    options = {"PURE"}
 
     useFirstSphereCenterList: VectorizedSocket.newProperty()
     useFirstSphereRadiusList: VectorizedSocket.newProperty()
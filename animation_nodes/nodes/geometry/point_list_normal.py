@@ -5,6 +5,7 @@ class PointListNormalNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_PointListNormalNode"
     bl_label = "Point List Normal"
     bl_width_default = 160
+    options = {"PURE"}
     errorHandlingType = "MESSAGE"
     searchTags = ["Points Normal", "Calculate Normal"]
 
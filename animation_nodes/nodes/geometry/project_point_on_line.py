@@ -8,6 +8,7 @@ class ProjectPointOnLineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ProjectPointOnLineNode"
     bl_label = "Project Point on Line"
     bl_width_default = 160
+    options = {"PURE"}
     searchTags = ["Distance Point to Line", "Closest Point on Line"]
 
     useLineStartList: VectorizedSocket.newProperty()
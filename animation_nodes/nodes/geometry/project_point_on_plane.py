@@ -8,6 +8,7 @@ class ProjectPointOnPlaneNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ProjectPointOnPlaneNode"
     bl_label = "Project Point on Plane"
     bl_width_default = 160
+    options = {"PURE"}
     searchTags = ["Distance Point to Plane", "Closest Point on Plane"]
 
     usePlanePointList: VectorizedSocket.newProperty()
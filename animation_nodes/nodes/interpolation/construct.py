@@ -26,6 +26,7 @@ class ConstructInterpolationNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ConstructInterpolationNode"
     bl_label = "Construct Interpolation"
     bl_width_default = 160
+    options = {"PURE"}
 
     category: EnumProperty(name = "Category", default = "LINEAR",
         items = categoryItems, update = AnimationNode.refresh)
@@ -5,6 +5,7 @@ class EvaluateInterpolationNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_EvaluateInterpolationNode"
     bl_label = "Evaluate Interpolation"
     bl_width_default = 160
+    options = {"PURE"}
 
     useList: VectorizedSocket.newProperty()
 
@@ -11,6 +11,7 @@ from ... algorithms.interpolations import (
 class MirrorInterpolationNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MirrorInterpolationNode"
     bl_label = "Mirror Interpolation"
+    options = {"PURE"}
 
     chain: BoolProperty(name = "Chain", default = True,
         description = "Connect original and mirrored interpolation",
@@ -13,6 +13,7 @@ class MixInterpolationNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MixInterpolationNode"
     bl_label = "Mix Interpolation"
     bl_width_default = 180
+    options = {"PURE"}
 
     mode: EnumProperty(name = "Mode", default = "OVERLAY",
         items = modeItems, update = AnimationNode.refresh)
@@ -14,11 +14,6 @@ class FindNearestNPointsInKDTreeNode(bpy.types.Node, AnimationNode):
         self.newOutput("Integer List", "Indices", "indices")
 
     def getExecutionCode(self, required):
-        yield "_amount = max(amount, 0)"
-        yield "nearestVectors = Vector3DList(capacity = _amount)"
-        yield "distances = DoubleList(capacity = _amount)"
-        yield "indices = LongList(capacity = _amount)"
-        yield "for vector, index, distance in kdTree.find_n(searchVector, _amount):"
-        yield "    nearestVectors.append(vector)"
-        yield "    indices.append(index)"
-        yield "    distances.append(distance)"
+        yield "indices, distances = kdTree.findNearestN(Vector3DList.fromValues([searchVector]), amount)"
+        if "nearestVectors" in required:
+            yield "nearestVectors = kdTree.getPoints(indices)"
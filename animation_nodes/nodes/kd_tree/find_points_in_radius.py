@@ -15,10 +15,6 @@ class FindPointsInRadiusInKDTreeNode(bpy.types.Node, AnimationNode):
         self.newOutput("an_IntegerListSocket", "Indices", "indices")
 
     def getExecutionCode(self, required):
-        yield "nearestVectors = Vector3DList()"
-        yield "distances = DoubleList()"
-        yield "indices = LongList()"
-        yield "for vector, index, distance in kdTree.find_range(searchVector, max(radius, 0)):"
-        yield "    nearestVectors.append(vector)"
-        yield "    indices.append(index)"
-        yield "    distances.append(distance)"
+        yield "indices, distances, _ = kdTree.findInRadius(Vector3DList.fromValues([searchVector]), max(radius, 0))"
+        if "nearestVectors" in required:
+            yield "nearestVectors = kdTree.getPoints(indices)"
@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, ListTypeSelectorSocket
 class AppendListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_AppendListNode"
     bl_label = "Append to List"
+    options = {"PURE", "COPY_ON_WRITE"}
 
     assignedType: ListTypeSelectorSocket.newProperty(default = "Float")
 
@@ -11,6 +11,7 @@ fillModeItems = [
 class FillListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FillListNode"
     bl_label = "Fill List"
+    options = {"PURE"}
 
     assignedType: ListTypeSelectorSocket.newProperty(default = "Float")
 
@@ -8,6 +8,7 @@ class GetListElementNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_GetListElementNode"
     bl_label = "Get List Element"
     bl_width_default = 180
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
 
     assignedType: ListTypeSelectorSocket.newProperty(default = "Float")
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode
 class GetListLengthNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_GetListLengthNode"
     bl_label = "Get List Length"
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
 
     def create(self):
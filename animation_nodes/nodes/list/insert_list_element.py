@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, ListTypeSelectorSocket, VectorizedSock
 class InsertListElementNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_InsertListElementNode"
     bl_label = "Insert List Element"
+    options = {"PURE", "COPY_ON_WRITE"}
 
     assignedType: ListTypeSelectorSocket.newProperty(default = "Float")
     useList: VectorizedSocket.newProperty()
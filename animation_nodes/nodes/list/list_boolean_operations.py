@@ -14,6 +14,7 @@ operationItems = [
 class ListBooleanOperationsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ListBooleanOperationsNode"
     bl_label = "List Boolean Operations"
+    options = {"PURE"}
 
     operation: EnumProperty(name = "Operation", default = "UNION",
         items = operationItems, update = executionCodeChanged)
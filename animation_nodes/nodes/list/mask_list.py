@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, ListTypeSelectorSocket
 class MaskListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MaskListNode"
     bl_label = "Mask List"
+    options = {"PURE"}
 
     assignedType: ListTypeSelectorSocket.newProperty(default = "Integer List")
 
@@ -7,6 +7,7 @@ from ... algorithms.lists import getRepeatFunction, getShuffleFunction
 class RandomListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RandomListNode"
     bl_label = "Random List"
+    options = {"PURE"}
 
     assignedType: ListTypeSelectorSocket.newProperty(default = "Float List")
 
@@ -12,6 +12,7 @@ removeTypeItems = [
 class RemoveListElementNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RemoveListElementNode"
     bl_label = "Remove List Element"
+    options = {"PURE", "COPY_ON_WRITE"}
 
     def typeChanged(self, context):
         if self.isAllowedDataType(self.assignedType):
@@ -17,6 +17,7 @@ amountTypeItems = [
 class RepeatListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RepeatListNode"
     bl_label = "Repeat List"
+    options = {"PURE"}
 
     assignedType: ListTypeSelectorSocket.newProperty(default = "Float List")
 
@@ -9,6 +9,7 @@ from ... base_types import AnimationNode, VectorizedSocket, ListTypeSelectorSock
 class RepeatListElementsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RepeatListElementsNode"
     bl_label = "Repeat List Elements"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     useList: VectorizedSocket.newProperty()
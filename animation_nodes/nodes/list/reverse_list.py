@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, ListTypeSelectorSocket
 class ReverseListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ReverseListNode"
     bl_label = "Reverse List"
+    options = {"PURE"}
 
     assignedType: ListTypeSelectorSocket.newProperty(default = "Float List")
 
@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, ListTypeSelectorSocket
 class SearchListElementNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SearchListElementNode"
     bl_label = "Search List Element"
+    options = {"PURE"}
 
     assignedType: ListTypeSelectorSocket.newProperty(default = "Float")
 
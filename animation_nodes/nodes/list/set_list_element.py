@@ -7,6 +7,7 @@ from ... base_types import AnimationNode, ListTypeSelectorSocket
 class SetListElementNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SetListElementNode"
     bl_label = "Set List Element"
+    options = {"PURE"}
     errorHandlingType = "MESSAGE"
 
     assignedType: ListTypeSelectorSocket.newProperty(default = "Float")
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, ListTypeSelectorSocket
 class ShiftListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ShiftListNode"
     bl_label = "Shift List"
+    options = {"PURE"}
 
     assignedType: ListTypeSelectorSocket.newProperty(default = "Float List")
 
@@ -11,6 +11,7 @@ class SliceListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SliceListNode"
     bl_label = "Slice List"
     bl_width_default = 180
+    options = {"PURE"}
 
     assignedType: ListTypeSelectorSocket.newProperty(default = "Float")
 
@@ -13,6 +13,7 @@ axisItems = [
 class AxisRotationMatrixNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_AxisRotationMatrixNode"
     bl_label = "Axis Rotation Matrix"
+    options = {"PURE"}
 
     axis: EnumProperty(default = "X", items = axisItems,
         update = AnimationNode.refresh)
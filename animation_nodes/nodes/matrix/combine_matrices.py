@@ -5,6 +5,7 @@ from . c_utils import reduceMatrixList
 class MatrixCombineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MatrixCombineNode"
     bl_label = "Combine Matrices"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Matrix List", "Matrices", "matrices")
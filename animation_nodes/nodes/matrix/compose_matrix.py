@@ -24,6 +24,7 @@ class ComposeMatrixNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ComposeMatrixNode"
     bl_label = "Compose Matrix"
     bl_width_default = 180
+    options = {"PURE"}
 
     onlySearchTags = True
     searchTags = [
@@ -9,6 +9,7 @@ from . c_utils import (
 class DecomposeMatrixNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_DecomposeMatrixNode"
     bl_label = "Decompose Matrix"
+    options = {"PURE"}
 
     useMatrixList: VectorizedSocket.newProperty()
 
@@ -51,6 +51,7 @@ directionAxisItems = [(axis, axis, "") for axis in ("X", "Y", "Z")]
 class DistributeMatricesNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_DistributeMatricesNode"
     bl_label = "Distribute Matrices"
+    options = {"PURE"}
     searchTags = [(name, {"mode" : repr(op)}) for name, op in searchItems.items()]
 
     __annotations__ = {}
@@ -14,6 +14,7 @@ basisAxisItems = [
 class ExtractMatrixBasisNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ExtractMatrixBasisNode"
     bl_label = "Extract Matrix Basis"
+    options = {"PURE"}
 
     basisAxis: EnumProperty(name = "Axis", default = "X",
         items = basisAxisItems, update = propertyChanged)
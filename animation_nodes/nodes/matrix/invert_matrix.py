@@ -4,6 +4,7 @@ from ... base_types import AnimationNode
 class InvertMatrixNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_InvertMatrixNode"
     bl_label = "Invert Matrix"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Matrix", "Matrix", "matrix")
@@ -10,6 +10,7 @@ operationItems = [("MULTIPLY", "Multiply", "", "NONE", 0)]
 class MatrixMathNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MatrixMathNode"
     bl_label = "Matrix Math"
+    options = {"PURE"}
     errorHandlingType = "MESSAGE"
 
     operation: EnumProperty(name = "Operation", items = operationItems,
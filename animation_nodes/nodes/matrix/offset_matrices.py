@@ -7,6 +7,7 @@ class OffsetMatrixNode(bpy.types.Node, AnimationNode, MatrixTransformationBase):
     bl_idname = "an_OffsetMatrixNode"
     bl_label = "Offset Matrix"
     bl_width_default = 200
+    options = {"PURE"}
     onlySearchTags = True
     errorHandlingType = "EXCEPTION"
     searchTags = [("Offset Matrices", {"useMatrixList" : repr(True)})]
@@ -16,6 +16,7 @@ transformationTypeItems = [
 class ReplicateMatrixNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ReplicateMatrixNode"
     bl_label = "Replicate Matrix"
+    options = {"PURE"}
 
     useMatrixList: VectorizedSocket.newProperty()
 
@@ -10,6 +10,7 @@ planeItems = [
 class ShearMatrixNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ShearMatrixNode"
     bl_label = "Shear Matrix"
+    options = {"PURE"}
 
     plane: EnumProperty(items = planeItems, update = AnimationNode.refresh)
 
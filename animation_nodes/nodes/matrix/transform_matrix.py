@@ -5,6 +5,7 @@ from . c_utils import multiplyMatrixWithList
 class TransformMatrixNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TransformMatrixNode"
     bl_label = "Transform Matrix"
+    options = {"PURE"}
 
     useMatrixList: VectorizedSocket.newProperty()
 
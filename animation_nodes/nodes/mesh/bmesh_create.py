@@ -6,6 +6,7 @@ from ... base_types import AnimationNode
 class CreateBMeshFromMesh(bpy.types.Node, AnimationNode):
     bl_idname = "an_CreateBMeshFromMeshNode"
     bl_label = "Create BMesh"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     def create(self):
@@ -6,6 +6,7 @@ from ... base_types import AnimationNode
 class BMeshInvertNormalsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_BMeshInvertNormalsNode"
     bl_label = "BMesh Invert Normals"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("BMesh", "BMesh", "bm").dataIsModified = True
@@ -6,6 +6,7 @@ from ... data_structures import Vector3DList, EdgeIndicesList, PolygonIndicesLis
 class BMeshMeshNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_BMeshMeshNode"
     bl_label = "BMesh Mesh"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("BMesh", "BMesh", "bm")
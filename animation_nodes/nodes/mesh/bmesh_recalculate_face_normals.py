@@ -4,6 +4,7 @@ from ... base_types import AnimationNode
 class BMeshRecalculateFaceNormalsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_BMeshRecalculateFaceNormalsNode"
     bl_label = "BMesh Recalculate Normals"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("BMesh", "BMesh", "bm").dataIsModified = True
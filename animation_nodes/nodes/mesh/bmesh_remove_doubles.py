@@ -5,6 +5,7 @@ from ... base_types import AnimationNode
 class BMeshRemoveDoublesNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_BMeshRemoveDoublesNode"
     bl_label = "BMesh Remove Doubles"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("BMesh", "BMesh", "bm").dataIsModified = True
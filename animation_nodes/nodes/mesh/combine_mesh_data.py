@@ -7,6 +7,7 @@ from ... data_structures import Mesh, LongList
 class CombineMeshNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CombineMeshNode"
     bl_label = "Combine Mesh"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     skipValidation: BoolProperty(name = "Skip Validation", default = False,
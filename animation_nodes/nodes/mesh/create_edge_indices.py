@@ -6,6 +6,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class CreateEdgeIndicesNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CreateEdgeIndicesNode"
     bl_label = "Create Edge Indices"
+    options = {"PURE"}
 
     useList1: VectorizedSocket.newProperty()
     useList2: VectorizedSocket.newProperty()
@@ -6,6 +6,7 @@ class CreateEdgesNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CreateEdgesNode"
     bl_label = "Create Edges"
     bl_width_default = 140
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     def create(self):
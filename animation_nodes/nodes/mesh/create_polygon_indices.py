@@ -13,6 +13,7 @@ class CreatePolygonIndicesNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CreatePolygonIndicesNode"
     bl_label = "Create Polygon Indices"
     bl_width_default = 160
+    options = {"PURE"}
     errorHandlingType = "MESSAGE"
 
     mode: EnumProperty(name = "Mode", default = "VERTEX_AMOUNT",
@@ -9,6 +9,7 @@ from . c_utils import (
 class EdgeInfoNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_EdgeInfoNode"
     bl_label = "Edge Info"
+    options = {"PURE"}
     errorHandlingType = "MESSAGE"
 
     useEdgeList: VectorizedSocket.newProperty()
@@ -7,6 +7,7 @@ from ... data_structures import Vector3DList, EdgeIndicesList, PolygonIndicesLis
 class EdgeToTubeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_EdgeToTubeNode"
     bl_label = "Edge to Tube"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     useEdgeIndicesList: VectorizedSocket.newProperty()
@@ -6,6 +6,7 @@ from ... data_structures.meshes.validate import createValidEdgesList
 class EdgesOfPolygonsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_EdgesOfPolygonsNode"
     bl_label = "Edges of Polygons"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Polygon Indices List", "Polygons", "polygons")
@@ -50,6 +50,7 @@ distanceTypeItems = [
 class ExtractPolygonTransformsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ExtractPolygonTransformsNode"
     bl_label = "Extract Polygon Transforms"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     sourceType: EnumProperty(name = "Source Type", default = "MESH",
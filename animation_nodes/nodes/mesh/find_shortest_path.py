@@ -18,6 +18,7 @@ pathTypeItems = [
 class FindShortestPathNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FindShortestPathNode"
     bl_label = "Find Shortest Path"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     mode: EnumProperty(name = "Mode Type", default = "TREE",
@@ -16,6 +16,7 @@ class CircleMeshNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CircleMeshNode"
     bl_label = "Circle Mesh"
     bl_width_default = 160
+    options = {"PURE"}
 
     searchTags = [(name, {'inputs["Radial Loops"].value' : repr(n)}) for name, n in regularPolygons]
 
@@ -5,6 +5,7 @@ from .... algorithms.mesh_generation.cylinder import getCylinderMesh
 class CylinderMeshNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CylinderMeshNode"
     bl_label = "Cylinder Mesh"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Float", "Radius", "radius", value = 1, minValue = 0)
@@ -12,6 +12,7 @@ class GridMeshNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_GridMeshNode"
     bl_label = "Grid Mesh"
     bl_width_default = 160
+    options = {"PURE"}
 
     mode: EnumProperty(name = "Mode", default = "SIZE",
         update = AnimationNode.refresh, items = modeItems)
@@ -11,6 +11,7 @@ lineModeItems = [
 class LineMeshNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_LineMeshNode"
     bl_label = "Line Mesh"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     lineMode: EnumProperty(name = "Line Mode", default = "START_END",
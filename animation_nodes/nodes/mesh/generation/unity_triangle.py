@@ -11,6 +11,7 @@ from .... data_structures import (
 class UnityTriangleMeshNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_UnityTriangleMeshNode"
     bl_label = "Unity Triangle Mesh"
+    options = {"PURE"}
 
     def create(self):
         self.newOutput("Mesh", "Mesh", "meshData")
@@ -5,6 +5,7 @@ from ... data_structures import LongList
 class GetLinkedVerticesNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_GetLinkedVerticesNode"
     bl_label = "Get Linked Vertices"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     def create(self):
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode
 class GetUVMapNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_GetUVMapNode"
     bl_label = "Get UV Map"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     def create(self):
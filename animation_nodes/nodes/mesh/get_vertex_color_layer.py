@@ -14,6 +14,7 @@ colorModeItems = [
 class GetVertexColorLayerNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_GetVertexColorLayerNode"
     bl_label = "Get Vertex Color Layer"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     colorMode: EnumProperty(name = "Color Mode", default = "LOOP",
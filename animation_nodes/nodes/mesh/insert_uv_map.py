@@ -6,6 +6,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class InsertUVMapNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_InsertUVMapNode"
     bl_label = "Insert UV Map"
+    options = {"PURE", "COPY_ON_WRITE"}
     errorHandlingType = "EXCEPTION"
 
     useVector2DList: VectorizedSocket.newProperty()
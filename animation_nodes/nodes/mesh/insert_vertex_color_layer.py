@@ -14,6 +14,7 @@ colorModeItems = [
 class InsertVertexColorLayerNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_InsertVertexColorLayerNode"
     bl_label = "Insert Vertex Color Layer"
+    options = {"PURE", "COPY_ON_WRITE"}
     errorHandlingType = "EXCEPTION"
 
     colorMode: EnumProperty(name = "Color Mode", default = "LOOP",
@@ -5,6 +5,7 @@ from ... base_types import AnimationNode
 class JoinMeshListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_JoinMeshListNode"
     bl_label = "Join Mesh List"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Mesh List", "Mesh List", "meshDataList", dataIsModified = True)
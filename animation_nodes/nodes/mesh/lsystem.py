@@ -8,6 +8,7 @@ from ... algorithms.lsystem import calculateLSystem
 class LSystemNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_LSystemNode"
     bl_label = "LSystem"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
     bl_width_default = 180
 
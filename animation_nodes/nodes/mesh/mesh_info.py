@@ -4,6 +4,7 @@ from ... base_types import AnimationNode
 class MeshInfoNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MeshInfoNode"
     bl_label = "Mesh Info"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Mesh", "Mesh", "mesh", dataIsModified = True)
@@ -12,6 +12,10 @@ meshDataTypeItems = [
     ("BMESH", "BMesh", "BMesh object", "", 1),
     ("VERTICES", "Vertices", "A list of vertex locations; The length of this list has to be equal to the amount of vertices the mesh already has", "", 2) ]
 
+# topology that has been written to a mesh by a node during this session
+# node identifier -> (mesh pointer, topology key, copies of the topology lists)
+writtenTopologies = {}
+
 class MeshObjectOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MeshObjectOutputNode"
     bl_label = "Mesh Object Output"
@@ -102,6 +106,48 @@ class MeshObjectOutputNode(bpy.types.Node, AnimationNode):
         return True
 
     def setMesh(self, outMesh, mesh):
+        topologyKey = self.getTopologyKey(mesh)
+        if self.hasWrittenTopology(outMesh, mesh, topologyKey):
+            self.setMeshVertices(outMesh, mesh)
+        else:
+            writtenTopologies.pop(self.identifier, None)
+            self.setMeshWithTopology(outMesh, mesh)
+            if not self.validateMesh:
+                writtenTopologies[self.identifier] = (outMesh.as_pointer(), topologyKey,
+                    tuple(data.copy() for data in getTopologyLists(mesh)))
+
+    def getTopologyKey(self, mesh):
+        return (mesh.getTopologyHash(), tuple(mesh.getUVMapNames()),
+                tuple(mesh.getVertexColorLayerNames()))
+
+    def hasWrittenTopology(self, outMesh, mesh, topologyKey):
+        written = writtenTopologies.get(self.identifier)
+        if written is None or written[:2] != (outMesh.as_pointer(), topologyKey):
+            return False
+        # the hash can collide, so the written lists are compared as well
+        if not all(a == b for a, b in zip(written[2], getTopologyLists(mesh))):
+            return False
+        # the amounts can change outside of Animation Nodes
+        return (len(outMesh.vertices) == len(mesh.vertices) and
+                len(outMesh.edges) == len(mesh.edges) and
+                len(outMesh.loops) == len(mesh.polygons.indices) and
+                len(outMesh.polygons) == len(mesh.polygons) and
+                all(name in outMesh.uv_layers for name in mesh.getUVMapNames()) and
+                all(name in outMesh.vertex_colors for name in mesh.getVertexColorLayerNames()))
+
+    def setMeshVertices(self, outMesh, mesh):
+        outMesh.vertices.foreach_set("co", mesh.vertices.asMemoryView())
+        outMesh.vertices.foreach_set("normal", mesh.getVertexNormals().asMemoryView())
+
+        for name, data in mesh.getUVMaps():
+            outMesh.uv_layers[name].data.foreach_set("uv", data.asMemoryView())
+        for name, data in mesh.getVertexColorLayers():
+            outMesh.vertex_colors[name].data.foreach_set("color", data.asMemoryView())
+
+        # update would recalculate the normals
+        outMesh.update_tag()
+
+    def setMeshWithTopology(self, outMesh, mesh):
         # clear existing mesh
         bmesh.new().to_mesh(outMesh)
 
@@ -145,6 +191,7 @@ class MeshObjectOutputNode(bpy.types.Node, AnimationNode):
             outMesh.update(calc_edges_loose = True)
 
     def setBMesh(self, mesh, bm):
+        writtenTopologies.pop(self.identifier, None)
         bm.to_mesh(mesh)
 
     def setVertices(self, mesh, vertices):
@@ -159,3 +206,6 @@ class MeshObjectOutputNode(bpy.types.Node, AnimationNode):
         if not isAnimated(mesh):
             mesh['an_helper_property'] = 0
             mesh.keyframe_insert(data_path = '["an_helper_property"]')
+
+def getTopologyLists(mesh):
+    return (mesh.edges, mesh.polygons.indices, mesh.polygons.polyLengths, mesh.materialIndices)
@@ -6,6 +6,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class OffsetVerticesNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_OffsetVerticesNode"
     bl_label = "Offset Vertices"
+    options = {"PURE", "COPY_ON_WRITE"}
     errorHandlingType = "EXCEPTION"
 
     useVectorList: VectorizedSocket.newProperty()
@@ -20,6 +21,7 @@ class OffsetVerticesNode(bpy.types.Node, AnimationNode):
 
     def execute(self, mesh, falloff, offsets):
         _offsets = VirtualVector3DList.create(offsets, (0, 0, 0))
+        mesh.vertices.makeUnique()
         offsetVector3DList(mesh.vertices, _offsets, self.getFalloffEvaluator(falloff))
         mesh.verticesTransformed()
         return mesh
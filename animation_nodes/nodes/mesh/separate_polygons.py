@@ -5,6 +5,7 @@ from ... base_types import AnimationNode
 class SeparatePolygonsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SeparatePolygonsNode"
     bl_label = "Separate Polygons"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     def create(self):
@@ -3,6 +3,8 @@ from bpy.props import *
 from ... events import propertyChanged
 from ... data_structures import VirtualDoubleList
 from ... base_types import AnimationNode, VectorizedSocket
+from ... utils.vertex_groups import setVertexGroupWeights
+from .. number.c_utils import range_LongList_StartStep
 
 modeItems = [
     ("ALL", "All", "Set weight of every vertex", "NONE", 0),
@@ -88,9 +90,8 @@ class SetVertexWeightNode(bpy.types.Node, AnimationNode):
         vertexGroup = self.getVertexGroup(object, identifier)
 
         weights = VirtualDoubleList.create(weights, 0)
-        for i, index in enumerate(indices):
-            vertexGroup.add([index], weights[i], "REPLACE")
-        object.data.update()    
+        setVertexGroupWeights(vertexGroup, indices, weights)
+        object.data.update()
         return object
 
     def execute_All_SingleWeight(self, object, identifier, weight):
@@ -108,8 +109,8 @@ class SetVertexWeightNode(bpy.types.Node, AnimationNode):
         vertexGroup = self.getVertexGroup(object, identifier)
 
         weights = VirtualDoubleList.create(weights, 0)
-        for i in range(len(object.data.vertices)):
-            vertexGroup.add([i], weights[i], "REPLACE") 
+        indices = range_LongList_StartStep(len(object.data.vertices), 0, 1)
+        setVertexGroupWeights(vertexGroup, indices, weights)
         object.data.update()
         return object            
 
@@ -13,6 +13,7 @@ transformationTypeItems = [
 class TransformMeshNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TransformMeshNode"
     bl_label = "Transform Mesh"
+    options = {"PURE"}
 
     transformationType: EnumProperty(name = "Transformation Type", default = "MATRIX",
         items = transformationTypeItems, update = AnimationNode.refresh)
@@ -7,6 +7,7 @@ from ... data_structures.meshes.validate import checkMeshData
 class TriangulateMeshNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TriangulateMeshNode"
     bl_label = "Triangulate Mesh"
+    options = {"PURE", "COPY_ON_WRITE"}
     errorHandlingType = "EXCEPTION"
 
     methodType: BoolProperty(name = "Use Advanced Method", default = False,
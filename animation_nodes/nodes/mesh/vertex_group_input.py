@@ -3,6 +3,9 @@ from bpy.props import *
 from ... events import propertyChanged
 from ... data_structures import DoubleList
 from ... base_types import AnimationNode, VectorizedSocket
+from ... utils.vertex_groups import (getVertexGroupWeights,
+                                     getVertexGroupWeights_Indices,
+                                     getMeshVertexGroupWeights)
 
 modeItems = [
     ("ALL", "All", "Get weight of every vertex", "NONE", 0),
@@ -82,13 +85,7 @@ class VertexGroupInputNode(bpy.types.Node, AnimationNode):
                 self.raiseErrorMessage(groupNotFoundMessage)
             return DoubleList()
 
-        weights = DoubleList(length = len(indices))
-        getWeight = vertexGroup.weight
-
-        for i, index in enumerate(indices):
-            try: weights[i] = getWeight(index)
-            except: weights[i] = 0
-        return weights
+        return getVertexGroupWeights_Indices(vertexGroup, indices)
 
     def execute_All(self, object, identifier, useModifiers, *optionalScene):
         if object is None:
@@ -107,28 +104,14 @@ class VertexGroupInputNode(bpy.types.Node, AnimationNode):
             return self.execute_All_WithoutModifiers(object, vertexGroup)
 
     def execute_All_WithoutModifiers(self, object, vertexGroup):
-        vertexAmount = len(object.data.vertices)
-        weights = DoubleList(length = vertexAmount)
-        getWeight = vertexGroup.weight
-
-        for i in range(vertexAmount):
-            try: weights[i] = getWeight(i)
-            except: weights[i] = 0
-        return weights
+        return getVertexGroupWeights(vertexGroup, len(object.data.vertices))
 
     def execute_All_WithModifiers(self, object, vertexGroup, scene):
         if scene is None:
             self.raiseErrorMessage(noSceneMessage)
 
         mesh = object.an.getMesh(applyModifiers = True)
-        index = vertexGroup.index
-        weights = DoubleList(length = len(mesh.vertices))
-        weights.fill(0)
-        for i, vertex in enumerate(mesh.vertices):
-            for vertexGroupElement in vertex.groups:
-                if vertexGroupElement.group == index:
-                    weights[i] = vertexGroupElement.weight
-                    break
+        weights = getMeshVertexGroupWeights(mesh, vertexGroup.index)
 
         if mesh.users == 0: object.to_mesh_clear()
 
@@ -24,6 +24,7 @@ compareTypeItems = (
 class CompareNumbersNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CompareNumbersNode"
     bl_label = "Compare Numbers"
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
 
     useAList: VectorizedSocket.newProperty()
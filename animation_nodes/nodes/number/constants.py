@@ -15,6 +15,7 @@ factorItems = [(c, c, "", "NONE", i) for i, c in enumerate(factors)]
 class NumberConstantsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_NumberConstantsNode"
     bl_label = "Constants"
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
 
     constant: EnumProperty(name = "Constant", default = "Pi",
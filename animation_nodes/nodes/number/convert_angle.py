@@ -9,6 +9,7 @@ conversionTypeItems = [
 class ConvertAngleNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ConvertAngleNode"
     bl_label = "Convert Angle"
+    options = {"PURE"}
 
     searchTags = [(name, {"conversionType" : repr(type)}) for type, name, *_ in conversionTypeItems]
 
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class FloatClampNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FloatClampNode"
     bl_label = "Clamp"
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
 
     useValueList: VectorizedSocket.newProperty()
@@ -159,6 +159,7 @@ justCopiedIdentifiers = set()
 class FloatMathNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FloatMathNode"
     bl_label = "Float Math"
+    options = {"PURE"}
     dynamicLabelType = "ALWAYS"
     searchTags = [(name, {"operation" : repr(op)}) for name, op in searchItems.items()]
 
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode
 class FloatToTextNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FloatToTextNode"
     bl_label = "Float to Text"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Float", "Number", "number")
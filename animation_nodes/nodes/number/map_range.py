@@ -11,6 +11,7 @@ class MapRangeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MapRangeNode"
     bl_label = "Map Range"
     bl_width_default = 200
+    options = {"PURE"}
 
     clampInput: BoolProperty(name = "Clamp Input", default = True,
         description = "The input will be between Input Min and Input Max",
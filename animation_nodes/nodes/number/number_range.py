@@ -20,6 +20,7 @@ floatStepTypeItems = [
 class NumberRangeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_NumberRangeNode"
     bl_label = "Number Range"
+    options = {"PURE"}
     dynamicLabelType = "ALWAYS"
 
     onlySearchTags = True
@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class ParseNumberNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ParseNumberNode"
     bl_label = "Parse Number"
+    options = {"PURE"}
 
     parsingSuccessfull: BoolProperty()
     useList: VectorizedSocket.newProperty()
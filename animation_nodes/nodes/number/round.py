@@ -4,6 +4,7 @@ from ... base_types import AnimationNode
 class RoundNumberNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RoundNumberNode"
     bl_label = "Round Number"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Float", "Number", "number")
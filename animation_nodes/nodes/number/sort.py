@@ -4,6 +4,7 @@ from ... base_types import AnimationNode
 class SortNumbersNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SortNumbersNode"
     bl_label = "Sort Numbers"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Float List", "Numbers", "numbers")
@@ -13,12 +14,12 @@ class SortNumbersNode(bpy.types.Node, AnimationNode):
     def getExecutionCode(self, required):
         if "sortedNumbers" in required:
             yield "if len(numbers):"
-            yield "    sortedNumbers = DoubleList.fromNumpyArray(numpy.sort(numbers.asMemoryView()))"
+            yield "    sortedNumbers = DoubleList.fromNumpyArray(numpy.sort(numbers.asMemoryView()), copy = False)"
             yield "else:"
             yield "    sortedNumbers = DoubleList()"
         if "indices" in required:
             yield "if len(numbers):"
-            yield "    indices = LongList.fromNumpyArray(numpy.argsort(numbers.asMemoryView()).astype(int))"
+            yield "    indices = LongList.fromNumpyArray(numpy.argsort(numbers.asMemoryView()).astype(int), copy = False)"
             yield "else:"
             yield "    indices = LongList()"
 
@@ -3,7 +3,7 @@ from bpy.props import *
 from ... math import composeMatrixList
 from ... tree_info import getNodesByType
 from ... base_types import AnimationNode, VectorizedSocket
-from ... id_keys import keyDataTypeItems, IDKey, findsIDKeys, updateIdKeysList
+from ... id_keys import keyDataTypeItems, IDKey, findsIDKeys, updateIdKeysList, packableDataTypes
 
 class ObjectIDKeyNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ObjectIDKeyNode"
@@ -24,6 +24,10 @@ class ObjectIDKeyNode(bpy.types.Node, AnimationNode):
     keyName: StringProperty(name = "Key Name", default = "",
         update = keyChanged)
 
+    usePackedStorage: BoolProperty(name = "Use Packed Storage", default = False,
+        description = "Read the values from the ID Key that is packed in a collection",
+        update = AnimationNode.refresh)
+
     useList: VectorizedSocket.newProperty()
 
     def create(self):
@@ -34,6 +38,10 @@ class ObjectIDKeyNode(bpy.types.Node, AnimationNode):
         if self.keyName == "":
             return
 
+        if self.readsPackedStorage:
+            self.newInput("Collection", "Collection", "collection",
+                defaultDrawType = "PROPERTY_ONLY")
+
         if self.keyDataType == "Transforms":
             self.newOutput(VectorizedSocket("Vector", "useList",
                 ("Location", "location"), ("Locations", "locations")))
@@ -61,6 +69,8 @@ class ObjectIDKeyNode(bpy.types.Node, AnimationNode):
         col = layout.column()
         col.prop(self, "keyDataType", text = "Type")
         col.prop(self, "keyName", text = "Name")
+        if self.useList and self.keyDataType in packableDataTypes:
+            col.prop(self, "usePackedStorage")
 
     def draw(self, layout):
         col = layout.column()
@@ -104,25 +114,39 @@ class ObjectIDKeyNode(bpy.types.Node, AnimationNode):
     def getExecutionCode_List(self, keyName, required):
         dataType = self.keyDataType
 
+        if self.readsPackedStorage:
+            yield "_packed = AN.id_keys.getPackedIDKey(collection, {}, {})".format(repr(dataType), keyName)
+
         if "exists" in required:
-            yield "exists = _key.existsList(objects, %s)" % keyName
+            yield self.readList("exists", "existsList", keyName)
 
         if dataType == "Transforms":
             useMatrices = "matrices" in required
             if "locations" in required or useMatrices:
-                yield "locations = _key.getLocations(objects, %s)" % keyName
+                yield self.readList("locations", "getLocations", keyName)
             if "rotations" in required or useMatrices:
-                yield "rotations = _key.getRotations(objects, %s)" % keyName
+                yield self.readList("rotations", "getRotations", keyName)
             if "scales" in required or useMatrices:
-                yield "scales = _key.getScales(objects, %s)" % keyName
+                yield self.readList("scales", "getScales", keyName)
             if useMatrices:
                 yield "matrices = AN.math.composeMatrixList(locations, rotations, scales)"
         elif dataType == "Text":
             if "texts" in required:
-                yield "texts = _key.getList(objects, %s)" % keyName
+                yield self.readList("texts", "getList", keyName)
         elif dataType in ("Integer", "Float"):
             if "numbers" in required:
-                yield "numbers = _key.getList(objects, %s)" % keyName
+                yield self.readList("numbers", "getList", keyName)
+
+    def readList(self, name, method, keyName):
+        code = "{} = _key.{}(objects, {})".format(name, method, keyName)
+        if self.readsPackedStorage:
+            # use the ID properties of the objects when the collection has no packed ID Key
+            code += " if _packed is None else _packed.{}(objects)".format(method)
+        return code
+
+    @property
+    def readsPackedStorage(self):
+        return self.useList and self.usePackedStorage and self.keyDataType in packableDataTypes
 
     def getList_Exists(self, objects):
         from animation_nodes.id_keys import doesIDKeyExist
@@ -2,6 +2,7 @@ import bpy
 from bpy.props import *
 from ... events import propertyChanged
 from ... base_types import AnimationNode
+from ... utils.handlers import eventHandler
 from ... utils.names import getRandomString
 from ... utils.blender_ui import iterActiveSpacesByType
 from ... utils.data_blocks import removeNotUsedDataBlock
@@ -15,6 +16,43 @@ from ... utils.names import (getPossibleMeshName,
 lastSourceHashes = {}
 lastSceneHashes = {}
 
+# instances of the nodes during this session, so that they don't have to be
+# collected from the linked objects on every execution
+# node identifier -> InstanceCache
+instanceCaches = {}
+
+class InstanceCache:
+    def __init__(self, objects):
+        self.objects = objects
+        # -1 means that the visibility of the objects is unknown
+        self.visibleAmount = -1
+        self.objectAmount = len(bpy.data.objects)
+
+    def isValid(self):
+        # objects can be removed somewhere else, then their references are invalid.
+        # Checking every reference is only done when the amount of objects changed
+        # since the last execution, undo and file loading clear the caches anyway.
+        objectAmount = len(bpy.data.objects)
+        if objectAmount == self.objectAmount:
+            return True
+        if not self.objectsExist():
+            return False
+        self.objectAmount = objectAmount
+        return True
+
+    def objectsExist(self):
+        try:
+            for object in self.objects:
+                object.name
+        except ReferenceError:
+            return False
+        return True
+
+@eventHandler("FILE_LOAD_POST")
+@eventHandler("UNDO_POST")
+def clearInstanceCaches():
+    instanceCaches.clear()
+
 objectTypeItems = [
     ("MESH", "Mesh", "", "MESH_DATA", 0),
     ("TEXT", "Text", "", "FONT_DATA", 1),
@@ -74,6 +112,10 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
     emptyDisplayType: EnumProperty(name = "Empty Draw Type", default = "PLAIN_AXES",
         items = emptyDisplayTypeItems, update = resetInstancesEvent)
 
+    poolInstances: BoolProperty(name = "Pool Instances", default = False,
+        description = "Hide surplus instances instead of removing them, so that they can be reused when the amount grows again",
+        update = resetInstancesEvent)
+
     def create(self):
         self.newInput("Integer", "Instances", "instancesAmount", minValue = 0)
         if self.copyFromSource:
@@ -96,6 +138,7 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
     def drawAdvanced(self, layout):
         layout.prop(self, "addToMainContainer")
         layout.prop(self, "removeAnimationData")
+        layout.prop(self, "poolInstances")
 
         self.invokeFunction(layout, "resetObjectDataOnAllInstances",
             text = "Reset Source Data",
@@ -153,57 +196,86 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
             self.removeAllObjects()
             self.resetInstances = False
 
-        self.removeObjectsInRange(instancesAmount, len(self.linkedObjects))
+        cache = self.getInstanceCache()
+        if self.poolInstances:
+            self.updateVisibility(cache, instancesAmount)
+        else:
+            self.removeInstancesInRange(cache, instancesAmount)
 
-        return self.getOutputObjects(instancesAmount, sourceObject, scenes)
+        missingAmount = instancesAmount - len(cache.objects)
+        if missingAmount > 0:
+            cache.objects.extend(self.createNewObjects(missingAmount, sourceObject, scenes))
+            cache.visibleAmount = instancesAmount
 
+        # the changes of this node don't invalidate the instances
+        cache.objectAmount = len(bpy.data.objects)
+        return cache.objects[:instancesAmount]
 
-    def getOutputObjects(self, instancesAmount, sourceObject, scenes):
-        objects = []
+    def getInstanceCache(self):
+        cache = instanceCaches.get(self.identifier)
+        if cache is None or len(cache.objects) != len(self.linkedObjects) or not cache.isValid():
+            cache = InstanceCache(self.collectLinkedObjects())
+            instanceCaches[self.identifier] = cache
+        return cache
 
+    def collectLinkedObjects(self):
+        objects = []
+        removedIndices = []
         for i, objectGroup in enumerate(self.linkedObjects):
             object = objectGroup.object
             if object is None:
-                self.linkedObjects.remove(i)
+                removedIndices.append(i)
             else:
                 objects.append(object)
 
-        missingAmount = instancesAmount - len(objects)
-        if missingAmount == 0:
-            return objects
-
-        newObjects = self.createNewObjects(missingAmount, sourceObject, scenes)
-        objects.extend(newObjects)
-
+        for i in reversed(removedIndices):
+            self.linkedObjects.remove(i)
         return objects
 
-    def removeAllObjects(self):
-        for objectGroup in self.linkedObjects:
-            object = objectGroup.object
-            if object is not None:
-                self.removeObject(object)
+    def updateVisibility(self, cache, amount):
+        if cache.visibleAmount == -1:
+            start, end = 0, len(cache.objects)
+        else:
+            start, end = sorted((amount, cache.visibleAmount))
+
+        # only the instances in the changed range have to be touched
+        for i, object in enumerate(cache.objects[start:end], start):
+            hide = i >= amount
+            if object.hide_viewport != hide:
+                object.hide_viewport = hide
+                object.hide_render = hide
+        cache.visibleAmount = min(amount, len(cache.objects))
+
+    def removeInstancesInRange(self, cache, start):
+        if start >= len(cache.objects):
+            return
+
+        self.removeObjects(cache.objects[start:])
+        del cache.objects[start:]
+        for i in reversed(range(start, len(self.linkedObjects))):
+            self.linkedObjects.remove(i)
+        if cache.visibleAmount != -1:
+            cache.visibleAmount = min(cache.visibleAmount, start)
 
+    def removeAllObjects(self):
+        objects = [objectGroup.object for objectGroup in self.linkedObjects]
+        self.removeObjects([object for object in objects if object is not None])
         self.linkedObjects.clear()
+        instanceCaches.pop(self.identifier, None)
 
-    def removeObjectsInRange(self, start, end):
-        for i in reversed(range(start, end)):
-            self.removeObjectAtIndex(i)
-
-    def removeObjectAtIndex(self, index):
-        object = self.linkedObjects[index].object
-        if object is not None:
-            self.removeObject(object)
-        self.linkedObjects.remove(index)
+    def removeObjects(self, objects):
+        dataByPointer = {}
+        for object in objects:
+            if object.data is not None:
+                dataByPointer[object.data.as_pointer()] = (object.data, object.type)
+            self.removeShapeKeys(object)
 
-    def removeObject(self, object):
-        data = object.data
-        type = object.type
-        self.removeShapeKeys(object)
-        bpy.data.objects.remove(object)
-        self.removeObjectData(data, type)
+        # removing many objects one by one is much slower
+        bpy.data.batch_remove(objects)
+        for data, type in dataByPointer.values():
+            self.removeObjectData(data, type)
 
     def removeObjectData(self, data, type):
-        if data is None: return # the object was an empty
         if data.an_data.removeOnZeroUsers and data.users == 0:
             removeNotUsedDataBlock(data, type)
 
@@ -219,30 +291,23 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
 
     def createNewObjects(self, amount, sourceObject, scenes):
         objects = []
+        collectionObjects = self.getTargetCollection(scenes).objects
         nameSuffix = "instance_{}_".format(getRandomString(5))
         for i in range(amount):
             name = nameSuffix + str(i)
-            newObject = self.appendNewObject(name, sourceObject, scenes)
+            newObject = self.newInstance(name, sourceObject, scenes)
+            collectionObjects.link(newObject)
+            self.linkedObjects.add().object = newObject
             objects.append(newObject)
         return objects
 
-    def appendNewObject(self, name, sourceObject, scenes):
-        object = self.newInstance(name, sourceObject, scenes)
-        self.linkObject(object, scenes)
-        self.linkedObjects.add().object = object
-        return object
-
-    def linkObject(self, object, scenes):
-        if self.addToMainContainer:
-            for scene in scenes:
-                if scene is not None:
-                    getMainObjectContainer(scene).objects.link(object)
-                    break
-        else:
-            for scene in scenes:
-                if scene is not None:
-                    scene.collection.objects.link(object)
-                    break
+    def getTargetCollection(self, scenes):
+        for scene in scenes:
+            if scene is not None:
+                if self.addToMainContainer:
+                    return getMainObjectContainer(scene)
+                else:
+                    return scene.collection
 
     def newInstance(self, name, sourceObject, scenes):
         instanceData = self.getSourceObjectData(sourceObject)
@@ -292,6 +357,7 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
 
     def unlinkInstancesFromNode(self):
         self.linkedObjects.clear()
+        instanceCaches.pop(self.identifier, None)
         self.inputs.get("Instances").number = 0
 
     def delete(self):
@@ -299,6 +365,7 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
 
     def duplicate(self, sourceNode):
         self.linkedObjects.clear()
+        instanceCaches.pop(self.identifier, None)
 
     def toggleRelationshipLines(self):
         for space in iterActiveSpacesByType("VIEW_3D"):
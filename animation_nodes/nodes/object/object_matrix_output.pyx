@@ -1,7 +1,8 @@
 import bpy
 from bpy.props import *
-from ... math cimport toPyMatrix4
+from libc.math cimport fabs
 from ... sockets.info import isList
+from ... math cimport Matrix4, toMatrix4, toPyMatrix4
 from ... events import executionCodeChanged
 from ... data_structures cimport Matrix4x4List
 from ... base_types import AnimationNode, VectorizedSocket
@@ -11,6 +12,17 @@ outputItems = [	("BASIS", "Basis", "", "NONE", 0),
                 ("PARENT_INVERSE", "Parent Inverse", "", "NONE", 2),
                 ("WORLD", "World", "", "NONE", 3) ]
 
+attributeNames = {
+    "BASIS" : "matrix_basis",
+    "LOCAL" : "matrix_local",
+    "PARENT_INVERSE" : "matrix_parent_inverse",
+    "WORLD" : "matrix_world" }
+
+# matrices read from objects are composed from their location, rotation
+# and scale, so they can differ in the last bits from the matrix that was set.
+# The tolerance is relative, so that small motions are never skipped.
+cdef float relativeMatrixTolerance = 1e-6
+
 
 class ObjectMatrixOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ObjectMatrixOutputNode"
@@ -21,6 +33,9 @@ class ObjectMatrixOutputNode(bpy.types.Node, AnimationNode):
     __annotations__["outputType"] = EnumProperty(name = "Type", default = "WORLD",
         items = outputItems, update = executionCodeChanged)
 
+    __annotations__["skipUnchanged"] = BoolProperty(name = "Skip Unchanged", default = True,
+        description = "Don't write matrices that are equal to the current matrix of the object")
+
     __annotations__["useObjectList"] = VectorizedSocket.newProperty()
     __annotations__["useMatrixList"] = VectorizedSocket.newProperty()
 
@@ -39,6 +54,7 @@ class ObjectMatrixOutputNode(bpy.types.Node, AnimationNode):
         layout.prop(self, "outputType", text = "Type")
         if self.outputType != "WORLD":
             layout.label(text = "This mode might not work as expected", icon = "INFO")
+        layout.prop(self, "skipUnchanged")
 
     def getExecutionFunctionName(self):
         if isList(self.inputs[1].dataType):
@@ -61,28 +77,25 @@ class ObjectMatrixOutputNode(bpy.types.Node, AnimationNode):
     def execute_List(self, list objects, Matrix4x4List matrices):
         cdef:
             Py_ssize_t i
-            str attribute = self.outputType
+            Matrix4 currentMatrix
+            str attribute = attributeNames[self.outputType]
+            bint isWorld = self.outputType == "WORLD"
+            bint skipUnchanged = self.skipUnchanged
             Py_ssize_t amount = min(len(objects), len(matrices))
-        if attribute == "WORLD":
-            for i in range(amount):
-                obj = objects[i]
-                if obj is not None:
-                    obj.matrix_world = toPyMatrix4(matrices.data + i)
-        elif attribute == "LOCAL":
-            for i in range(amount):
-                obj = objects[i]
-                if obj is not None:
-                    obj.matrix_local = toPyMatrix4(matrices.data + i)
-        elif attribute == "PARENT_INVERSE":
-            for i in range(amount):
-                obj = objects[i]
-                if obj is not None:
-                    obj.matrix_parent_inverse = toPyMatrix4(matrices.data + i)
-        elif attribute == "BASIS":
-            for i in range(amount):
-                obj = objects[i]
-                if obj is not None:
-                    obj.matrix_basis = toPyMatrix4(matrices.data + i)
+
+        for i in range(amount):
+            obj = objects[i]
+            if obj is None:
+                continue
+
+            # the world matrix of a child is outdated when the parent moved
+            if skipUnchanged and not (isWorld and obj.parent is not None):
+                currentMatrix = toMatrix4(getattr(obj, attribute))
+                if matricesAreClose(&currentMatrix, matrices.data + i):
+                    continue
+
+            setattr(obj, attribute, toPyMatrix4(matrices.data + i))
+
         return objects
 
     def getBakeCode(self):
@@ -94,3 +107,12 @@ class ObjectMatrixOutputNode(bpy.types.Node, AnimationNode):
         yield "    object.keyframe_insert('location')"
         yield "    object.keyframe_insert('rotation_euler')"
         yield "    object.keyframe_insert('scale')"
+
+cdef bint matricesAreClose(Matrix4 *a, Matrix4 *b):
+    cdef float *_a = <float*>a
+    cdef float *_b = <float*>b
+    cdef Py_ssize_t i
+    for i in range(16):
+        if fabs(_a[i] - _b[i]) > relativeMatrixTolerance * max(fabs(_a[i]), fabs(_b[i])):
+            return False
+    return True
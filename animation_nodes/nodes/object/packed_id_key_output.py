@@ -0,0 +1,94 @@
+import bpy
+from bpy.props import *
+from ... tree_info import getNodesByType
+from ... base_types import AnimationNode
+from ... id_keys import IDKey, findsIDKeys, updateIdKeysList, packableDataTypes
+
+keyDataTypeItems = [
+    ("Transforms", "Transforms", "", "NONE", 0),
+    ("Float", "Float", "", "NONE", 1),
+    ("Integer", "Integer", "", "NONE", 2)
+]
+
+class PackedIDKeyOutputNode(bpy.types.Node, AnimationNode):
+    bl_idname = "an_PackedIDKeyOutputNode"
+    bl_label = "Packed ID Key Output"
+    bl_width_default = 160
+
+    def keyChanged(self, context):
+        updateIdKeysList()
+        self.refresh()
+
+    keyDataType: EnumProperty(name = "Key Data Type", default = "Transforms",
+        items = keyDataTypeItems, update = keyChanged)
+
+    keyName: StringProperty(name = "Key Name", default = "",
+        update = keyChanged)
+
+    def create(self):
+        self.newInput("Collection", "Collection", "collection",
+            defaultDrawType = "PROPERTY_ONLY")
+        self.newInput("Object List", "Objects", "objects")
+
+        if self.keyName != "":
+            if self.keyDataType == "Transforms":
+                self.newInput("Vector List", "Locations", "locations")
+                self.newInput("Euler List", "Rotations", "rotations")
+                self.newInput("Vector List", "Scales", "scales")
+            elif self.keyDataType == "Float":
+                self.newInput("Float List", "Numbers", "numbers")
+            elif self.keyDataType == "Integer":
+                self.newInput("Integer List", "Numbers", "numbers")
+
+        self.newOutput("Object List", "Objects", "objects")
+
+    def drawAdvanced(self, layout):
+        col = layout.column()
+        col.prop(self, "keyDataType", text = "Type")
+        col.prop(self, "keyName", text = "Name")
+
+    def draw(self, layout):
+        col = layout.column()
+        col.scale_y = 1.5
+        text = "Choose ID Key" if self.keyName == "" else repr(self.keyName)
+        self.invokeSelector(col, "ID_KEY", "assignIDKey",
+            text = text, icon = "VIEWZOOM")
+
+    def assignIDKey(self, dataType, name):
+        # text ID Keys cannot be packed
+        if dataType in packableDataTypes:
+            self.keyDataType = dataType
+            self.keyName = name
+
+    def getExecutionCode(self, required):
+        if self.keyName == "":
+            return
+
+        # the values are written for all objects at once, without
+        # accessing the ID properties of every object
+        args = "collection, {}, {}, objects".format(repr(self.keyDataType), repr(self.keyName))
+        yield "if collection is not None:"
+        yield "    _amount = len(objects)"
+        if self.keyDataType == "Transforms":
+            yield "    _locations = VirtualVector3DList.create(locations, (0, 0, 0)).materialize(_amount, True)"
+            yield "    _rotations = VirtualEulerList.create(rotations, Euler((0, 0, 0))).materialize(_amount, True)"
+            yield "    _scales = VirtualVector3DList.create(scales, (1, 1, 1)).materialize(_amount, True)"
+            yield "    AN.id_keys.setPackedValues({}, _locations, _rotations, _scales)".format(args)
+        elif self.keyDataType == "Float":
+            yield "    _numbers = VirtualDoubleList.create(numbers, 0).materialize(_amount, True)"
+            yield "    AN.id_keys.setPackedValues({}, _numbers)".format(args)
+        elif self.keyDataType == "Integer":
+            yield "    _numbers = VirtualLongList.create(numbers, 0).materialize(_amount, True)"
+            yield "    AN.id_keys.setPackedValues({}, _numbers)".format(args)
+
+    def delete(self):
+        self.keyName = ""
+        bpy.ops.an.update_id_keys_list()
+
+@findsIDKeys(removable = False)
+def getIDKeysOfNodes():
+    idKeys = set()
+    for node in getNodesByType("an_PackedIDKeyOutputNode"):
+        if node.keyName != "":
+            idKeys.add(IDKey(node.keyDataType, node.keyName))
+    return idKeys
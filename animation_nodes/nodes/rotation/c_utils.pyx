@@ -1,6 +1,7 @@
 
-from libc.math cimport M_PI as PI, sqrt, sin, cos, asin, acos
+from libc.math cimport M_PI as PI, sqrt, sin, cos, asin, acos, fabs
 from ... math cimport (
+    Euler3, Vector3,
     quaternionNormalize_InPlace, normalizeVec3_InPlace,
     euler3ToQuaternion, quaternionToMatrix4,
     quaternionToEuler3, quaternionToAxisAngle,
@@ -10,7 +11,8 @@ from ... algorithms.random_number_generators cimport XoShiRo256Plus
 
 from ... data_structures cimport (
     Vector3DList, EulerList, DoubleList, Matrix4x4List,
-    VirtualDoubleList, Quaternion, QuaternionList
+    VirtualDoubleList, Quaternion, QuaternionList,
+    VirtualEulerList, VirtualVector3DList
 )
 
 cdef float degreeToRadianFactor = <float>(PI / 180)
@@ -29,6 +31,74 @@ def combineEulerList(Py_ssize_t amount,
         output.data[i].order = 0
     return output
 
+def combineEulerLists(str operation, Py_ssize_t amount,
+                      VirtualEulerList a, VirtualEulerList b):
+    assert operation in ("ADD", "SUBTRACT")
+    cdef EulerList output = EulerList(length = amount)
+    cdef float sign = 1 if operation == "ADD" else -1
+    cdef Euler3 *_a
+    cdef Euler3 *_b
+    cdef Py_ssize_t i
+    for i in range(amount):
+        _a = a.get(i)
+        _b = b.get(i)
+        output.data[i].x = _a.x + sign * _b.x
+        output.data[i].y = _a.y + sign * _b.y
+        output.data[i].z = _a.z + sign * _b.z
+        output.data[i].order = _a.order
+    return output
+
+def multiplyEulerListWithVectors(str operation, Py_ssize_t amount,
+                                 VirtualEulerList a, VirtualVector3DList b):
+    assert operation in ("MULTIPLY", "DIVIDE")
+    cdef EulerList output = EulerList(length = amount)
+    cdef Euler3 *_a
+    cdef Vector3 *_b
+    cdef Py_ssize_t i
+    if operation == "MULTIPLY":
+        for i in range(amount):
+            _a = a.get(i)
+            _b = b.get(i)
+            output.data[i].x = _a.x * _b.x
+            output.data[i].y = _a.y * _b.y
+            output.data[i].z = _a.z * _b.z
+            output.data[i].order = _a.order
+    else:
+        for i in range(amount):
+            _a = a.get(i)
+            _b = b.get(i)
+            output.data[i].x = _a.x / _b.x if _b.x != 0 else 0
+            output.data[i].y = _a.y / _b.y if _b.y != 0 else 0
+            output.data[i].z = _a.z / _b.z if _b.z != 0 else 0
+            output.data[i].order = _a.order
+    return output
+
+def scaleEulerList(Py_ssize_t amount, VirtualEulerList a, VirtualDoubleList scales):
+    cdef EulerList output = EulerList(length = amount)
+    cdef Euler3 *_a
+    cdef float scale
+    cdef Py_ssize_t i
+    for i in range(amount):
+        _a = a.get(i)
+        scale = <float>scales.get(i)
+        output.data[i].x = _a.x * scale
+        output.data[i].y = _a.y * scale
+        output.data[i].z = _a.z * scale
+        output.data[i].order = _a.order
+    return output
+
+def absoluteEulerList(Py_ssize_t amount, VirtualEulerList a):
+    cdef EulerList output = EulerList(length = amount)
+    cdef Euler3 *_a
+    cdef Py_ssize_t i
+    for i in range(amount):
+        _a = a.get(i)
+        output.data[i].x = fabs(_a.x)
+        output.data[i].y = fabs(_a.y)
+        output.data[i].z = fabs(_a.z)
+        output.data[i].order = _a.order
+    return output
+
 def vectorsToEulers(Vector3DList vectors, bint useDegree):
     cdef EulerList eulers = EulerList(length = len(vectors))
     cdef Py_ssize_t i
@@ -8,6 +8,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class CombineEulerNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CombineEulerNode"
     bl_label = "Combine Euler"
+    options = {"PURE"}
 
     useListX: VectorizedSocket.newProperty()
     useListY: VectorizedSocket.newProperty()
@@ -8,6 +8,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class CombineQuaternionNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CombineQuaternionNode"
     bl_label = "Combine Quaternion"
+    options = {"PURE"}
 
     useListW: VectorizedSocket.newProperty()
     useListX: VectorizedSocket.newProperty()
@@ -11,6 +11,7 @@ conversionTypeItems = [
 class ConvertVectorAndEulerNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ConvertVectorAndEulerNode"
     bl_label = "Convert Vector and Euler"
+    options = {"PURE"}
     dynamicLabelType = "ALWAYS"
 
     onlySearchTags = True
@@ -19,6 +19,7 @@ class ConvertRotationsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ConvertRotationsNode"
     bl_label = "Convert Rotations"
     bl_width_default = 160
+    options = {"PURE"}
     dynamicLabelType = "ALWAYS"
 
     onlySearchTags = True
@@ -2,6 +2,13 @@ import bpy
 import math
 from bpy.props import *
 from ... base_types import AnimationNode, VectorizedSocket
+from ... data_structures import VirtualEulerList, VirtualVector3DList, VirtualDoubleList
+from . c_utils import (
+    combineEulerLists,
+    multiplyEulerListWithVectors,
+    scaleEulerList,
+    absoluteEulerList
+)
 
 operationItems = [
     ("ADD", "Add", "", "", 0),
@@ -31,6 +38,7 @@ operationsWithStepEuler = ["SNAP"]
 class EulerMathNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_EulerMathNode"
     bl_label = "Euler Math"
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
     codeEffects = [VectorizedSocket.CodeEffect]
 
@@ -106,3 +114,26 @@ class EulerMathNode(bpy.types.Node, AnimationNode):
             yield "if stepSize.x != 0: result[0] = round(a[0] / stepSize[0]) * stepSize[0]"
             yield "if stepSize.y != 0: result[1] = round(a[1] / stepSize[1]) * stepSize[1]"
             yield "if stepSize.z != 0: result[2] = round(a[2] / stepSize[2]) * stepSize[2]"
+
+    def getVectorizedKernelName(self, required):
+        if self.operation != "SNAP":
+            return "calculateResults"
+
+    def calculateResults(self, a, *args):
+        op = self.operation
+        eulers = VirtualEulerList.create(a, (0, 0, 0))
+
+        if op in operationsWithSecondEuler:
+            others = VirtualEulerList.create(args[0], (0, 0, 0))
+            amount = VirtualEulerList.getMaxRealLength(eulers, others)
+            return combineEulerLists(op, amount, eulers, others)
+        elif op in operationsWithVector:
+            vectors = VirtualVector3DList.create(args[0], (1, 1, 1))
+            amount = VirtualEulerList.getMaxRealLength(eulers, vectors)
+            return multiplyEulerListWithVectors(op, amount, eulers, vectors)
+        elif op == "SCALE":
+            scales = VirtualDoubleList.create(args[0], 0)
+            amount = VirtualEulerList.getMaxRealLength(eulers, scales)
+            return scaleEulerList(amount, eulers, scales)
+        elif op == "ABSOLUTE":
+            return absoluteEulerList(len(a), eulers)
@@ -7,6 +7,7 @@ from ... base_types import AnimationNode
 class QuaternionListCombineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_QuaternionListCombineNode"
     bl_label = "Combine Quaternion Rotations"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Quaternion List", "Quaternions", "quaternions")
@@ -39,6 +39,7 @@ operationsWithStepQuaternion = ["SNAP"]
 class QuaternionMathNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_QuaternionMathNode"
     bl_label = "Quaternion Math"
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
 
     operation: EnumProperty(name = "Operation", default = "ADD",
@@ -10,6 +10,7 @@ class RotationToDirectionNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RotationToDirectionNode"
     bl_label = "Rotation to Direction"
     bl_width_default = 160
+    options = {"PURE"}
 
     useRotationList: VectorizedSocket.newProperty()
 
@@ -7,6 +7,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class SeparateEulerNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SeparateEulerNode"
     bl_label = "Separate Euler"
+    options = {"PURE"}
 
     useDegree: BoolProperty(name = "Use Degree", default = False,
         update = executionCodeChanged)
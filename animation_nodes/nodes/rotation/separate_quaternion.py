@@ -7,6 +7,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class SeparateQuaternionNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SeparateQuaternionNode"
     bl_label = "Separate Quaternion"
+    options = {"PURE"}
 
     useList: VectorizedSocket.newProperty()
 
@@ -42,5 +42,5 @@ class EvaluateMIDITrackNode(bpy.types.Node, AnimationNode):
             yield ("noteValue = track.evaluate(time, channel, noteNumber,"
                    "attackTime, attackInterpolation, releaseTime, releaseInterpolation)")
         else:
-            yield ("noteValues = DoubleList.fromValues(track.evaluateAll(time, channel,"
-                   "attackTime, attackInterpolation, releaseTime, releaseInterpolation))")
+            yield ("noteValues = track.evaluateAll(time, channel,"
+                   "attackTime, attackInterpolation, releaseTime, releaseInterpolation)")
@@ -39,6 +39,10 @@ class SoundSpectrumNode(bpy.types.Node, AnimationNode):
         description = ("The minimum duration of the sound used to compute the spectrum."
         " High value corresponds to higher spectral resolution but introduce overlapping spectrum"))
 
+    useSpectrogramCache: BoolProperty(name = "Cache Spectrogram", default = True,
+        description = ("Compute the spectrum of every frame once and look it up afterwards."
+        " Uses more memory, but is much faster when the frame changes"))
+
     samplingMethod: EnumProperty(name = "Sampling Method", default = "EXP",
         items = samplingMethodItems, update = AnimationNode.refresh)
 
@@ -75,6 +79,7 @@ class SoundSpectrumNode(bpy.types.Node, AnimationNode):
         layout.prop(self, "smoothingSamples")
         layout.prop(self, "kaiserBeta")
         layout.prop(self, "minDuration")
+        layout.prop(self, "useSpectrogramCache")
 
     def getExecutionFunctionName(self):
         if self.samplingMethod == "EXP": return "executeExponential"
@@ -88,9 +93,7 @@ class SoundSpectrumNode(bpy.types.Node, AnimationNode):
         if not isValidRange(low, high): self.raiseErrorMessage("Invalid interval!")
         if count < 1: self.raiseErrorMessage("Invalid count!")
 
-        spectrum = sound.computeTimeSmoothedSpectrum(frame / getFPS(scene),
-            frame / getFPS(scene) + max(1 / getFPS(scene), self.minDuration),
-            attack, release, self.smoothingSamples, self.kaiserBeta)
+        spectrum = self.computeSpectrum(sound, frame, attack, release, scene)
         maxFrequency = len(spectrum) - 1
 
         scale = expm1(exponentialRate) / (high - low)
@@ -108,9 +111,7 @@ class SoundSpectrumNode(bpy.types.Node, AnimationNode):
         if len(sound.soundSequences) == 0: self.raiseErrorMessage("Empty sound!")
         if not isValidRange(low, high): self.raiseErrorMessage("Invalid interval!")
 
-        spectrum = sound.computeTimeSmoothedSpectrum(frame / getFPS(scene),
-            frame / getFPS(scene) + max(1 / getFPS(scene), self.minDuration),
-            attack, release, self.smoothingSamples, self.kaiserBeta)
+        spectrum = self.computeSpectrum(sound, frame, attack, release, scene)
         maxFrequency = len(spectrum) - 1
 
         reductionFunction = reductionFunctions[self.reductionFunction]
@@ -120,9 +121,7 @@ class SoundSpectrumNode(bpy.types.Node, AnimationNode):
         if len(sound.soundSequences) == 0: self.raiseErrorMessage("Empty sound!")
         if not isValidCustomList(pins): self.raiseErrorMessage("Invalid pins list!")
 
-        spectrum = sound.computeTimeSmoothedSpectrum(frame / getFPS(scene),
-            frame / getFPS(scene) + max(1 / getFPS(scene), self.minDuration),
-            attack, release, self.smoothingSamples, self.kaiserBeta)
+        spectrum = self.computeSpectrum(sound, frame, attack, release, scene)
         maxFrequency = len(spectrum) - 1
 
         bins = DoubleList(len(pins) - 1)
@@ -135,10 +134,17 @@ class SoundSpectrumNode(bpy.types.Node, AnimationNode):
     def executeFull(self, sound, frame, attack, release, amplitude, scene):
         if len(sound.soundSequences) == 0: self.raiseErrorMessage("Empty sound!")
 
-        spectrum = sound.computeTimeSmoothedSpectrum(frame / getFPS(scene),
-            frame / getFPS(scene) + max(1 / getFPS(scene), self.minDuration),
+        spectrum = self.computeSpectrum(sound, frame, attack, release, scene)
+        return DoubleList.fromNumpyArray(spectrum * amplitude, copy = False)
+
+    def computeSpectrum(self, sound, frame, attack, release, scene):
+        fps = getFPS(scene)
+        duration = max(1 / fps, self.minDuration)
+        if self.useSpectrogramCache:
+            return sound.computeTimeSmoothedSpectrumAtFrame(frame, fps, duration,
+                attack, release, self.smoothingSamples, self.kaiserBeta)
+        return sound.computeTimeSmoothedSpectrum(frame / fps, frame / fps + duration,
             attack, release, self.smoothingSamples, self.kaiserBeta)
-        return DoubleList.fromNumpyArray(spectrum * amplitude)
 
 def isValidRange(low, high):
     if low >= high: return False
@@ -10,6 +10,7 @@ pointTypeItems = [
 class AppendPointToSplineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_AppendPointToSplineNode"
     bl_label = "Append Point to Spline"
+    options = {"PURE"}
 
     pointType: EnumProperty(name = "Point Type", default = "POINT",
         items = pointTypeItems, update = AnimationNode.refresh)
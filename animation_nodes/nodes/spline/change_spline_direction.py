@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class ChangeSplineDirectionNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ChangeSplineDirectionNode"
     bl_label = "Change Spline Direction"
+    options = {"PURE"}
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useSplineList: VectorizedSocket.newProperty()
@@ -12,6 +12,7 @@ targetTypeItems = [
 class ChangeSplineTypeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ChangeSplineTypeNode"
     bl_label = "Change Spline Type"
+    options = {"PURE"}
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useSplineList: VectorizedSocket.newProperty()
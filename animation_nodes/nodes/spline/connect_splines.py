@@ -5,6 +5,7 @@ from ... data_structures.splines.connect import connectSplines
 class ConnectSplinesNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ConnectSplinesNode"
     bl_label = "Connect Splines"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Spline List", "Splines", "splines", defaultDrawType = "PROPERTY_ONLY")
@@ -14,6 +14,7 @@ evaluationTypeItems = [
 class EvaluateSplineNode(bpy.types.Node, AnimationNode, SplineEvaluationBase):
     bl_idname = "an_EvaluateSplineNode"
     bl_label = "Evaluate Spline"
+    options = {"PURE"}
 
     evaluationType: EnumProperty(name = "Evaluation Type", default = "PARAMETER",
         items = evaluationTypeItems, description = "Type of evaluation",
@@ -25,9 +26,16 @@ class EvaluateSplineNode(bpy.types.Node, AnimationNode, SplineEvaluationBase):
         update = AnimationNode.refresh)
 
     useParameterList: VectorizedSocket.newProperty()
+    useSplineList: VectorizedSocket.newProperty()
 
     def create(self):
-        self.newInput("Spline", "Spline", "spline", defaultDrawType = "PROPERTY_ONLY")
+        if self.evaluationType == "RANGE_COUNT":
+            socket = self.newInput(VectorizedSocket("Spline", "useSplineList",
+                ("Spline", "spline"), ("Splines", "splines")))
+            socket.defaultDrawType = "PROPERTY_ONLY"
+        else:
+            self.newInput("Spline", "Spline", "spline", defaultDrawType = "PROPERTY_ONLY")
+
         if self.evaluationType in ("RANGE_COUNT", "RANGE_STEP"):
             if self.evaluationType == "RANGE_COUNT":
                 self.newInput("Integer", "Amount", "amount", value = 50)
@@ -87,6 +95,10 @@ class EvaluateSplineNode(bpy.types.Node, AnimationNode, SplineEvaluationBase):
         col.prop(self, "wrapParameters")
 
     def getExecutionCode(self, required):
+        if self.evaluationType == "RANGE_COUNT" and self.useSplineList:
+            yield from self.getExecutionCode_SplineList(required)
+            return
+
         yield "if spline.isEvaluable():"
         if self.parameterType == "UNIFORM" or self.evaluationType == "RANGE_STEP":
             yield "    spline.ensureUniformConverter(self.resolution)"
@@ -134,6 +146,37 @@ class EvaluateSplineNode(bpy.types.Node, AnimationNode, SplineEvaluationBase):
         if "matrices" in required:
             yield "matrices = spline.getDistributedMatrices(_amount, _start, _end, parameterType)"
 
+    def getExecutionCode_SplineList(self, required):
+        # all splines are evaluated in one pass, the samples are stored one spline after another
+        yield "_splines = SplineList.fromSplines(splines)"
+        if self.parameterType == "UNIFORM":
+            yield "_splines.ensureUniformConverter(self.resolution)"
+        if any(output in required for output in ("normals", "matrices")):
+            yield "_splines.ensureNormals()"
+
+        yield "_start = min(max(start, 0), 1)"
+        yield "_end = min(max(end, 0), 1)"
+        yield "_amount = max(amount, 0)"
+        yield "parameterType = self.parameterType"
+
+        if "locations" in required:
+            yield "locations = _splines.getDistributedPoints(_amount, _start, _end, parameterType)"
+        if "tangents" in required:
+            yield "tangents = _splines.getDistributedTangents(_amount, _start, _end, parameterType)"
+        if "normals" in required:
+            yield "normals = _splines.getDistributedNormals(_amount, _start, _end, parameterType)"
+        if "radii" in required:
+            yield "_radii = _splines.getDistributedRadii(_amount, _start, _end, parameterType)"
+            yield "radii = DoubleList.fromValues(_radii)"
+        if "tilts" in required:
+            yield "_tilts = _splines.getDistributedTilts(_amount, _start, _end, parameterType)"
+            yield "tilts = DoubleList.fromValues(_tilts)"
+        if "curvatures" in required:
+            yield "_curvatures = _splines.getDistributedCurvatures(_amount, _start, _end, parameterType)"
+            yield "curvatures = DoubleList.fromValues(_curvatures)"
+        if "matrices" in required:
+            yield "matrices = _splines.getDistributedMatrices(_amount, _start, _end, parameterType)"
+
     def getExecutionCode_Parameters(self, required):
         if self.useParameterList:
             yield from self.getExecutionCode_Parameters_List(required)
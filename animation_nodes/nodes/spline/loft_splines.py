@@ -17,6 +17,7 @@ class LoftSplinesNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_LoftSplinesNode"
     bl_label = "Loft Splines"
     bl_width_default = 160
+    options = {"PURE"}
 
     interpolationType: EnumProperty(name = "Interpolation Type", default = "LINEAR",
         items = interpolationTypeItems, update = AnimationNode.refresh)
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode
 class MakeSplineCyclicNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MakeSplineCyclicNode"
     bl_label = "Make Spline Cyclic"
+    options = {"PURE"}
 
     def create(self):
         socket = self.newInput("Spline", "Spline", "spline")
@@ -12,6 +12,7 @@ class MeshFromSplineNode(bpy.types.Node, AnimationNode, SplineEvaluationBase):
     bl_idname = "an_MeshFromSplineNode"
     bl_label = "Mesh from Spline"
     bl_width_default = 160
+    options = {"PURE"}
 
     useCustomShape: BoolProperty(name = "Use Custom Shape", default = False,
         update = AnimationNode.refresh)
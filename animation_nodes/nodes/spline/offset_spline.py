@@ -9,6 +9,7 @@ from ... data_structures import VirtualVector3DList, VirtualDoubleList
 class OffsetSplineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_OffsetSplineNode"
     bl_label = "Offset Spline"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     def checkedPropertiesChanged(self, context):
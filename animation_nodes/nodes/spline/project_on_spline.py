@@ -5,6 +5,7 @@ from ... base_types import AnimationNode
 class ProjectOnSplineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ProjectOnSplineNode"
     bl_label = "Project on Spline"
+    options = {"PURE"}
 
     extended: BoolProperty(
         name = "Extended Spline",
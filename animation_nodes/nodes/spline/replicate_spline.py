@@ -12,6 +12,7 @@ transformationTypeItems = [
 class ReplicateSplineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ReplicateSplineNode"
     bl_label = "Replicate Spline"
+    options = {"PURE"}
 
     useSplineList: VectorizedSocket.newProperty()
 
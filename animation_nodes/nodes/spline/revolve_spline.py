@@ -13,6 +13,7 @@ class RevolveSplineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RevolveSplineNode"
     bl_label = "Revolve Spline"
     bl_width_default = 160
+    options = {"PURE"}
 
     projectionType: EnumProperty(name = "Projection Type", default = "PROJECT",
         items = projectionTypeItems, update = propertyChanged)
@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class SetSplineRadiusNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SetSplineRadiusNode"
     bl_label = "Set Spline Radius"
+    options = {"PURE"}
 
     useSplineList: VectorizedSocket.newProperty()
     useRadiusList: VectorizedSocket.newProperty()
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class SmoothBezierSplineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SmoothBezierSplineNode"
     bl_label = "Smooth Bezier Spline"
+    options = {"PURE"}
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useSplineList: VectorizedSocket.newProperty()
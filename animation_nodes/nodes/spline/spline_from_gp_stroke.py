@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class SplineFromGPStrokeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SplineFromGPStrokeNode"
     bl_label = "Spline From GP Stroke"
+    options = {"PURE"}
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useStrokeList: VectorizedSocket.newProperty()
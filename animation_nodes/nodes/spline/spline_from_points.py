@@ -12,6 +12,7 @@ splineTypeItems = [
 class SplineFromPointsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SplineFromPointsNode"
     bl_label = "Spline from Points"
+    options = {"PURE"}
 
     splineType: EnumProperty(name = "Spline Type", default = "BEZIER",
         items = splineTypeItems, update = AnimationNode.refresh)
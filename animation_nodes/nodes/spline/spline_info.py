@@ -11,6 +11,7 @@ splineTypeItems = [
 class SplineInfoNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SplineInfoNode"
     bl_label = "Spline Info"
+    options = {"PURE"}
 
     splineType: EnumProperty(name = "Spline Type", default = "POLY",
         items = splineTypeItems, update = AnimationNode.refresh)
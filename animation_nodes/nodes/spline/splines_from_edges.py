@@ -17,6 +17,7 @@ radiusTypeItems = [
 class SplinesFromEdgesNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SplinesFromEdgesNode"
     bl_label = "Splines from Edges"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
     bl_width_default = 160
 
@@ -8,6 +8,7 @@ from ... data_structures import VirtualFloatList, FloatList
 class TiltSplineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TiltSplineNode"
     bl_label = "Tilt Spline"
+    options = {"PURE"}
 
     useTiltList: VectorizedSocket.newProperty()
     useSplineList: VectorizedSocket.newProperty()
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class TransformSplineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TransformSplineNode"
     bl_label = "Transform Spline"
+    options = {"PURE"}
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useSplineList: VectorizedSocket.newProperty()
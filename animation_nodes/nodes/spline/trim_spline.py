@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class TrimSplineNode(bpy.types.Node, AnimationNode, SplineEvaluationBase):
     bl_idname = "an_TrimSplineNode"
     bl_label = "Trim Spline"
+    options = {"PURE"}
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useSplineList: VectorizedSocket.newProperty()
@@ -7,6 +7,7 @@ from ... utils.layout import splitAlignment, writeText
 class GetStructElementsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_GetStructElementsNode"
     bl_label = "Get Struct Elements"
+    options = {"PURE"}
     errorHandlingType = "EXCEPTION"
 
     makeCopies: BoolProperty(name = "Make Copies", default = True,
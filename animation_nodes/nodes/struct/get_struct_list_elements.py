@@ -8,6 +8,7 @@ class GetStructListElementsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_GetStructListElementsNode"
     bl_label = "Get Struct List Elements"
     bl_width_default = 160
+    options = {"PURE"}
     errorHandlingType = "MESSAGE"
 
     makeCopies: BoolProperty(name = "Make Copies", default = True,
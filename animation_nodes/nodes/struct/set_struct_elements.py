@@ -6,6 +6,7 @@ from ... base_types import AnimationNode
 class SetStructElementsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SetStructElementsNode"
     bl_label = "Set Struct Elements"
+    options = {"PURE"}
 
     def setup(self):
         self.newInput("Struct", "Struct", "struct", dataIsModified = True)
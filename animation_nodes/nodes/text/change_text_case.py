@@ -14,6 +14,7 @@ caseTypeCode = { item[0] : item[0].lower() for item in caseTypeItems }
 class ChangeTextCaseNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ChangeTextCaseNode"
     bl_label = "Change Text Case"
+    options = {"PURE"}
 
     def caseTypeChanges(self, context):
         executionCodeChanged()
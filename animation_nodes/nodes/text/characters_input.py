@@ -5,6 +5,7 @@ from ... base_types import AnimationNode
 class CharactersNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CharactersNode"
     bl_label = "Characters"
+    options = {"PURE"}
 
     def create(self):
         self.newOutput("Text", "Lower Case", "lower")
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode
 class ConvertToTextNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ConvertToTextNode"
     bl_label = "Convert to Text"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Generic", "Data", "data")
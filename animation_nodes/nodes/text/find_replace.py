@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class ReplaceTextNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ReplaceTextNode"
     bl_label = "Replace Text"
+    options = {"PURE"}
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useTextList: VectorizedSocket.newProperty()
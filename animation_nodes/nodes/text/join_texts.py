@@ -4,6 +4,7 @@ from ... base_types import AnimationNode
 class JoinTextsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_JoinTextsNode"
     bl_label = "Join Texts"
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Text List", "Texts", "texts")
@@ -11,6 +11,7 @@ modeItems = [
 class RepeatTextNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RepeatTextNode"
     bl_label = "Repeat Text"
+    options = {"PURE"}
 
     mode: EnumProperty(name = "Mode", default = "END",
         items = modeItems, update = propertyChanged)
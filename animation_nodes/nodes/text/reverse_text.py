@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class ReverseTextNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ReverseTextNode"
     bl_label = "Reverse Text"
+    options = {"PURE"}
 
     useList: VectorizedSocket.newProperty()
 
@@ -15,6 +15,7 @@ class SplitTextNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SplitTextNode"
     bl_label = "Split Text"
     bl_width_default = 180
+    options = {"PURE"}
     errorHandlingType = "MESSAGE"
 
     splitType: EnumProperty(
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class TextLengthNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TextLengthNode"
     bl_label = "Text Length"
+    options = {"PURE"}
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useTextList: VectorizedSocket.newProperty()
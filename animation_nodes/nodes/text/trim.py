@@ -6,6 +6,7 @@ from ... events import executionCodeChanged
 class TrimTextNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TrimTextNode"
     bl_label = "Trim Text"
+    options = {"PURE"}
 
     trimStart: BoolProperty(name = "Trim Start", default = False,
         update = AnimationNode.refresh)
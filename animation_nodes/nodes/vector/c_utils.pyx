@@ -1,4 +1,4 @@
-from ... math cimport Vector3, distanceVec3, lengthVec3, dotVec3
+from ... math cimport Vector3, distanceVec3, lengthVec3, dotVec3, angleVec3
 from ... data_structures cimport (
     DoubleList, Vector3DList, CDefaultList, Vector2DList,
     VirtualDoubleList, VirtualVector3DList, FloatList)
@@ -48,6 +48,17 @@ def calculateVectorDistancesVirtual(int amount,
 
     return distances
 
+def calculateVectorAnglesVirtual(Py_ssize_t amount,
+                                 VirtualVector3DList vectors1,
+                                 VirtualVector3DList vectors2):
+    cdef DoubleList angles = DoubleList(length = amount)
+    cdef Py_ssize_t i
+
+    for i in range(amount):
+        angles.data[i] = angleVec3(vectors1.get(i), vectors2.get(i))
+
+    return angles
+
 def calculateVectorDistances(Vector3DList vectors1, Vector3DList vectors2):
     cdef DoubleList distances = DoubleList(length = len(vectors1))
     cdef Py_ssize_t i
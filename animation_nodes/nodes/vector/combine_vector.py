@@ -7,6 +7,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class CombineVectorNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CombineVectorNode"
     bl_label = "Combine Vector"
+    options = {"PURE"}
     dynamicLabelType = "HIDDEN_ONLY"
 
     useListX: VectorizedSocket.newProperty()
@@ -1,8 +1,7 @@
 import bpy
 from bpy.props import *
-from mathutils.kdtree import KDTree
 from ... base_types import AnimationNode
-from ... data_structures import EdgeIndicesList
+from ... data_structures import KDTree
 from .. mesh.c_utils import calculateEdgeLengths
 
 modeItems = [
@@ -13,6 +12,7 @@ modeItems = [
 class FindClosePointsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FindClosePointsNode"
     bl_label = "Find Close Points"
+    options = {"PURE"}
 
     mode: EnumProperty(name = "Mode", default = "AMOUNT",
         items = modeItems, update = AnimationNode.refresh)
@@ -41,49 +41,10 @@ class FindClosePointsNode(bpy.types.Node, AnimationNode):
             yield "distances = self.calculateEdgeLengths(points, edges)"
 
     def execute_Amount(self, points, amount):
-        kdTree = self.buildKDTree(points)
-        amount = max(0, amount)
-
-        edges = EdgeIndicesList()
-        edgeSet = set()
-
-        for index, point in enumerate(points):
-            for foundPoint, foundIndex, distance in kdTree.find_n(point, amount + 1):
-                if foundIndex == index:
-                    continue
-
-                edge = (foundIndex, index) if foundIndex < index else (index, foundIndex)
-                if edge not in edgeSet:
-                    edgeSet.add(edge)
-                    edges.append(edge)
-
-        return edges
+        return KDTree(points).findNeighbourEdges(max(0, amount))
 
     def execute_Distance(self, points, maxDistance):
-        kdTree = self.buildKDTree(points)
-        maxDistance = max(0, maxDistance)
-
-        edges = EdgeIndicesList()
-        edgeSet = set()
-
-        for index, point in enumerate(points):
-            for foundPoint, foundIndex, distance in kdTree.find_range(point, maxDistance):
-                if foundIndex == index:
-                    continue
-
-                edge = (foundIndex, index) if foundIndex < index else (index, foundIndex)
-                if edge not in edgeSet:
-                    edgeSet.add(edge)
-                    edges.append(edge)
-
-        return edges
-
-    def buildKDTree(self, points):
-        kdTree = KDTree(len(points))
-        for i, vector in enumerate(points):
-            kdTree.insert(vector, i)
-        kdTree.balance()
-        return kdTree
+        return KDTree(points).findPairsInRadius(max(0, maxDistance))
 
     def calculateEdgeLengths(self, points, edges):
         return calculateEdgeLengths(points, edges)
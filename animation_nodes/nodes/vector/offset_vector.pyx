@@ -15,6 +15,7 @@ specifiedStateItems = [
 class OffsetVectorNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_OffsetVectorNode"
     bl_label = "Offset Vector"
+    options = {"PURE"}
     onlySearchTags = True
     errorHandlingType = "EXCEPTION"
     searchTags = [("Offset Vectors", {"useVectorList" : repr(True)})]
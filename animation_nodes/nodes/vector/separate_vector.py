@@ -6,6 +6,7 @@ from . c_utils import getAxisListOfVectorList
 class SeparateVectorNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SeparateVectorNode"
     bl_label = "Separate Vector"
+    options = {"PURE"}
 
     useList: VectorizedSocket.newProperty()
 
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class TransformVectorNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TransformVectorNode"
     bl_label = "Transform Vector"
+    options = {"PURE"}
 
     useVectorList: VectorizedSocket.newProperty()
 
@@ -1,9 +1,12 @@
 import bpy
+from . c_utils import calculateVectorAnglesVirtual
 from ... base_types import AnimationNode, VectorizedSocket
+from ... data_structures import VirtualVector3DList
 
 class VectorAngleNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_VectorAngleNode"
     bl_label = "Vector Angle"
+    options = {"PURE"}
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useListA: VectorizedSocket.newProperty()
@@ -28,3 +31,13 @@ class VectorAngleNode(bpy.types.Node, AnimationNode):
             yield "angle = a.angle(b, 0.0)"
         if "rotationDifference" in required:
             yield "rotationDifference = a.rotation_difference(b)"
+
+    def getVectorizedKernelName(self, required):
+        if "rotationDifferences" not in required:
+            return "calcAngles"
+
+    def calcAngles(self, a, b):
+        vectors1 = VirtualVector3DList.create(a, (0, 0, 0))
+        vectors2 = VirtualVector3DList.create(b, (0, 0, 0))
+        amount = VirtualVector3DList.getMaxRealLength(vectors1, vectors2)
+        return calculateVectorAnglesVirtual(amount, vectors1, vectors2)
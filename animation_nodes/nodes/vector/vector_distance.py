@@ -6,6 +6,7 @@ from ... data_structures import VirtualVector3DList
 class VectorDistanceNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_VectorDistanceNode"
     bl_label = "Vector Distance"
+    options = {"PURE"}
 
     useListA: VectorizedSocket.newProperty()
     useListB: VectorizedSocket.newProperty()
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class VectorDotProductNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_VectorDotProductNode"
     bl_label = "Vector Dot Product"
+    options = {"PURE"}
 
     useListA: VectorizedSocket.newProperty()
     useListB: VectorizedSocket.newProperty()
@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class VectorFromValueNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_VectorFromValueNode"
     bl_label = "Vector from Value"
+    options = {"PURE"}
 
     useList: VectorizedSocket.newProperty()
 
@@ -5,6 +5,7 @@ from . c_utils import calculateVectorLengths
 class VectorLengthNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_VectorLengthNode"
     bl_label = "Vector Length"
+    options = {"PURE"}
 
     useList: VectorizedSocket.newProperty()
 
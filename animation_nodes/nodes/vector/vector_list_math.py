@@ -10,6 +10,7 @@ operationItems = [
 class VectorListMathNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_VectorListMathNode"
     bl_label = "Vector List Math"
+    options = {"PURE"}
 
     operation: EnumProperty(name = "Operation", default = "ADD",
         items = operationItems, update = executionCodeChanged)
@@ -10,6 +10,7 @@ class VectorNoiseNode(bpy.types.Node, AnimationNode, Noise3DNodeBase):
     bl_idname = "an_VectorNoiseNode"
     bl_label = "Vector Noise"
     bl_width_default = 160
+    options = {"PURE"}
 
     def create(self):
         self.newInput("Vector List", "Vectors", "vectors")
@@ -55,6 +55,7 @@ def execute_TreeExecutiong():
 
 def execute_TreeAnalysis():
     from .. import tree_info
+    tree_info.treeChanged()
     tree_info.update()
 
 def execute_UpdateEverything():
@@ -0,0 +1,26 @@
+import bpy
+from bpy.props import *
+from .. import auto_load
+from .. utils.timing import prettyTime
+
+class PrintStartupTimings(bpy.types.Operator):
+    bl_idname = "an.print_startup_timings"
+    bl_label = "Print Startup Timings"
+    bl_description = "Print how long it took to import and register the addon"
+
+    amount: IntProperty(name = "Amount", default = 20, min = 0,
+        description = "Amount of slowest modules to print")
+
+    def execute(self, context):
+        print("\n" * 2)
+        print("#### Animation Nodes Startup ####")
+        print("Registration Manifest: {}".format("used" if auto_load.used_manifest else "not used"))
+        for name, duration in auto_load.startup_timings.items():
+            print("  {:20}{}".format(name + ":", prettyTime(duration)))
+        print("  {:20}{}".format("Total:", prettyTime(sum(auto_load.startup_timings.values()))))
+
+        print("\nSlowest module imports (including the modules they import first):")
+        timings = sorted(auto_load.module_import_timings, key = lambda x: x[1], reverse = True)
+        for name, duration in timings[:self.amount]:
+            print("  {:14}{}".format(prettyTime(duration), name))
+        return {"FINISHED"}
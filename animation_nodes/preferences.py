@@ -93,7 +93,9 @@ class ExecutionCodeProperties(bpy.types.PropertyGroup):
         ("DEFAULT", "Default", "", "NONE", 0),
         ("MONITOR", "Monitor Execution", "", "NONE", 1),
         ("MEASURE", "Measure Execution Times", "", "NONE", 2),
-        ("BAKE", "Bake", "", "NONE", 3)]
+        ("BAKE", "Bake", "", "NONE", 3),
+        ("INCREMENTAL", "Incremental", "Only execute nodes whose inputs changed since the last execution", "NONE", 4),
+        ("PROFILE", "Profile", "Record a call tree of nodes, subprograms and loop iterations that can be exported", "NONE", 5)]
 
     type: EnumProperty(name = "Execution Code Type", default = "DEFAULT",
         description = "Different execution codes can be useful in different contexts",
@@ -111,6 +113,32 @@ class ExecutionCodeProperties(bpy.types.PropertyGroup):
         get = get_MeasureExecution, set = set_MeasureExecution,
         description = "Measure execution times of the individual nodes")
 
+    outputCacheSize: IntProperty(name = "Output Cache Size", default = 512, min = 1,
+        description = "Maximum memory in MB used by the outputs of nodes that cache their outputs")
+
+    usePersistentScriptCache: BoolProperty(name = "Persistent Script Cache", default = True,
+        description = "Store compiled execution scripts on disk, so that they can be reused in later sessions")
+
+    def threadAmountChanged(self, context):
+        from . events import threadAmountChanged
+        threadAmountChanged()
+
+    threadAmount: IntProperty(name = "Threads", default = 0, min = 0, soft_max = 64,
+        description = "Maximum amount of threads used to evaluate falloffs on long lists (0 = one per core)",
+        update = threadAmountChanged)
+
+    def soundCacheSettingsChanged(self, context):
+        from . events import soundCacheSettingsChanged
+        soundCacheSettingsChanged()
+
+    soundCacheSize: IntProperty(name = "Sound Cache Size", default = 256, min = 1,
+        description = "Maximum memory in MB used by decoded sound samples",
+        update = soundCacheSettingsChanged)
+
+    useDecodedSoundFiles: BoolProperty(name = "Decoded Sound Files", default = False,
+        description = "Decode sound files once into a temporary file that is memory mapped",
+        update = soundCacheSettingsChanged)
+
 class DrawMeshIndicesProperties(bpy.types.PropertyGroup):
     bl_idname = "an_DrawMeshIndicesProperties"
     _drawVertices = _drawEdges = _drawPolygons = False
@@ -18,6 +18,10 @@ class MeshSocket(bpy.types.NodeSocket, AnimationNodeSocket):
     def getCopyExpression(cls):
         return "value.copy()"
 
+    @classmethod
+    def getLazyCopyExpression(cls):
+        return "value.copyOnWrite()"
+
     @classmethod
     def correctValue(cls, value):
         if isinstance(value, Mesh):
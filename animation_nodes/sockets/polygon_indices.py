@@ -45,6 +45,10 @@ class PolygonIndicesListSocket(bpy.types.NodeSocket, ListSocket):
     def getCopyExpression(cls):
         return "value.copy()"
 
+    @classmethod
+    def getLazyCopyExpression(cls):
+        return "value.copyOnWrite()"
+
     @classmethod
     def getFromValuesCode(cls):
         return "PolygonIndicesList.fromValues(value)"
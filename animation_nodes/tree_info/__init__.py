@@ -1,15 +1,17 @@
 import functools
 from itertools import chain
 from .. utils.timing import measureTime
-from .. utils.nodes import idToNode, idToSocket, createNodeByIdDict
+from .. utils.nodes import idToNode, idToSocket, createNodeByIdDict, getAnimationNodeTrees
 
 def __setup():
     from . forest_data import ForestData
     from . networks import NodeNetworks
 
-    global _needsUpdate, _forestData, _networks
+    global _needsUpdate, _changedTreeNames, _forestData, _networks
 
     _needsUpdate = True
+    # None means that all trees have to be updated
+    _changedTreeNames = None
     _forestData = ForestData()
     _networks = NodeNetworks()
 
@@ -19,22 +21,40 @@ def __setup():
 
 @measureTime
 def update():
-    _forestData.update()
+    treeNames = getTreeNamesToUpdate()
+    _forestData.update(treeNames)
 
     nodeByID = createNodeByIdDict()
-    _networks.update(_forestData, nodeByID)
+    _networks.update(_forestData, nodeByID, treeNames)
     nodeByID.clear()
 
-    global _needsUpdate
+    global _needsUpdate, _changedTreeNames
     _needsUpdate = False
+    _changedTreeNames = set()
 
 def updateIfNecessary():
     if _needsUpdate:
         update()
 
-def treeChanged():
-    global _needsUpdate
+def treeChanged(treeName = None):
+    '''
+    Only the given tree is analysed again in the next update.
+    All trees are analysed again when no tree name is given.
+    '''
+    global _needsUpdate, _changedTreeNames
     _needsUpdate = True
+    if treeName is None:
+        _changedTreeNames = None
+    elif _changedTreeNames is not None:
+        _changedTreeNames.add(treeName)
+
+def getTreeNamesToUpdate():
+    if _changedTreeNames is None:
+        return None
+    # trees have been added, removed or renamed
+    if {tree.name for tree in getAnimationNodeTrees()} != _forestData.treeNames:
+        return None
+    return _changedTreeNames
 
 
 
@@ -77,6 +97,9 @@ def getLinkedSockets(socket):
 def getDirectlyLinkedSocketsIDs(socket):
     return _forestData.linkedSocketsWithReroutes[socket.toID()]
 
+def getLinkedSocketsIDs(socket):
+    return _forestData.linkedSockets[socket.toID()]
+
 def getUndefinedNodes(nodeByID):
     return [nodeByID[nodeID] for nodeID in _forestData.nodesByType["NodeUndefined"]]
 
@@ -106,6 +129,18 @@ def getOriginNodes(node, nodeByID = None):
     else:
         return [nodeByID[nodeID] for nodeID in linkedNodeIDs]
 
+def getTargetNodes(node, nodeByID = None):
+    nodeID = node.toID()
+    linkedNodeIDs = set()
+    for socketID in _forestData.socketsByNode[nodeID][1]:
+        for linkedSocketID in _forestData.linkedSockets[socketID]:
+            linkedNodeIDs.add(linkedSocketID[0])
+
+    if nodeByID is None:
+        return [idToNode(nodeID) for nodeID in linkedNodeIDs]
+    else:
+        return [nodeByID[nodeID] for nodeID in linkedNodeIDs]
+
 def getAllDataLinkIDs():
     linkDataIDs = set()
     dataType = _forestData.dataTypeBySocket
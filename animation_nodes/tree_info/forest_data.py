@@ -7,6 +7,10 @@ class ForestData:
         self._reset()
 
     def _reset(self):
+        self.treeNames = set()
+        self.nodesByTree = defaultdict(list)
+        self.identifierByNode = dict()
+
         self.nodes = []
         self.nodesByType = defaultdict(set)
         self.typeByNode = defaultdict(None)
@@ -21,19 +25,55 @@ class ForestData:
 
         self.dataTypeBySocket = dict()
 
-    def update(self):
-        self._reset()
-        self.insertNodeTrees()
+    def update(self, treeNames = None):
+        '''
+        Update the data of the given trees (all trees when None).
+        The data of all other trees is kept.
+        '''
+        if treeNames is None:
+            self._reset()
+            trees = getAnimationNodeTrees()
+        else:
+            self.removeNodeTrees(treeNames)
+            trees = [tree for tree in getAnimationNodeTrees() if tree.name in treeNames]
+
+        self.insertNodeTrees(trees)
         self.rerouteNodes = self.nodesByType["NodeReroute"]
-        self.findLinksSkippingReroutes()
+        for tree in trees:
+            self.findLinksSkippingReroutes(self.nodesByTree[tree.name])
 
-    def insertNodeTrees(self):
-        for tree in getAnimationNodeTrees():
+    def insertNodeTrees(self, trees):
+        for tree in trees:
+            self.treeNames.add(tree.name)
             self.insertNodes(tree.nodes, tree.name)
             self.insertLinks(tree.links, tree.name)
 
+    def removeNodeTrees(self, treeNames):
+        for treeName in treeNames:
+            self.treeNames.discard(treeName)
+            for nodeID in self.nodesByTree.pop(treeName, []):
+                self.removeNode(nodeID)
+        self.nodes = [nodeID for nodeID in self.nodes if nodeID[0] not in treeNames]
+
+    def removeNode(self, nodeID):
+        nodeType = self.typeByNode.pop(nodeID)
+        self.nodesByType[nodeType].discard(nodeID)
+        self.animationNodes.discard(nodeID)
+
+        identifier = self.identifierByNode.pop(nodeID, None)
+        if self.nodeByIdentifier.get(identifier) == nodeID:
+            del self.nodeByIdentifier[identifier]
+
+        for socketID in chain.from_iterable(self.socketsByNode.pop(nodeID)):
+            self.linkedSockets.pop(socketID, None)
+            self.linkedSocketsWithReroutes.pop(socketID, None)
+            self.reroutePairs.pop(socketID, None)
+            self.dataTypeBySocket.pop(socketID, None)
+
     def insertNodes(self, nodes, treeName):
         appendNode = self.nodes.append
+        appendTreeNode = self.nodesByTree[treeName].append
+        identifierByNode = self.identifierByNode
         nodesByType = self.nodesByType
         typeByNode = self.typeByNode
         nodeByIdentifier = self.nodeByIdentifier
@@ -49,6 +89,7 @@ class ForestData:
             outputIDs = [(nodeID, True, socket.identifier) for socket in node.outputs]
 
             appendNode(nodeID)
+            appendTreeNode(nodeID)
             typeByNode[nodeID] = node.bl_idname
             nodesByType[node.bl_idname].add(nodeID)
 
@@ -63,6 +104,7 @@ class ForestData:
                 if node.bl_idname != "NodeUndefined":
                     animationNodes.add(nodeID)
                     nodeByIdentifier[node.identifier] = nodeID
+                    identifierByNode[nodeID] = node.identifier
 
                 chainedSockets = chain(node.inputs, node.outputs)
                 chainedSocketIDs = chain(inputIDs, outputIDs)
@@ -85,9 +127,9 @@ class ForestData:
             linkedSocketsWithReroutes[originID].append(targetID)
             linkedSocketsWithReroutes[targetID].append(originID)
 
-    def findLinksSkippingReroutes(self):
+    def findLinksSkippingReroutes(self, nodes):
         rerouteNodes = self.rerouteNodes
-        nonRerouteNodes = filter(lambda n: n not in rerouteNodes, self.nodes)
+        nonRerouteNodes = filter(lambda n: n not in rerouteNodes, nodes)
 
         socketsByNode = self.socketsByNode
         linkedSockets = self.linkedSockets
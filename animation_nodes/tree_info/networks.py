@@ -5,26 +5,41 @@ from . network import NodeNetwork
 class NodeNetworks:
     def __init__(self):
         self._reset()
+        self.unjoinedNetworksByTree = {}
 
     def _reset(self):
         self.networks = []
         self.networkByNode = {}
 
-    def update(self, forestData, nodeByID):
+    def update(self, forestData, nodeByID, treeNames = None):
+        '''
+        Find the networks in the given trees again (all trees when None).
+        The networks of other trees are reused, only the subprogram
+        networks that are split across multiple trees are joined again.
+        '''
         self._reset()
         self.forestData = forestData
 
-        networksByIdentifier = defaultdict(list)
-        for nodes in self.iterNodeGroups():
-            if not self.groupContainsAnimationNodes(nodes): continue
+        if treeNames is None:
+            self.unjoinedNetworksByTree.clear()
+            treeNames = forestData.treeNames
+        for treeName in list(self.unjoinedNetworksByTree):
+            if treeName in treeNames or treeName not in forestData.treeNames:
+                del self.unjoinedNetworksByTree[treeName]
+        for treeName in treeNames:
+            self.unjoinedNetworksByTree[treeName] = self.findNetworks(treeName, nodeByID)
 
-            network = NodeNetwork(nodes, self.forestData, nodeByID)
-            networksByIdentifier[network.identifier].append(network)
+        networksByIdentifier = defaultdict(list)
+        for networks in self.unjoinedNetworksByTree.values():
+            for network in networks:
+                networksByIdentifier[network.identifier].append(network)
 
         for identifier, networks in networksByIdentifier.items():
             if identifier is None:
                 # this are the main networks
                 self.networks.extend(networks)
+            elif len(networks) == 1:
+                self.networks.append(networks[0])
             else:
                 # join subprogram networks if they are not connected with links
                 self.networks.append(NodeNetwork.join(networks, nodeByID))
@@ -33,14 +48,21 @@ class NodeNetworks:
             for nodeID in network.nodeIDs:
                 self.networkByNode[nodeID] = network
 
+    def findNetworks(self, treeName, nodeByID):
+        networks = []
+        for nodes in self.iterNodeGroups(self.forestData.nodesByTree[treeName]):
+            if self.groupContainsAnimationNodes(nodes):
+                networks.append(NodeNetwork(nodes, self.forestData, nodeByID))
+        return networks
+
     def groupContainsAnimationNodes(self, nodes):
         typeByNode = self.forestData.typeByNode
         nonAnimationNodes = ("NodeFrame", "NodeReroute")
         return any(typeByNode[node] not in nonAnimationNodes for node in nodes)
 
-    def iterNodeGroups(self):
+    def iterNodeGroups(self, nodes):
         foundNodes = set()
-        for node in self.forestData.nodes:
+        for node in nodes:
             if node not in foundNodes:
                 nodeGroup = self.getAllConnectedNodes(node)
                 foundNodes.update(nodeGroup)
@@ -1,4 +1,8 @@
 import bpy
+from .. utils.pretty_strings import formatBytes
+from .. preferences import getExecutionCodeSettings
+from .. execution.output_cache import outputCache
+from .. execution.disk_cache import getBakedFramesAmount, nodeSupportsDiskCache
 
 class NodeSettingsPanel(bpy.types.Panel):
     bl_idname = "AN_PT_node_settings_panel"
@@ -16,3 +20,39 @@ class NodeSettingsPanel(bpy.types.Panel):
     def draw(self, context):
         node = bpy.context.active_node
         node.drawAdvanced(self.layout)
+
+        if "PURE" in node.options:
+            self.drawOutputCacheSettings(self.layout, node)
+        if nodeSupportsDiskCache(node):
+            self.drawDiskCacheSettings(self.layout, node)
+
+    def drawOutputCacheSettings(self, layout, node):
+        box = layout.box()
+        box.prop(node, "cacheOutputs")
+        if not node.cacheOutputs:
+            return
+
+        col = box.column(align = True)
+        col.prop(getExecutionCodeSettings(), "outputCacheSize", text = "Budget (MB)")
+        col.label(text = "Used: {} in {} entries".format(formatBytes(outputCache.size), len(outputCache.entries)))
+        col.label(text = "Hits: {:,d}  Misses: {:,d}".format(outputCache.hits, outputCache.misses))
+        col.label(text = "Evictions: {:,d}".format(outputCache.evictions))
+        col.operator("an.clear_output_cache", icon = "TRASH")
+
+    def drawDiskCacheSettings(self, layout, node):
+        box = layout.box()
+        box.prop(node, "useDiskCache")
+        if not node.useDiskCache:
+            return
+
+        col = box.column(align = True)
+        col.prop(node.nodeTree, "diskCacheDirectory", text = "")
+        col.label(text = "Baked Frames: {:,d}".format(getBakedFramesAmount(node)))
+        row = col.row(align = True)
+        props = row.operator("an.bake_to_disk_cache", icon = "FILE_CACHE")
+        props.treeName = node.nodeTree.name
+        props = row.operator("an.bake_to_disk_cache_parallel", text = "", icon = "SORTTIME")
+        props.treeName = node.nodeTree.name
+        props = row.operator("an.clear_disk_cache", text = "", icon = "TRASH")
+        props.nodeIdentifier = node.identifier
+        col.prop(node.nodeTree, "diskCacheProcessAmount")
@@ -1,5 +1,6 @@
 import bpy
 from .. preferences import getPreferences
+from .. execution.profiler import profiler
 from .. operators.output_execution_code import setupTextEditorCallback, executionCodeTextBlockName
 
 
@@ -45,6 +46,8 @@ class DeveloperPanel(bpy.types.Panel):
         row.prop(executionCode, "type", text = "")
         if executionCode.type == "MEASURE":
             row.operator("an.reset_measurements", text = "", icon = "RECOVER_LAST")
+        elif executionCode.type == "PROFILE":
+            row.operator("an.reset_profile", text = "", icon = "RECOVER_LAST")
 
         row = col.row(align = True)
         row.operator("an.print_current_execution_code", text = "Print", icon = "CONSOLE")
@@ -53,6 +56,31 @@ class DeveloperPanel(bpy.types.Panel):
         subrow.active = executionCodeTextBlockName in bpy.data.texts
         subrow.operator("an.select_area", text = "", icon = "ZOOM_SELECTED").callback = setupTextEditorCallback
 
+        row = col.row(align = True)
+        row.prop(executionCode, "usePersistentScriptCache")
+        row.operator("an.clear_compiled_script_cache", text = "", icon = "TRASH")
+
+        col.prop(executionCode, "threadAmount")
+
+        row = col.row(align = True)
+        row.prop(executionCode, "soundCacheSize")
+        row.prop(executionCode, "useDecodedSoundFiles", text = "", icon = "FILE_SOUND")
+        row.operator("an.clear_sound_cache", text = "", icon = "TRASH")
+
+        col.operator("an.print_startup_timings", text = "Print Startup Timings", icon = "TIME")
+
+        if executionCode.type == "PROFILE":
+            self.drawProfileExport(layout)
+
+    def drawProfileExport(self, layout):
+        col = layout.column(align = True)
+        if profiler.droppedEvents > 0:
+            col.label(text = "Event limit reached", icon = "INFO")
+        row = col.row(align = True)
+        row.enabled = not profiler.isEmpty
+        row.operator("an.export_profile", text = "Chrome Trace", icon = "EXPORT").exportFormat = "CHROME"
+        row.operator("an.export_profile", text = "Speedscope", icon = "EXPORT").exportFormat = "SPEEDSCOPE"
+
     def drawProfilingSettings(self, layout, preferences):
         profiling = preferences.developer.profiling
 
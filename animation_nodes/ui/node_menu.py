@@ -348,6 +348,7 @@ class ObjectMenu(bpy.types.Menu):
         insertNode(layout, "an_ShapeKeyOutputNode", "Shape Key Output")
         layout.separator()
         insertNode(layout, "an_ObjectIDKeyNode", "ID Key")
+        insertNode(layout, "an_PackedIDKeyOutputNode", "Packed ID Key Output")
         insertNode(layout, "an_CopyObjectDataNode", "Copy Data")
         insertNode(layout, "an_CopyObjectModifiersNode", "Copy Modifiers")
         insertNode(layout, "an_SetKeyframesNode", "Set Keyframes")
@@ -17,6 +17,7 @@ fileSavePreHandlers = []
 fileLoadPostHandlers = []
 addonLoadPostHandlers = []
 frameChangePostHandlers = []
+undoPostHandlers = []
 
 renderPreHandlers = []
 renderInitHandlers = []
@@ -30,6 +31,7 @@ def eventHandler(event):
         if event == "FILE_LOAD_POST": fileLoadPostHandlers.append(function)
         if event == "ADDON_LOAD_POST": addonLoadPostHandlers.append(function)
         if event == "FRAME_CHANGE_POST": frameChangePostHandlers.append(function)
+        if event == "UNDO_POST": undoPostHandlers.append(function)
 
         if event == "RENDER_INIT": renderInitHandlers.append(function)
         if event == "RENDER_PRE": renderPreHandlers.append(function)
@@ -60,6 +62,11 @@ def loadPost(scene):
     for handler in fileLoadPostHandlers:
         handler()
 
+@persistent
+def undoPost(scene):
+    for handler in undoPostHandlers:
+        handler()
+
 @persistent
 def renderPre(scene):
     for handler in renderPreHandlers:
@@ -90,6 +97,8 @@ def register():
     bpy.app.timers.register(always, persistent = True)
     bpy.app.handlers.load_post.append(loadPost)
     bpy.app.handlers.save_pre.append(savePre)
+    bpy.app.handlers.undo_post.append(undoPost)
+    bpy.app.handlers.redo_post.append(undoPost)
 
     bpy.app.handlers.render_complete.append(renderCompleted)
     bpy.app.handlers.render_init.append(renderInitialized)
@@ -103,6 +112,8 @@ def unregister():
     bpy.app.handlers.frame_change_post.remove(frameChangedPost)
     bpy.app.handlers.load_post.remove(loadPost)
     bpy.app.handlers.save_pre.remove(savePre)
+    bpy.app.handlers.undo_post.remove(undoPost)
+    bpy.app.handlers.redo_post.remove(undoPost)
     bpy.app.timers.unregister(always)
 
     bpy.app.handlers.render_complete.remove(renderCompleted)
@@ -0,0 +1,74 @@
+import numpy
+from .. data_structures cimport DoubleList, LongList, VirtualDoubleList
+
+'''
+Blender does not provide functions that read or write all weights of a vertex
+group at once. These functions use as few calls into Blender as possible and
+do everything else in compiled loops.
+'''
+
+# Read
+##########################################
+
+def getVertexGroupWeights(vertexGroup, Py_ssize_t vertexAmount):
+    cdef DoubleList weights = DoubleList(length = vertexAmount)
+    cdef Py_ssize_t i
+    getWeight = vertexGroup.weight
+    for i in range(vertexAmount):
+        # raises when the vertex is not in the group
+        try: weights.data[i] = getWeight(i)
+        except RuntimeError: weights.data[i] = 0
+    return weights
+
+def getVertexGroupWeights_Indices(vertexGroup, LongList indices):
+    cdef DoubleList weights = DoubleList(length = indices.length)
+    cdef Py_ssize_t i
+    getWeight = vertexGroup.weight
+    for i in range(indices.length):
+        try: weights.data[i] = getWeight(indices.data[i])
+        except: weights.data[i] = 0
+    return weights
+
+def getMeshVertexGroupWeights(mesh, long groupIndex):
+    '''
+    Works with evaluated meshes that are not linked to vertex groups.
+    '''
+    cdef DoubleList weights = DoubleList(length = len(mesh.vertices))
+    cdef Py_ssize_t i = 0
+    weights.fill(0)
+    for vertex in mesh.vertices:
+        for element in vertex.groups:
+            if element.group == groupIndex:
+                weights.data[i] = element.weight
+                break
+        i += 1
+    return weights
+
+
+# Write
+##########################################
+
+def setVertexGroupWeights(vertexGroup, LongList indices, VirtualDoubleList weights):
+    '''
+    VertexGroup.add gives many vertices the same weight. Vertices that get
+    the same weight are added in a single call.
+    '''
+    cdef Py_ssize_t i
+    cdef Py_ssize_t amount = indices.length
+    if amount == 0:
+        return
+
+    # the group stores single precision weights
+    values = numpy.empty(amount, dtype = numpy.float32)
+    cdef float[:] valuesView = values
+    for i in range(amount):
+        valuesView[i] = <float>weights.get(i)
+
+    order = numpy.argsort(values, kind = "stable")
+    sortedValues = values[order]
+    sortedIndices = indices.asNumpyArray()[order]
+    starts = numpy.concatenate(([0], numpy.flatnonzero(numpy.diff(sortedValues)) + 1))
+    ends = numpy.append(starts[1:], amount)
+
+    for start, end in zip(starts, ends):
+        vertexGroup.add(sortedIndices[start:end].tolist(), float(sortedValues[start]), "REPLACE")
@@ -0,0 +1,138 @@
+'''
+Run the Animation Nodes benchmarks and compare the results to a baseline.
+
+Running the benchmarks requires a Python that can import bpy, i.e. Blender
+itself or the bpy module. The addon has to be built in this directory first.
+
+    blender --background --factory-startup --python benchmark.py -- run
+        [--sizes 1e3 1e5] [--filter Vector3DList] [--repetitions 5]
+        [--output results.json] [--baseline baseline.json] [--threshold 1.1]
+
+Comparing results only requires Python:
+
+    python benchmark.py compare results.json baseline.json [--threshold 1.1]
+
+The exit code is 1 when a benchmark is slower than the baseline by more
+than the threshold factor.
+'''
+
+import os
+import sys
+import json
+import argparse
+from collections import OrderedDict
+
+currentDirectory = os.path.dirname(os.path.abspath(__file__))
+
+
+# Main
+####################################################
+
+def main(arguments):
+    args = parseArguments(arguments)
+    if args.command == "run":
+        results = main_Run(args)
+    else:
+        results = readJsonFile(args.results)
+
+    baselinePath = args.baseline
+    if baselinePath is None:
+        return 0
+
+    regressions = compareResults(results, readJsonFile(baselinePath), args.threshold)
+    return 1 if len(regressions) > 0 else 0
+
+def getScriptArguments():
+    # Blender passes the arguments after -- to the script
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return sys.argv[1:]
+
+def parseArguments(arguments):
+    parser = argparse.ArgumentParser(prog = "benchmark.py")
+    subparsers = parser.add_subparsers(dest = "command")
+    subparsers.required = True
+
+    runParser = subparsers.add_parser("run", help = "Run the benchmarks (requires bpy)")
+    runParser.add_argument("--sizes", nargs = "+", type = parseSize,
+        default = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7])
+    runParser.add_argument("--filter", default = "",
+        help = "Only run benchmarks whose name contains this text")
+    runParser.add_argument("--repetitions", type = int, default = 5)
+    runParser.add_argument("--output", help = "Write the results to this JSON file")
+    runParser.add_argument("--baseline", help = "Compare the results to this JSON file")
+    runParser.add_argument("--threshold", type = float, default = 1.1)
+
+    compareParser = subparsers.add_parser("compare", help = "Compare two result files")
+    compareParser.add_argument("results")
+    compareParser.add_argument("baseline")
+    compareParser.add_argument("--threshold", type = float, default = 1.1)
+
+    return parser.parse_args(arguments)
+
+def parseSize(text):
+    return int(float(text))
+
+
+# Run
+####################################################
+
+def main_Run(args):
+    if currentDirectory not in sys.path:
+        sys.path.insert(0, currentDirectory)
+    from animation_nodes.benchmarks import runBenchmarks, getEnvironmentInfo
+
+    results = OrderedDict()
+    results["environment"] = getEnvironmentInfo()
+    results["sizes"] = args.sizes
+    results["benchmarks"] = runBenchmarks(args.sizes, args.filter, args.repetitions)
+
+    if args.output is not None:
+        writeJsonFile(args.output, results)
+        print("Results written to {}".format(args.output))
+    return results
+
+
+# Compare
+####################################################
+
+def compareResults(results, baseline, threshold):
+    print("\n{:40}{:>10}{:>14}{:>14}{:>9}".format("Benchmark", "Size", "Baseline", "Current", "Factor"))
+
+    regressions = []
+    for name, durations in results["benchmarks"].items():
+        baselineDurations = baseline["benchmarks"].get(name, {})
+        for size, duration in durations.items():
+            if size not in baselineDurations:
+                continue
+
+            factor = duration / max(baselineDurations[size], 1e-12)
+            isRegression = factor > threshold
+            if isRegression:
+                regressions.append((name, size, factor))
+
+            print("{:40}{:>10}{:>14.6f}{:>14.6f}{:>9.2f}{}".format(
+                name, size, baselineDurations[size], duration, factor,
+                "  <- slower" if isRegression else ""))
+
+    print("\n{} regression(s) with threshold {}".format(len(regressions), threshold))
+    return regressions
+
+
+# Utils
+####################################################
+
+def readJsonFile(path):
+    with open(path) as f:
+        return json.load(f, object_pairs_hook = OrderedDict)
+
+def writeJsonFile(path, content):
+    with open(path, "w") as f:
+        json.dump(content, f, indent = 2)
+
+
+# Run Main
+###############################################
+
+if __name__ == "__main__":
+    sys.exit(main(getScriptArguments()))
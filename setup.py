@@ -23,6 +23,7 @@ from _setuputils.compilation import execute_Compile
 from _setuputils.copy_addon import execute_CopyAddon
 from _setuputils.pypreprocess import execute_PyPreprocess
 from _setuputils.setup_info_files import getSetupInfoList
+from _setuputils.registration_manifest import execute_RegistrationManifest
 from _setuputils.compile_libraries import execute_CompileLibraries
 from _setuputils.export import execute_Export, execute_ExportC, execute_ExportHeaders
 
@@ -189,6 +190,7 @@ def build(configs, skipCompilation = False):
     setupInfoList = getSetupInfoList(addonDirectory)
 
     execute_PyPreprocess(setupInfoList, addonDirectory)
+    execute_RegistrationManifest(addonDirectory)
     execute_Cythonize(setupInfoList, addonDirectory, configs)
 
     if not skipCompilation:
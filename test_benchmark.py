@@ -0,0 +1,61 @@
+import os
+import json
+import tempfile
+from unittest import TestCase
+from collections import OrderedDict
+from benchmark import compareResults, main, readJsonFile, writeJsonFile
+
+def createResults(durations):
+    return {"benchmarks" : {name : {str(size) : duration for size, duration in values.items()}
+                            for name, values in durations.items()}}
+
+class TestCompareResults(TestCase):
+    def testNoRegression(self):
+        results = createResults({"a" : {1000 : 1.05}})
+        baseline = createResults({"a" : {1000 : 1.0}})
+        self.assertEqual(compareResults(results, baseline, 1.1), [])
+
+    def testRegression(self):
+        results = createResults({"a" : {1000 : 1.0, 10000 : 12.0}})
+        baseline = createResults({"a" : {1000 : 1.0, 10000 : 10.0}})
+        regressions = compareResults(results, baseline, 1.1)
+        self.assertEqual(len(regressions), 1)
+        name, size, factor = regressions[0]
+        self.assertEqual((name, size), ("a", "10000"))
+        self.assertAlmostEqual(factor, 1.2)
+
+    def testMissingInBaseline(self):
+        results = createResults({"a" : {1000 : 5.0}, "b" : {1000 : 5.0}})
+        baseline = createResults({"a" : {10000 : 1.0}})
+        self.assertEqual(compareResults(results, baseline, 1.1), [])
+
+    def testZeroBaselineDuration(self):
+        results = createResults({"a" : {1000 : 1.0}})
+        baseline = createResults({"a" : {1000 : 0.0}})
+        self.assertEqual(len(compareResults(results, baseline, 1.1)), 1)
+
+class TestCompareCommand(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def writeResults(self, name, durations):
+        path = os.path.join(self.directory.name, name)
+        writeJsonFile(path, createResults(durations))
+        return path
+
+    def testExitCodes(self):
+        results = self.writeResults("results.json", {"a" : {1000 : 2.0}})
+        baseline = self.writeResults("baseline.json", {"a" : {1000 : 1.0}})
+        self.assertEqual(main(["compare", results, baseline]), 1)
+        self.assertEqual(main(["compare", results, baseline, "--threshold", "3"]), 0)
+
+    def testKeepsOrder(self):
+        path = os.path.join(self.directory.name, "results.json")
+        content = OrderedDict((name, 1.0) for name in ["c", "a", "b"])
+        writeJsonFile(path, content)
+        self.assertEqual(list(readJsonFile(path)), ["c", "a", "b"])
+        with open(path) as f:
+            self.assertEqual(json.load(f), {"a" : 1.0, "b" : 1.0, "c" : 1.0})